@@ -0,0 +1,107 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+# Compared against the baseline, the other metrics are informative
+HIGHER_IS_BETTER = ("fps",)
+LOWER_IS_BETTER = ("p50_ms", "p99_ms")
+
+
+def get_rss_mb():
+    """Resident set size of this process in MiB, the peak one where the current one is not available."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes elsewhere
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def summarize(latencies, wall_sec, frames, rss_before_mb):
+    """Throughput, latency percentiles and memory of a stage.
+
+    Args:
+        latencies (list[float]): Duration of each step in seconds, empty for a stage only timed as a whole.
+        wall_sec (float): Duration of the measured steps, including the time between them.
+        frames (int): Frames processed.
+        rss_before_mb (float): RSS before the stage, for the growth.
+    """
+    rss_mb = get_rss_mb()
+    result = {
+        "frames": frames,
+        "fps": frames / wall_sec if wall_sec > 0 else None,
+        "p50_ms": None,
+        "p99_ms": None,
+        "rss_mb": rss_mb,
+        "rss_growth_mb": rss_mb - rss_before_mb if rss_mb is not None and rss_before_mb is not None else None,
+    }
+    if len(latencies):
+        latencies_ms = np.asarray(latencies) * 1e3
+        result["p50_ms"] = float(np.percentile(latencies_ms, 50))
+        result["p99_ms"] = float(np.percentile(latencies_ms, 99))
+
+    return result
+
+
+def measure(step, frames, warmup=3):
+    """Call `step()` `warmup` times, then time `frames` calls of it."""
+    for _ in range(warmup):
+        step()
+
+    rss_before_mb = get_rss_mb()
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(frames):
+        step_start = time.perf_counter()
+        step()
+        latencies.append(time.perf_counter() - step_start)
+    wall_sec = time.perf_counter() - start
+
+    return summarize(latencies, wall_sec, frames, rss_before_mb)
+
+
+def measure_total(run):
+    """Time `run()`, which returns the number of frames it processed. Only the throughput is measured."""
+    rss_before_mb = get_rss_mb()
+    start = time.perf_counter()
+    frames = run()
+    return summarize([], time.perf_counter() - start, frames, rss_before_mb)
+
+
+def compare(results, baseline, tolerance=0.2):
+    """Regressions of `results` against `baseline`, both keyed by benchmark name.
+
+    A metric regresses when it is worse than the baseline by more than `tolerance` (relative). Benchmarks
+    missing from either side, skipped or without the metric are not compared.
+    Returns:
+        list[dict]: One entry per regressed metric, with the benchmark name, the metric and both values.
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None or "skipped" in result or "skipped" in reference:
+            continue
+
+        for metric in HIGHER_IS_BETTER + LOWER_IS_BETTER:
+            value, reference_value = result.get(metric), reference.get(metric)
+            if value is None or not reference_value:
+                continue
+            change = value / reference_value - 1
+            if (metric in HIGHER_IS_BETTER and change < -tolerance) or (
+                metric in LOWER_IS_BETTER and change > tolerance
+            ):
+                regressions.append(
+                    {"benchmark": name, "metric": metric, "baseline": reference_value, "value": value, "change": change}
+                )
+
+    return regressions
@@ -0,0 +1,182 @@
+"""Benchmark each stage of the capture, preview, recording and extraction pipeline.
+
+Run from the repository root::
+
+    python -m benchmarks.run                        # simulated devices, compared to benchmarks/baseline.json
+    python -m benchmarks.run --save-baseline        # store the results as the new baseline
+    python -m benchmarks.run --backend sdk          # Azure Kinect SDK and a connected camera
+    python -m benchmarks.run --backend sdk -s wrapper_call -s wrapper_call_unbound   # ctypes overhead, no camera
+
+Baselines are only comparable on the same machine and backend, the comparison is skipped otherwise.
+"""
+import os
+import sys
+import json
+import shutil
+import platform
+import tempfile
+import datetime
+
+import click
+import cv2
+import numpy as np
+
+from pykinect_recorder.cli.command import COLOR_RESOLUTIONS, DEPTH_MODES
+
+from .harness import compare
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def get_environment(backend, frames):
+    return {
+        "backend": backend,
+        "frames": frames,
+        "machine": platform.node(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "opencv": cv2.__version__,
+    }
+
+
+def initialize_backend(backend):
+    if backend == "simulator":
+        # Inherited by the processes spawned by the pipeline
+        os.environ["PYKINECT_SIMULATOR"] = "1"
+
+    from pykinect_recorder.pyk4a.pykinect import initialize_libraries
+
+    if not initialize_libraries():
+        raise click.ClickException("Azure Kinect SDK libraries not found.")
+
+
+def run_benchmarks(color_resolutions, depth_modes, stages, frames, workdir, echo=print):
+    """Run `stages` for every (color resolution, depth mode) pair, the device free ones only once.
+
+    Returns:
+        dict: Results keyed by "<stage>/<color resolution>/<depth mode>", by "<stage>" for the device free stages.
+    """
+    from .stages import DEVICE_FREE_STAGES, STAGES, PipelineContext, StageSkipped
+
+    results = {}
+    for stage in [stage for stage in stages if stage in DEVICE_FREE_STAGES]:
+        try:
+            results[stage] = STAGES[stage](None, frames)
+        except StageSkipped as e:
+            results[stage] = {"skipped": str(e)}
+        echo(format_result(stage, results[stage]))
+
+    stages = [stage for stage in stages if stage not in DEVICE_FREE_STAGES]
+    if not stages:
+        return results
+
+    for color_resolution in color_resolutions:
+        for depth_mode in depth_modes:
+            pair_dir = tempfile.mkdtemp(dir=workdir)
+            context = PipelineContext(COLOR_RESOLUTIONS[color_resolution], DEPTH_MODES[depth_mode], pair_dir)
+            try:
+                for stage in stages:
+                    name = f"{stage}/{color_resolution}/{depth_mode}"
+                    try:
+                        results[name] = STAGES[stage](context, frames)
+                    except StageSkipped as e:
+                        results[name] = {"skipped": str(e)}
+                    echo(format_result(name, results[name]))
+            finally:
+                context.close()
+                shutil.rmtree(pair_dir, ignore_errors=True)
+
+    return results
+
+
+def format_result(name, result):
+    if "skipped" in result:
+        return f"{name:<42} skipped: {result['skipped']}"
+
+    def number(value, unit):
+        return f"{value:9.2f}{unit}" if value is not None else f"{'-':>9}{' ' * len(unit)}"
+
+    return (
+        f"{name:<42} {number(result['fps'], ' fps')} {number(result['p50_ms'], ' ms p50')}"
+        f" {number(result['p99_ms'], ' ms p99')} {number(result['rss_mb'], ' MiB')}"
+    )
+
+
+def load_baseline(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+@click.command(help="Benchmark the pipeline stages and compare them to a stored baseline.")
+@click.option("--backend", type=click.Choice(["simulator", "sdk"]), default="simulator", show_default=True)
+@click.option(
+    "-c", "--color-resolution", "color_resolutions", type=click.Choice(list(COLOR_RESOLUTIONS)), multiple=True,
+    default=["720P", "1080P"], show_default=True,
+)
+@click.option(
+    "-d", "--depth-mode", "depth_modes", type=click.Choice(list(DEPTH_MODES)), multiple=True,
+    default=["NFOV_UNBINNED", "WFOV_2X2BINNED"], show_default=True,
+)
+@click.option("-s", "--stage", "stages", multiple=True, help="Stages to run.  [default: all]")
+@click.option("-n", "--frames", default=100, show_default=True, help="Frames measured per stage.")
+@click.option("-o", "--output", default="benchmark_results.json", show_default=True, type=click.Path(dir_okay=False))
+@click.option("--baseline", default=DEFAULT_BASELINE, show_default=True, type=click.Path(dir_okay=False))
+@click.option("--save-baseline", is_flag=True, help="Store the results as the baseline.")
+@click.option("--tolerance", default=0.2, show_default=True, help="Relative change accepted before a regression.")
+def main(backend, color_resolutions, depth_modes, stages, frames, output, baseline, save_baseline, tolerance):
+    from .stages import STAGES
+
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        raise click.BadParameter(f"Unknown stages: {', '.join(sorted(unknown))}", param_hint="--stage")
+
+    initialize_backend(backend)
+    workdir = tempfile.mkdtemp(prefix="pykinect_benchmark_")
+    try:
+        results = run_benchmarks(color_resolutions, depth_modes, stages or list(STAGES), frames, workdir, click.echo)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "environment": get_environment(backend, frames),
+        "results": results,
+    }
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    click.echo(f"Results written to {output}")
+
+    if save_baseline:
+        with open(baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        click.echo(f"Baseline written to {baseline}")
+        return
+
+    reference = load_baseline(baseline)
+    if reference is None:
+        click.echo(f"No baseline at {baseline}, run with --save-baseline to store one.")
+        return
+    environment = reference.get("environment", {})
+    if (environment.get("backend"), environment.get("machine")) != (backend, platform.node()):
+        click.echo("Baseline recorded with another backend or machine, not compared.")
+        return
+
+    regressions = compare(results, reference["results"], tolerance)
+    for regression in regressions:
+        click.echo(
+            f"REGRESSION {regression['benchmark']} {regression['metric']}: "
+            f"{regression['baseline']:.2f} -> {regression['value']:.2f} ({regression['change']:+.0%})"
+        )
+    if regressions:
+        sys.exit(1)
+    click.echo(f"No regression against {baseline} (tolerance {tolerance:.0%}).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+import os
+import ctypes
+import itertools
+
+import cv2
+
+from pykinect_recorder.pyk4a.k4a import _k4a, Configuration, DecodePool, Device
+from pykinect_recorder.pyk4a.k4arecord.record import Record
+from pykinect_recorder.pyk4a.k4arecord.playback import Playback
+from pykinect_recorder.pyk4a.k4arecord import extract
+from pykinect_recorder.pyk4a.utils import Colorizer, colorize
+
+from .harness import measure, measure_total
+
+# Distinct captures cycled through by the stages working on captures
+CAPTURE_POOL_SIZE = 8
+# Wrapper calls timed as one step, a single call is too short for the timer
+CALLS_PER_STEP = 1000
+
+
+class StageSkipped(Exception):
+    """The stage can't run with this backend or configuration."""
+
+
+class PipelineContext:
+    """Device, captures and recording shared by the stages of one (color resolution, depth mode) pair.
+
+    Args:
+        color_resolution (int): `K4A_COLOR_RESOLUTION_*`.
+        depth_mode (int): `K4A_DEPTH_MODE_*`.
+        workdir (str): Directory of the recording and of the extracted frames.
+        color_format (int, optional): Defaults to MJPG, the format of the recordings.
+        camera_fps (int, optional): Defaults to 30 fps, 15 fps for the modes without 30 fps.
+    """
+
+    def __init__(self, color_resolution, depth_mode, workdir, color_format=_k4a.K4A_IMAGE_FORMAT_COLOR_MJPG,
+                 camera_fps=None):
+        self.workdir = workdir
+        self.configuration = Configuration()
+        self.configuration.color_format = color_format
+        self.configuration.color_resolution = color_resolution
+        self.configuration.depth_mode = depth_mode
+        if camera_fps is None:
+            # Not available at 30 fps
+            limited = (
+                color_resolution == _k4a.K4A_COLOR_RESOLUTION_3072P or depth_mode == _k4a.K4A_DEPTH_MODE_WFOV_UNBINNED
+            )
+            camera_fps = _k4a.K4A_FRAMES_PER_SECOND_15 if limited else _k4a.K4A_FRAMES_PER_SECOND_30
+        self.configuration.camera_fps = camera_fps
+
+        self.device = Device(0)
+        self.device.start(self.configuration)
+        self.captures = [self.device.update().reference() for _ in range(CAPTURE_POOL_SIZE)]
+        self.recording_path = None
+
+    def close(self):
+        for capture in self.captures:
+            capture.reset()
+        self.captures = []
+        self.device.capture = None
+        self.device.close()
+
+    def cycle_captures(self):
+        return itertools.cycle(self.captures)
+
+    def get_recording(self, frames):
+        """Path of a recording of at least `frames` captures, written on first use."""
+        if self.recording_path is None:
+            self.recording_path = os.path.join(self.workdir, "benchmark.mkv")
+            record = Record(self.device.handle(), self.configuration.handle(), self.recording_path)
+            captures = self.cycle_captures()
+            for _ in range(frames):
+                record.write_capture(next(captures).handle())
+            record.flush()
+            record.close()
+
+        return self.recording_path
+
+
+def require_color(context):
+    if context.configuration.color_resolution == _k4a.K4A_COLOR_RESOLUTION_OFF:
+        raise StageSkipped("color camera off")
+
+
+def require_depth(context):
+    if context.configuration.depth_mode in (_k4a.K4A_DEPTH_MODE_OFF, _k4a.K4A_DEPTH_MODE_PASSIVE_IR):
+        raise StageSkipped("depth camera off")
+
+
+def bench_acquisition(context, frames):
+    """`Device.update()`, with the simulator the capture is produced as soon as it is requested."""
+    device = context.device
+
+    def step():
+        device.update()
+
+    return measure(step, frames)
+
+
+def bench_to_numpy(context, frames):
+    """Copy of the depth image into a new array."""
+    require_depth(context)
+    captures = context.cycle_captures()
+
+    def step():
+        with next(captures).get_depth_image_object() as image:
+            image.to_numpy()
+
+    return measure(step, frames)
+
+
+def bench_mjpg_decode(context, frames):
+    require_color(context)
+    if context.configuration.color_format != _k4a.K4A_IMAGE_FORMAT_COLOR_MJPG:
+        raise StageSkipped("color format is not MJPG")
+    captures = context.cycle_captures()
+
+    def step():
+        with next(captures).get_color_image_object() as image:
+            image.to_numpy()
+
+    return measure(step, frames)
+
+
+def bench_mjpg_decode_pool(context, frames):
+    """Ordered `DecodePool.map()` over the color images, with the default number of threads."""
+    require_color(context)
+    if context.configuration.color_format != _k4a.K4A_IMAGE_FORMAT_COLOR_MJPG:
+        raise StageSkipped("color format is not MJPG")
+    images = [capture.get_color_image_object() for capture in context.captures]
+
+    def run():
+        with DecodePool() as decode_pool:
+            return sum(ret for ret, _ in decode_pool.map(images[i % len(images)] for i in range(frames)))
+
+    try:
+        return measure_total(run)
+    finally:
+        for image in images:
+            image.reset()
+
+
+def require_native_library():
+    # The simulated library is pure Python, its calls say nothing about the ctypes overhead
+    if not isinstance(_k4a.k4a_dll, ctypes.CDLL):
+        raise StageSkipped("the backend is not a native library")
+
+
+def measure_image_get_size(get_size, frames):
+    """Time `CALLS_PER_STEP` calls of `get_size(image_handle)` per step, on an image created without a device."""
+    image_handle = _k4a.k4a_image_t()
+    if _k4a.k4a_image_create(_k4a.K4A_IMAGE_FORMAT_DEPTH16, 640, 576, 640 * 2, image_handle) != 0:
+        raise StageSkipped("image creation failed")
+
+    def step():
+        for _ in range(CALLS_PER_STEP):
+            get_size(image_handle)
+
+    try:
+        return measure(step, frames)
+    finally:
+        _k4a.k4a_image_release(image_handle)
+
+
+def bench_wrapper_call(context, frames):
+    """`k4a_image_get_size` through its prototype bound once by `setup_library()`. Needs no device."""
+    require_native_library()
+    return measure_image_get_size(_k4a.k4a_image_get_size, frames)
+
+
+def bench_wrapper_call_unbound(context, frames):
+    """Same calls as `wrapper_call`, declaring the prototype on every call as the wrappers did before binding."""
+    require_native_library()
+
+    def get_size(image_handle):
+        function = _k4a.k4a_dll.k4a_image_get_size
+        function.restype = ctypes.c_size_t
+        function.argtypes = (_k4a.k4a_image_t,)
+        return function(image_handle)
+
+    return measure_image_get_size(get_size, frames)
+
+
+def bench_colorize(context, frames):
+    require_depth(context)
+    colorizer = Colorizer()
+    depth_images = itertools.cycle([capture.get_depth_image()[1] for capture in context.captures])
+
+    def step():
+        colorizer.to_bgra(next(depth_images))
+
+    return measure(step, frames)
+
+
+def bench_colorize_normalize(context, frames):
+    """`colorize()`: clip, min/max normalize and colormap each frame, the path `Colorizer` replaced."""
+    require_depth(context)
+    depth_images = itertools.cycle([capture.get_depth_image()[1] for capture in context.captures])
+
+    def step():
+        colorize(next(depth_images), (None, 5000))
+
+    return measure(step, frames)
+
+
+def bench_qimage(context, frames):
+    """Conversion of a decoded color frame to a QImage, as the preview does."""
+    require_color(context)
+    try:
+        from PySide6.QtGui import QImage
+    except ImportError as e:
+        raise StageSkipped(f"PySide6 unavailable: {e}")
+
+    color_images = itertools.cycle([capture.get_color_image()[1][..., :3] for capture in context.captures])
+
+    def step():
+        bgr_frame = next(color_images)
+        h, w = bgr_frame.shape[:2]
+        rgb_frame = cv2.cvtColor(bgr_frame, cv2.COLOR_BGR2RGB)
+        QImage(rgb_frame, w, h, 3 * w, QImage.Format_RGB888).copy()
+
+    return measure(step, frames)
+
+
+def bench_record_write(context, frames):
+    """Synchronous `Record.write_capture()`, the work of the writer thread."""
+    record = Record(context.device.handle(), context.configuration.handle(), os.path.join(context.workdir, "write.mkv"))
+    captures = context.cycle_captures()
+
+    def step():
+        record.write_capture(next(captures).handle())
+
+    try:
+        return measure(step, frames)
+    finally:
+        record.flush()
+        record.close()
+        os.remove(os.path.join(context.workdir, "write.mkv"))
+
+
+def bench_playback_read(context, frames):
+    playback = Playback(context.get_recording(frames))
+
+    def step():
+        ret, capture = playback.update()
+        if not ret:
+            playback.seek_timestamp(0)
+            playback.update()
+
+    try:
+        return measure(step, frames)
+    finally:
+        playback.close()
+
+
+def bench_extraction(context, frames):
+    """`extract_segment()` over a whole recording: read, encode and write the color, IR and depth frames."""
+    recording = context.get_recording(frames)
+    playback = Playback(recording)
+    segment = (recording, 0, playback.get_start_timestamp(), -1)
+    playback.close()
+
+    return measure_total(
+        lambda: len(extract.extract_segment(segment, os.path.join(context.workdir, "extract"), ("rgb", "ir", "depth")))
+    )
+
+
+def bench_pointcloud(context, frames):
+    """Depth image to point cloud through the SDK transformation."""
+    require_depth(context)
+    # The simulated library has no transformation functions
+    if not hasattr(_k4a.k4a_dll, "k4a_transformation_depth_image_to_point_cloud"):
+        raise StageSkipped("transformations unsupported by the backend")
+    captures = context.cycle_captures()
+
+    def step():
+        next(captures).get_pointcloud()
+
+    return measure(step, frames)
+
+
+# Stages run once, without opening a device: their context is None
+DEVICE_FREE_STAGES = ("wrapper_call", "wrapper_call_unbound")
+
+STAGES = {
+    "acquisition": bench_acquisition,
+    "to_numpy": bench_to_numpy,
+    "mjpg_decode": bench_mjpg_decode,
+    "mjpg_decode_pool": bench_mjpg_decode_pool,
+    "wrapper_call": bench_wrapper_call,
+    "wrapper_call_unbound": bench_wrapper_call_unbound,
+    "colorize": bench_colorize,
+    "colorize_normalize": bench_colorize_normalize,
+    "qimage": bench_qimage,
+    "record_write": bench_record_write,
+    "playback_read": bench_playback_read,
+    "extraction": bench_extraction,
+    "pointcloud": bench_pointcloud,
+}
@@ -1,25 +1,212 @@
+import time
+
 import click
-from pykinect_recorder.main_window import MainWindow
-import qdarktheme
-from PySide6.QtWidgets import QApplication
 
 
 CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
 
+# Command line names of the `Configuration` enums, the values are the k4a constants
+COLOR_FORMATS = {"MJPG": 0, "NV12": 1, "YUY2": 2, "BGRA32": 3}
+COLOR_RESOLUTIONS = {"OFF": 0, "720P": 1, "1080P": 2, "1440P": 3, "1536P": 4, "2160P": 5, "3072P": 6}
+DEPTH_MODES = {
+    "OFF": 0,
+    "NFOV_2X2BINNED": 1,
+    "NFOV_UNBINNED": 2,
+    "WFOV_2X2BINNED": 3,
+    "WFOV_UNBINNED": 4,
+    "PASSIVE_IR": 5,
+}
+CAMERA_FPS = {"5": 0, "15": 1, "30": 2}
+WIRED_SYNC_MODES = {"STANDALONE": 0, "MASTER": 1, "SUBORDINATE": 2}
 
-@click.group(context_settings=CONTEXT_SETTINGS)
-def cli():
-    pass
 
+@click.group(context_settings=CONTEXT_SETTINGS, invoke_without_command=True)
+@click.pass_context
+def cli(ctx):
+    # Without a subcommand `pykinect` keeps opening the GUI
+    if ctx.invoked_subcommand is None:
+        run_gui()
 
-# @click.command(help="pykinect")
-# @click.option("--open", is_flag=True)
-# def check(open):
-#     if open:
-#         # run()
 
+@cli.command(help="Record an MKV without the GUI: no preview, decode or colorize.")
+@click.option("-o", "--output", default="output.mkv", show_default=True, type=click.Path(dir_okay=False))
+@click.option("-d", "--duration", type=float, help="Stop after this many seconds.")
+@click.option("-n", "--frames", type=int, help="Stop after this many captures.")
+@click.option("--device", "device_index", default=0, show_default=True, help="Device index.")
+@click.option("--color-format", type=click.Choice(list(COLOR_FORMATS)), default="MJPG", show_default=True)
+@click.option("--color-resolution", type=click.Choice(list(COLOR_RESOLUTIONS)), default="720P", show_default=True)
+@click.option("--depth-mode", type=click.Choice(list(DEPTH_MODES)), default="NFOV_UNBINNED", show_default=True)
+@click.option("--fps", type=click.Choice(list(CAMERA_FPS)), default="30", show_default=True)
+@click.option("--synchronized-images-only", is_flag=True, help="Drop captures without both color and depth.")
+@click.option("--depth-delay-off-color-usec", default=0, show_default=True)
+@click.option("--wired-sync-mode", type=click.Choice(list(WIRED_SYNC_MODES)), default="STANDALONE", show_default=True)
+@click.option("--subordinate-delay-off-master-usec", default=0, show_default=True)
+@click.option("--disable-streaming-indicator", is_flag=True)
+def record(
+    output,
+    duration,
+    frames,
+    device_index,
+    color_format,
+    color_resolution,
+    depth_mode,
+    fps,
+    synchronized_images_only,
+    depth_delay_off_color_usec,
+    wired_sync_mode,
+    subordinate_delay_off_master_usec,
+    disable_streaming_indicator,
+):
+    from pykinect_recorder.pyk4a.k4a.configuration import Configuration
+    from pykinect_recorder.pyk4a.k4arecord.health import get_health_path
+    from pykinect_recorder.pyk4a.pykinect import initialize_libraries, start_device
+
+    if not initialize_libraries():
+        raise click.ClickException("Azure Kinect SDK libraries not found.")
+
+    config = Configuration()
+    config.color_format = COLOR_FORMATS[color_format]
+    config.color_resolution = COLOR_RESOLUTIONS[color_resolution]
+    config.depth_mode = DEPTH_MODES[depth_mode]
+    config.camera_fps = CAMERA_FPS[fps]
+    config.synchronized_images_only = synchronized_images_only
+    config.depth_delay_off_color_usec = depth_delay_off_color_usec
+    config.wired_sync_mode = WIRED_SYNC_MODES[wired_sync_mode]
+    config.subordinate_delay_off_master_usec = subordinate_delay_off_master_usec
+    config.disable_streaming_indicator = disable_streaming_indicator
+
+    device = start_device(device_index, config=config, record=True, record_filepath=output)
+    click.echo(f"Recording {output} ({color_format} {color_resolution}, {depth_mode}, {fps} fps). Ctrl+C to stop.")
+    stats = RecordStats(int(fps))
+    try:
+        while not stats.is_done(duration, frames):
+            capture = device.update()
+            if device.is_imu:
+                device.write_imu_samples(device.drain_imu_samples())
+
+            stats.add(capture)
+            if stats.should_report():
+                click.echo(stats.report(device.record_writer.get_stats()))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        device.close()
+
+    click.echo(stats.summary())
+    click.echo(device.health.summary())
+    click.echo(f"Health report written to {get_health_path(output)}")
+
+
+@cli.command(help="Extract the frames of MKV recordings (files or directories) into image files.")
+@click.argument("paths", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option("-o", "--output", "root_path", default="datas", show_default=True, type=click.Path(file_okay=False))
+@click.option(
+    "-s", "--streams", default="rgb,ir", show_default=True, help="Comma separated streams among rgb, ir and depth."
+)
+@click.option("--segment-sec", default=10.0, show_default=True, help="Length of the parallel work units.")
+@click.option("-j", "--workers", type=int, help="Number of processes.  [default: CPU count]")
+@click.option("--write-threads", default=4, show_default=True, help="Encoding/writing threads per process.")
+@click.option(
+    "--decode-threads", default=0, show_default=True, help="Color conversion threads per process, 0 for none."
+)
+@click.option("--resume/--no-resume", default=True, show_default=True, help="Skip the segments already extracted.")
+def extract(paths, root_path, streams, segment_sec, workers, write_threads, decode_threads, resume):
+    from pykinect_recorder.pyk4a.k4arecord.extract import STREAMS, extract as extract_recordings
+    from pykinect_recorder.pyk4a.pykinect import initialize_libraries
+
+    streams = tuple(stream.strip() for stream in streams.split(",") if stream.strip())
+    unknown = set(streams) - set(STREAMS)
+    if unknown:
+        raise click.BadParameter(f"Unknown streams: {', '.join(sorted(unknown))}", param_hint="--streams")
+    if not initialize_libraries():
+        raise click.ClickException("Azure Kinect SDK libraries not found.")
+
+    def report(done, total):
+        click.echo(f"\r{done}/{total} segments", nl=done == total)
+
+    start_time = time.perf_counter()
+    metadata_path = extract_recordings(
+        paths,
+        root_path,
+        streams=streams,
+        segment_sec=segment_sec,
+        workers=workers,
+        write_threads=write_threads,
+        decode_threads=decode_threads,
+        resume=resume,
+        callback=report,
+    )
+    click.echo(f"Done in {time.perf_counter() - start_time:.1f}s, metadata written to {metadata_path}")
+
+
+class RecordStats:
+    """Per-second throughput and drop statistics of a headless recording.
+
+    Frames dropped by the device are counted from gaps between consecutive device timestamps, as the
+    `RecordingHealth` report does.
+    """
+
+    def __init__(self, fps: int) -> None:
+        self.period_usec = 1e6 / fps
+        self.start_time = time.perf_counter()
+        self.last_report_time = self.start_time
+        self.last_report_frames = 0
+
+        self.frames = 0
+        self.dropped_frames = 0
+        self.last_timestamp = None
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start_time
+
+    def is_done(self, duration, frames) -> bool:
+        return (duration is not None and self.elapsed >= duration) or (frames is not None and self.frames >= frames)
+
+    def add(self, capture) -> None:
+        from pykinect_recorder.pyk4a.k4arecord.health import count_missing_frames
+
+        self.frames += 1
+
+        image = capture.get_depth_image_object()
+        if not image.is_valid():
+            image = capture.get_color_image_object()
+        timestamp = image.device_timestamp
+        if timestamp is None:
+            return
+
+        if self.last_timestamp is not None:
+            self.dropped_frames += count_missing_frames(timestamp - self.last_timestamp, self.period_usec)
+        self.last_timestamp = timestamp
+
+    def should_report(self) -> bool:
+        return time.perf_counter() - self.last_report_time >= 1.0
+
+    def report(self, writer_stats: dict) -> str:
+        now = time.perf_counter()
+        fps = (self.frames - self.last_report_frames) / (now - self.last_report_time)
+        self.last_report_time = now
+        self.last_report_frames = self.frames
+
+        latency = writer_stats.get("latency_ms", {})
+        return (
+            f"[{self.elapsed:7.1f}s] {self.frames:7d} frames | {fps:5.1f} fps | "
+            f"{writer_stats['bytes_per_second'] / 1e6:6.1f} MB/s | dropped {self.dropped_frames} | "
+            f"queue {writer_stats['queue_depth']} | write p99 {latency.get('p99', 0.0):.1f} ms"
+        )
+
+    def summary(self) -> str:
+        return (
+            f"Recorded {self.frames} frames in {self.elapsed:.1f}s "
+            f"({self.frames / max(self.elapsed, 1e-9):.1f} fps), dropped {self.dropped_frames}."
+        )
+
+
+def run_gui():
+    import qdarktheme
+    from PySide6.QtWidgets import QApplication
+    from pykinect_recorder.main_window import MainWindow
 
-def main():
     app = QApplication()
     qdarktheme.setup_theme()
     screen_rect = app.primaryScreen().size()
@@ -29,5 +216,9 @@ def main():
     app.exec()
 
 
+def main():
+    cli()
+
+
 if __name__ == "__main__":
     main()
@@ -10,7 +10,9 @@ from .utils import *
 from .pykinect import *
 
 __all__ = [
-    "Calibration", "Device", "Capture", "Image", "ImuSample", "Transformation",
-    "Configuration", "default_configuration", "initialize_libraries", "start_device",
+    "BufferPool", "Calibration", "Device", "DeviceGroup", "Capture", "CaptureRing", "DecodePool", "Image", "ImuSample",
+    "PipelineStats", "Transformation",
+    "Configuration", "default_configuration", "initialize_libraries",
+    "initialize_simulator", "start_device",
     "start_playback", "utils.colorize",
 ]
\ No newline at end of file
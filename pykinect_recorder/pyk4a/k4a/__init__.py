@@ -1,7 +1,12 @@
+from .buffer_pool import BufferPool
 from .calibration import Calibration
 from .capture import Capture
+from .capture_ring import CaptureRing
 from .configuration import Configuration, default_configuration
+from .decode_pool import DecodePool
 from .device import Device
+from .device_group import DeviceGroup
 from .image import Image
 from .imu_sample import ImuSample
+from .pipeline_stats import PipelineStats
 from .transformation import Transformation
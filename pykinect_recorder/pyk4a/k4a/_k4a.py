@@ -9,15 +9,51 @@ k4a_dll = None
 
 
 def setup_library(module_k4a_path):
-    global k4a_dll
-
     try:
-        k4a_dll = ctypes.CDLL(module_k4a_path)
+        library = ctypes.CDLL(module_k4a_path)
 
     except Exception as e:
         print("Failed to load library", e)
         sys.exit(1)
 
+    set_library(library)
+
+
+def set_library(library):
+    """
+    Call `library` from every wrapper of this module.
+
+    Args:
+        library (ctypes.CDLL | object): Loaded shared library, or an object with the same functions
+            taking the same arguments (see `pyk4a.simulator`), whose prototypes are not bound.
+    """
+    global k4a_dll
+
+    k4a_dll = library
+    if isinstance(library, ctypes.CDLL):
+        bind_prototypes(library, _k4a_prototypes)
+
+
+def bind_prototypes(library, prototypes):
+    """
+    Configure `restype`/`argtypes` of every exported function once.
+
+    `ctypes.CDLL` caches the function pointer on first attribute access, so the wrappers below
+    call the pre-configured function directly instead of re-declaring its prototype per call.
+    Functions missing from the loaded library (older SDK builds) are skipped.
+
+    Args:
+        library (ctypes.CDLL): Loaded shared library.
+        prototypes (dict): Mapping of function name to `(restype, argtypes)`.
+    """
+    for name, (restype, argtypes) in prototypes.items():
+        function = getattr(library, name, None)
+        if function is None:
+            continue
+
+        function.restype = restype
+        function.argtypes = argtypes
+
 
 # ?
 def k4a_device_get_installed_count() -> ctypes.c_uint32:
@@ -49,11 +85,7 @@ def k4a_device_open(device_id: ctypes.c_uint32, device_handle: ctypes.POINTER(k4
     Returns:
         c_int: `K4A_RESULT_SUCCEEDED` if the device was opened successfully.
     """
-    _k4a_device_open = k4a_dll.k4a_device_open
-    _k4a_device_open.restype = ctypes.c_int
-    _k4a_device_open.argtypes = (ctypes.c_uint32, ctypes.POINTER(k4a_device_t))
-
-    return _k4a_device_open(device_id, device_handle)
+    return k4a_dll.k4a_device_open(device_id, device_handle)
 
 
 def k4a_device_close(device_handle: k4a_device_t) -> None:
@@ -68,10 +100,7 @@ def k4a_device_close(device_handle: k4a_device_t) -> None:
     Args:
         device_handle (k4a_device_t): Handle obtained by `k4a_device_open()`.
     """
-    _k4a_device_close = k4a_dll.k4a_device_close
-    _k4a_device_close.restype = None
-    _k4a_device_close.argtypes = (k4a_device_t,)
-    _k4a_device_close(device_handle)
+    k4a_dll.k4a_device_close(device_handle)
 
 
 def k4a_device_get_capture(
@@ -118,15 +147,7 @@ def k4a_device_get_capture(
             before the timeout elapses, the function will return `K4A_WAIT_RESULT_TIMEOUT`. All other
             failures will return `K4A_WAIT_RESULT_FAILED`.
     """
-    _k4a_device_get_capture = k4a_dll.k4a_device_get_capture
-    _k4a_device_get_capture.restype = ctypes.c_int
-    _k4a_device_get_capture.argtypes = (
-        k4a_device_t,
-        ctypes.POINTER(k4a_capture_t),
-        ctypes.c_int32,
-    )
-
-    return _k4a_device_get_capture(device_handle, capture_handle, timeout)
+    return k4a_dll.k4a_device_get_capture(device_handle, capture_handle, timeout)
 
 
 def k4a_device_get_imu_sample(
@@ -172,15 +193,7 @@ def k4a_device_get_imu_sample(
             before the timeout elapses, the function will return `K4A_WAIT_RESULT_TIMEOUT`.
             All other failures will return `K4A_WAIT_RESULT_FAILED`.
     """
-    _k4a_device_get_imu_sample = k4a_dll.k4a_device_get_imu_sample
-    _k4a_device_get_imu_sample.restype = ctypes.c_int
-    _k4a_device_get_imu_sample.argtypes = (
-        k4a_device_t,
-        ctypes.POINTER(k4a_imu_sample_t),
-        ctypes.c_int32,
-    )
-
-    return _k4a_device_get_imu_sample(device_handle, imu_sample_handle, timeout)
+    return k4a_dll.k4a_device_get_imu_sample(device_handle, imu_sample_handle, timeout)
 
 
 def k4a_capture_create(capture_handle: ctypes.POINTER(k4a_capture_t)) -> k4a_result_t:
@@ -199,11 +212,7 @@ def k4a_capture_create(capture_handle: ctypes.POINTER(k4a_capture_t)) -> k4a_res
         k4a_result_t: Returns `K4A_RESULT_SUCCEEDED` on success. Errors are indicated with
             `K4A_RESULT_FAILED` and error specific data can be found in the log.
     """
-    _k4a_capture_create = k4a_dll.k4a_capture_create
-    _k4a_capture_create.restype = k4a_result_t
-    _k4a_capture_create.argtypes = (ctypes.POINTER(k4a_capture_t),)
-
-    return _k4a_capture_create(capture_handle)
+    return k4a_dll.k4a_capture_create(capture_handle)
 
 
 def k4a_capture_release(capture_handle: k4a_capture_t) -> None:
@@ -215,11 +224,7 @@ def k4a_capture_release(capture_handle: k4a_capture_t) -> None:
     Args:
         capture_handle (k4a_capture_t): Capture to release.
     """
-    _k4a_capture_release = k4a_dll.k4a_capture_release
-    _k4a_capture_release.restype = None
-    _k4a_capture_release.argtypes = (k4a_capture_t,)
-
-    _k4a_capture_release(capture_handle)
+    k4a_dll.k4a_capture_release(capture_handle)
 
 
 def k4a_capture_reference(capture_handle: k4a_capture_t) -> None:
@@ -232,11 +237,7 @@ def k4a_capture_reference(capture_handle: k4a_capture_t) -> None:
     Args:
         capture_handle (k4a_capture_t): Capture to add a reference to.
     """
-    _k4a_capture_reference = k4a_dll.k4a_capture_reference
-    _k4a_capture_reference.restype = None
-    _k4a_capture_reference.argtypes = (k4a_capture_t,)
-
-    _k4a_capture_reference(capture_handle)
+    k4a_dll.k4a_capture_reference(capture_handle)
 
 
 def k4a_capture_get_color_image(capture_handle: k4a_capture_t) -> k4a_image_t:
@@ -252,11 +253,7 @@ def k4a_capture_get_color_image(capture_handle: k4a_capture_t) -> k4a_image_t:
     Returns:
         k4a_image_t
     """
-    _k4a_capture_get_color_image = k4a_dll.k4a_capture_get_color_image
-    _k4a_capture_get_color_image.restype = k4a_image_t
-    _k4a_capture_get_color_image.argtypes = (k4a_capture_t,)
-
-    return _k4a_capture_get_color_image(capture_handle)
+    return k4a_dll.k4a_capture_get_color_image(capture_handle)
 
 
 def k4a_capture_get_depth_image(capture_handle: k4a_capture_t) -> k4a_image_t:
@@ -272,11 +269,7 @@ def k4a_capture_get_depth_image(capture_handle: k4a_capture_t) -> k4a_image_t:
     Returns:
         k4a_image_t
     """
-    _k4a_capture_get_depth_image = k4a_dll.k4a_capture_get_depth_image
-    _k4a_capture_get_depth_image.restype = k4a_image_t
-    _k4a_capture_get_depth_image.argtypes = (k4a_capture_t,)
-
-    return _k4a_capture_get_depth_image(capture_handle)
+    return k4a_dll.k4a_capture_get_depth_image(capture_handle)
 
 
 def k4a_capture_get_ir_image(capture_handle: k4a_capture_t) -> k4a_image_t:
@@ -292,11 +285,7 @@ def k4a_capture_get_ir_image(capture_handle: k4a_capture_t) -> k4a_image_t:
     Returns:
         k4a_image_t
     """
-    _k4a_capture_get_ir_image = k4a_dll.k4a_capture_get_ir_image
-    _k4a_capture_get_ir_image.restype = k4a_image_t
-    _k4a_capture_get_ir_image.argtypes = (k4a_capture_t,)
-
-    return _k4a_capture_get_ir_image(capture_handle)
+    return k4a_dll.k4a_capture_get_ir_image(capture_handle)
 
 
 def k4a_capture_set_color_image(capture_handle: k4a_capture_t, image_handle: k4a_image_t) -> None:
@@ -319,14 +308,7 @@ def k4a_capture_set_color_image(capture_handle: k4a_capture_t, image_handle: k4a
         capture_handle (k4a_capture_t): Capture handle to hold the image.
         image_handle (k4a_image_t): Image handle containing the image.
     """
-    _k4a_capture_set_color_image = k4a_dll.k4a_capture_set_color_image
-    _k4a_capture_set_color_image.restype = None
-    _k4a_capture_set_color_image.argtypes = (
-        k4a_capture_t,
-        k4a_image_t,
-    )
-
-    _k4a_capture_set_color_image(capture_handle, image_handle)
+    k4a_dll.k4a_capture_set_color_image(capture_handle, image_handle)
 
 
 def k4a_capture_set_depth_image(capture_handle: k4a_capture_t, image_handle: k4a_image_t) -> None:
@@ -349,14 +331,7 @@ def k4a_capture_set_depth_image(capture_handle: k4a_capture_t, image_handle: k4a
         capture_handle (k4a_capture_t): Capture handle to hold the image.
         image_handle (k4a_image_t): Image handle containing the image.
     """
-    _k4a_capture_set_depth_image = k4a_dll.k4a_capture_set_depth_image
-    _k4a_capture_set_depth_image.restype = None
-    _k4a_capture_set_depth_image.argtypes = (
-        k4a_capture_t,
-        k4a_image_t,
-    )
-
-    _k4a_capture_set_depth_image(capture_handle, image_handle)
+    k4a_dll.k4a_capture_set_depth_image(capture_handle, image_handle)
 
 
 def k4a_capture_set_ir_image(capture_handle: k4a_capture_t, image_handle: k4a_image_t) -> None:
@@ -379,14 +354,7 @@ def k4a_capture_set_ir_image(capture_handle: k4a_capture_t, image_handle: k4a_im
         capture_handle (k4a_capture_t): Capture handle to hold the image.
         image_handle (k4a_image_t): Image handle containing the image.
     """
-    _k4a_capture_set_ir_image = k4a_dll.k4a_capture_set_ir_image
-    _k4a_capture_set_ir_image.restype = None
-    _k4a_capture_set_ir_image.argtypes = (
-        k4a_capture_t,
-        k4a_image_t,
-    )
-
-    _k4a_capture_set_ir_image(capture_handle, image_handle)
+    k4a_dll.k4a_capture_set_ir_image(capture_handle, image_handle)
 
 
 def k4a_capture_set_temperature_c(capture_handle: k4a_capture_t, temperature: ctypes.c_float) -> None:
@@ -399,14 +367,7 @@ def k4a_capture_set_temperature_c(capture_handle: k4a_capture_t, temperature: ct
     """
     # K4A_EXPORT void k4a_capture_set_temperature_c(k4a_capture_t capture_handle, float temperature_c);
 
-    _k4a_capture_set_temperature_c = k4a_dll.k4a_capture_set_temperature_c
-    _k4a_capture_set_temperature_c.restype = None
-    _k4a_capture_set_temperature_c.argtypes = (
-        k4a_capture_t,
-        ctypes.c_float,
-    )
-
-    _k4a_capture_set_temperature_c(capture_handle, temperature)
+    k4a_dll.k4a_capture_set_temperature_c(capture_handle, temperature)
 
 
 def k4a_capture_get_temperature_c(capture_handle: k4a_capture_t) -> ctypes.c_float:
@@ -422,11 +383,7 @@ def k4a_capture_get_temperature_c(capture_handle: k4a_capture_t) -> ctypes.c_flo
     """
     # K4A_EXPORT float k4a_capture_get_temperature_c(k4a_capture_t capture_handle);
 
-    _k4a_capture_get_temperature_c = k4a_dll.k4a_capture_get_temperature_c
-    _k4a_capture_get_temperature_c.restype = ctypes.c_float
-    _k4a_capture_get_temperature_c.argtypes = (k4a_capture_t,)
-
-    return _k4a_capture_get_temperature_c(capture_handle)
+    return k4a_dll.k4a_capture_get_temperature_c(capture_handle)
 
 
 def k4a_image_create(
@@ -465,17 +422,7 @@ def k4a_image_create(
     Returns:
         k4a_result_t: Returns `K4A_RESULT_SUCCEEDED` on success. Errors are indicated with `K4A_RESULT_FAILED`.
     """
-    _k4a_image_create = k4a_dll.k4a_image_create
-    _k4a_image_create.restype = k4a_result_t
-    _k4a_image_create.argtypes = (
-        k4a_image_format_t,
-        ctypes.c_int,
-        ctypes.c_int,
-        ctypes.c_int,
-        ctypes.POINTER(k4a_image_t),
-    )
-
-    return _k4a_image_create(image_format, width, height, stride, image_handle)
+    return k4a_dll.k4a_image_create(image_format, width, height, stride, image_handle)
 
 
 def k4a_image_create_from_buffer(
@@ -519,21 +466,7 @@ def k4a_image_create_from_buffer(
         k4a_result_t: Returns `K4A_RESULT_SUCCEEDED` on success. Errors are indicated with
             `K4A_RESULT_FAILED` and error specific data can be found in the log.
     """
-    _k4a_image_create_from_buffer = k4a_dll.k4a_image_create_from_buffer
-    _k4a_image_create_from_buffer.restype = k4a_result_t
-    _k4a_image_create_from_buffer.argtypes = (
-        k4a_image_format_t,
-        ctypes.c_int,
-        ctypes.c_int,
-        ctypes.c_int,
-        ctypes.POINTER(ctypes.c_uint8),
-        ctypes.c_size_t,
-        ctypes.c_void_p,
-        ctypes.c_void_p,
-        ctypes.POINTER(k4a_image_t),
-    )
-
-    return _k4a_image_create_from_buffer(
+    return k4a_dll.k4a_image_create_from_buffer(
         image_format,
         width,
         height,
@@ -562,11 +495,7 @@ def k4a_image_get_buffer(image_handle: k4a_image_t) -> ctypes.POINTER(ctypes.c_u
     """
     # K4A_EXPORT uint8_t *k4a_image_get_buffer(k4a_image_t image_handle);
 
-    _k4a_image_get_buffer = k4a_dll.k4a_image_get_buffer
-    _k4a_image_get_buffer.restype = ctypes.POINTER(ctypes.c_uint8)
-    _k4a_image_get_buffer.argtypes = (k4a_image_t,)
-
-    return _k4a_image_get_buffer(image_handle)
+    return k4a_dll.k4a_image_get_buffer(image_handle)
 
 
 def k4a_image_get_size(image_handle: k4a_image_t) -> ctypes.c_size_t:
@@ -585,11 +514,7 @@ def k4a_image_get_size(image_handle: k4a_image_t) -> ctypes.c_size_t:
     """
     # K4A_EXPORT size_t k4a_image_get_size(k4a_image_t image_handle);
 
-    _k4a_image_get_size = k4a_dll.k4a_image_get_size
-    _k4a_image_get_size.restype = ctypes.c_size_t
-    _k4a_image_get_size.argtypes = (k4a_image_t,)
-
-    return _k4a_image_get_size(image_handle)
+    return k4a_dll.k4a_image_get_size(image_handle)
 
 
 def k4a_image_get_format(image_handle: k4a_image_t) -> k4a_image_format_t:
@@ -608,11 +533,7 @@ def k4a_image_get_format(image_handle: k4a_image_t) -> k4a_image_format_t:
     """
     # K4A_EXPORT k4a_image_format_t k4a_image_get_format(k4a_image_t image_handle);
 
-    _k4a_image_get_format = k4a_dll.k4a_image_get_format
-    _k4a_image_get_format.restype = k4a_image_format_t
-    _k4a_image_get_format.argtypes = (k4a_image_t,)
-
-    return _k4a_image_get_format(image_handle)
+    return k4a_dll.k4a_image_get_format(image_handle)
 
 
 def k4a_image_get_width_pixels(image_handle: k4a_image_t) -> ctypes.c_int:
@@ -628,11 +549,7 @@ def k4a_image_get_width_pixels(image_handle: k4a_image_t) -> ctypes.c_int:
     """
     # K4A_EXPORT int k4a_image_get_width_pixels(k4a_image_t image_handle);
 
-    _k4a_image_get_width_pixels = k4a_dll.k4a_image_get_width_pixels
-    _k4a_image_get_width_pixels.restype = ctypes.c_int
-    _k4a_image_get_width_pixels.argtypes = (k4a_image_t,)
-
-    return _k4a_image_get_width_pixels(image_handle)
+    return k4a_dll.k4a_image_get_width_pixels(image_handle)
 
 
 def k4a_image_get_height_pixels(image_handle: k4a_image_t) -> ctypes.c_int:
@@ -648,11 +565,7 @@ def k4a_image_get_height_pixels(image_handle: k4a_image_t) -> ctypes.c_int:
     """
     # K4A_EXPORT int k4a_image_get_height_pixels(k4a_image_t image_handle);
 
-    _k4a_image_get_height_pixels = k4a_dll.k4a_image_get_height_pixels
-    _k4a_image_get_height_pixels.restype = ctypes.c_int
-    _k4a_image_get_height_pixels.argtypes = (k4a_image_t,)
-
-    return _k4a_image_get_height_pixels(image_handle)
+    return k4a_dll.k4a_image_get_height_pixels(image_handle)
 
 
 def k4a_image_get_stride_bytes(image_handle: k4a_image_t) -> ctypes.c_int:
@@ -669,11 +582,7 @@ def k4a_image_get_stride_bytes(image_handle: k4a_image_t) -> ctypes.c_int:
     """
     # K4A_EXPORT int k4a_image_get_stride_bytes(k4a_image_t image_handle);
 
-    _k4a_image_get_stride_bytes = k4a_dll.k4a_image_get_stride_bytes
-    _k4a_image_get_stride_bytes.restype = ctypes.c_int
-    _k4a_image_get_stride_bytes.argtypes = (k4a_image_t,)
-
-    return _k4a_image_get_stride_bytes(image_handle)
+    return k4a_dll.k4a_image_get_stride_bytes(image_handle)
 
 
 def k4a_image_get_timestamp_usec(image_handle: k4a_image_t) -> ctypes.c_uint64:
@@ -697,11 +606,7 @@ def k4a_image_get_timestamp_usec(image_handle: k4a_image_t) -> ctypes.c_uint64:
     """
     # K4A_DEPRECATED_EXPORT uint64_t k4a_image_get_timestamp_usec(k4a_image_t image_handle);
 
-    _k4a_image_get_timestamp_usec = k4a_dll.k4a_image_get_timestamp_usec
-    _k4a_image_get_timestamp_usec.restype = ctypes.c_uint64
-    _k4a_image_get_timestamp_usec.argtypes = (k4a_image_t,)
-
-    return _k4a_image_get_timestamp_usec(image_handle)
+    return k4a_dll.k4a_image_get_timestamp_usec(image_handle)
 
 
 def k4a_image_get_device_timestamp_usec(image_handle: k4a_image_t) -> ctypes.c_uint64:
@@ -722,11 +627,7 @@ def k4a_image_get_device_timestamp_usec(image_handle: k4a_image_t) -> ctypes.c_u
     """
     # K4A_EXPORT uint64_t k4a_image_get_device_timestamp_usec(k4a_image_t image_handle);
 
-    _k4a_image_get_device_timestamp_usec = k4a_dll.k4a_image_get_device_timestamp_usec
-    _k4a_image_get_device_timestamp_usec.restype = ctypes.c_uint64
-    _k4a_image_get_device_timestamp_usec.argtypes = (k4a_image_t,)
-
-    return _k4a_image_get_device_timestamp_usec(image_handle)
+    return k4a_dll.k4a_image_get_device_timestamp_usec(image_handle)
 
 
 def k4a_image_get_system_timestamp_nsec(image_handle: k4a_image_t) -> ctypes.c_uint64:
@@ -755,11 +656,7 @@ def k4a_image_get_system_timestamp_nsec(image_handle: k4a_image_t) -> ctypes.c_u
     """
     # K4A_EXPORT uint64_t k4a_image_get_system_timestamp_nsec(k4a_image_t image_handle);
 
-    _k4a_image_get_system_timestamp_nsec = k4a_dll.k4a_image_get_system_timestamp_nsec
-    _k4a_image_get_system_timestamp_nsec.restype = ctypes.c_uint64
-    _k4a_image_get_system_timestamp_nsec.argtypes = (k4a_image_t,)
-
-    return _k4a_image_get_system_timestamp_nsec(image_handle)
+    return k4a_dll.k4a_image_get_system_timestamp_nsec(image_handle)
 
 
 def k4a_image_get_exposure_usec(image_handle: k4a_image_t) -> ctypes.c_uint64:
@@ -777,11 +674,7 @@ def k4a_image_get_exposure_usec(image_handle: k4a_image_t) -> ctypes.c_uint64:
     """
     # K4A_EXPORT uint64_t k4a_image_get_exposure_usec(k4a_image_t image_handle);
 
-    _k4a_image_get_exposure_usec = k4a_dll.k4a_image_get_exposure_usec
-    _k4a_image_get_exposure_usec.restype = ctypes.c_uint64
-    _k4a_image_get_exposure_usec.argtypes = (k4a_image_t,)
-
-    return _k4a_image_get_exposure_usec(image_handle)
+    return k4a_dll.k4a_image_get_exposure_usec(image_handle)
 
 
 def k4a_image_get_white_balance(image_handle: k4a_image_t) -> ctypes.c_uint32:
@@ -800,11 +693,7 @@ def k4a_image_get_white_balance(image_handle: k4a_image_t) -> ctypes.c_uint32:
     """
     # K4A_EXPORT uint32_t k4a_image_get_white_balance(k4a_image_t image_handle);
 
-    _k4a_image_get_white_balance = k4a_dll.k4a_image_get_white_balance
-    _k4a_image_get_white_balance.restype = ctypes.c_uint32
-    _k4a_image_get_white_balance.argtypes = (k4a_image_t,)
-
-    return _k4a_image_get_white_balance(image_handle)
+    return k4a_dll.k4a_image_get_white_balance(image_handle)
 
 
 def k4a_image_get_iso_speed(image_handle: k4a_image_t) -> ctypes.c_uint32:
@@ -823,11 +712,7 @@ def k4a_image_get_iso_speed(image_handle: k4a_image_t) -> ctypes.c_uint32:
     """
     # K4A_EXPORT uint32_t k4a_image_get_iso_speed(k4a_image_t image_handle);
 
-    _k4a_image_get_iso_speed = k4a_dll.k4a_image_get_iso_speed
-    _k4a_image_get_iso_speed.restype = ctypes.c_uint32
-    _k4a_image_get_iso_speed.argtypes = (k4a_image_t,)
-
-    return _k4a_image_get_iso_speed(image_handle)
+    return k4a_dll.k4a_image_get_iso_speed(image_handle)
 
 
 def k4a_image_set_device_timestamp_usec(image_handle: k4a_image_t, timestamp_usec: ctypes.c_uint64) -> None:
@@ -845,14 +730,7 @@ def k4a_image_set_device_timestamp_usec(image_handle: k4a_image_t, timestamp_use
     """
     # K4A_EXPORT void k4a_image_set_device_timestamp_usec(k4a_image_t image_handle, uint64_t timestamp_usec);
 
-    _k4a_image_set_device_timestamp_usec = k4a_dll.k4a_image_set_device_timestamp_usec
-    _k4a_image_set_device_timestamp_usec.restype = None
-    _k4a_image_set_device_timestamp_usec.argtypes = (
-        k4a_image_t,
-        ctypes.c_uint64,
-    )
-
-    _k4a_image_set_device_timestamp_usec(image_handle, timestamp_usec)
+    k4a_dll.k4a_image_set_device_timestamp_usec(image_handle, timestamp_usec)
 
 
 def k4a_image_set_timestamp_usec(image_handle: k4a_image_t, timestamp_usec: ctypes.c_uint64) -> None:
@@ -873,14 +751,7 @@ def k4a_image_set_timestamp_usec(image_handle: k4a_image_t, timestamp_usec: ctyp
     """
     # K4A_DEPRECATED_EXPORT void k4a_image_set_timestamp_usec(k4a_image_t image_handle, uint64_t timestamp_usec);
 
-    _k4a_image_set_timestamp_usec = k4a_dll.k4a_image_set_timestamp_usec
-    _k4a_image_set_timestamp_usec.restype = None
-    _k4a_image_set_timestamp_usec.argtypes = (
-        k4a_image_t,
-        ctypes.c_uint64,
-    )
-
-    _k4a_image_set_timestamp_usec(image_handle, timestamp_usec)
+    k4a_dll.k4a_image_set_timestamp_usec(image_handle, timestamp_usec)
 
 
 def k4a_image_set_system_timestamp_nsec(image_handle: k4a_image_t, timestamp_nsec: ctypes.c_uint64) -> None:
@@ -899,14 +770,7 @@ def k4a_image_set_system_timestamp_nsec(image_handle: k4a_image_t, timestamp_nse
     """
     # K4A_EXPORT void k4a_image_set_system_timestamp_nsec(k4a_image_t image_handle, uint64_t timestamp_nsec);
 
-    _k4a_image_set_system_timestamp_nsec = k4a_dll.k4a_image_set_system_timestamp_nsec
-    _k4a_image_set_system_timestamp_nsec.restype = None
-    _k4a_image_set_system_timestamp_nsec.argtypes = (
-        k4a_image_t,
-        ctypes.c_uint64,
-    )
-
-    _k4a_image_set_system_timestamp_nsec(image_handle, timestamp_nsec)
+    k4a_dll.k4a_image_set_system_timestamp_nsec(image_handle, timestamp_nsec)
 
 
 def k4a_image_set_exposure_usec(image_handle: k4a_image_t, exposure_usec: ctypes.c_uint64) -> None:
@@ -923,14 +787,7 @@ def k4a_image_set_exposure_usec(image_handle: k4a_image_t, exposure_usec: ctypes
     """
     # K4A_EXPORT void k4a_image_set_exposure_usec(k4a_image_t image_handle, uint64_t exposure_usec);
 
-    _k4a_image_set_exposure_usec = k4a_dll.k4a_image_set_exposure_usec
-    _k4a_image_set_exposure_usec.restype = None
-    _k4a_image_set_exposure_usec.argtypes = (
-        k4a_image_t,
-        ctypes.c_uint64,
-    )
-
-    _k4a_image_set_exposure_usec(image_handle, exposure_usec)
+    k4a_dll.k4a_image_set_exposure_usec(image_handle, exposure_usec)
 
 
 def k4a_image_set_exposure_time_usec(image_handle: k4a_image_t, exposure_usec: ctypes.c_uint64) -> None:
@@ -950,14 +807,7 @@ def k4a_image_set_exposure_time_usec(image_handle: k4a_image_t, exposure_usec: c
     """
     # K4A_DEPRECATED_EXPORT void k4a_image_set_exposure_time_usec(k4a_image_t image_handle, uint64_t exposure_usec);
 
-    _k4a_image_set_exposure_time_usec = k4a_dll.k4a_image_set_exposure_time_usec
-    _k4a_image_set_exposure_time_usec.restype = None
-    _k4a_image_set_exposure_time_usec.argtypes = (
-        k4a_image_t,
-        ctypes.c_uint64,
-    )
-
-    _k4a_image_set_exposure_time_usec(image_handle, exposure_usec)
+    k4a_dll.k4a_image_set_exposure_time_usec(image_handle, exposure_usec)
 
 
 def k4a_image_set_white_balance(image_handle: k4a_image_t, white_balance: ctypes.c_uint32) -> None:
@@ -974,14 +824,7 @@ def k4a_image_set_white_balance(image_handle: k4a_image_t, white_balance: ctypes
     """
     # K4A_EXPORT void k4a_image_set_white_balance(k4a_image_t image_handle, uint32_t white_balance);
 
-    _k4a_image_set_white_balance = k4a_dll.k4a_image_set_white_balance
-    _k4a_image_set_white_balance.restype = None
-    _k4a_image_set_white_balance.argtypes = (
-        k4a_image_t,
-        ctypes.c_uint32,
-    )
-
-    _k4a_image_set_white_balance(image_handle, white_balance)
+    k4a_dll.k4a_image_set_white_balance(image_handle, white_balance)
 
 
 def k4a_image_set_iso_speed(image_handle: k4a_image_t, iso_speed: ctypes.c_uint32) -> None:
@@ -998,14 +841,7 @@ def k4a_image_set_iso_speed(image_handle: k4a_image_t, iso_speed: ctypes.c_uint3
     """
     # K4A_EXPORT void k4a_image_set_iso_speed(k4a_image_t image_handle, uint32_t iso_speed);
 
-    _k4a_image_set_iso_speed = k4a_dll.k4a_image_set_iso_speed
-    _k4a_image_set_iso_speed.restype = None
-    _k4a_image_set_iso_speed.argtypes = (
-        k4a_image_t,
-        ctypes.c_uint32,
-    )
-
-    _k4a_image_set_iso_speed(image_handle, iso_speed)
+    k4a_dll.k4a_image_set_iso_speed(image_handle, iso_speed)
 
 
 def k4a_image_reference(image_handle: k4a_image_t) -> None:
@@ -1020,11 +856,7 @@ def k4a_image_reference(image_handle: k4a_image_t) -> None:
     """
     # K4A_EXPORT void k4a_image_reference(k4a_image_t image_handle);
 
-    _k4a_image_reference = k4a_dll.k4a_image_reference
-    _k4a_image_reference.restype = None
-    _k4a_image_reference.argtypes = (k4a_image_t,)
-
-    _k4a_image_reference(image_handle)
+    k4a_dll.k4a_image_reference(image_handle)
 
 
 def k4a_image_release(image_handle: k4a_image_t) -> None:
@@ -1039,11 +871,7 @@ def k4a_image_release(image_handle: k4a_image_t) -> None:
     """
     # K4A_EXPORT void k4a_image_release(k4a_image_t image_handle);
 
-    _k4a_image_release = k4a_dll.k4a_image_release
-    _k4a_image_release.restype = None
-    _k4a_image_release.argtypes = (k4a_image_t,)
-
-    _k4a_image_release(image_handle)
+    k4a_dll.k4a_image_release(image_handle)
 
 
 def k4a_device_start_cameras(
@@ -1067,14 +895,7 @@ def k4a_device_start_cameras(
     """
     # K4A_EXPORT k4a_result_t k4a_device_start_cameras(k4a_device_t device_handle, const k4a_device_configuration_t *config);
 
-    _k4a_device_start_cameras = k4a_dll.k4a_device_start_cameras
-    _k4a_device_start_cameras.restype = k4a_result_t
-    _k4a_device_start_cameras.argtypes = (
-        k4a_device_t,
-        ctypes.POINTER(k4a_device_configuration_t),
-    )
-
-    return _k4a_device_start_cameras(device_handle, config)
+    return k4a_dll.k4a_device_start_cameras(device_handle, config)
 
 
 def k4a_device_stop_cameras(device_handle: k4a_device_t) -> None:
@@ -1093,11 +914,7 @@ def k4a_device_stop_cameras(device_handle: k4a_device_t) -> None:
     """
     # K4A_EXPORT void k4a_device_stop_cameras(k4a_device_t device_handle);
 
-    _k4a_device_stop_cameras = k4a_dll.k4a_device_stop_cameras
-    _k4a_device_stop_cameras.restype = None
-    _k4a_device_stop_cameras.argtypes = (k4a_device_t,)
-
-    _k4a_device_stop_cameras(device_handle)
+    k4a_dll.k4a_device_stop_cameras(device_handle)
 
 
 def k4a_device_start_imu(device_handle: k4a_device_t) -> k4a_result_t:
@@ -1119,11 +936,7 @@ def k4a_device_start_imu(device_handle: k4a_device_t) -> k4a_result_t:
     """
     # K4A_EXPORT k4a_result_t k4a_device_start_imu(k4a_device_t device_handle);
 
-    _k4a_device_start_imu = k4a_dll.k4a_device_start_imu
-    _k4a_device_start_imu.restype = k4a_result_t
-    _k4a_device_start_imu.argtypes = (k4a_device_t,)
-
-    return _k4a_device_start_imu(device_handle)
+    return k4a_dll.k4a_device_start_imu(device_handle)
 
 
 def k4a_device_stop_imu(device_handle: k4a_device_t) -> None:
@@ -1142,11 +955,7 @@ def k4a_device_stop_imu(device_handle: k4a_device_t) -> None:
     """
     # K4A_EXPORT void k4a_device_stop_imu(k4a_device_t device_handle);
 
-    _k4a_device_stop_imu = k4a_dll.k4a_device_stop_imu
-    _k4a_device_stop_imu.restype = None
-    _k4a_device_stop_imu.argtypes = (k4a_device_t,)
-
-    _k4a_device_stop_imu(device_handle)
+    k4a_dll.k4a_device_stop_imu(device_handle)
 
 
 def k4a_device_get_serialnum(
@@ -1179,15 +988,7 @@ def k4a_device_get_serialnum(
             All other failures return `K4A_BUFFER_RESULT_FAILED`.
     """
 
-    _k4a_device_get_serialnum = k4a_dll.k4a_device_get_serialnum
-    _k4a_device_get_serialnum.restype = k4a_buffer_result_t
-    _k4a_device_get_serialnum.argtypes = (
-        k4a_device_t,
-        ctypes.c_char_p,
-        ctypes.POINTER(ctypes.c_size_t),
-    )
-
-    return _k4a_device_get_serialnum(device_handle, serial_number, serial_number_size)
+    return k4a_dll.k4a_device_get_serialnum(device_handle, serial_number, serial_number_size)
 
 
 def k4a_device_get_version(
@@ -1206,14 +1007,7 @@ def k4a_device_get_version(
     """
     # K4A_EXPORT k4a_result_t k4a_device_get_version(k4a_device_t device_handle, k4a_hardware_version_t *version);
 
-    _k4a_device_get_version = k4a_dll.k4a_device_get_version
-    _k4a_device_get_version.restype = k4a_result_t
-    _k4a_device_get_version.argtypes = (
-        k4a_device_t,
-        ctypes.POINTER(k4a_hardware_version_t),
-    )
-
-    return _k4a_device_get_version(device_handle, hardware_version)
+    return k4a_dll.k4a_device_get_version(device_handle, hardware_version)
 
 
 def k4a_device_get_color_control_capabilities(
@@ -1250,20 +1044,7 @@ def k4a_device_get_color_control_capabilities(
             if an error occurred.
     """
 
-    _k4a_device_get_color_control_capabilities = k4a_dll.k4a_device_get_color_control_capabilities
-    _k4a_device_get_color_control_capabilities.restype = k4a_result_t
-    _k4a_device_get_color_control_capabilities.argtypes = (
-        k4a_device_t,
-        k4a_color_control_command_t,
-        ctypes.POINTER(ctypes.c_bool),
-        ctypes.POINTER(ctypes.c_int32),
-        ctypes.POINTER(ctypes.c_int32),
-        ctypes.POINTER(ctypes.c_int32),
-        ctypes.POINTER(ctypes.c_int32),
-        ctypes.POINTER(k4a_color_control_mode_t),
-    )
-
-    return _k4a_device_get_color_control_capabilities(
+    return k4a_dll.k4a_device_get_color_control_capabilities(
         device_handle,
         command,
         supports_auto,
@@ -1307,16 +1088,7 @@ def k4a_device_get_color_control(
             if an error occurred.
     """
 
-    _k4a_device_get_color_control = k4a_dll.k4a_device_get_color_control
-    _k4a_device_get_color_control.restype = k4a_result_t
-    _k4a_device_get_color_control.argtypes = (
-        k4a_device_t,
-        k4a_color_control_command_t,
-        ctypes.POINTER(k4a_color_control_mode_t),
-        ctypes.POINTER(ctypes.c_int32),
-    )
-
-    return _k4a_device_get_color_control(device_handle, command, mode, value)
+    return k4a_dll.k4a_device_get_color_control(device_handle, command, mode, value)
 
 
 def k4a_device_set_color_control(
@@ -1350,16 +1122,7 @@ def k4a_device_set_color_control(
             if an error occurred.
     """
 
-    _k4a_device_set_color_control = k4a_dll.k4a_device_set_color_control
-    _k4a_device_set_color_control.restype = k4a_result_t
-    _k4a_device_set_color_control.argtypes = (
-        k4a_device_t,
-        k4a_color_control_command_t,
-        k4a_color_control_mode_t,
-        ctypes.c_int32,
-    )
-
-    return _k4a_device_set_color_control(device_handle, command, mode, value)
+    return k4a_dll.k4a_device_set_color_control(device_handle, command, mode, value)
 
 
 def k4a_device_get_raw_calibration(
@@ -1388,15 +1151,7 @@ def k4a_device_get_raw_calibration(
             buffer size needed to capture the calibration data.
     """
 
-    _k4a_device_get_raw_calibration = k4a_dll.k4a_device_get_raw_calibration
-    _k4a_device_get_raw_calibration.restype = k4a_buffer_result_t
-    _k4a_device_get_raw_calibration.argtypes = (
-        k4a_device_t,
-        ctypes.POINTER(ctypes.c_uint8),
-        ctypes.POINTER(ctypes.c_size_t),
-    )
-
-    return _k4a_device_get_raw_calibration(device_handle, data, data_size)
+    return k4a_dll.k4a_device_get_raw_calibration(device_handle, data, data_size)
 
 
 def k4a_device_get_calibration(
@@ -1424,16 +1179,7 @@ def k4a_device_get_calibration(
             `K4A_RESULT_FAILED` otherwise.
     """
 
-    _k4a_device_get_calibration = k4a_dll.k4a_device_get_calibration
-    _k4a_device_get_calibration.restype = k4a_result_t
-    _k4a_device_get_calibration.argtypes = (
-        k4a_device_t,
-        k4a_depth_mode_t,
-        k4a_color_resolution_t,
-        ctypes.POINTER(k4a_calibration_t),
-    )
-
-    return _k4a_device_get_calibration(device_handle, depth_mode, color_resolution, calibration)
+    return k4a_dll.k4a_device_get_calibration(device_handle, depth_mode, color_resolution, calibration)
 
 
 def k4a_device_get_sync_jack(
@@ -1460,15 +1206,7 @@ def k4a_device_get_sync_jack(
         k4a_result_t: `K4A_RESULT_SUCCEEDED` if the connector status was successfully read.
     """
 
-    _k4a_device_get_sync_jack = k4a_dll.k4a_device_get_sync_jack
-    _k4a_device_get_sync_jack.restype = k4a_result_t
-    _k4a_device_get_sync_jack.argtypes = (
-        k4a_device_t,
-        ctypes.POINTER(ctypes.c_bool),
-        ctypes.POINTER(ctypes.c_bool),
-    )
-
-    return _k4a_device_get_sync_jack(device_handle, sync_in_jack_connected, sync_out_jack_connected)
+    return k4a_dll.k4a_device_get_sync_jack(device_handle, sync_in_jack_connected, sync_out_jack_connected)
 
 
 def k4a_calibration_get_from_raw(
@@ -1501,17 +1239,7 @@ def k4a_calibration_get_from_raw(
             `K4A_RESULT_FAILED` otherwise.
     """
 
-    _k4a_calibration_get_from_raw = k4a_dll.k4a_calibration_get_from_raw
-    _k4a_calibration_get_from_raw.restype = k4a_result_t
-    _k4a_calibration_get_from_raw.argtypes = (
-        ctypes.POINTER(ctypes.c_char),
-        ctypes.c_size_t,
-        k4a_depth_mode_t,
-        k4a_color_resolution_t,
-        ctypes.POINTER(k4a_calibration_t),
-    )
-
-    return _k4a_calibration_get_from_raw(
+    return k4a_dll.k4a_calibration_get_from_raw(
         raw_calibration, raw_calibration_size, depth_mode, color_resolution, calibration
     )
 
@@ -1545,17 +1273,7 @@ def k4a_calibration_3d_to_3d(
             `K4A_RESULT_FAILED` if `calibration` contained invalid transformation parameters.
     """
 
-    _k4a_calibration_3d_to_3d = k4a_dll.k4a_calibration_3d_to_3d
-    _k4a_calibration_3d_to_3d.restype = k4a_result_t
-    _k4a_calibration_3d_to_3d.argtypes = (
-        ctypes.POINTER(k4a_calibration_t),
-        ctypes.POINTER(k4a_float3_t),
-        k4a_calibration_type_t,
-        k4a_calibration_type_t,
-        ctypes.POINTER(k4a_float3_t),
-    )
-
-    return _k4a_calibration_3d_to_3d(calibration, source_point3d_mm, source_camera, target_camera, target_point3d_mm)
+    return k4a_dll.k4a_calibration_3d_to_3d(calibration, source_point3d_mm, source_camera, target_camera, target_point3d_mm)
 
 
 def k4a_calibration_2d_to_3d(
@@ -1602,19 +1320,7 @@ def k4a_calibration_2d_to_3d(
             `target_point3d_mm` are outside of the range of valid calibration and should be ignored.
     """
 
-    _k4a_calibration_2d_to_3d = k4a_dll.k4a_calibration_2d_to_3d
-    _k4a_calibration_2d_to_3d.restype = k4a_result_t
-    _k4a_calibration_2d_to_3d.argtypes = (
-        ctypes.POINTER(k4a_calibration_t),
-        ctypes.POINTER(k4a_float2_t),
-        ctypes.c_float,
-        k4a_calibration_type_t,
-        k4a_calibration_type_t,
-        ctypes.POINTER(k4a_float3_t),
-        ctypes.POINTER(ctypes.c_int),
-    )
-
-    return _k4a_calibration_2d_to_3d(
+    return k4a_dll.k4a_calibration_2d_to_3d(
         calibration,
         source_point2d,
         source_depth_mm,
@@ -1665,18 +1371,7 @@ def k4a_calibration_3d_to_2d(
             of valid calibration and should be ignored.
     """
 
-    _k4a_calibration_3d_to_2d = k4a_dll.k4a_calibration_3d_to_2d
-    _k4a_calibration_3d_to_2d.restype = k4a_result_t
-    _k4a_calibration_3d_to_2d.argtypes = (
-        ctypes.POINTER(k4a_calibration_t),
-        ctypes.POINTER(k4a_float3_t),
-        k4a_calibration_type_t,
-        k4a_calibration_type_t,
-        ctypes.POINTER(k4a_float2_t),
-        ctypes.POINTER(ctypes.c_int),
-    )
-
-    return _k4a_calibration_3d_to_2d(
+    return k4a_dll.k4a_calibration_3d_to_2d(
         calibration,
         source_point3d_mm,
         source_camera,
@@ -1732,19 +1427,7 @@ def k4a_calibration_2d_to_2d(
             and should be ignored.
     """
 
-    _k4a_calibration_2d_to_2d = k4a_dll.k4a_calibration_2d_to_2d
-    _k4a_calibration_2d_to_2d.restype = k4a_result_t
-    _k4a_calibration_2d_to_2d.argtypes = (
-        ctypes.POINTER(k4a_calibration_t),
-        ctypes.POINTER(k4a_float2_t),
-        ctypes.c_float,
-        k4a_calibration_type_t,
-        k4a_calibration_type_t,
-        ctypes.POINTER(k4a_float2_t),
-        ctypes.POINTER(ctypes.c_int),
-    )
-
-    return _k4a_calibration_2d_to_2d(
+    return k4a_dll.k4a_calibration_2d_to_2d(
         calibration,
         source_point2d,
         source_depth_mm,
@@ -1794,17 +1477,7 @@ def k4a_calibration_color_2d_to_depth_2d(
             calibration and should be ignored.
     """
 
-    _k4a_calibration_color_2d_to_depth_2d = k4a_dll.k4a_calibration_color_2d_to_depth_2d
-    _k4a_calibration_color_2d_to_depth_2d.restype = k4a_result_t
-    _k4a_calibration_color_2d_to_depth_2d.argtypes = (
-        ctypes.POINTER(k4a_calibration_t),
-        ctypes.POINTER(k4a_float2_t),
-        k4a_image_t,
-        ctypes.POINTER(k4a_float2_t),
-        ctypes.POINTER(ctypes.c_int),
-    )
-
-    return _k4a_calibration_color_2d_to_depth_2d(calibration, source_point2d, depth_image, target_point2d, valid)
+    return k4a_dll.k4a_calibration_color_2d_to_depth_2d(calibration, source_point2d, depth_image, target_point2d, valid)
 
 
 def k4a_transformation_create(calibration: ctypes.POINTER(k4a_calibration_t)) -> k4a_transformation_t:
@@ -1825,11 +1498,7 @@ def k4a_transformation_create(calibration: ctypes.POINTER(k4a_calibration_t)) ->
     """
     # K4A_EXPORT k4a_transformation_t k4a_transformation_create(const k4a_calibration_t *calibration);
 
-    _k4a_transformation_create = k4a_dll.k4a_transformation_create
-    _k4a_transformation_create.restype = k4a_transformation_t
-    _k4a_transformation_create.argtypes = (ctypes.POINTER(k4a_calibration_t),)
-
-    return _k4a_transformation_create(calibration)
+    return k4a_dll.k4a_transformation_create(calibration)
 
 
 def k4a_transformation_destroy(transformation_handle: k4a_transformation_t) -> None:
@@ -1841,11 +1510,7 @@ def k4a_transformation_destroy(transformation_handle: k4a_transformation_t) -> N
     """
     # K4A_EXPORT void k4a_transformation_destroy(k4a_transformation_t transformation_handle);
 
-    _k4a_transformation_destroy = k4a_dll.k4a_transformation_destroy
-    _k4a_transformation_destroy.restype = None
-    _k4a_transformation_destroy.argtypes = (k4a_transformation_t,)
-
-    _k4a_transformation_destroy(transformation_handle)
+    k4a_dll.k4a_transformation_destroy(transformation_handle)
 
 
 def k4a_transformation_depth_image_to_color_camera(
@@ -1879,15 +1544,7 @@ def k4a_transformation_depth_image_to_color_camera(
             and `K4A_RESULT_FAILED` otherwise.
     """
 
-    _k4a_transformation_depth_image_to_color_camera = k4a_dll.k4a_transformation_depth_image_to_color_camera
-    _k4a_transformation_depth_image_to_color_camera.restype = k4a_result_t
-    _k4a_transformation_depth_image_to_color_camera.argtypes = (
-        k4a_transformation_t,
-        k4a_image_t,
-        k4a_image_t,
-    )
-
-    _k4a_transformation_depth_image_to_color_camera(transformation_handle, depth_image, transformed_depth_image)
+    k4a_dll.k4a_transformation_depth_image_to_color_camera(transformation_handle, depth_image, transformed_depth_image)
 
 
 def k4a_transformation_depth_image_to_color_camera_custom(
@@ -1949,21 +1606,7 @@ def k4a_transformation_depth_image_to_color_camera_custom(
             were successfully written and `K4A_RESULT_FAILED` otherwise.
     """
 
-    _k4a_transformation_depth_image_to_color_camera_custom = (
-        k4a_dll.k4a_transformation_depth_image_to_color_camera_custom
-    )
-    _k4a_transformation_depth_image_to_color_camera_custom.restype = k4a_result_t
-    _k4a_transformation_depth_image_to_color_camera_custom.argtypes = (
-        k4a_transformation_t,
-        k4a_image_t,
-        k4a_image_t,
-        k4a_image_t,
-        k4a_image_t,
-        k4a_transformation_interpolation_type_t,
-        ctypes.c_uint32,
-    )
-
-    return _k4a_transformation_depth_image_to_color_camera_custom(
+    return k4a_dll.k4a_transformation_depth_image_to_color_camera_custom(
         transformation_handle,
         depth_image,
         custom_image,
@@ -2010,16 +1653,7 @@ def k4a_transformation_color_image_to_depth_camera(
             and `K4A_RESULT_FAILED` otherwise.
     """
 
-    _k4a_transformation_color_image_to_depth_camera = k4a_dll.k4a_transformation_color_image_to_depth_camera
-    _k4a_transformation_color_image_to_depth_camera.restype = k4a_result_t
-    _k4a_transformation_color_image_to_depth_camera.argtypes = (
-        k4a_transformation_t,
-        k4a_image_t,
-        k4a_image_t,
-        k4a_image_t,
-    )
-
-    return _k4a_transformation_color_image_to_depth_camera(
+    return k4a_dll.k4a_transformation_color_image_to_depth_camera(
         transformation_handle, depth_image, color_image, transformed_color_image
     )
 
@@ -2062,16 +1696,199 @@ def k4a_transformation_depth_image_to_point_cloud(
             `K4A_RESULT_FAILED` otherwise.
     """
 
-    _k4a_transformation_depth_image_to_point_cloud = k4a_dll.k4a_transformation_depth_image_to_point_cloud
-    _k4a_transformation_depth_image_to_point_cloud.restype = k4a_result_t
-    _k4a_transformation_depth_image_to_point_cloud.argtypes = (
-        k4a_transformation_t,
-        k4a_image_t,
-        k4a_calibration_type_t,
-        k4a_image_t,
-    )
-
-    return _k4a_transformation_depth_image_to_point_cloud(transformation_handle, depth_image, camera, xyz_image)
+    return k4a_dll.k4a_transformation_depth_image_to_point_cloud(transformation_handle, depth_image, camera, xyz_image)
+
+
+# Prototypes of the exported functions, bound once in `setup_library()`
+_k4a_prototypes = {
+    "k4a_device_get_installed_count": (ctypes.c_uint32, ()),
+    "k4a_device_open": (ctypes.c_int, (ctypes.c_uint32, ctypes.POINTER(k4a_device_t))),
+    "k4a_device_close": (None, (k4a_device_t,)),
+    "k4a_device_get_capture": (ctypes.c_int, (k4a_device_t, ctypes.POINTER(k4a_capture_t), ctypes.c_int32)),
+    "k4a_device_get_imu_sample": (ctypes.c_int, (k4a_device_t, ctypes.POINTER(k4a_imu_sample_t), ctypes.c_int32)),
+    "k4a_capture_create": (k4a_result_t, (ctypes.POINTER(k4a_capture_t),)),
+    "k4a_capture_release": (None, (k4a_capture_t,)),
+    "k4a_capture_reference": (None, (k4a_capture_t,)),
+    "k4a_capture_get_color_image": (k4a_image_t, (k4a_capture_t,)),
+    "k4a_capture_get_depth_image": (k4a_image_t, (k4a_capture_t,)),
+    "k4a_capture_get_ir_image": (k4a_image_t, (k4a_capture_t,)),
+    "k4a_capture_set_color_image": (None, (k4a_capture_t, k4a_image_t)),
+    "k4a_capture_set_depth_image": (None, (k4a_capture_t, k4a_image_t)),
+    "k4a_capture_set_ir_image": (None, (k4a_capture_t, k4a_image_t)),
+    "k4a_capture_set_temperature_c": (None, (k4a_capture_t, ctypes.c_float)),
+    "k4a_capture_get_temperature_c": (ctypes.c_float, (k4a_capture_t,)),
+    "k4a_image_create": (
+        k4a_result_t,
+        (k4a_image_format_t, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.POINTER(k4a_image_t)),
+    ),
+    "k4a_image_create_from_buffer": (
+        k4a_result_t,
+        (
+            k4a_image_format_t,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.POINTER(ctypes.c_uint8),
+            ctypes.c_size_t,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.POINTER(k4a_image_t),
+        ),
+    ),
+    "k4a_image_get_buffer": (ctypes.POINTER(ctypes.c_uint8), (k4a_image_t,)),
+    "k4a_image_get_size": (ctypes.c_size_t, (k4a_image_t,)),
+    "k4a_image_get_format": (k4a_image_format_t, (k4a_image_t,)),
+    "k4a_image_get_width_pixels": (ctypes.c_int, (k4a_image_t,)),
+    "k4a_image_get_height_pixels": (ctypes.c_int, (k4a_image_t,)),
+    "k4a_image_get_stride_bytes": (ctypes.c_int, (k4a_image_t,)),
+    "k4a_image_get_timestamp_usec": (ctypes.c_uint64, (k4a_image_t,)),
+    "k4a_image_get_device_timestamp_usec": (ctypes.c_uint64, (k4a_image_t,)),
+    "k4a_image_get_system_timestamp_nsec": (ctypes.c_uint64, (k4a_image_t,)),
+    "k4a_image_get_exposure_usec": (ctypes.c_uint64, (k4a_image_t,)),
+    "k4a_image_get_white_balance": (ctypes.c_uint32, (k4a_image_t,)),
+    "k4a_image_get_iso_speed": (ctypes.c_uint32, (k4a_image_t,)),
+    "k4a_image_set_device_timestamp_usec": (None, (k4a_image_t, ctypes.c_uint64)),
+    "k4a_image_set_timestamp_usec": (None, (k4a_image_t, ctypes.c_uint64)),
+    "k4a_image_set_system_timestamp_nsec": (None, (k4a_image_t, ctypes.c_uint64)),
+    "k4a_image_set_exposure_usec": (None, (k4a_image_t, ctypes.c_uint64)),
+    "k4a_image_set_exposure_time_usec": (None, (k4a_image_t, ctypes.c_uint64)),
+    "k4a_image_set_white_balance": (None, (k4a_image_t, ctypes.c_uint32)),
+    "k4a_image_set_iso_speed": (None, (k4a_image_t, ctypes.c_uint32)),
+    "k4a_image_reference": (None, (k4a_image_t,)),
+    "k4a_image_release": (None, (k4a_image_t,)),
+    "k4a_device_start_cameras": (k4a_result_t, (k4a_device_t, ctypes.POINTER(k4a_device_configuration_t))),
+    "k4a_device_stop_cameras": (None, (k4a_device_t,)),
+    "k4a_device_start_imu": (k4a_result_t, (k4a_device_t,)),
+    "k4a_device_stop_imu": (None, (k4a_device_t,)),
+    "k4a_device_get_serialnum": (k4a_buffer_result_t, (k4a_device_t, ctypes.c_char_p, ctypes.POINTER(ctypes.c_size_t))),
+    "k4a_device_get_version": (k4a_result_t, (k4a_device_t, ctypes.POINTER(k4a_hardware_version_t))),
+    "k4a_device_get_color_control_capabilities": (
+        k4a_result_t,
+        (
+            k4a_device_t,
+            k4a_color_control_command_t,
+            ctypes.POINTER(ctypes.c_bool),
+            ctypes.POINTER(ctypes.c_int32),
+            ctypes.POINTER(ctypes.c_int32),
+            ctypes.POINTER(ctypes.c_int32),
+            ctypes.POINTER(ctypes.c_int32),
+            ctypes.POINTER(k4a_color_control_mode_t),
+        ),
+    ),
+    "k4a_device_get_color_control": (
+        k4a_result_t,
+        (
+            k4a_device_t,
+            k4a_color_control_command_t,
+            ctypes.POINTER(k4a_color_control_mode_t),
+            ctypes.POINTER(ctypes.c_int32),
+        ),
+    ),
+    "k4a_device_set_color_control": (
+        k4a_result_t,
+        (k4a_device_t, k4a_color_control_command_t, k4a_color_control_mode_t, ctypes.c_int32),
+    ),
+    "k4a_device_get_raw_calibration": (
+        k4a_buffer_result_t,
+        (k4a_device_t, ctypes.POINTER(ctypes.c_uint8), ctypes.POINTER(ctypes.c_size_t)),
+    ),
+    "k4a_device_get_calibration": (
+        k4a_result_t,
+        (k4a_device_t, k4a_depth_mode_t, k4a_color_resolution_t, ctypes.POINTER(k4a_calibration_t)),
+    ),
+    "k4a_device_get_sync_jack": (
+        k4a_result_t,
+        (k4a_device_t, ctypes.POINTER(ctypes.c_bool), ctypes.POINTER(ctypes.c_bool)),
+    ),
+    "k4a_calibration_get_from_raw": (
+        k4a_result_t,
+        (
+            ctypes.POINTER(ctypes.c_char),
+            ctypes.c_size_t,
+            k4a_depth_mode_t,
+            k4a_color_resolution_t,
+            ctypes.POINTER(k4a_calibration_t),
+        ),
+    ),
+    "k4a_calibration_3d_to_3d": (
+        k4a_result_t,
+        (
+            ctypes.POINTER(k4a_calibration_t),
+            ctypes.POINTER(k4a_float3_t),
+            k4a_calibration_type_t,
+            k4a_calibration_type_t,
+            ctypes.POINTER(k4a_float3_t),
+        ),
+    ),
+    "k4a_calibration_2d_to_3d": (
+        k4a_result_t,
+        (
+            ctypes.POINTER(k4a_calibration_t),
+            ctypes.POINTER(k4a_float2_t),
+            ctypes.c_float,
+            k4a_calibration_type_t,
+            k4a_calibration_type_t,
+            ctypes.POINTER(k4a_float3_t),
+            ctypes.POINTER(ctypes.c_int),
+        ),
+    ),
+    "k4a_calibration_3d_to_2d": (
+        k4a_result_t,
+        (
+            ctypes.POINTER(k4a_calibration_t),
+            ctypes.POINTER(k4a_float3_t),
+            k4a_calibration_type_t,
+            k4a_calibration_type_t,
+            ctypes.POINTER(k4a_float2_t),
+            ctypes.POINTER(ctypes.c_int),
+        ),
+    ),
+    "k4a_calibration_2d_to_2d": (
+        k4a_result_t,
+        (
+            ctypes.POINTER(k4a_calibration_t),
+            ctypes.POINTER(k4a_float2_t),
+            ctypes.c_float,
+            k4a_calibration_type_t,
+            k4a_calibration_type_t,
+            ctypes.POINTER(k4a_float2_t),
+            ctypes.POINTER(ctypes.c_int),
+        ),
+    ),
+    "k4a_calibration_color_2d_to_depth_2d": (
+        k4a_result_t,
+        (
+            ctypes.POINTER(k4a_calibration_t),
+            ctypes.POINTER(k4a_float2_t),
+            k4a_image_t,
+            ctypes.POINTER(k4a_float2_t),
+            ctypes.POINTER(ctypes.c_int),
+        ),
+    ),
+    "k4a_transformation_create": (k4a_transformation_t, (ctypes.POINTER(k4a_calibration_t),)),
+    "k4a_transformation_destroy": (None, (k4a_transformation_t,)),
+    "k4a_transformation_depth_image_to_color_camera": (k4a_result_t, (k4a_transformation_t, k4a_image_t, k4a_image_t)),
+    "k4a_transformation_depth_image_to_color_camera_custom": (
+        k4a_result_t,
+        (
+            k4a_transformation_t,
+            k4a_image_t,
+            k4a_image_t,
+            k4a_image_t,
+            k4a_image_t,
+            k4a_transformation_interpolation_type_t,
+            ctypes.c_uint32,
+        ),
+    ),
+    "k4a_transformation_color_image_to_depth_camera": (
+        k4a_result_t,
+        (k4a_transformation_t, k4a_image_t, k4a_image_t, k4a_image_t),
+    ),
+    "k4a_transformation_depth_image_to_point_cloud": (
+        k4a_result_t,
+        (k4a_transformation_t, k4a_image_t, k4a_calibration_type_t, k4a_image_t),
+    ),
+}
 
 
 def VERIFY(result, error):
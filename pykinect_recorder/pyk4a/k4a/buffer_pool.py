@@ -0,0 +1,113 @@
+import sys
+import weakref
+import threading
+from collections import deque
+
+import numpy as np
+
+
+class BufferPool:
+    """Recycles frame sized NumPy arrays between the decode, colorize and display stages.
+
+    Buffers are keyed by (shape, dtype). :meth:`release` gives a buffer back right away, while
+    :meth:`release_when_unused` parks it until nothing else references it anymore, e.g. a ``QImage``
+    wrapping it that is still waiting in the GUI event queue. Arrays the pool did not hand out (or that
+    were already released) are ignored by :meth:`release`.
+
+    Args:
+        max_buffers (int): Maximum number of idle buffers kept, released buffers above it are dropped.
+    """
+
+    def __init__(self, max_buffers=32):
+        self.max_buffers = max_buffers
+
+        self.hits = 0
+        self.misses = 0
+        self.high_water = 0
+
+        self._free = {}
+        self._free_count = 0
+        self._in_use = 0
+        self._pending = deque()
+        # Handed out buffers by id, weak so that a buffer dropped without release doesn't leak
+        self._acquired = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def acquire(self, shape, dtype=np.uint8):
+        """Get an uninitialized buffer, reused if an idle one of the same shape and dtype exists."""
+        key = (tuple(shape), np.dtype(dtype))
+        self.collect()
+
+        with self._lock:
+            buffers = self._free.get(key)
+            if buffers:
+                buffer = buffers.pop()
+                self._free_count -= 1
+                self.hits += 1
+            else:
+                buffer = None
+                self.misses += 1
+
+            self._in_use += 1
+            self.high_water = max(self.high_water, self._in_use)
+
+        if buffer is None:
+            buffer = np.empty(key[0], dtype=key[1])
+        with self._lock:
+            self._acquired[id(buffer)] = buffer
+
+        return buffer
+
+    def owns(self, buffer):
+        """Whether `buffer` was handed out by :meth:`acquire` and not released yet."""
+        with self._lock:
+            return self._acquired.get(id(buffer)) is buffer
+
+    def release(self, buffer):
+        """Give a buffer back to the pool, the caller must not use it anymore."""
+        with self._lock:
+            if self._acquired.get(id(buffer)) is not buffer:
+                return
+            del self._acquired[id(buffer)]
+            self._in_use -= 1
+            if self._free_count >= self.max_buffers:
+                return
+
+            self._free.setdefault((buffer.shape, buffer.dtype), []).append(buffer)
+            self._free_count += 1
+
+    def release_when_unused(self, buffer):
+        """Give a buffer back once the last outside reference to it is gone."""
+        with self._lock:
+            self._pending.append(buffer)
+
+    def collect(self):
+        """Move the parked buffers that are not referenced anymore back to the pool."""
+        unused = []
+        with self._lock:
+            for _ in range(len(self._pending)):
+                buffer = self._pending.popleft()
+                # Only `buffer` and the getrefcount argument are left
+                if sys.getrefcount(buffer) <= 2:
+                    unused.append(buffer)
+                else:
+                    self._pending.append(buffer)
+                del buffer
+
+        for buffer in unused:
+            self.release(buffer)
+
+    def clear(self):
+        with self._lock:
+            self._free.clear()
+            self._free_count = 0
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "in_use": self._in_use,
+                "free": self._free_count,
+                "high_water": self.high_water,
+            }
@@ -1,6 +1,14 @@
 import ctypes
+import threading
+
+import numpy as np
 
 from . import _k4a
+from .transformation import Transformation
+from ..utils import struct_view
+
+# Memory layout of `k4a_calibration_t`, the intrinsics parameters union has both its `param` and `v` views
+CALIBRATION_DTYPE = np.dtype(_k4a.k4a_calibration_t)
 
 
 class Calibration:
@@ -12,6 +20,8 @@ class Calibration:
 
     def __init__(self, calibration_handle: _k4a.k4a_calibration_t):
         self._handle = calibration_handle
+        self._transformation = None
+        self._transformation_lock = threading.Lock()
         self.color_params = self._handle.color_camera_calibration.intrinsics.parameters.param
         self.depth_params = self._handle.depth_camera_calibration.intrinsics.parameters.param
 
@@ -56,11 +66,27 @@ class Calibration:
     def is_valid(self):
         return self._handle
 
+    def get_view(self) -> np.void:
+        """`CALIBRATION_DTYPE` record sharing the memory of the calibration."""
+        return struct_view(self._handle, CALIBRATION_DTYPE)
+
     def handle(self):
         return self._handle
 
+    def get_transformation(self) -> Transformation:
+        """Transformation of this calibration, created on first use and shared by the captures."""
+        transformation = self._transformation
+        if transformation is None:
+            # Captures decoded on several threads ask for it at once, only one of them creates it
+            with self._transformation_lock:
+                if self._transformation is None:
+                    self._transformation = Transformation(self)
+                transformation = self._transformation
+        return transformation
+
     def reset(self):
         if self.is_valid():
+            self._transformation = None
             self._handle = None
 
     # 3D point of source_camera to 3D point of target_camera
@@ -1,50 +1,93 @@
+import threading
+
 import cv2
 
 from . import _k4a
 from .image import Image
-from .transformation import Transformation
-from ..utils import smooth_depth_image
+from ..utils import Colorizer, smooth_depth_image
+
+# 0-5100 mm is the alpha=0.05 scaling fitted by visual comparison with Azure k4aviewer results
+_depth_colorizer = Colorizer((0, 5100), cv2.COLORMAP_JET)
 
 
 class Capture:
+    """Owner of one reference on a `k4a_capture_t`.
+
+    Every Capture holds its own SDK reference: :meth:`reference` gives another owner (a thread, a ring,
+    a recorder, ...) its own, and :meth:`reset` only drops the reference of this object. The SDK frees
+    the capture once all of them are released, so releasing a capture on one thread can't free it under
+    another. The images returned by the getters hold their own references too. Calls on the handle are
+    serialized with :meth:`reset`, so a Capture can also be shared between threads.
+    """
+
+    _handle = None
+
     def __init__(self, capture_handle, calibration):
+        self._lock = threading.Lock()
         self._handle = capture_handle
         self.calibration = calibration
-        self.camera_transform = Transformation(calibration)
 
     def __del__(self):
         self.reset()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.reset()
+
+    @property
+    def camera_transform(self):
+        # Created once per calibration, an SDK transformation is expensive to set up
+        return self.calibration.get_transformation()
+
     def is_valid(self):
         return self._handle
 
     def handle(self):
         return self._handle
 
+    def reference(self):
+        """New Capture owning another reference on the same `k4a_capture_t`."""
+        with self._lock:
+            if not self._handle:
+                return Capture(None, self.calibration)
+            _k4a.k4a_capture_reference(self._handle)
+            return Capture(self._handle, self.calibration)
+
     def reset(self):
-        if self.is_valid():
-            self.release_handle()
-            self._handle = None
+        if self._handle is None:
+            return
+
+        with self._lock:
+            capture_handle, self._handle = self._handle, None
+            if capture_handle:
+                _k4a.k4a_capture_release(capture_handle)
 
     def release_handle(self):
-        if self.is_valid():
-            _k4a.k4a_capture_release(self._handle)
+        self.reset()
 
     @staticmethod
     def create():
-        handle = _k4a.k4a_capture_t
-        _k4a.VERIFY(Capture._k4a.k4a_capture_create(handle), "Create capture failed!")
+        handle = _k4a.k4a_capture_t()
+        _k4a.VERIFY(_k4a.k4a_capture_create(handle), "Create capture failed!")
+
+        return Capture(handle, None)
 
-        return Capture(handle)
+    def _get_image(self, getter):
+        with self._lock:
+            if not self._handle:
+                return Image()
+            return Image(getter(self._handle))
 
     def get_color_image_object(self):
-        return Image(_k4a.k4a_capture_get_color_image(self._handle))
+        return self._get_image(_k4a.k4a_capture_get_color_image)
 
     def get_depth_image_object(self):
-        return Image(_k4a.k4a_capture_get_depth_image(self._handle))
+        return self._get_image(_k4a.k4a_capture_get_depth_image)
 
     def get_ir_image_object(self):
-        return Image(_k4a.k4a_capture_get_ir_image(self._handle))
+        return self._get_image(_k4a.k4a_capture_get_ir_image)
 
     def get_transformed_depth_object(self):
         return self.camera_transform.depth_image_to_color_camera(self.get_depth_image_object())
@@ -62,21 +105,29 @@ class Capture:
             self.get_transformed_depth_object(), _k4a.K4A_CALIBRATION_TYPE_COLOR
         )
 
-    def get_color_image(self):
-        return self.get_color_image_object().to_numpy()
+    def get_device_timestamp_usec(self):
+        """Device timestamp of the first image present, looked up in depth, IR then color order."""
+        for image in (self.get_depth_image_object(), self.get_ir_image_object(), self.get_color_image_object()):
+            if image.is_valid():
+                return image.device_timestamp
 
-    def get_depth_image(self):
-        return self.get_depth_image_object().to_numpy()
+        return None
 
-    def get_colored_depth_image(self):
-        ret, depth_image = self.get_depth_image()
+    def get_color_image(self, copy=True, reduce=1):
+        return self.get_color_image_object().to_numpy(copy, reduce)
+
+    def get_depth_image(self, copy=True, reduce=1):
+        return self.get_depth_image_object().to_numpy(copy, reduce)
+
+    def get_colored_depth_image(self, copy=True, reduce=1):
+        ret, depth_image = self.get_depth_image(copy, reduce)
         if not ret:
             return ret, None
 
         return ret, self.color_depth_image(depth_image)
 
-    def get_ir_image(self):
-        return self.get_ir_image_object().to_numpy()
+    def get_ir_image(self, copy=True, reduce=1):
+        return self.get_ir_image_object().to_numpy(copy, reduce)
 
     def get_transformed_depth_image(self):
         return self.get_transformed_depth_object().to_numpy()
@@ -108,10 +159,5 @@ class Capture:
         return ret, points
 
     @staticmethod
-    def color_depth_image(depth_image):
-        depth_color_image = cv2.convertScaleAbs(
-            depth_image, alpha=0.05
-        )  # alpha is fitted by visual comparison with Azure k4aviewer results
-        depth_color_image = cv2.applyColorMap(depth_color_image, cv2.COLORMAP_JET)
-
-        return depth_color_image
+    def color_depth_image(depth_image, out=None):
+        return _depth_colorizer(depth_image, out=out)
@@ -0,0 +1,114 @@
+import time
+import threading
+from collections import deque
+
+from . import _k4a
+
+DROP_OLDEST = "drop_oldest"
+BLOCK = "block"
+
+
+class CaptureRingEntry:
+    __slots__ = ("capture_handle", "imu_samples", "arrival_time")
+
+    def __init__(self, capture_handle, imu_samples, arrival_time):
+        self.capture_handle = capture_handle
+        self.imu_samples = imu_samples
+        self.arrival_time = arrival_time
+
+
+class CaptureRing:
+    """Bounded FIFO of capture handles shared between the acquisition thread and one consumer.
+
+    Every queued capture holds its own ``k4a_capture_reference``; the consumer owns the handle
+    returned by :meth:`get` and must release it, overflowed and left-over entries are released here.
+
+    Args:
+        size (int): Maximum number of queued captures.
+        overflow (str): ``"drop_oldest"`` releases the oldest capture when the ring is full,
+            ``"block"`` makes the producer wait for the consumer.
+        late_threshold_sec (float, optional): Captures consumed later than this after their arrival
+            are counted as late. Defaults to None (not counted).
+    """
+
+    def __init__(self, size=4, overflow=DROP_OLDEST, late_threshold_sec=None):
+        if overflow not in (DROP_OLDEST, BLOCK):
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+
+        self.size = size
+        self.overflow = overflow
+        self.late_threshold_sec = late_threshold_sec
+
+        self.pushed_frames = 0
+        self.dropped_frames = 0
+        self.late_frames = 0
+
+        self._entries = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def __len__(self):
+        with self._condition:
+            return len(self._entries)
+
+    def put(self, capture_handle, imu_samples=(), timeout=None):
+        """Queue a capture. Returns False if it was dropped."""
+        _k4a.k4a_capture_reference(capture_handle)
+        entry = CaptureRingEntry(capture_handle, imu_samples, time.perf_counter())
+
+        with self._condition:
+            if self._closed:
+                _k4a.k4a_capture_release(capture_handle)
+                return False
+
+            if len(self._entries) >= self.size:
+                if self.overflow == DROP_OLDEST:
+                    _k4a.k4a_capture_release(self._entries.popleft().capture_handle)
+                    self.dropped_frames += 1
+                else:
+                    self._condition.wait_for(lambda: len(self._entries) < self.size or self._closed, timeout)
+                    if len(self._entries) >= self.size or self._closed:
+                        _k4a.k4a_capture_release(capture_handle)
+                        self.dropped_frames += 1
+                        return False
+
+            self._entries.append(entry)
+            self.pushed_frames += 1
+            self._condition.notify_all()
+
+        return True
+
+    def get(self, timeout=None):
+        """Pop the oldest capture, or None if the ring was closed or the timeout expired."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._entries or self._closed, timeout)
+            if not self._entries:
+                return None
+
+            entry = self._entries.popleft()
+            late_threshold_sec = self.late_threshold_sec
+            if late_threshold_sec is not None and time.perf_counter() - entry.arrival_time > late_threshold_sec:
+                self.late_frames += 1
+            self._condition.notify_all()
+
+        return entry
+
+    def close(self):
+        """Stop accepting captures and wake up waiting threads. Queued captures can still be read."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def clear(self):
+        with self._condition:
+            while self._entries:
+                _k4a.k4a_capture_release(self._entries.popleft().capture_handle)
+            self._condition.notify_all()
+
+    def get_stats(self):
+        return {
+            "queued": len(self),
+            "pushed": self.pushed_frames,
+            "dropped": self.dropped_frames,
+            "late": self.late_frames,
+        }
@@ -0,0 +1,81 @@
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Number of decode threads of the pools created without an explicit count
+DECODE_THREADS_ENV = "PYKINECT_DECODE_THREADS"
+
+
+def get_default_workers():
+    """$PYKINECT_DECODE_THREADS, otherwise one thread per core but one (for the consumer), at most 4."""
+    value = os.environ.get(DECODE_THREADS_ENV)
+    if value:
+        return max(int(value), 1)
+    return min(max((os.cpu_count() or 1) - 1, 1), 4)
+
+
+class DecodePool:
+    """Decode color images (MJPG, NV12, YUY2) on worker threads, the frames are handed back in order.
+
+    ``cv2.imdecode`` and ``cv2.cvtColor`` release the GIL, so the workers decode in parallel with each
+    other and with the consumer. :meth:`submit` takes its own reference on the image, the caller can
+    release its one right away. :meth:`map` and :meth:`imap` yield in submission order with at most
+    `max_pending` items in flight.
+
+    Args:
+        workers (int, optional): Decode threads. Defaults to :func:`get_default_workers`.
+        max_pending (int, optional): Items decoded ahead of the consumer by :meth:`imap`. Defaults to
+            twice the number of workers.
+    """
+
+    def __init__(self, workers=None, max_pending=None):
+        self.workers = workers or get_default_workers()
+        self.max_pending = max_pending or 2 * self.workers
+        self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="k4a_decode")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def submit(self, image, reduce=1, pool=None):
+        """Future of ``image.to_numpy(reduce=reduce, pool=pool)``, i.e. of `(ret, frame)`."""
+        return self._executor.submit(self._decode, image.reference(), reduce, pool)
+
+    @staticmethod
+    def _decode(image, reduce, pool):
+        with image:
+            return image.to_numpy(reduce=reduce, pool=pool)
+
+    def imap(self, function, items):
+        """`function(item)` of every item, computed on the workers and yielded in order."""
+        pending = deque()
+        for item in items:
+            pending.append(self._executor.submit(function, item))
+            if len(pending) >= self.max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    def map(self, images, reduce=1, pool=None):
+        """`(ret, frame)` of every image, in order."""
+        return self.imap(lambda image: self._decode(image, reduce, pool), (image.reference() for image in images))
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_decode_pool():
+    """Process wide pool shared by the live preview and the playback, created on first use."""
+    global _default_pool
+
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = DecodePool()
+        return _default_pool
@@ -2,31 +2,57 @@ import os
 import sys
 import ctypes
 import datetime
+import threading
 from pathlib import Path
 
+import numpy as np
+
 from . import _k4a
 from .capture import Capture
-from .imu_sample import ImuSample
+from .capture_ring import CaptureRing, DROP_OLDEST
+from .imu_sample import ImuSample, ImuSampleBuffer, IMU_SAMPLE_DTYPE, imu_samples_to_numpy
 from .calibration import Calibration
 from .configuration import Configuration
 from ..k4arecord.record import Record
+from ..k4arecord.health import RecordingHealth
 from ..k4a._k4atypes import K4A_WAIT_INFINITE
 from ..k4arecord._k4arecord import k4a_playback_get_next_capture, K4A_STREAM_RESULT_EOF
 
+CAMERA_FPS = {
+    _k4a.K4A_FRAMES_PER_SECOND_5: 5,
+    _k4a.K4A_FRAMES_PER_SECOND_15: 15,
+    _k4a.K4A_FRAMES_PER_SECOND_30: 30,
+}
+
 
 class Device:
-    calibration = None
-    capture = None
-    imu_sample = None
     filename_video = None
+    # `RecordingHealth` of the recorded captures and IMU samples, kept after `close()`
+    health = None
 
     def __init__(self, index: int = 0) -> None:
         self._handle = None
         self._handle = self.open(index)
+        # Per instance, several devices can be opened in one process (see `DeviceGroup`)
+        self.calibration = None
+        self.capture = None
+        self.imu_sample = None
         self.recording = False
         self.record = False
+        self.record_writer = None
+        self.record_filepath = None
         self.is_imu = True
 
+        self.ring = None
+        self.rings = []
+        self._acquiring = False
+        self._acquisition_thread = None
+        self._imu_samples = np.empty(0, dtype=IMU_SAMPLE_DTYPE)
+        self.imu_samples = self._imu_samples
+
+        # Staging buffer of `drain_imu_samples`
+        self._imu_buffer = ImuSampleBuffer()
+
     def __del__(self) -> None:
         self.close()
 
@@ -34,10 +60,10 @@ class Device:
         return self._handle
 
     def is_capture_initialized(self) -> None:
-        return Device.capture
+        return self.capture
 
     def is_imu_sample_initialized(self) -> None:
-        return Device.imu_sample
+        return self.imu_sample
 
     def handle(self) -> None:
         return self._handle
@@ -50,53 +76,74 @@ class Device:
         if record:
             self.record = Record(self._handle, self.configuration.handle(), record_filepath)
             self.record.add_imu_track()
+            self.record_writer = self.record.start_writer()
+            self.record_filepath = record_filepath
+            self.health = RecordingHealth(CAMERA_FPS[configuration.camera_fps])
             self.recording = True
 
     def close(self) -> None:
         if self.is_valid():
+            self.stop_acquisition()
             self.stop_cameras()
             self.stop_imu()
-            _k4a.k4a_device_close(self._handle)
-
-            # Clear members
-            self._handle = None
-            self.record = None
-            self.recording = False
+            try:
+                if self.record_writer is not None:
+                    self.record_writer.stop()
+            finally:
+                # Closed even if the recording failed, the writer error is raised after
+                if self.health is not None:
+                    self.health.save_sidecar(self.record_filepath)
+                _k4a.k4a_device_close(self._handle)
+
+                # Clear members
+                self._handle = None
+                self.record_writer = None
+                self.record = None
+                self.recording = False
 
     def update(self, timeout_in_ms: int = K4A_WAIT_INFINITE) -> Capture:
         # Get cameras capture
         capture_handle = self.get_capture(timeout_in_ms)
+        self.capture = Capture(capture_handle, self.calibration)
 
-        if self.is_capture_initialized():
-            Device.capture._handle = capture_handle
-        else:
-            Device.capture = Capture(capture_handle, Device.calibration)
-
-        # Write capture if recording
-        if self.recording:
-            self.record.write_capture(Device.capture.handle())
+        # Write capture if recording, the acquisition thread already did
+        if self.recording and not self.is_acquiring():
+            self.write_capture(self.capture.handle())
 
-        return Device.capture
+        return self.capture
 
     def update_imu(self, timeout_in_ms: int = K4A_WAIT_INFINITE) -> ImuSample:
-        # Get imu sample
-        imu_sample = self.get_imu_sample(timeout_in_ms)
-
-        if self.is_imu_sample_initialized():
-            Device.imu_sample._struct = imu_sample
-            Device.imu_sample.parse_data()
+        """Latest IMU sample, every sample received since the previous call is in `self.imu_samples`.
+
+        All the samples queued by the SDK are drained (and recorded) at once, the call only blocks for
+        up to `timeout_in_ms` when none is pending.
+        """
+        if self.is_acquiring():
+            # Samples drained (and recorded) by the acquisition thread together with the last capture
+            imu_samples, self._imu_samples = self._imu_samples, self._imu_samples[:0]
         else:
-            Device.imu_sample = ImuSample(imu_sample)
+            imu_samples = self.drain_imu_samples()
+            if not len(imu_samples):
+                imu_samples = imu_samples_to_numpy([self.get_imu_sample(timeout_in_ms)])
 
-        if self.recording:
-            self.record.write_imu(imu_sample)
+            if self.recording:
+                self.write_imu_samples(imu_samples)
+
+        self.imu_samples = imu_samples
+        if not len(imu_samples) and self.is_imu_sample_initialized():
+            return self.imu_sample
 
-        return Device.imu_sample
+        # A view of the drained array, which is not reused
+        self.imu_sample = ImuSample(imu_samples[-1] if len(imu_samples) else np.zeros(1, IMU_SAMPLE_DTYPE)[0])
+
+        return self.imu_sample
 
     def get_capture(self, timeout_in_ms: int = K4A_WAIT_INFINITE) -> _k4a.ctypes.POINTER:
-        # Release current handle
-        if self.is_capture_initialized():
-            Device.capture.release_handle()
+        # Drop the reference on the previous capture, other owners keep theirs
+        self.capture = None
+
+        if self.is_acquiring():
+            return self.get_ring_capture(timeout_in_ms)
 
         capture_handle = _k4a.k4a_capture_t()
         _k4a.VERIFY(
@@ -106,6 +153,130 @@ class Device:
 
         return capture_handle
 
+    def get_ring_capture(self, timeout_in_ms: int = K4A_WAIT_INFINITE) -> _k4a.ctypes.POINTER:
+        entry = self.ring.get(None if timeout_in_ms == K4A_WAIT_INFINITE else timeout_in_ms / 1000)
+        if entry is None:
+            _k4a.VERIFY(_k4a.K4A_RESULT_FAILED, "Get capture failed!")
+
+        self._imu_samples = entry.imu_samples
+        return entry.capture_handle
+
+    def is_acquiring(self) -> bool:
+        return self._acquisition_thread is not None
+
+    def start_acquisition(self, ring_size: int = 4, overflow: str = DROP_OLDEST, timeout_in_ms: int = 1000) -> None:
+        """Pull captures and IMU samples on a background thread.
+
+        Captures are published to every ring registered with `add_capture_ring()`. `update()` and
+        `update_imu()` then read from `self.ring` instead of blocking on the SDK queue.
+        """
+        if self.is_acquiring():
+            return
+
+        self.ring = self.add_capture_ring(ring_size, overflow)
+        self._acquiring = True
+        self._acquisition_thread = threading.Thread(target=self._acquire, args=(timeout_in_ms,), daemon=True)
+        self._acquisition_thread.start()
+
+    def stop_acquisition(self) -> None:
+        if not self.is_acquiring():
+            return
+
+        self._acquiring = False
+        # Wake up the producer first, it may be waiting for room in a full "block" ring
+        for ring in self.rings:
+            ring.close()
+        self._acquisition_thread.join()
+        self._acquisition_thread = None
+
+        for ring in self.rings:
+            ring.clear()
+        self.rings = []
+        self.ring = None
+
+    def add_capture_ring(self, ring_size: int = 4, overflow: str = DROP_OLDEST) -> CaptureRing:
+        """Register an additional consumer (recording, analytics, ...) of the acquisition thread."""
+        late_threshold_sec = 1 / CAMERA_FPS[self.configuration.camera_fps]
+        ring = CaptureRing(ring_size, overflow, late_threshold_sec)
+        self.rings = self.rings + [ring]
+
+        return ring
+
+    def _acquire(self, timeout_in_ms: int) -> None:
+        while self._acquiring:
+            capture_handle = _k4a.k4a_capture_t()
+            result = _k4a.k4a_device_get_capture(self._handle, capture_handle, timeout_in_ms)
+            if result == _k4a.K4A_WAIT_RESULT_TIMEOUT:
+                continue
+            elif result != _k4a.K4A_WAIT_RESULT_SUCCEEDED:
+                break
+
+            imu_samples = self.drain_imu_samples() if self.is_imu else self._imu_samples[:0]
+            if self.recording:
+                try:
+                    self.write_capture(capture_handle)
+                    self.write_imu_samples(imu_samples)
+                except RuntimeError:
+                    # The writer failed, keep delivering the captures, close() raises its error
+                    self.recording = False
+
+            for ring in self.rings:
+                ring.put(capture_handle, imu_samples)
+
+            # Every ring holds its own reference
+            _k4a.k4a_capture_release(capture_handle)
+
+        # Wake up the consumers, they can still read what is queued
+        for ring in self.rings:
+            ring.close()
+
+    def drain_imu_samples(self, out: np.ndarray = None) -> np.ndarray:
+        """Read every IMU sample queued by the SDK, without waiting, into a structured array.
+
+        The SDK writes the samples straight into a preallocated :class:`ImuSampleBuffer`, they are
+        copied out once per call.
+        Args:
+            out (np.ndarray, optional): `IMU_SAMPLE_DTYPE` array to fill, at most `len(out)` samples are read
+                and the others stay queued. Defaults to None (a new array).
+        Returns:
+            np.ndarray: The samples read, a view on `out` when given.
+        """
+        count = self._imu_buffer.fill(
+            lambda slot: _k4a.k4a_device_get_imu_sample(self._handle, slot, 0) == _k4a.K4A_WAIT_RESULT_SUCCEEDED,
+            None if out is None else len(out),
+        )
+        if out is None:
+            return self._imu_buffer.view[:count].copy()
+
+        out[:count] = self._imu_buffer.view[:count]
+        return out[:count]
+
+    def write_capture(self, capture_handle) -> None:
+        if self.health is not None:
+            self.health.add_capture(capture_handle)
+        if self.record_writer is not None:
+            self.record_writer.write_capture(capture_handle)
+        else:
+            self.record.write_capture(capture_handle)
+
+    def write_imu(self, imu_sample) -> None:
+        if self.health is not None:
+            self.health.add_imu_samples(imu_samples_to_numpy([imu_sample]))
+        if self.record_writer is not None:
+            self.record_writer.write_imu(imu_sample)
+        else:
+            self.record.write_imu(imu_sample)
+
+    def write_imu_samples(self, imu_samples: np.ndarray) -> None:
+        if not len(imu_samples):
+            return
+        if self.health is not None:
+            self.health.add_imu_samples(imu_samples)
+        if self.record_writer is not None:
+            self.record_writer.write_imu_samples(imu_samples)
+        else:
+            self.record.write_imu_samples(imu_samples)
+
     def get_imu_sample(self, timeout_in_ms: int = K4A_WAIT_INFINITE) -> _k4a.k4a_imu_sample_t:
         imu_sample = _k4a.k4a_imu_sample_t()
 
@@ -117,7 +288,7 @@ class Device:
         return imu_sample
 
     def start_cameras(self, device_config: Configuration) -> None:
-        Device.calibration = self.get_calibration(device_config.depth_mode, device_config.color_resolution)
+        self.calibration = self.get_calibration(device_config.depth_mode, device_config.color_resolution)
 
         _k4a.VERIFY(
             _k4a.k4a_device_start_cameras(self._handle, device_config.handle()),
@@ -133,6 +304,18 @@ class Device:
     def stop_imu(self) -> None:
         _k4a.k4a_device_stop_imu(self._handle)
 
+    def get_sync_jack(self) -> tuple:
+        """Whether a cable is plugged in the sync in and sync out jacks."""
+        sync_in_jack_connected = ctypes.c_bool()
+        sync_out_jack_connected = ctypes.c_bool()
+
+        _k4a.VERIFY(
+            _k4a.k4a_device_get_sync_jack(self._handle, sync_in_jack_connected, sync_out_jack_connected),
+            "Get sync jack failed!",
+        )
+
+        return sync_in_jack_connected.value, sync_out_jack_connected.value
+
     # get device serial number
     def get_serialnum(self) -> ctypes.c_int:
         serial_number_size = ctypes.c_size_t()
@@ -187,16 +370,11 @@ class Device:
             return None
 
     def save_frame_for_clip(self, playback_handle, playback_calibration):
+        self.capture = None
         capture_handle = self.get_playback_capture(playback_handle)
-
-        if self.is_capture_initialized():
-            Device.capture.release_handle()
-            Device.capture._handle = capture_handle
-        else:
-            Device.capture = Capture(capture_handle, playback_calibration)
+        self.capture = Capture(capture_handle, playback_calibration)
 
         if self.recording:
-            self.record.write_capture(Device.capture.handle())
-            
+            self.write_capture(self.capture.handle())
 
-        return Device.capture
+        return self.capture
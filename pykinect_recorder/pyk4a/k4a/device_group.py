@@ -0,0 +1,318 @@
+import os
+import json
+from collections import deque
+
+import numpy as np
+
+from . import _k4a
+from .capture import Capture
+from .configuration import Configuration
+from .device import Device, CAMERA_FPS
+from .capture_ring import DROP_OLDEST
+from ._k4atypes import K4A_WAIT_INFINITE
+
+# Recommended spacing of the depth captures of synchronized devices, so that their lasers don't interfere
+SUBORDINATE_DELAY_STEP_USEC = 160
+
+
+class FrameSet:
+    """Captures of every device of a :class:`DeviceGroup` taken by the same sync pulse, master first.
+
+    Attributes:
+        captures (list[Capture]): One capture per device.
+        imu_samples (list[np.ndarray]): IMU samples received by each device with its capture.
+        timestamps (NDArray[N]): Device timestamps (usec) of the captures, corrected by the device offsets.
+        skew_usec (NDArray[N]): Corrected timestamps relative to the master.
+    """
+
+    __slots__ = ("captures", "imu_samples", "timestamps", "skew_usec")
+
+    def __init__(self, captures, imu_samples, timestamps):
+        self.captures = captures
+        self.imu_samples = imu_samples
+        self.timestamps = np.asarray(timestamps, dtype=np.int64)
+        self.skew_usec = self.timestamps - self.timestamps[0]
+
+    def __len__(self):
+        return len(self.captures)
+
+    def release(self):
+        for capture in self.captures:
+            capture.reset()
+
+
+class FrameAligner:
+    """Group the frames of N streams whose corrected timestamps are within `tolerance_usec` of each other.
+
+    Each stream keeps a short queue of pending frames. A frame set is complete once every stream has a
+    pending frame close enough to the newest head; older heads can't be matched anymore and are dropped.
+    Stream 0 is the reference of the skew statistics.
+
+    Args:
+        offsets_usec (list[int]): Subtracted from the timestamps of each stream, e.g. the subordinate delays.
+        tolerance_usec (int): Largest spread of the timestamps in a frame set.
+        max_pending (int, optional): Frames queued per stream, the oldest is dropped beyond. Defaults to 8.
+        release (callable, optional): Called with every dropped frame. Defaults to None.
+        max_skews (int, optional): Number of recent frame sets kept for the statistics. Defaults to 1024.
+    """
+
+    def __init__(self, offsets_usec, tolerance_usec, max_pending=8, release=None, max_skews=1024):
+        self.offsets_usec = list(offsets_usec)
+        self.tolerance_usec = tolerance_usec
+        self.max_pending = max_pending
+        self.release = release
+
+        self.matched = 0
+        self.dropped = [0] * len(self.offsets_usec)
+        self.skews = deque(maxlen=max_skews)
+
+        self._pending = [deque() for _ in self.offsets_usec]
+
+    def __len__(self):
+        return len(self._pending)
+
+    def push(self, index, timestamp_usec, frame):
+        pending = self._pending[index]
+        pending.append((timestamp_usec - self.offsets_usec[index], frame))
+        if len(pending) > self.max_pending:
+            self._drop(index)
+
+    def needs(self):
+        """Streams without a pending frame, a frame set can't be completed before they get one."""
+        return [index for index, pending in enumerate(self._pending) if not pending]
+
+    def pop(self):
+        """Next complete frame set as ``(timestamps, frames)``, None if some stream is missing a frame."""
+        while all(self._pending):
+            heads = [pending[0][0] for pending in self._pending]
+            newest = max(heads)
+            stale = [index for index, timestamp in enumerate(heads) if newest - timestamp > self.tolerance_usec]
+            if not stale:
+                frames = [pending.popleft()[1] for pending in self._pending]
+                self.matched += 1
+                self.skews.append([timestamp - heads[0] for timestamp in heads])
+                return heads, frames
+
+            for index in stale:
+                self._drop(index)
+
+        return None
+
+    def clear(self):
+        for index, pending in enumerate(self._pending):
+            while pending:
+                frame = pending.popleft()[1]
+                if self.release is not None:
+                    self.release(frame)
+
+    def _drop(self, index):
+        frame = self._pending[index].popleft()[1]
+        self.dropped[index] += 1
+        if self.release is not None:
+            self.release(frame)
+
+    def get_stats(self) -> dict:
+        """Matched and dropped frame counts, and the skew of each stream to stream 0 in microseconds."""
+        skews = np.asarray(self.skews, dtype=np.float64).reshape(-1, len(self.offsets_usec))
+        spreads = skews.max(axis=1) - skews.min(axis=1) if len(skews) else skews[:, 0]
+
+        def summarize(values):
+            if not len(values):
+                return {"mean": 0.0, "p50": 0.0, "p99": 0.0, "max": 0.0}
+            values = np.abs(values)
+            return {
+                "mean": float(values.mean()),
+                "p50": float(np.percentile(values, 50)),
+                "p99": float(np.percentile(values, 99)),
+                "max": float(values.max()),
+            }
+
+        return {
+            "matched": self.matched,
+            "dropped": list(self.dropped),
+            "spread_usec": summarize(spreads),
+            "skew_usec": [summarize(skews[:, index]) for index in range(skews.shape[1])],
+        }
+
+
+class DeviceGroup:
+    """Devices connected with sync cables, captured (and recorded) together.
+
+    The master is the device whose sync out jack is connected but not its sync in jack, unless given.
+    Subordinates are started before the master so that none of them misses the first sync pulse. Each
+    device pulls its captures on its own acquisition thread (and records them on its own writer thread),
+    :meth:`update` aligns them into :class:`FrameSet` by device timestamp, corrected by the subordinate
+    delays.
+
+    Args:
+        device_indices (list[int], optional): Devices to open. Defaults to None (every installed device).
+        master_index (int, optional): Index of the master among `device_indices`. Defaults to None (sync jacks).
+    """
+
+    def __init__(self, device_indices=None, master_index=None):
+        if device_indices is None:
+            device_indices = range(Device.device_get_installed_count())
+
+        devices = [Device(index) for index in device_indices]
+        if not devices:
+            _k4a.VERIFY(_k4a.K4A_RESULT_FAILED, "No K4A device connected!")
+
+        if master_index is None:
+            master_index = self.find_master(devices) if len(devices) > 1 else 0
+
+        # Master first, it is the reference of the frame sets
+        self.devices = [devices[master_index]] + devices[:master_index] + devices[master_index + 1:]
+        self.serial_numbers = [device.get_serialnum() for device in self.devices]
+        self.configurations = []
+        self.aligner = None
+        self.record_dir = None
+
+    def __len__(self):
+        return len(self.devices)
+
+    @property
+    def master(self) -> Device:
+        return self.devices[0]
+
+    @property
+    def subordinates(self) -> list:
+        return self.devices[1:]
+
+    @staticmethod
+    def find_master(devices) -> int:
+        for index, device in enumerate(devices):
+            sync_in_jack_connected, sync_out_jack_connected = device.get_sync_jack()
+            if sync_out_jack_connected and not sync_in_jack_connected:
+                return index
+
+        _k4a.VERIFY(_k4a.K4A_RESULT_FAILED, "No master device found, check the sync cables!")
+
+    def get_configurations(self, configuration: Configuration, subordinate_delay_usec=SUBORDINATE_DELAY_STEP_USEC):
+        """Copy of `configuration` for each device, with its wired sync mode and delay set."""
+        configurations = []
+        for index in range(len(self.devices)):
+            device_configuration = Configuration()
+            device_configuration.create_from_handle(
+                _k4a.k4a_device_configuration_t.from_buffer_copy(configuration.handle())
+            )
+            if len(self.devices) == 1:
+                device_configuration.wired_sync_mode = _k4a.K4A_WIRED_SYNC_MODE_STANDALONE
+            elif index == 0:
+                device_configuration.wired_sync_mode = _k4a.K4A_WIRED_SYNC_MODE_MASTER
+                device_configuration.subordinate_delay_off_master_usec = 0
+            else:
+                device_configuration.wired_sync_mode = _k4a.K4A_WIRED_SYNC_MODE_SUBORDINATE
+                device_configuration.subordinate_delay_off_master_usec = index * subordinate_delay_usec
+            configurations.append(device_configuration)
+
+        return configurations
+
+    def start(
+        self,
+        configuration: Configuration,
+        record=False,
+        record_dir=".",
+        subordinate_delay_usec=SUBORDINATE_DELAY_STEP_USEC,
+        tolerance_usec=None,
+        ring_size=4,
+        overflow=DROP_OLDEST,
+    ) -> None:
+        """Start the subordinates, then the master, and their acquisition threads.
+
+        Args:
+            configuration (Configuration): Shared by every device, the sync mode and delay are set per device.
+            record (bool, optional): Record every device to `record_dir/<serial number>.mkv`. Defaults to False.
+            record_dir (str, optional): Directory of the recordings and of the skew report. Defaults to ".".
+            subordinate_delay_usec (int, optional): Delay of each subordinate after the previous device.
+                Defaults to 160.
+            tolerance_usec (int, optional): Largest spread of a frame set. Defaults to None (half a frame period).
+            ring_size (int, optional): Captures queued per device. Defaults to 4.
+            overflow (str, optional): Policy of the capture rings when full. Defaults to "drop_oldest".
+        """
+        self.configurations = self.get_configurations(configuration, subordinate_delay_usec)
+        if tolerance_usec is None:
+            tolerance_usec = 1e6 / CAMERA_FPS[configuration.camera_fps] / 2
+
+        self.record_dir = record_dir if record else None
+        if record:
+            os.makedirs(record_dir, exist_ok=True)
+
+        for index in reversed(range(len(self.devices))):
+            record_filepath = os.path.join(record_dir, f"{self.serial_numbers[index]}.mkv")
+            self.devices[index].start(self.configurations[index], record, record_filepath)
+
+        self.aligner = FrameAligner(
+            [device_configuration.subordinate_delay_off_master_usec for device_configuration in self.configurations],
+            tolerance_usec,
+            max_pending=2 * ring_size,
+            release=lambda frame: frame[0].reset(),
+        )
+        for device in self.devices:
+            device.start_acquisition(ring_size, overflow)
+
+    def update(self, timeout_in_ms: int = K4A_WAIT_INFINITE):
+        """Next synchronized :class:`FrameSet`, None if a device produced nothing within `timeout_in_ms`.
+
+        The captures of the frame set are owned by the caller, `FrameSet.release()` frees them early.
+        """
+        timeout = None if timeout_in_ms == K4A_WAIT_INFINITE else timeout_in_ms / 1000
+        while True:
+            match = self.aligner.pop()
+            if match is not None:
+                timestamps, frames = match
+                return FrameSet([frame[0] for frame in frames], [frame[1] for frame in frames], timestamps)
+
+            for index in self.aligner.needs():
+                device = self.devices[index]
+                entry = device.ring.get(timeout)
+                if entry is None:
+                    return None
+
+                capture = Capture(entry.capture_handle, device.calibration)
+                timestamp = capture.get_device_timestamp_usec()
+                if timestamp is None:
+                    capture.reset()
+                    continue
+                self.aligner.push(index, timestamp, (capture, entry.imu_samples))
+
+    def get_skew_report(self) -> dict:
+        """Frame set counts and cross-device timestamp skew, per device serial number."""
+        stats = self.aligner.get_stats() if self.aligner is not None else None
+        roles = ["master"] + ["subordinate"] * (len(self.devices) - 1) if len(self.devices) > 1 else ["standalone"]
+        devices = []
+        for index, device in enumerate(self.devices):
+            report = {"serial_number": self.serial_numbers[index], "role": roles[index]}
+            if self.configurations:
+                delay_usec = self.configurations[index].subordinate_delay_off_master_usec
+                report["subordinate_delay_off_master_usec"] = delay_usec
+            if stats is not None:
+                report["dropped"] = stats["dropped"][index]
+                report["skew_usec"] = stats["skew_usec"][index]
+            if device.ring is not None:
+                report["ring"] = device.ring.get_stats()
+            devices.append(report)
+
+        return {
+            "matched": stats["matched"] if stats is not None else 0,
+            "spread_usec": stats["spread_usec"] if stats is not None else None,
+            "devices": devices,
+        }
+
+    def save_skew_report(self, path) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.get_skew_report(), f, indent=2)
+
+    def close(self) -> None:
+        """Stop and close the master first, then the subordinates. The skew report is saved next to the recordings."""
+        if self.record_dir is not None and self.aligner is not None:
+            self.save_skew_report(os.path.join(self.record_dir, "skew_report.json"))
+
+        for device in self.devices:
+            device.stop_acquisition()
+        if self.aligner is not None:
+            self.aligner.clear()
+
+        for device in self.devices:
+            device.close()
+        self.aligner = None
+        self.record_dir = None
@@ -1,14 +1,33 @@
+import ctypes
+import threading
+
 import numpy as np
 import cv2
 
 from . import _k4a
 
+# JPEG decode with DCT scaling, much cheaper than decoding the full frame and resizing it
+_MJPG_REDUCED_FLAGS = {
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
 
 class Image:
+    """Owner of one reference on a `k4a_image_t`.
+
+    Every Image holds its own SDK reference, :meth:`reference` gives another owner (thread, cache, ...)
+    its own and :meth:`reset` only drops the reference of this object. The SDK frees the image once all
+    of them are released. Calls on the handle are serialized with :meth:`reset`, and `to_numpy` pins the
+    image for the duration of the conversion, so an Image can be shared between threads.
+    """
+
     _handle = None
     buffer_pointer = None
 
     def __init__(self, image_handle=None):
+        self._lock = threading.Lock()
         self._handle = image_handle
         # Get the pointer to the buffer containing the image data
         self.buffer_pointer = self.get_buffer() if self.is_valid() else None
@@ -16,16 +35,41 @@ class Image:
     def __del__(self):
         self.reset()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.reset()
+
     def is_valid(self):
         return self._handle or self.buffer_pointer is not None
 
     def handle(self):
         return self._handle
 
+    def reference(self):
+        """New Image owning another reference on the same `k4a_image_t`."""
+        with self._lock:
+            if not self._handle:
+                return Image()
+            _k4a.k4a_image_reference(self._handle)
+            return Image(self._handle)
+
     def reset(self):
-        if self.is_valid():
-            _k4a.k4a_image_release(self._handle)
-            self._handle = None
+        if self._handle is None:
+            return
+
+        with self._lock:
+            image_handle, self._handle = self._handle, None
+            self.buffer_pointer = None
+            if image_handle:
+                _k4a.k4a_image_release(image_handle)
+
+    def _get(self, getter):
+        with self._lock:
+            if not self._handle:
+                return None
+            return int(getter(self._handle))
 
     @staticmethod
     def create(image_format, width_pixels, height_pixels, stride_bytes):
@@ -57,76 +101,158 @@ class Image:
     def size(self):
         return self.get_size()
 
-    def get_buffer(self):
-        if not self._handle:
-            return None
+    @property
+    def device_timestamp(self):
+        return self.get_device_timestamp_usec()
 
-        return _k4a.k4a_image_get_buffer(self._handle)
+    def get_buffer(self):
+        with self._lock:
+            if not self._handle:
+                return None
+            return _k4a.k4a_image_get_buffer(self._handle)
 
     def get_size(self):
-        if not self.is_valid():
-            return None
-
-        return int(_k4a.k4a_image_get_size(self._handle))
+        return self._get(_k4a.k4a_image_get_size)
 
     def get_format(self):
-        if not self.is_valid():
-            return None
-
-        return int(_k4a.k4a_image_get_format(self._handle))
+        return self._get(_k4a.k4a_image_get_format)
 
     def get_width_pixels(self):
-        if not self.is_valid():
-            return None
-
-        return int(_k4a.k4a_image_get_width_pixels(self._handle))
+        return self._get(_k4a.k4a_image_get_width_pixels)
 
     def get_height_pixels(self):
-        if not self.is_valid():
-            return None
+        return self._get(_k4a.k4a_image_get_height_pixels)
 
-        return int(_k4a.k4a_image_get_height_pixels(self._handle))
+    def get_device_timestamp_usec(self):
+        return self._get(_k4a.k4a_image_get_device_timestamp_usec)
 
     def get_stride_bytes(self):
-        return int(_k4a.k4a_image_get_stride_bytes(self._handle))
+        return self._get(_k4a.k4a_image_get_stride_bytes)
+
+    def to_numpy(self, copy=True, reduce=1, pool=None):
+        """Convert the image buffer to a NumPy array.
+
+        With ``copy=False`` raw formats (BGRA32, DEPTH16, IR16 and CUSTOM*) are returned as a read-only
+        view on the SDK buffer. The view holds its own reference on the ``k4a_image_t``, so the buffer
+        stays valid for as long as the array (or anything derived from it) is alive.
+        Compressed formats are always decoded into a new array.
+
+        ``reduce`` (1, 2, 4 or 8) shrinks the image by that factor on each side: MJPG is decoded at the
+        reduced size directly, other 2D formats are area-resized into a new array.
 
-    def to_numpy(self):
-        if not self.is_valid():
-            return False, None
+        New arrays are taken from ``pool`` (a :class:`BufferPool`) when given, except for MJPG which
+        OpenCV always decodes into a fresh array. The caller releases them to the pool when done.
+        """
+        with self._lock:
+            if not self._handle:
+                return False, None
+            # Pinned while converting, a concurrent reset() only drops the reference of this object
+            image_handle, buffer_pointer = self._handle, self.buffer_pointer
+            _k4a.k4a_image_reference(image_handle)
 
+        try:
+            return self._to_numpy(image_handle, buffer_pointer, copy, reduce, pool)
+        finally:
+            _k4a.k4a_image_release(image_handle)
+
+    def _to_numpy(self, image_handle, buffer_pointer, copy, reduce, pool):
         # Get the size of the buffer
-        image_size = self.get_size()
-        image_width = self.get_width_pixels()
-        image_height = self.get_height_pixels()
+        image_size = int(_k4a.k4a_image_get_size(image_handle))
+        image_width = int(_k4a.k4a_image_get_width_pixels(image_handle))
+        image_height = int(_k4a.k4a_image_get_height_pixels(image_handle))
 
         # Get the image format
-        image_format = self.get_format()
+        image_format = int(_k4a.k4a_image_get_format(image_handle))
 
         # Read the data in the buffer
-        buffer_array = np.ctypeslib.as_array(self.buffer_pointer, shape=(image_size,))
+        if copy:
+            buffer_array = np.ctypeslib.as_array(buffer_pointer, shape=(image_size,))
+        else:
+            buffer_array = np.asarray(_ImageBufferOwner(image_handle, buffer_pointer, image_size))
 
         # Parse buffer based on image formats
         if image_format == _k4a.K4A_IMAGE_FORMAT_COLOR_MJPG:
-            return True, cv2.imdecode(np.frombuffer(buffer_array, dtype=np.uint8).copy(), -1)
+            if reduce > 1:
+                return True, cv2.imdecode(buffer_array, _MJPG_REDUCED_FLAGS[reduce])
+            return True, cv2.imdecode(buffer_array, -1)
         elif image_format == _k4a.K4A_IMAGE_FORMAT_COLOR_NV12:
-            yuv_image = np.frombuffer(buffer_array, dtype=np.uint8).copy().reshape(int(image_height * 1.5), image_width)
-            return True, cv2.cvtColor(yuv_image, cv2.COLOR_YUV2BGR_NV12)
+            yuv_image = buffer_array.reshape(int(image_height * 1.5), image_width)
+            return True, self._convert(yuv_image, cv2.COLOR_YUV2BGR_NV12, (image_height, image_width, 3), reduce, pool)
         elif image_format == _k4a.K4A_IMAGE_FORMAT_COLOR_YUY2:
-            yuv_image = np.frombuffer(buffer_array, dtype=np.uint8).copy().reshape(image_height, image_width, 2)
-            return True, cv2.cvtColor(yuv_image, cv2.COLOR_YUV2BGR_YUY2)
+            yuv_image = buffer_array.reshape(image_height, image_width, 2)
+            return True, self._convert(yuv_image, cv2.COLOR_YUV2BGR_YUY2, (image_height, image_width, 3), reduce, pool)
         elif image_format == _k4a.K4A_IMAGE_FORMAT_COLOR_BGRA32:
-            return True, np.frombuffer(buffer_array, dtype=np.uint8).copy().reshape(image_height, image_width, 4)
+            return True, self._view(buffer_array, np.uint8, (image_height, image_width, 4), copy, reduce, pool)
         elif image_format == _k4a.K4A_IMAGE_FORMAT_DEPTH16:
-            return True, np.frombuffer(buffer_array, dtype="<u2").copy().reshape(
-                image_height, image_width
-            )  # little-endian 16 bits unsigned Depth data
+            # little-endian 16 bits unsigned Depth data
+            return True, self._view(buffer_array, "<u2", (image_height, image_width), copy, reduce, pool)
         elif image_format == _k4a.K4A_IMAGE_FORMAT_IR16:
-            return True, np.frombuffer(buffer_array, dtype="<u2").copy().reshape(
-                image_height, image_width
-            )  # little-endian 16 bits unsigned IR data. For more details see: https://microsoft.github.io/Azure-Kinect-Sensor-SDK/release/1.2.x/namespace_microsoft_1_1_azure_1_1_kinect_1_1_sensor_a7a3cb7a0a3073650bf17c2fef2bfbd1b.html
+            # little-endian 16 bits unsigned IR data. For more details see: https://microsoft.github.io/Azure-Kinect-Sensor-SDK/release/1.2.x/namespace_microsoft_1_1_azure_1_1_kinect_1_1_sensor_a7a3cb7a0a3073650bf17c2fef2bfbd1b.html
+            return True, self._view(buffer_array, "<u2", (image_height, image_width), copy, reduce, pool)
         elif image_format == _k4a.K4A_IMAGE_FORMAT_CUSTOM8:
-            return True, np.frombuffer(buffer_array, dtype="<u1").copy().reshape(image_height, image_width)
+            return True, self._view(buffer_array, "<u1", (image_height, image_width), copy, reduce, pool)
         elif image_format == _k4a.K4A_IMAGE_FORMAT_CUSTOM16:
-            return True, np.frombuffer(buffer_array, dtype="<u2").copy().reshape(image_height, image_width)
+            return True, self._view(buffer_array, "<u2", (image_height, image_width), copy, reduce, pool)
         elif image_format == _k4a.K4A_IMAGE_FORMAT_CUSTOM:
-            return True, np.frombuffer(buffer_array, dtype="<i2").copy()
+            return True, self._view(buffer_array, "<i2", (-1,), copy, pool=pool)
+
+    @staticmethod
+    def _view(buffer_array, dtype, shape, copy, reduce=1, pool=None):
+        array = buffer_array.view(dtype).reshape(shape)
+        if reduce > 1:
+            # The resize writes a new array, no need to copy the buffer first
+            return Image._reduce(array, reduce, pool)
+        if not copy:
+            return array
+
+        copied = Image._empty(array.shape, array.dtype, pool)
+        np.copyto(copied, array)
+        return copied
+
+    @staticmethod
+    def _convert(yuv_image, code, shape, reduce, pool):
+        bgr_image = cv2.cvtColor(yuv_image, code, dst=Image._empty(shape, np.uint8, pool))
+        if reduce <= 1:
+            return bgr_image
+
+        reduced = Image._reduce(bgr_image, reduce, pool)
+        if pool is not None:
+            pool.release(bgr_image)
+        return reduced
+
+    @staticmethod
+    def _reduce(array, reduce, pool=None):
+        if reduce <= 1:
+            return array
+
+        height, width = array.shape[:2]
+        size = (width // reduce, height // reduce)
+        dst = Image._empty((size[1], size[0]) + array.shape[2:], array.dtype, pool)
+        return cv2.resize(array, size, dst=dst, interpolation=cv2.INTER_AREA)
+
+    @staticmethod
+    def _empty(shape, dtype, pool):
+        return np.empty(shape, dtype) if pool is None else pool.acquire(shape, dtype)
+
+
+class _ImageBufferOwner:
+    """Exposes an image buffer through the array interface and pins the image while it is referenced.
+
+    NumPy keeps this object as the ``base`` of every view created from it, so the extra
+    ``k4a_image_reference`` taken here is only dropped once the last view is garbage collected.
+    """
+
+    def __init__(self, image_handle, buffer_pointer, image_size):
+        _k4a.k4a_image_reference(image_handle)
+        self._handle = image_handle
+        self.__array_interface__ = {
+            "shape": (image_size,),
+            "typestr": "|u1",
+            "data": (ctypes.cast(buffer_pointer, ctypes.c_void_p).value, True),
+            "version": 3,
+        }
+
+    def __del__(self):
+        if self._handle:
+            _k4a.k4a_image_release(self._handle)
+            self._handle = None
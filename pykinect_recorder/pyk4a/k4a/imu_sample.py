@@ -1,30 +1,117 @@
-from ..utils import get_dict
+import ctypes
+
+import numpy as np
+
+from . import _k4a
+from ..utils import struct_view
+
+_IMU_FIELDS = ("temperature", "acc_sample", "acc_timestamp_usec", "gyro_sample", "gyro_timestamp_usec")
+
+# Memory layout of `k4a_imu_sample_t`, an array of them can be viewed as an array of this dtype
+IMU_SAMPLE_DTYPE = np.dtype(
+    {
+        "names": list(_IMU_FIELDS),
+        "formats": ["<f4", ("<f4", (3,)), "<u8", ("<f4", (3,)), "<u8"],
+        "offsets": [getattr(_k4a.k4a_imu_sample_t, field).offset for field in _IMU_FIELDS],
+        "itemsize": _k4a.IMU_SAMPLE_SIZE,
+    }
+)
+
+
+def imu_samples_to_numpy(imu_sample_structs) -> np.ndarray:
+    """Copy `k4a_imu_sample_t` structures (or a ctypes array of them) into a structured array."""
+    return np.frombuffer(b"".join(bytes(struct) for struct in imu_sample_structs), dtype=IMU_SAMPLE_DTYPE).copy()
+
+
+def imu_sample_from_numpy(imu_sample) -> _k4a.k4a_imu_sample_t:
+    """`k4a_imu_sample_t` holding a sample of an `IMU_SAMPLE_DTYPE` array."""
+    return _k4a.k4a_imu_sample_t.from_buffer_copy(np.asarray(imu_sample, dtype=IMU_SAMPLE_DTYPE).tobytes())
+
+
+def imu_samples_to_columns(imu_samples) -> dict:
+    """Flat columns of an `IMU_SAMPLE_DTYPE` array.
+
+    The columns are temperature, acc_x/y/z, acc_timestamp_usec, gyro_x/y/z and gyro_timestamp_usec.
+    """
+    columns = {"temperature": imu_samples["temperature"]}
+    for sensor in ("acc", "gyro"):
+        for axis, name in enumerate("xyz"):
+            columns[f"{sensor}_{name}"] = np.ascontiguousarray(imu_samples[f"{sensor}_sample"][:, axis])
+        columns[f"{sensor}_timestamp_usec"] = imu_samples[f"{sensor}_timestamp_usec"]
+
+    return {name: np.ascontiguousarray(column) for name, column in columns.items()}
+
+
+class ImuSampleBuffer:
+    """Preallocated `k4a_imu_sample_t` array the SDK fills in place, viewed as an `IMU_SAMPLE_DTYPE` array.
+
+    Args:
+        size (int, optional): Initial number of samples, doubled whenever a fill needs more. Defaults to 128.
+    """
+
+    def __init__(self, size=128):
+        self.array = None
+        self.view = None
+        self.slots = []
+        self.resize(size)
+
+    def __len__(self):
+        return len(self.slots)
+
+    def resize(self, size):
+        array = (_k4a.k4a_imu_sample_t * size)()
+        if self.array is not None:
+            ctypes.memmove(array, self.array, min(ctypes.sizeof(array), ctypes.sizeof(self.array)))
+
+        self.array = array
+        self.view = struct_view(array, IMU_SAMPLE_DTYPE)
+        # Structures sharing the memory of the elements, passed to the SDK as pointers
+        self.slots = list(array)
+
+    def fill(self, read_sample, limit=None):
+        """Call `read_sample(slot)` on consecutive slots until it returns False or `limit` samples are read.
+        Returns:
+            int: Number of samples read, they are `self.view[:count]`.
+        """
+        count = 0
+        while limit is None or count < limit:
+            if count == len(self.slots):
+                self.resize(2 * count)
+            if not read_sample(self.slots[count]):
+                break
+            count += 1
+
+        return count
 
 
 class ImuSample:
-    def __init__(self, imu_sample_struct):
-        self._struct = imu_sample_struct
-        self.parse_data()
+    """Accessor over one IMU sample, reading the fields in place.
 
-    def __del__(self):
-        self.reset()
+    Wraps either a `k4a_imu_sample_t`, viewed as an `IMU_SAMPLE_DTYPE` record, or a record of an
+    `IMU_SAMPLE_DTYPE` array. The vectors are float32 views of the sample, not copies.
+    """
+
+    __slots__ = ("_struct", "_sample")
+
+    def __init__(self, imu_sample):
+        if isinstance(imu_sample, _k4a.k4a_imu_sample_t):
+            self._struct = imu_sample
+            self._sample = struct_view(imu_sample, IMU_SAMPLE_DTYPE)
+        else:
+            self._struct = None
+            self._sample = imu_sample
 
     def is_valid(self):
-        return self._struct
+        return self._sample is not None
 
     def struct(self):
+        if self._struct is None and self.is_valid():
+            self._struct = imu_sample_from_numpy(self._sample)
         return self._struct
 
     def reset(self):
-        if self.is_valid():
-            self._struct = None
-
-    def parse_data(self):
-        self.imu_sample_dict = get_dict(self._struct)
-
-        # Convert the acc and gyro dicts to numpy array
-        self.imu_sample_dict["acc_sample"] = self.imu_sample_dict["acc_sample"]["v"]
-        self.imu_sample_dict["gyro_sample"] = self.imu_sample_dict["gyro_sample"]["v"]
+        self._struct = None
+        self._sample = None
 
     @property
     def temp(self):
@@ -47,19 +134,19 @@ class ImuSample:
         return self.get_gyro_time()
 
     def get_temp(self):
-        return self.imu_sample_dict["temperature"]
+        return float(self._sample["temperature"])
 
     def get_acc(self):
-        return self.imu_sample_dict["acc_sample"]
+        return self._sample["acc_sample"]
 
     def get_acc_time(self):
-        return self.imu_sample_dict["acc_timestamp_usec"]
+        return int(self._sample["acc_timestamp_usec"])
 
     def get_gyro(self):
-        return self.imu_sample_dict["gyro_sample"]
+        return self._sample["gyro_sample"]
 
     def get_gyro_time(self):
-        return self.imu_sample_dict["gyro_timestamp_usec"]
+        return int(self._sample["gyro_timestamp_usec"])
 
     def get_sample(self):
-        return self.imu_sample_dict
+        return {name: self._sample[name] for name in _IMU_FIELDS}
@@ -0,0 +1,146 @@
+import os
+import json
+import time
+import threading
+from collections import deque
+
+import numpy as np
+
+from ..k4arecord.health import count_missing_frames
+
+# Stages of the capture pipeline, from the SDK queue to the screen and the recording
+CAPTURE_WAIT = "capture_wait"
+DECODE = "decode"
+COLORIZE = "colorize"
+EMIT = "emit"
+PAINT = "paint"
+RECORD_WRITE = "record_write"
+STAGES = (CAPTURE_WAIT, DECODE, COLORIZE, EMIT, PAINT, RECORD_WRITE)
+
+
+class StageTimer:
+    """Context manager timing one execution of a stage, see :meth:`PipelineStats.stage`."""
+
+    __slots__ = ("stats", "name", "start_ns")
+
+    def __init__(self, stats, name):
+        self.stats = stats
+        self.name = name
+        self.start_ns = 0
+
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stats.add(self.name, self.start_ns, time.perf_counter_ns())
+
+
+class PipelineStats:
+    """Per-stage latencies, measured frame rate and dropped frames of a capture pipeline.
+
+    Stage executions are kept in one ring buffer per stage as (start, duration, thread) tuples of
+    ``perf_counter_ns`` values, so the percentiles and the exported trace cover the last `window`
+    executions. Appending to a deque is atomic, the stages can be timed from any thread.
+
+    Dropped frames are counted from the gaps between consecutive device timestamps, which covers the
+    frames dropped by the SDK as well as the ones dropped by a :class:`CaptureRing`.
+
+    Args:
+        expected_fps (float, optional): Camera frame rate, needed to count dropped frames.
+        window (int): Number of recent executions kept per stage.
+        fps_window (int): Number of recent frames the frame rate is measured over.
+    """
+
+    def __init__(self, expected_fps=None, window=1024, fps_window=30):
+        self.expected_fps = expected_fps
+        self.window = window
+
+        self.frames = 0
+        self.dropped_frames = 0
+        self.origin_ns = time.perf_counter_ns()
+
+        self._stages = {}
+        self._frame_times = deque(maxlen=fps_window)
+        self._last_timestamp_usec = None
+        self._lock = threading.Lock()
+
+    def stage(self, name):
+        """Time the body of a ``with`` block as one execution of stage `name`."""
+        return StageTimer(self, name)
+
+    def add(self, name, start_ns, end_ns):
+        """Record an execution of stage `name` timed with ``time.perf_counter_ns()``."""
+        events = self._stages.get(name)
+        if events is None:
+            with self._lock:
+                events = self._stages.setdefault(name, deque(maxlen=self.window))
+        events.append((start_ns, end_ns - start_ns, threading.get_ident()))
+
+    def frame(self, device_timestamp_usec=None):
+        """Count a frame delivered by the pipeline, with the device timestamp of its capture."""
+        self.frames += 1
+        self._frame_times.append(time.perf_counter_ns())
+
+        if device_timestamp_usec is None or not self.expected_fps:
+            return
+        if self._last_timestamp_usec is not None:
+            period_usec = 1e6 / self.expected_fps
+            self.dropped_frames += count_missing_frames(device_timestamp_usec - self._last_timestamp_usec, period_usec)
+        self._last_timestamp_usec = device_timestamp_usec
+
+    @property
+    def fps(self):
+        """Frame rate over the last `fps_window` frames, 0 until two frames were delivered."""
+        frame_times = list(self._frame_times)
+        if len(frame_times) < 2 or frame_times[-1] == frame_times[0]:
+            return 0.0
+        return (len(frame_times) - 1) * 1e9 / (frame_times[-1] - frame_times[0])
+
+    def get_stage_stats(self, name):
+        """Execution count and latency percentiles (ms) of the recent executions of a stage."""
+        durations = np.array([duration for _, duration, _ in list(self._stages.get(name, ()))], dtype=np.float64)
+        if not len(durations):
+            return {"count": 0, "p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+
+        durations /= 1e6
+        p50, p90, p99 = np.percentile(durations, [50, 90, 99])
+        return {"count": len(durations), "p50": float(p50), "p90": float(p90), "p99": float(p99),
+                "max": float(durations.max())}
+
+    def get_stats(self):
+        """Frame rate, frame and drop counts, and the latency percentiles of every timed stage."""
+        return {
+            "fps": self.fps,
+            "expected_fps": self.expected_fps,
+            "frames": self.frames,
+            "dropped_frames": self.dropped_frames,
+            "stages": {name: self.get_stage_stats(name) for name in list(self._stages)},
+        }
+
+    def to_chrome_trace(self):
+        """Recent stage executions as a Chrome trace (``chrome://tracing``, Perfetto), timestamps in µs."""
+        pid = os.getpid()
+        events = []
+        for name, stage_events in list(self._stages.items()):
+            for start_ns, duration_ns, tid in list(stage_events):
+                events.append({
+                    "name": name,
+                    "cat": "pipeline",
+                    "ph": "X",
+                    "ts": (start_ns - self.origin_ns) / 1e3,
+                    "dur": duration_ns / 1e3,
+                    "pid": pid,
+                    "tid": tid,
+                })
+        events.sort(key=lambda event: event["ts"])
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save_json(self, filepath):
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(self.get_stats(), f, indent=2)
+
+    def save_chrome_trace(self, filepath):
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
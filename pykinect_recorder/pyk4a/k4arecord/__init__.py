@@ -2,3 +2,6 @@ from .datablock import Datablock
 from .record import Record
 from .record_configuration import RecordConfiguration
 from .playback import Playback
+from .playback_index import PlaybackIndex
+from .frame_cache import FrameCache, ReadAhead
+from .recording_info import RecordingInfoCache
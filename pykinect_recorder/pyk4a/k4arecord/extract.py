@@ -0,0 +1,278 @@
+import os
+import csv
+import json
+import threading
+import multiprocessing
+from glob import glob
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import cv2
+import numpy as np
+
+from .playback import Playback, split_time_range
+from ..k4a import _k4a
+from ..k4a.decode_pool import DecodePool
+from ..utils import Colorizer, DEPTH_CLIPPING_RANGE, IR_CLIPPING_RANGE
+
+STREAMS = ("rgb", "ir", "depth")
+METADATA_FIELDS = ["file_name", "frame", "device_timestamp_usec", "rgb", "ir", "depth"]
+SEGMENTS_DIRNAME = ".segments"
+
+
+def find_recordings(paths) -> list[str]:
+    """Expand files and directories (searched for `*.mkv`) into a sorted list of recordings."""
+    recordings = []
+    for path in paths:
+        if os.path.isdir(path):
+            recordings.extend(glob(os.path.join(path, "*.mkv")))
+        else:
+            recordings.append(path)
+
+    return sorted(set(recordings))
+
+
+def plan_segments(filepath: str, segment_sec: float = 10.0) -> list[tuple[str, int, int, int]]:
+    """Split a recording into device time segments, the unit of work of :func:`extract_segment`.
+    Args:
+        filepath (str): Path of the MKV.
+        segment_sec (float, optional): Length of a segment in seconds. Defaults to 10.0.
+    Returns:
+        list[tuple[str, int, int, int]]: (filepath, index, start, end) with device timestamps in microseconds,
+            the end of the last segment is -1 (until the end of the file).
+    """
+    playback = Playback(filepath)
+    start, length = playback.get_start_timestamp(), playback.get_recording_length()
+    playback.close()
+
+    count = -(-length // max(int(segment_sec * 1e6), 1))
+    return [
+        (filepath, index, segment_start, -1 if segment_end is None else segment_end)
+        for index, (segment_start, segment_end) in enumerate(split_time_range(start, length, count))
+    ]
+
+
+def get_output_dir(root_path: str, filepath: str) -> str:
+    return os.path.join(root_path, Path(filepath).stem)
+
+
+def get_segment_marker(root_path: str, segment) -> str:
+    """Done marker of a segment, named after its bounds so that a different segmentation is not resumed."""
+    filepath, _, start, end = segment
+    return os.path.join(get_output_dir(root_path, filepath), SEGMENTS_DIRNAME, f"{start:015d}_{end}.json")
+
+
+def extract_segment(
+    segment, root_path: str, streams=("rgb", "ir"), write_threads: int = 4, decode_threads: int = 0
+) -> list[dict]:
+    """Write the frames of one segment and mark it as done.
+
+    Captures are read on this thread, image encoding and writes run on a thread pool. A capture belongs
+    to the segment its device timestamp (depth, IR then color) falls in, so segments never overlap.
+    MJPG color frames are written as they are, NV12, YUY2 and BGRA32 ones are converted on this thread,
+    or on a :class:`DecodePool` of `decode_threads` threads.
+
+    Returns:
+        list[dict]: One metadata row per frame, also stored in the segment marker.
+    """
+    filepath, _, start, end = segment
+    file_name = Path(filepath).stem
+    output_dir = get_output_dir(root_path, filepath)
+    for stream in streams:
+        os.makedirs(os.path.join(output_dir, stream), exist_ok=True)
+
+    playback = Playback(filepath)
+    rows = []
+    decode_pool = DecodePool(decode_threads) if decode_threads > 0 else None
+    writer = ImageWriter(write_threads, decode_pool)
+    with writer:
+        for timestamp, capture in playback.get_segment_captures(start, None if end == -1 else end):
+            row = {"file_name": file_name, "frame": None, "device_timestamp_usec": timestamp}
+            for stream in STREAMS:
+                filename = None
+                if stream in streams:
+                    filename = writer.submit(capture, stream, os.path.join(output_dir, stream), file_name, timestamp)
+                row[stream] = filename
+            rows.append(row)
+
+    playback.close()
+    if decode_pool is not None:
+        decode_pool.close()
+
+    marker = get_segment_marker(root_path, segment)
+    os.makedirs(os.path.dirname(marker), exist_ok=True)
+    with open(f"{marker}.tmp", "w", encoding="utf-8") as f:
+        json.dump(rows, f)
+    os.replace(f"{marker}.tmp", marker)
+
+    return rows
+
+
+class ImageWriter:
+    """Encode and write frames on a thread pool, with at most `2 * max_workers` frames in flight.
+
+    Color frames to convert are decoded on `decode_pool` when given, the writing thread waits for them.
+    """
+
+    def __init__(self, max_workers: int = 4, decode_pool: DecodePool = None) -> None:
+        self.decode_pool = decode_pool
+        self.ir_colorizer = Colorizer(IR_CLIPPING_RANGE, cv2.COLORMAP_BONE)
+        self.depth_colorizer = Colorizer(DEPTH_CLIPPING_RANGE, cv2.COLORMAP_HSV)
+        self._executor = ThreadPoolExecutor(max_workers)
+        self._slots = threading.BoundedSemaphore(2 * max_workers)
+        self._futures = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self._executor.shutdown(wait=True)
+        # Surface write errors
+        for future in self._futures:
+            future.result()
+
+    def submit(self, capture, stream: str, output_dir: str, file_name: str, timestamp: int):
+        if stream == "rgb":
+            image = capture.get_color_image_object()
+        elif stream == "ir":
+            image = capture.get_ir_image_object()
+        else:
+            image = capture.get_depth_image_object()
+        if not image.is_valid():
+            return None
+
+        self._slots.acquire()
+        if stream == "rgb" and image.format == _k4a.K4A_IMAGE_FORMAT_COLOR_MJPG:
+            # Already a JPEG, write the compressed buffer as is
+            data = np.ctypeslib.as_array(image.buffer_pointer, shape=(image.size,)).copy()
+            filename = f"{file_name}_rgb_{timestamp:012d}.jpg"
+            task = self._write_bytes
+        else:
+            extension = "jpg" if stream == "rgb" else "png"
+            filename = f"{file_name}_{stream}_{timestamp:012d}.{extension}"
+            if stream == "rgb" and self.decode_pool is not None:
+                data = self.decode_pool.submit(image)
+                task = self._write_decoded
+            else:
+                _, data = image.to_numpy()
+                task = self._write_image
+
+        future = self._executor.submit(task, data, stream, os.path.join(output_dir, filename))
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+
+        return filename
+
+    @staticmethod
+    def _write_bytes(data, stream, path):
+        with open(path, "wb") as f:
+            f.write(data.tobytes())
+
+    def _write_decoded(self, decoded, stream, path):
+        _, data = decoded.result()
+        self._write_image(data, stream, path)
+
+    def _write_image(self, data, stream, path):
+        if stream == "ir":
+            data = self.ir_colorizer(data)
+        elif stream == "depth":
+            data = self.depth_colorizer(data)
+
+        params = [cv2.IMWRITE_JPEG_QUALITY, 100] if stream == "rgb" else []
+        ret, encoded = cv2.imencode(Path(path).suffix, data, params)
+        if not ret:
+            raise IOError(f"Failed to encode {path}")
+        with open(path, "wb") as f:
+            f.write(encoded.tobytes())
+
+
+def _initialize_worker(module_k4a_path):
+    from ..pykinect import initialize_libraries
+
+    initialize_libraries(module_k4a_path)
+
+
+def _extract_segment_task(args):
+    return extract_segment(*args)
+
+
+def extract(
+    paths,
+    root_path: str = "datas",
+    streams=("rgb", "ir"),
+    segment_sec: float = 10.0,
+    workers: int = None,
+    write_threads: int = 4,
+    decode_threads: int = 0,
+    resume: bool = True,
+    module_k4a_path: str = None,
+    callback=None,
+) -> str:
+    """Extract the frames of recordings in parallel and write one consolidated `metadata.csv`.
+
+    Every (recording, segment) pair is extracted by a process pool worker. Finished segments leave a
+    marker in `<root_path>/<name>/.segments`, with `resume` they are skipped when the extraction is
+    started again after an interruption.
+
+    Args:
+        paths (list[str]): MKV files or directories containing them.
+        root_path (str, optional): Output directory. Defaults to "datas".
+        streams (tuple[str], optional): Streams to write among "rgb", "ir" and "depth". Defaults to ("rgb", "ir").
+        segment_sec (float, optional): Length of the work units in seconds. Defaults to 10.0.
+        workers (int, optional): Number of processes. Defaults to None (CPU count).
+        write_threads (int, optional): Encoding/writing threads per process. Defaults to 4.
+        decode_threads (int, optional): Color conversion threads per process, 0 converts on the reading
+            thread. Defaults to 0.
+        resume (bool, optional): Skip the segments already extracted. Defaults to True.
+        module_k4a_path (str, optional): Path of the k4a library for the workers. Defaults to None (searched).
+        callback (callable, optional): Called with (done, total) segments as they complete. Defaults to None.
+    Returns:
+        str: Path of the metadata file.
+    """
+    os.makedirs(root_path, exist_ok=True)
+    recordings = find_recordings(paths)
+    segments = [segment for filepath in recordings for segment in plan_segments(filepath, segment_sec)]
+
+    pending = [
+        segment
+        for segment in segments
+        if not (resume and os.path.exists(get_segment_marker(root_path, segment)))
+    ]
+    done = len(segments) - len(pending)
+    if callback is not None:
+        callback(done, len(segments))
+
+    if pending:
+        # spawn: the workers load their own SDK instance instead of inheriting the parent's one
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            workers, mp_context=context, initializer=_initialize_worker, initargs=(module_k4a_path,)
+        ) as executor:
+            tasks = [(segment, root_path, tuple(streams), write_threads, decode_threads) for segment in pending]
+            for _ in executor.map(_extract_segment_task, tasks):
+                done += 1
+                if callback is not None:
+                    callback(done, len(segments))
+
+    return write_metadata(root_path, segments)
+
+
+def write_metadata(root_path: str, segments) -> str:
+    """Merge the markers of the segments into `<root_path>/metadata.csv`, frames are numbered per recording."""
+    metadata_path = os.path.join(root_path, "metadata.csv")
+    with open(f"{metadata_path}.tmp", "w", newline="", encoding="utf-8") as f:
+        metadata = csv.DictWriter(f, fieldnames=METADATA_FIELDS)
+        metadata.writeheader()
+
+        frames = {}
+        for segment in segments:
+            with open(get_segment_marker(root_path, segment), "r", encoding="utf-8") as marker:
+                rows = json.load(marker)
+
+            for row in rows:
+                row["frame"] = frames.get(segment[0], 0)
+                frames[segment[0]] = row["frame"] + 1
+                metadata.writerow(row)
+    os.replace(f"{metadata_path}.tmp", metadata_path)
+
+    return metadata_path
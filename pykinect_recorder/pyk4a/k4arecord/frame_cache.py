@@ -0,0 +1,190 @@
+import threading
+from collections import OrderedDict
+
+from .playback import Playback, STREAMS, decode_capture
+from ..k4a.decode_pool import DecodePool, get_default_workers
+
+
+class FrameCache:
+    """Byte bounded LRU cache of decoded frames, keyed by capture device timestamp.
+
+    An entry maps the streams ("color", "depth", "ir") of a capture to the arrays `decode_capture` returns.
+    The least recently used entries are evicted once the decoded bytes exceed `max_bytes`. Entries are
+    shared between threads and must be treated as read-only.
+
+    Args:
+        max_bytes (int, optional): Memory budget of the decoded arrays. Defaults to 256 MiB.
+        streams (tuple[str], optional): Streams decoded for each entry. Defaults to all.
+        decode_pool (DecodePool, optional): Pool decoding the color images of :meth:`decode`. Defaults to
+            None (decoded on the calling thread).
+    """
+
+    def __init__(self, max_bytes=256 * 2**20, streams=STREAMS, decode_pool=None):
+        self.max_bytes = max_bytes
+        self.streams = tuple(streams)
+        self.decode_pool = decode_pool
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, timestamp):
+        return timestamp in self._entries
+
+    def get(self, timestamp):
+        """Frames of the capture at `timestamp`, None on a miss."""
+        with self._lock:
+            frames = self._entries.get(timestamp)
+            if frames is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(timestamp)
+            self.hits += 1
+            return frames
+
+    def put(self, timestamp, frames):
+        size = sum(frame.nbytes for frame in frames.values())
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(timestamp, None)
+            if previous is not None:
+                self.bytes -= sum(frame.nbytes for frame in previous.values())
+
+            self._entries[timestamp] = frames
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= sum(frame.nbytes for frame in evicted.values())
+                self.evictions += 1
+
+    def decode(self, capture):
+        """Device timestamp and decoded frames of a capture, the decode is skipped on a cache hit."""
+        timestamp = capture.get_device_timestamp_usec()
+        frames = None if timestamp is None else self.get(timestamp)
+        if frames is None:
+            frames = decode_capture(capture, self.streams, self.decode_pool)
+            if timestamp is not None:
+                self.put(timestamp, frames)
+
+        return timestamp, frames
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def get_stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+class ReadAhead:
+    """Prefetch the frames around the playback position into a :class:`FrameCache`.
+
+    The worker thread reads the recording through its own `Playback`, so the read position of the viewer
+    is untouched. :meth:`schedule` replaces the pending target: the `frames` captures after `timestamp`
+    when playing forward, the ones before it when stepping back. Captures already cached are not decoded
+    again.
+
+    The captures are decoded on a pool of its own, never on the one of the cache: speculative decodes
+    can't queue up in front of the frame the viewer is waiting for. The pool is bounded to
+    `decode_workers` threads and `frames` pending captures.
+
+    Args:
+        filepath (str): Path of the MKV.
+        cache (FrameCache): Cache to fill.
+        frames (int, optional): Number of captures read ahead. Defaults to 8.
+        decode_workers (int, optional): Threads of the read-ahead pool, 0 decodes on the read-ahead thread.
+            Defaults to half the default decode threads.
+    """
+
+    def __init__(self, filepath, cache, frames=8, decode_workers=None):
+        self.filepath = filepath
+        self.cache = cache
+        self.frames = frames
+
+        if decode_workers is None:
+            decode_workers = get_default_workers() // 2
+        self.decode_pool = DecodePool(decode_workers, max_pending=frames) if decode_workers > 0 else None
+
+        self._target = None
+        self._stopped = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def schedule(self, timestamp, direction=1):
+        """Prefetch from the capture at `timestamp` in the play direction (1 forward, -1 backward)."""
+        with self._condition:
+            self._target = (timestamp, direction)
+            self._condition.notify()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        self._thread.join()
+        if self.decode_pool is not None:
+            self.decode_pool.close()
+
+    def _is_interrupted(self):
+        return self._target is not None or self._stopped
+
+    def _run(self):
+        playback = Playback(self.filepath)
+        period = playback.get_frame_period()
+        try:
+            while True:
+                with self._condition:
+                    while self._target is None and not self._stopped:
+                        self._condition.wait()
+                    if self._stopped:
+                        return
+                    timestamp, direction = self._target
+                    self._target = None
+
+                if direction < 0:
+                    self._prefetch(playback, timestamp - self.frames * period, timestamp)
+                else:
+                    self._prefetch(playback, timestamp + 1, None)
+        finally:
+            playback.close()
+
+    def _prefetch(self, playback, start, end):
+        decode_pool = self.decode_pool
+        if decode_pool is None:
+            for timestamp, capture in self._get_uncached(playback, start, end):
+                self.cache.put(timestamp, decode_capture(capture, self.cache.streams))
+            return
+
+        streams = self.cache.streams
+        for timestamp, frames in decode_pool.imap(
+            lambda item: (item[0], decode_capture(item[1], streams)), self._get_uncached(playback, start, end)
+        ):
+            self.cache.put(timestamp, frames)
+
+    def _get_uncached(self, playback, start, end):
+        for count, (timestamp, capture) in enumerate(playback.get_segment_captures(start, end)):
+            if count >= self.frames or self._is_interrupted():
+                return
+            if timestamp not in self.cache:
+                yield timestamp, capture
@@ -0,0 +1,220 @@
+import json
+
+import numpy as np
+
+from ..k4a import _k4a
+
+HEALTH_SUFFIX = ".health.json"
+IMU_RATE_HZ = 1600
+
+# A delta longer than this many periods is a gap
+GAP_FACTOR = 1.5
+
+STREAMS = {
+    "color": _k4a.k4a_capture_get_color_image,
+    "depth": _k4a.k4a_capture_get_depth_image,
+    "ir": _k4a.k4a_capture_get_ir_image,
+}
+
+
+def get_health_path(filepath):
+    return f"{filepath}{HEALTH_SUFFIX}"
+
+
+def count_missing_frames(delta_usec, period_usec):
+    """Frames missing between two consecutive timestamps `delta_usec` apart, 0 unless it is a gap."""
+    if delta_usec <= GAP_FACTOR * period_usec:
+        return 0
+    return max(round(delta_usec / period_usec) - 1, 1)
+
+
+class StreamContinuity:
+    """Gap and reordering counters of the device timestamps of one stream."""
+
+    def __init__(self, period_usec):
+        self.period_usec = period_usec
+        self.frames = 0
+        self.gaps = 0
+        self.missing_frames = 0
+        self.reordered = 0
+        self.max_delta_usec = 0
+        self.first_timestamp_usec = None
+        self.last_timestamp_usec = None
+
+    def add(self, timestamp_usec):
+        """Count a timestamp. Returns the event it raised, ``("gap", missing)``, ``("reordered", delta)`` or None."""
+        self.frames += 1
+        last, self.last_timestamp_usec = self.last_timestamp_usec, timestamp_usec
+        if last is None:
+            self.first_timestamp_usec = timestamp_usec
+            return None
+
+        delta = timestamp_usec - last
+        self.max_delta_usec = max(self.max_delta_usec, delta)
+        if delta <= 0:
+            self.reordered += 1
+            return "reordered", delta
+        missing = count_missing_frames(delta, self.period_usec)
+        if missing:
+            self.gaps += 1
+            self.missing_frames += missing
+            return "gap", missing
+
+        return None
+
+    def to_dict(self):
+        return {
+            "frames": self.frames,
+            "gaps": self.gaps,
+            "missing_frames": self.missing_frames,
+            "reordered": self.reordered,
+            "max_delta_usec": self.max_delta_usec,
+            "first_timestamp_usec": self.first_timestamp_usec,
+            "last_timestamp_usec": self.last_timestamp_usec,
+        }
+
+
+class RecordingHealth:
+    """Continuity monitor of the captures and IMU samples written to a recording.
+
+    The device timestamps of every color, depth and IR image are compared with the previous one of
+    the same stream: a delta over 1.5 frame periods is a gap (the frames it spans are counted as
+    missing), a delta <= 0 is a reordering. Captures lacking a stream seen before are incomplete.
+    Accelerometer timestamps are checked the same way against the IMU sample period.
+
+    Args:
+        camera_fps (int): Frame rate of the cameras, 5, 15 or 30.
+        imu_rate_hz (float): Nominal IMU sample rate.
+        max_events (int): Number of gaps and reorderings listed in the report, the counters are complete.
+    """
+
+    def __init__(self, camera_fps, imu_rate_hz=IMU_RATE_HZ, max_events=1000):
+        self.camera_fps = camera_fps
+        self.imu_rate_hz = imu_rate_hz
+        self.max_events = max_events
+
+        self.captures = 0
+        self.incomplete_captures = 0
+        self.streams = {}
+        self.imu = StreamContinuity(1e6 / imu_rate_hz)
+        self.events = []
+        self.dropped_events = 0
+
+    @property
+    def frame_period_usec(self):
+        return 1e6 / self.camera_fps
+
+    def add_capture(self, capture_handle):
+        """Check the images of a capture, before it is written."""
+        self.captures += 1
+        present = 0
+        for stream, get_image in STREAMS.items():
+            image_handle = get_image(capture_handle)
+            if not image_handle:
+                continue
+
+            timestamp_usec = int(_k4a.k4a_image_get_device_timestamp_usec(image_handle))
+            _k4a.k4a_image_release(image_handle)
+            present += 1
+            continuity = self.streams.get(stream)
+            if continuity is None:
+                continuity = self.streams[stream] = StreamContinuity(self.frame_period_usec)
+            self.add_event(stream, timestamp_usec, continuity.add(timestamp_usec))
+
+        if present < len(self.streams):
+            self.incomplete_captures += 1
+
+    def add_imu_samples(self, imu_samples):
+        """Check a structured array of `IMU_SAMPLE_DTYPE` samples, in the order they are written."""
+        if not len(imu_samples):
+            return
+
+        timestamps = imu_samples["acc_timestamp_usec"].astype(np.int64)
+        if self.imu.last_timestamp_usec is not None:
+            deltas = np.diff(timestamps, prepend=self.imu.last_timestamp_usec)
+        else:
+            deltas = np.diff(timestamps, prepend=timestamps[0])
+            deltas[0] = self.imu.period_usec
+
+        # Only the irregular samples go through the per-sample bookkeeping
+        irregular = np.flatnonzero((deltas <= 0) | (deltas > GAP_FACTOR * self.imu.period_usec))
+        regular = len(timestamps) - len(irregular)
+        for i in irregular:
+            self.imu.last_timestamp_usec = int(timestamps[i]) - int(deltas[i])
+            self.add_event("imu", int(timestamps[i]), self.imu.add(int(timestamps[i])))
+
+        if self.imu.first_timestamp_usec is None:
+            self.imu.first_timestamp_usec = int(timestamps[0])
+        self.imu.frames += regular
+        self.imu.max_delta_usec = max(self.imu.max_delta_usec, int(deltas.max()))
+        self.imu.last_timestamp_usec = int(timestamps[-1])
+
+    def add_event(self, stream, timestamp_usec, event):
+        if event is None:
+            return
+        if len(self.events) >= self.max_events:
+            self.dropped_events += 1
+            return
+
+        kind, value = event
+        entry = {"type": kind, "stream": stream, "timestamp_usec": timestamp_usec}
+        entry["missing" if kind == "gap" else "delta_usec"] = value
+        self.events.append(entry)
+
+    @property
+    def missing_frames(self):
+        return sum(continuity.missing_frames for continuity in self.streams.values())
+
+    def get_counters(self):
+        """Totals of the frames and IMU samples lost and of the reorderings so far."""
+        return {
+            "missing_frames": self.missing_frames,
+            "reordered": self.imu.reordered + sum(continuity.reordered for continuity in self.streams.values()),
+            "incomplete_captures": self.incomplete_captures,
+            "missing_imu_samples": self.imu.missing_frames,
+        }
+
+    def is_healthy(self):
+        return not (
+            self.incomplete_captures or self.imu.gaps or self.imu.reordered
+            or any(continuity.gaps or continuity.reordered for continuity in self.streams.values())
+        )
+
+    def get_report(self):
+        imu = self.imu.to_dict()
+        imu["samples"], imu["missing_samples"] = imu.pop("frames"), imu.pop("missing_frames")
+        imu["rate_hz"] = self.imu_rate_hz
+
+        return {
+            "healthy": self.is_healthy(),
+            "camera_fps": self.camera_fps,
+            "frame_period_usec": self.frame_period_usec,
+            "captures": self.captures,
+            "incomplete_captures": self.incomplete_captures,
+            "streams": {stream: continuity.to_dict() for stream, continuity in self.streams.items()},
+            "imu": imu,
+            "events": self.events,
+            "dropped_events": self.dropped_events,
+        }
+
+    def summary(self):
+        streams = ", ".join(
+            f"{stream} {continuity.gaps} gaps/{continuity.missing_frames} missing/{continuity.reordered} reordered"
+            for stream, continuity in self.streams.items()
+        )
+        return (
+            f"{'Healthy' if self.is_healthy() else 'Unhealthy'} recording: {self.captures} captures "
+            f"({self.incomplete_captures} incomplete), {streams}, "
+            f"IMU {self.imu.missing_frames} samples lost in {self.imu.gaps} gaps."
+        )
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.get_report(), f, indent=2)
+
+    def save_sidecar(self, filepath):
+        try:
+            self.save(get_health_path(filepath))
+        except OSError:
+            # Read-only location, the counters are still available
+            pass
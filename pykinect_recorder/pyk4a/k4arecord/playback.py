@@ -1,23 +1,64 @@
+import queue
+import multiprocessing
+from pathlib import Path
+
+import numpy as np
+
 from . import _k4arecord
 from .datablock import Datablock
 from .record_configuration import RecordConfiguration
 from ..k4a import _k4a
 from ..k4a.capture import Capture
 from ..k4a.calibration import Calibration
-from ..k4a.imu_sample import ImuSample
+from ..k4a.imu_sample import ImuSample, ImuSampleBuffer, IMU_SAMPLE_DTYPE, imu_samples_to_columns
 from .record import Record
+from .playback_index import PlaybackIndex
 from ..k4a.configuration import Configuration
 
+CAMERA_FPS = {0: 5, 1: 15, 2: 30}
+STREAMS = ("color", "depth", "ir")
+
+
+def split_time_range(start, length, count):
+    """Split `[start, start + length]` into `count` contiguous [start, end) ranges, the last one is open (end None)."""
+    count = max(int(count), 1)
+    bounds = [start + length * index // count for index in range(count)]
+    return [(bound, bounds[index + 1] if index + 1 < count else None) for index, bound in enumerate(bounds)]
+
 
 class Playback:
     def __init__(self, filepath):
+        self._reset(filepath)
+        self.open(filepath)
+        self.calibration = self.get_calibration()
+
+    def _reset(self, filepath):
+        self.filepath = filepath
         self._handle = _k4arecord.k4a_playback_t()
         self._capture = None
         self._datablock = None
         self.clipping = None
+        self.index = None
 
-        self.open(filepath)
-        self.calibration = self.get_calibration()
+    @classmethod
+    def try_open(cls, filepath):
+        """`(True, playback)`, or `(False, None)` if the SDK can't open the recording or read its calibration.
+
+        Unlike the constructor, a file that is not a readable recording doesn't exit the process.
+        """
+        playback = cls.__new__(cls)
+        playback._reset(filepath)
+        if _k4arecord.k4a_playback_open(filepath.encode("utf-8"), playback._handle) != _k4a.K4A_RESULT_SUCCEEDED:
+            playback._handle = None
+            return False, None
+
+        calibration_handle = _k4arecord.k4a_calibration_t()
+        if _k4arecord.k4a_playback_get_calibration(playback._handle, calibration_handle) != _k4a.K4A_RESULT_SUCCEEDED:
+            playback.close()
+            return False, None
+        playback.calibration = Calibration(calibration_handle)
+
+        return True, playback
 
     def __del__(self):
         self.close()
@@ -66,46 +107,34 @@ class Playback:
 
         return RecordConfiguration(config)
 
-    def get_next_capture(self):
-        capture_handle = _k4a.k4a_capture_t()
+    def try_get_record_configuration(self):
+        """Like :meth:`get_record_configuration`, but `(False, None)` instead of exiting when it can't be read."""
+        config = _k4arecord.k4a_record_configuration_t()
+        if _k4arecord.k4a_playback_get_record_configuration(self._handle, config) != _k4a.K4A_RESULT_SUCCEEDED:
+            return False, None
 
-        if self.is_capture_initialized():
-            self._capture.release_handle()
-            self._capture._handle = capture_handle
-        else:
-            self._capture = Capture(capture_handle, self.calibration)
+        return True, RecordConfiguration(config)
 
+    def get_next_capture(self):
+        # Drop the reference on the previous capture, other owners keep theirs
+        self._capture = None
+        capture_handle = _k4a.k4a_capture_t()
         ret = _k4arecord.k4a_playback_get_next_capture(self._handle, capture_handle) != _k4arecord.K4A_STREAM_RESULT_EOF
+        self._capture = Capture(capture_handle, self.calibration)
 
         return ret, self._capture
 
     def get_next_capture_with_record(self):
-        if self.is_capture_initialized():
-            self._capture.release_handle()
-
-        capture_handle = _k4a.k4a_capture_t()
-        ret = _k4arecord.k4a_playback_get_next_capture(self._handle, capture_handle) != _k4arecord.K4A_STREAM_RESULT_EOF
-
-        if self.is_capture_initialized():
-            self._capture._handle = capture_handle
-        else:
-            self._capture = Capture(capture_handle, self.calibration)
-
-        return ret, self._capture
+        return self.get_next_capture()
 
     def get_previous_capture(self):
+        self._capture = None
         capture_handle = _k4a.k4a_capture_t()
-
-        if self.is_capture_initialized():
-            self._capture.release_handle()
-            self._capture._handle = capture_handle
-        else:
-            self._capture = Capture(capture_handle, self.calibration)
-
         ret = (
             _k4arecord.k4a_playback_get_previous_capture(self._handle, capture_handle)
             != _k4arecord.K4A_STREAM_RESULT_EOF
         )
+        self._capture = Capture(capture_handle, self.calibration)
 
         return ret, self._capture
 
@@ -121,6 +150,15 @@ class Playback:
 
         return _imu_sample
 
+    def try_get_next_imu_sample(self):
+        """Like :meth:`get_next_imu_sample`, but `(False, None)` at the end of the IMU track instead of exiting."""
+        imu_sample_struct = _k4a.k4a_imu_sample_t()
+        result = _k4arecord.k4a_playback_get_next_imu_sample(self._handle, imu_sample_struct)
+        if result != _k4arecord.K4A_STREAM_RESULT_SUCCEEDED:
+            return False, None
+
+        return True, ImuSample(imu_sample_struct)
+
     def get_previous_imu_sample(self):
         imu_sample_struct = _k4a.k4a_imu_sample_t()
         _k4a.VERIFY(
@@ -133,15 +171,225 @@ class Playback:
 
         return _imu_sample
 
+    def read_imu(self, start=None, end=None, chunk_size=4096):
+        """Stream the IMU track as structured arrays of up to `chunk_size` `IMU_SAMPLE_DTYPE` samples.
+
+        The SDK reads the samples straight into a preallocated :class:`ImuSampleBuffer`, each chunk is
+        copied out of it. The read position of the playback (captures included) is moved.
+        Args:
+            start (int, optional): First accelerometer device timestamp (usec). Defaults to None (beginning).
+            end (int, optional): Stop before this accelerometer timestamp. Defaults to None (end of the track).
+            chunk_size (int, optional): Samples per chunk. Defaults to 4096.
+        """
+        if start is None:
+            self.seek_timestamp(0, _k4arecord.K4A_PLAYBACK_SEEK_BEGIN)
+        else:
+            self.seek_device_timestamp(start)
+
+        buffer = ImuSampleBuffer(chunk_size)
+
+        def read_sample(slot):
+            result = _k4arecord.k4a_playback_get_next_imu_sample(self._handle, slot)
+            return result == _k4arecord.K4A_STREAM_RESULT_SUCCEEDED
+
+        while True:
+            count = buffer.fill(read_sample, chunk_size)
+            chunk = buffer.view[:count]
+            timestamps = chunk["acc_timestamp_usec"]
+            if start is not None and count and timestamps[0] < start:
+                chunk = chunk[timestamps >= start]
+                timestamps = chunk["acc_timestamp_usec"]
+            if end is not None and len(chunk) and timestamps[-1] >= end:
+                chunk = chunk[timestamps < end]
+                if len(chunk):
+                    yield chunk.copy()
+                return
+
+            if len(chunk):
+                yield chunk.copy()
+            if count < chunk_size:
+                return
+
+    def export_imu(self, path, start=None, end=None, chunk_size=65536):
+        """Write the IMU track to a columnar `.parquet` (requires pyarrow) or `.npz` file.
+
+        The columns are those of :func:`imu_samples_to_columns`. Parquet is written chunk by chunk, NPZ
+        needs the whole range in memory once (about 48 bytes per sample).
+        Returns:
+            int: Number of samples written.
+        """
+        suffix = Path(path).suffix.lower()
+        if suffix == ".parquet":
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError as e:
+                raise ImportError("Exporting to Parquet requires pyarrow, install it with `pip install pyarrow`") from e
+
+            count = 0
+            writer = None
+            try:
+                for chunk in self.read_imu(start, end, chunk_size):
+                    table = pa.table(imu_samples_to_columns(chunk))
+                    if writer is None:
+                        writer = pq.ParquetWriter(path, table.schema)
+                    writer.write_table(table)
+                    count += len(chunk)
+            finally:
+                if writer is not None:
+                    writer.close()
+            if writer is None:
+                pq.write_table(pa.table(imu_samples_to_columns(np.empty(0, dtype=IMU_SAMPLE_DTYPE))), path)
+
+            return count
+
+        if suffix == ".npz":
+            chunks = list(self.read_imu(start, end, chunk_size))
+            imu_samples = np.concatenate(chunks) if chunks else np.empty(0, dtype=IMU_SAMPLE_DTYPE)
+            with open(path, "wb") as f:
+                np.savez(f, **imu_samples_to_columns(imu_samples))
+
+            return len(imu_samples)
+
+        raise ValueError(f"Unsupported IMU export format '{suffix}', use .parquet or .npz")
+
     def seek_timestamp(self, offset=0, origin=_k4arecord.K4A_PLAYBACK_SEEK_BEGIN):
         _k4a.VERIFY(
             _k4arecord.k4a_playback_seek_timestamp(self._handle, offset, origin),
             "Seek recording failed!",
         )
 
+    def try_seek_timestamp(self, offset=0, origin=_k4arecord.K4A_PLAYBACK_SEEK_BEGIN):
+        """Like :meth:`seek_timestamp`, but returns whether the seek succeeded instead of exiting."""
+        return _k4arecord.k4a_playback_seek_timestamp(self._handle, offset, origin) == _k4a.K4A_RESULT_SUCCEEDED
+
+    def seek_device_timestamp(self, timestamp):
+        """Seek so that the next capture is the first one with an image at or after `timestamp` (device time)."""
+        start = self.get_start_timestamp()
+        if timestamp <= start:
+            self.seek_timestamp(0, _k4arecord.K4A_PLAYBACK_SEEK_BEGIN)
+        else:
+            self.seek_timestamp(timestamp, _k4arecord.K4A_PLAYBACK_SEEK_DEVICE_TIME)
+
     def get_recording_length(self):
         return int(_k4arecord.k4a_playback_get_recording_length_usec(self._handle))
 
+    def get_start_timestamp(self):
+        """Device timestamp (usec) the recording starts at."""
+        return int(self.get_record_configuration()._handle.start_timestamp_offset_usec)
+
+    def load_index(self, save=True):
+        """Load the timestamp index sidecar of the recording, building it on the first use.
+
+        The scan for a missing index uses its own handle, so the read position is kept.
+        """
+        if self.index is None:
+            self.index = PlaybackIndex.load_sidecar(self.filepath)
+
+        if self.index is None:
+            playback = Playback(self.filepath)
+            self.index = PlaybackIndex.build(playback)
+            playback.close()
+            if save:
+                self.index.save_sidecar(self.filepath)
+
+        return self.index
+
+    def get_frame_count(self):
+        return self.load_index().frame_count
+
+    def frame_to_timestamp(self, frame):
+        return self.load_index().frame_to_timestamp(frame)
+
+    def timestamp_to_frame(self, timestamp):
+        return self.load_index().timestamp_to_frame(timestamp)
+
+    def get_frame_seek(self, frame):
+        """`(offset, origin)` of the seek making `frame` (0-based, clamped to the recording) the next capture."""
+        index = self.load_index()
+        frame = min(max(int(frame), 0), max(index.frame_count - 1, 0))
+        if frame == 0:
+            return 0, _k4arecord.K4A_PLAYBACK_SEEK_BEGIN
+        return index.frame_to_timestamp(frame), _k4arecord.K4A_PLAYBACK_SEEK_DEVICE_TIME
+
+    def seek_frame(self, frame):
+        """Seek so that the next capture is `frame` (0-based)."""
+        self.seek_timestamp(*self.get_frame_seek(frame))
+
+    def get_frame_period(self):
+        return int(1e6 / CAMERA_FPS[self.get_record_configuration()._handle.camera_fps])
+
+    def get_segments(self, count):
+        """Partition the recording into `count` device time ranges [start, end), the last one is open (end None)."""
+        return split_time_range(self.get_start_timestamp(), self.get_recording_length(), count)
+
+    def get_segment_captures(self, start, end=None):
+        """Captures whose device timestamp is in [start, end), in order.
+
+        The timestamp of a capture is the one of its first image in depth, IR then color order, so
+        contiguous segments together give every capture of the recording exactly once.
+        """
+        # Seek one frame early, captures of the previous segment are skipped below
+        self.seek_device_timestamp(start - self.get_frame_period())
+        while True:
+            ret, capture = self.update()
+            if not ret:
+                return
+
+            timestamp = capture.get_device_timestamp_usec()
+            if timestamp is None or timestamp < start:
+                continue
+            if end is not None and timestamp >= end:
+                return
+
+            yield timestamp, capture
+
+    def iter_frames_parallel(self, workers=4, segments=None, streams=STREAMS, queue_size=16, module_k4a_path=None):
+        """Decode the recording on `workers` processes and yield `(timestamp, frames)` in timestamp order.
+
+        The recording is split into `segments` device time ranges (4 per worker by default). Each worker
+        opens its own `Playback` and decodes the segments `i, i + workers, ...` into its bounded queue,
+        which is read back segment after segment. `frames` maps the streams to decoded arrays, streams
+        missing from a capture are not in it.
+
+        Args:
+            workers (int, optional): Number of decoding processes. Defaults to 4.
+            segments (int, optional): Number of segments. Defaults to None (4 * workers).
+            streams (tuple[str], optional): Streams to decode among "color", "depth" and "ir". Defaults to all.
+            queue_size (int, optional): Decoded captures each worker can be ahead of the reader. Defaults to 16.
+            module_k4a_path (str, optional): Path of the k4a library for the workers. Defaults to None (searched).
+        """
+        ranges = self.get_segments(segments or 4 * workers)
+        workers = min(workers, len(ranges))
+
+        # spawn: the workers load their own SDK instance instead of inheriting the parent's one
+        context = multiprocessing.get_context("spawn")
+        queues = [context.Queue(queue_size) for _ in range(workers)]
+        processes = [
+            context.Process(
+                target=_decode_segments,
+                args=(self.filepath, ranges[index::workers], tuple(streams), queues[index], module_k4a_path),
+                daemon=True,
+            )
+            for index in range(workers)
+        ]
+        for process in processes:
+            process.start()
+
+        try:
+            for index in range(len(ranges)):
+                worker = index % workers
+                while True:
+                    item = _get_from_worker(queues[worker], processes[worker])
+                    if item is None:
+                        break
+                    yield item
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+
     def set_color_conversion(self, format=_k4a.K4A_IMAGE_FORMAT_DEPTH16):
         _k4a.VERIFY(
             _k4arecord.k4a_playback_set_color_conversion(self._handle, format),
@@ -175,3 +423,49 @@ class Playback:
             self._datablock = Datablock(block_handle)
 
         return self._datablock
+
+
+def decode_capture(capture, streams=STREAMS, decode_pool=None):
+    """Decoded frames of a capture by stream, with a `DecodePool` color is decoded while depth and IR are copied."""
+    color = None
+    if decode_pool is not None and "color" in streams:
+        with capture.get_color_image_object() as image:
+            if image.is_valid():
+                color = decode_pool.submit(image)
+
+    frames = {}
+    for stream in streams:
+        if stream == "color":
+            ret, frame = capture.get_color_image() if color is None else color.result()
+        elif stream == "depth":
+            ret, frame = capture.get_depth_image()
+        else:
+            ret, frame = capture.get_ir_image()
+        if ret:
+            frames[stream] = frame
+
+    return frames
+
+
+def _decode_segments(filepath, ranges, streams, frame_queue, module_k4a_path):
+    from ..pykinect import initialize_libraries
+
+    initialize_libraries(module_k4a_path)
+    playback = Playback(filepath)
+    for start, end in ranges:
+        for timestamp, capture in playback.get_segment_captures(start, end):
+            frame_queue.put((timestamp, decode_capture(capture, streams)))
+
+        # End of segment
+        frame_queue.put(None)
+
+    playback.close()
+
+
+def _get_from_worker(frame_queue, process):
+    while True:
+        try:
+            return frame_queue.get(timeout=1.0)
+        except queue.Empty:
+            if not process.is_alive():
+                raise RuntimeError(f"Decoding process exited with code {process.exitcode}")
@@ -0,0 +1,132 @@
+import os
+
+import numpy as np
+
+from . import _k4arecord
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".index.npz"
+
+# Bits of `PlaybackIndex.streams`
+COLOR_STREAM = 1
+DEPTH_STREAM = 2
+IR_STREAM = 4
+
+
+def get_index_path(filepath):
+    return f"{filepath}{INDEX_SUFFIX}"
+
+
+class PlaybackIndex:
+    """Per-capture device timestamps and stream presence of a recording, stored next to it.
+
+    Built by reading every capture once (nothing is decoded), then used to map frame numbers and
+    timestamps with a binary search and to seek to an exact frame. The capture timestamp is the one
+    of its first image in depth, IR then color order, as in `Playback.get_segment_captures`.
+    The SDK does not expose Matroska cluster offsets, so seeks still go through
+    `k4a_playback_seek_timestamp`, with the exact timestamp of the target frame.
+
+    Args:
+        timestamps (NDArray[N]): Device timestamps (usec) of the captures, increasing.
+        streams (NDArray[N]): Bitmask of the images present in each capture.
+        source_size (int): Size of the recording the index was built from.
+        source_mtime_ns (int): Modification time of the recording the index was built from.
+    """
+
+    def __init__(self, timestamps, streams, source_size=0, source_mtime_ns=0):
+        self.timestamps = np.asarray(timestamps, dtype=np.int64)
+        self.streams = np.asarray(streams, dtype=np.uint8)
+        self.source_size = int(source_size)
+        self.source_mtime_ns = int(source_mtime_ns)
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    @property
+    def frame_count(self):
+        return len(self.timestamps)
+
+    @staticmethod
+    def build(playback):
+        """Scan a playback from its beginning, its read position is left at the end."""
+        timestamps, streams = [], []
+        playback.seek_timestamp(0, _k4arecord.K4A_PLAYBACK_SEEK_BEGIN)
+        while True:
+            ret, capture = playback.update()
+            if not ret:
+                break
+
+            timestamp, present = None, 0
+            for bit, image in (
+                (DEPTH_STREAM, capture.get_depth_image_object()),
+                (IR_STREAM, capture.get_ir_image_object()),
+                (COLOR_STREAM, capture.get_color_image_object()),
+            ):
+                if image.is_valid():
+                    present |= bit
+                    if timestamp is None:
+                        timestamp = image.device_timestamp
+
+            if timestamp is not None:
+                timestamps.append(timestamp)
+                streams.append(present)
+
+        stat = os.stat(playback.filepath)
+        return PlaybackIndex(timestamps, streams, stat.st_size, stat.st_mtime_ns)
+
+    def save(self, path):
+        # np.savez appends .npz to names without it, write through a file object to keep `path`
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                version=INDEX_VERSION,
+                timestamps=self.timestamps,
+                streams=self.streams,
+                source_size=self.source_size,
+                source_mtime_ns=self.source_mtime_ns,
+            )
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def load(path):
+        with np.load(path) as data:
+            if int(data["version"]) != INDEX_VERSION:
+                raise ValueError(f"Unsupported index version in {path}")
+
+            return PlaybackIndex(data["timestamps"], data["streams"], data["source_size"], data["source_mtime_ns"])
+
+    @staticmethod
+    def load_sidecar(filepath):
+        """Index stored next to a recording, None if it is missing or was built from another version of the file."""
+        path = get_index_path(filepath)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            index = PlaybackIndex.load(path)
+        except (OSError, ValueError, KeyError):
+            return None
+
+        stat = os.stat(filepath)
+        if (index.source_size, index.source_mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+            return None
+
+        return index
+
+    def save_sidecar(self, filepath):
+        try:
+            self.save(get_index_path(filepath))
+        except OSError:
+            # Read-only location, the index is still usable for this session
+            pass
+
+    def frame_to_timestamp(self, frame):
+        return int(self.timestamps[frame])
+
+    def timestamp_to_frame(self, timestamp):
+        """Last frame at or before `timestamp`, the first frame for earlier timestamps."""
+        return max(int(np.searchsorted(self.timestamps, timestamp, side="right")) - 1, 0)
+
+    def has_stream(self, frame, stream):
+        return bool(self.streams[frame] & stream)
@@ -1,5 +1,18 @@
+import time
+import queue
+import threading
+from collections import deque
+
+import numpy as np
+
+from ..k4a import _k4a
+from ..k4a.imu_sample import IMU_SAMPLE_DTYPE
+from ..k4a.pipeline_stats import RECORD_WRITE
 from ..k4arecord import _k4arecord
 
+# How often a producer blocked on a full queue checks that the writer thread is still running
+ERROR_POLL_INTERVAL_SEC = 0.1
+
 
 class Record:
     def __init__(self, device_handle, device_configuration, filepath):
@@ -44,11 +57,20 @@ class Record:
 
     def write_imu(self, imu_sample):
         if self.is_valid():
+            if not self.header_written:
+                self.write_header()
+                self.header_written = True
             _k4arecord.VERIFY(
                 _k4arecord.k4a_record_write_imu_sample(self.record_handle, imu_sample),
                 "Failed to write imu!",
             )
 
+    def write_imu_samples(self, imu_samples):
+        """Write a structured array of `IMU_SAMPLE_DTYPE` samples."""
+        imu_samples = np.ascontiguousarray(imu_samples, dtype=IMU_SAMPLE_DTYPE)
+        for imu_sample in (_k4a.k4a_imu_sample_t * len(imu_samples)).from_buffer_copy(imu_samples):
+            self.write_imu(imu_sample)
+
     def write_capture(self, capture_handle):
         if not self.is_valid():
             raise NameError("Recording not found")
@@ -65,3 +87,193 @@ class Record:
             _k4arecord.k4a_record_add_imu_track(self.record_handle),
             "Failed to add imu track!",
         )
+
+    def start_writer(self, queue_size=128, flush_interval_sec=1.0):
+        """Move muxing and disk I/O of this recording to a `RecordWriter` thread."""
+        writer = RecordWriter(self, queue_size, flush_interval_sec)
+        writer.start()
+
+        return writer
+
+
+class RecordWriter:
+    """Writes captures and IMU samples of a `Record` on a dedicated thread.
+
+    Queued captures hold their own `k4a_capture_reference`, so the producer can release its handle
+    right after queueing it. A full queue blocks the producer (back-pressure) instead of dropping data.
+
+    If a write fails, the thread keeps the exception in `error`, releases what is still queued and
+    exits. From then on the write methods, blocked or not, raise a `RuntimeError` caused by it, and
+    so does :meth:`stop`.
+
+    Args:
+        record (Record): Recording to write to.
+        queue_size (int): Maximum number of captures and IMU samples waiting to be written.
+        flush_interval_sec (float): Period of `k4a_record_flush` calls.
+        stats_window (int): Number of recent writes used for the throughput and latency statistics.
+
+    Attributes:
+        pipeline_stats (PipelineStats): Set to time the capture writes as the ``record_write`` stage.
+        error (BaseException): Exception that stopped the writer thread, None while it runs.
+    """
+
+    def __init__(self, record, queue_size=128, flush_interval_sec=1.0, stats_window=512):
+        self.record = record
+        self.flush_interval_sec = flush_interval_sec
+
+        self.written_captures = 0
+        self.written_imu_samples = 0
+        self.written_bytes = 0
+        self.pipeline_stats = None
+        self.error = None
+
+        self._queue = queue.Queue(queue_size)
+        self._history = deque(maxlen=stats_window)
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        """Write everything still queued, flush and stop the thread. Raises the error of a failed writer."""
+        if self._thread.is_alive():
+            try:
+                self._put(None)
+            except RuntimeError:
+                # Failed meanwhile, raised below
+                pass
+            self._thread.join()
+
+        self._discard_queued()
+        self._check_error()
+
+    def write_capture(self, capture_handle):
+        _k4a.k4a_capture_reference(capture_handle)
+        try:
+            self._put((capture_handle, None))
+        except RuntimeError:
+            _k4a.k4a_capture_release(capture_handle)
+            raise
+
+    def write_imu(self, imu_sample):
+        self._put((None, imu_sample))
+
+    def write_imu_samples(self, imu_samples):
+        """Queue a structured array of IMU samples, written as one item."""
+        self._put((None, imu_samples))
+
+    def _check_error(self):
+        if self.error is not None:
+            raise RuntimeError("Record writer failed") from self.error
+
+    def _put(self, item):
+        # Blocks while the queue is full, but not past a failure of the writer thread
+        while True:
+            self._check_error()
+            try:
+                self._queue.put(item, timeout=ERROR_POLL_INTERVAL_SEC)
+                return
+            except queue.Full:
+                continue
+
+    def _discard_queued(self):
+        """Release the captures queued but not written."""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not None and item[0] is not None:
+                _k4a.k4a_capture_release(item[0])
+
+    @property
+    def queue_depth(self):
+        return self._queue.qsize()
+
+    def _run(self):
+        try:
+            self._write_queued()
+        except BaseException as e:
+            # SystemExit included, VERIFY exits on SDK errors
+            self.error = e
+            self._discard_queued()
+
+    def _write_queued(self):
+        last_flush = time.perf_counter()
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            capture_handle, imu_sample = item
+            start = time.perf_counter()
+            if capture_handle is not None:
+                try:
+                    size = self.get_capture_size(capture_handle)
+                    self.record.write_capture(capture_handle)
+                finally:
+                    _k4a.k4a_capture_release(capture_handle)
+                self.written_captures += 1
+                if self.pipeline_stats is not None:
+                    self.pipeline_stats.add(RECORD_WRITE, int(start * 1e9), time.perf_counter_ns())
+            elif isinstance(imu_sample, np.ndarray):
+                size = _k4a.IMU_SAMPLE_SIZE * len(imu_sample)
+                self.record.write_imu_samples(imu_sample)
+                self.written_imu_samples += len(imu_sample)
+            else:
+                size = _k4a.IMU_SAMPLE_SIZE
+                self.record.write_imu(imu_sample)
+                self.written_imu_samples += 1
+
+            end = time.perf_counter()
+            self.written_bytes += size
+            with self._lock:
+                self._history.append((end, size, end - start))
+
+            if end - last_flush >= self.flush_interval_sec:
+                self.record.flush()
+                last_flush = time.perf_counter()
+
+        self.record.flush()
+
+    @staticmethod
+    def get_capture_size(capture_handle):
+        size = 0
+        for get_image in (
+            _k4a.k4a_capture_get_color_image,
+            _k4a.k4a_capture_get_depth_image,
+            _k4a.k4a_capture_get_ir_image,
+        ):
+            image_handle = get_image(capture_handle)
+            if image_handle:
+                size += int(_k4a.k4a_image_get_size(image_handle))
+                _k4a.k4a_image_release(image_handle)
+
+        return size
+
+    def get_stats(self):
+        """Back-pressure metrics: queue depth, throughput and write latency percentiles (ms)."""
+        with self._lock:
+            history = list(self._history)
+
+        stats = {
+            "queue_depth": self.queue_depth,
+            "captures": self.written_captures,
+            "imu_samples": self.written_imu_samples,
+            "bytes": self.written_bytes,
+            "bytes_per_second": 0.0,
+            "latency_ms": {"p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0},
+        }
+        if len(history) < 2:
+            return stats
+
+        elapsed = history[-1][0] - history[0][0]
+        if elapsed > 0:
+            stats["bytes_per_second"] = sum(size for _, size, _ in history[1:]) / elapsed
+
+        latencies = np.array([latency for _, _, latency in history]) * 1e3
+        p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+        stats["latency_ms"] = {"p50": float(p50), "p90": float(p90), "p99": float(p99), "max": float(latencies.max())}
+
+        return stats
@@ -1,4 +1,11 @@
+import numpy as np
+
 from ..k4a import _k4a
+from . import _k4arecord
+from ..utils import struct_view
+
+# Memory layout of `k4a_record_configuration_t`
+RECORD_CONFIGURATION_DTYPE = np.dtype(_k4arecord.k4a_record_configuration_t)
 
 
 class RecordConfiguration:
@@ -8,6 +15,10 @@ class RecordConfiguration:
     def handle(self):
         return self._handle
 
+    def get_view(self) -> np.void:
+        """`RECORD_CONFIGURATION_DTYPE` record sharing the memory of the configuration."""
+        return struct_view(self._handle, RECORD_CONFIGURATION_DTYPE)
+
     def __getattr__(self, name):
         """Pass the handle parameter, when asked"""
 
@@ -0,0 +1,170 @@
+import os
+import json
+import base64
+import threading
+from pathlib import Path
+
+import cv2
+
+from .playback import Playback
+
+CACHE_VERSION = 1
+THUMBNAIL_WIDTH = 64
+
+
+def get_default_cache_path():
+    return os.path.join(Path.home(), ".cache", "pykinect_recorder", "recordings.json")
+
+
+def read_recording_info(filepath, thumbnail_width=THUMBNAIL_WIDTH):
+    """Summary of a recording: length, record configuration, camera calibrations and a thumbnail.
+
+    Only the first color capture is decoded (at a reduced size for MJPG), for the thumbnail.
+    Args:
+        filepath (str): Path of the MKV.
+        thumbnail_width (int, optional): Width of the thumbnail in pixels. Defaults to 64.
+    Returns:
+        dict: JSON serializable summary, keyed by the absolute path, size and mtime of the file.
+    Raises:
+        OSError: The file is missing, or the SDK can't read it as a recording.
+    """
+    stat = os.stat(filepath)
+    ret, playback = Playback.try_open(filepath)
+    if not ret:
+        raise OSError(f"Failed to open recording {filepath}")
+    try:
+        ret, record_configuration = playback.try_get_record_configuration()
+        if not ret:
+            raise OSError(f"Failed to read the record configuration of {filepath}")
+        config = record_configuration.get_view()
+        calibration = playback.calibration.get_view()
+        return {
+            "path": os.path.abspath(filepath),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "length_usec": playback.get_recording_length(),
+            "config": {name: config[name].item() for name in config.dtype.names},
+            "calibration": {
+                "color": _summarize_camera(calibration["color_camera_calibration"]),
+                "depth": _summarize_camera(calibration["depth_camera_calibration"]),
+            },
+            "thumbnail": _read_thumbnail(playback, thumbnail_width),
+        }
+    finally:
+        playback.close()
+
+
+def _summarize_camera(camera):
+    params = camera["intrinsics"]["parameters"]["param"]
+    return {
+        "width": int(camera["resolution_width"]),
+        "height": int(camera["resolution_height"]),
+        **{name: float(params[name]) for name in ("fx", "fy", "cx", "cy")},
+    }
+
+
+def _read_thumbnail(playback, width, max_captures=10):
+    """Base64 JPEG of the first color image among the first captures, None without color track."""
+    for _ in range(max_captures):
+        ret, capture = playback.update()
+        if not ret:
+            return None
+
+        image = capture.get_color_image_object()
+        if not image.is_valid():
+            continue
+
+        reduce = next((factor for factor in (8, 4, 2) if image.width // factor >= width), 1)
+        ret, frame = image.to_numpy(reduce=reduce)
+        if not ret:
+            return None
+
+        h, w = frame.shape[:2]
+        thumbnail = cv2.resize(frame[..., :3], (width, max(round(width * h / w), 1)), interpolation=cv2.INTER_AREA)
+        ret, encoded = cv2.imencode(".jpg", thumbnail, [cv2.IMWRITE_JPEG_QUALITY, 80])
+        return base64.b64encode(encoded.tobytes()).decode("ascii") if ret else None
+
+    return None
+
+
+class RecordingInfoCache:
+    """Persistent cache of :func:`read_recording_info` summaries, stored as one JSON file.
+
+    Entries are keyed by absolute path and only returned while the size and mtime of the recording
+    still match, an edited or replaced file is read again. Recordings that failed to open are kept
+    as ``{"error": ...}`` entries so that they are not retried until they change.
+
+    Args:
+        path (str, optional): Path of the cache file. Defaults to `~/.cache/pykinect_recorder/recordings.json`.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or get_default_cache_path()
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get("version") == CACHE_VERSION:
+            with self._lock:
+                self._entries = data.get("recordings", {})
+
+    def save(self):
+        with self._lock:
+            data = {"version": CACHE_VERSION, "recordings": dict(self._entries)}
+
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(f"{self.path}.tmp", "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(f"{self.path}.tmp", self.path)
+        except OSError:
+            # Read-only home, the cache is still usable for this session
+            pass
+
+    def get(self, filepath):
+        """Cached summary of a recording, None if it is missing or stale."""
+        path = os.path.abspath(filepath)
+        with self._lock:
+            info = self._entries.get(path)
+        if info is None:
+            return None
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if (info["size"], info["mtime_ns"]) != (stat.st_size, stat.st_mtime_ns):
+            return None
+
+        return info
+
+    def put(self, info):
+        with self._lock:
+            self._entries[info["path"]] = info
+
+    def update(self, filepath):
+        """Read a recording into the cache, returns its summary."""
+        try:
+            info = read_recording_info(filepath)
+        except (OSError, cv2.error) as e:
+            # Raises OSError again if the file itself is gone
+            stat = os.stat(filepath)
+            info = {
+                "path": os.path.abspath(filepath),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "error": str(e) or type(e).__name__,
+            }
+
+        self.put(info)
+        return info
@@ -1,3 +1,4 @@
+import os
 import ctypes
 
 from .k4a import _k4a, Device, default_configuration
@@ -11,6 +12,15 @@ from .utils import (
 
 
 def initialize_libraries(module_k4a_path=None, module_k4abt_path=None, track_body=False) -> bool:
+    # Simulated devices instead of the SDK, inherited by the decoding processes
+    simulator = os.environ.get("PYKINECT_SIMULATOR")
+    if simulator:
+        initialize_simulator(
+            frames_dir=None if simulator == "1" else simulator,
+            realtime=os.environ.get("PYKINECT_SIMULATOR_REALTIME") == "1",
+        )
+        return True
+
     # Search the module path for k4a if not available
     if module_k4a_path is None:
         module_k4a_path = get_k4a_module_path()
@@ -51,6 +61,31 @@ def init_k4arecord(module_k4arecord_path):
     _k4arecord.setup_library(module_k4arecord_path)
 
 
+def initialize_simulator(device_count=1, frames_dir=None, realtime=False, imu_rate_hz=1600):
+    """Replace the SDK libraries with simulated devices and recordings, no camera or SDK install needed.
+
+    Handles created before the call are not valid anymore. Setting the `PYKINECT_SIMULATOR` environment
+    variable to "1" (or to a frames directory) makes `initialize_libraries` call this instead, and
+    `PYKINECT_SIMULATOR_REALTIME=1` paces the devices at their frame rate.
+    Args:
+        device_count (int, optional): Number of devices, chained for `DeviceGroup`. Defaults to 1.
+        frames_dir (str, optional): Directory of `.npy` frames to replay (see `DirectoryFrames`).
+            Defaults to None (synthetic test pattern).
+        realtime (bool, optional): Deliver the frames at their nominal rate. Defaults to False (as fast as read).
+        imu_rate_hz (int, optional): IMU sample rate. Defaults to 1600.
+    Returns:
+        SimulatedK4A: The simulated k4a library.
+    """
+    from .simulator import SimulatedK4A, SimulatedK4ARecord, DirectoryFrames
+
+    frames = DirectoryFrames(frames_dir) if frames_dir else None
+    k4a = SimulatedK4A(device_count, frames, realtime, imu_rate_hz)
+    _k4a.set_library(k4a)
+    _k4arecord.set_library(SimulatedK4ARecord(k4a))
+
+    return k4a
+
+
 def start_device(
     device_index=0,
     config=default_configuration,
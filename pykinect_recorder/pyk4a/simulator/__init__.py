@@ -0,0 +1,3 @@
+from .frames import SyntheticFrames, DirectoryFrames, encode_color
+from .k4a import SimulatedK4A
+from .k4arecord import SimulatedK4ARecord
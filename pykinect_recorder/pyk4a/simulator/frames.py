@@ -0,0 +1,192 @@
+import os
+import glob
+
+import cv2
+import numpy as np
+
+from ..k4a import _k4a
+from ..k4a.imu_sample import IMU_SAMPLE_DTYPE
+
+COLOR_RESOLUTIONS = {
+    _k4a.K4A_COLOR_RESOLUTION_720P: (1280, 720),
+    _k4a.K4A_COLOR_RESOLUTION_1080P: (1920, 1080),
+    _k4a.K4A_COLOR_RESOLUTION_1440P: (2560, 1440),
+    _k4a.K4A_COLOR_RESOLUTION_1536P: (2048, 1536),
+    _k4a.K4A_COLOR_RESOLUTION_2160P: (3840, 2160),
+    _k4a.K4A_COLOR_RESOLUTION_3072P: (4096, 3072),
+}
+
+DEPTH_RESOLUTIONS = {
+    _k4a.K4A_DEPTH_MODE_NFOV_2X2BINNED: (320, 288),
+    _k4a.K4A_DEPTH_MODE_NFOV_UNBINNED: (640, 576),
+    _k4a.K4A_DEPTH_MODE_WFOV_2X2BINNED: (512, 512),
+    _k4a.K4A_DEPTH_MODE_WFOV_UNBINNED: (1024, 1024),
+    _k4a.K4A_DEPTH_MODE_PASSIVE_IR: (1024, 1024),
+}
+
+# Subdirectories read by `DirectoryFrames`, "rgb" is also accepted for the color stream
+STREAM_DIRECTORIES = {"color": ("color", "rgb"), "depth": ("depth",), "ir": ("ir",)}
+
+
+def encode_color(bgr, color_format):
+    """Encode a BGR (or BGRA) uint8 frame to a K4A color format.
+
+    Returns:
+        tuple[np.ndarray, int]: Flat uint8 buffer and stride in bytes (0 for MJPG).
+    """
+    if bgr.ndim == 3 and bgr.shape[2] == 4:
+        bgr = cv2.cvtColor(bgr, cv2.COLOR_BGRA2BGR)
+    height, width = bgr.shape[:2]
+
+    if color_format == _k4a.K4A_IMAGE_FORMAT_COLOR_MJPG:
+        ret, encoded = cv2.imencode(".jpg", bgr, [cv2.IMWRITE_JPEG_QUALITY, 90])
+        if not ret:
+            raise ValueError("JPEG encoding failed")
+        return encoded.ravel(), 0
+    if color_format == _k4a.K4A_IMAGE_FORMAT_COLOR_BGRA32:
+        return cv2.cvtColor(bgr, cv2.COLOR_BGR2BGRA).ravel(), width * 4
+    if color_format == _k4a.K4A_IMAGE_FORMAT_COLOR_NV12:
+        # I420 has the U and V planes one after the other, NV12 interleaves them
+        i420 = cv2.cvtColor(bgr, cv2.COLOR_BGR2YUV_I420).ravel()
+        luma, chroma = i420[: width * height], i420[width * height:].reshape(2, -1)
+        return np.concatenate([luma, chroma.T.ravel()]), width
+    if color_format == _k4a.K4A_IMAGE_FORMAT_COLOR_YUY2:
+        yuv = cv2.cvtColor(bgr, cv2.COLOR_BGR2YUV)
+        yuy2 = np.empty((height, width, 2), dtype=np.uint8)
+        yuy2[..., 0] = yuv[..., 0]
+        # Y0 U Y1 V, the chroma of each pixel pair is averaged
+        pairs = yuv[:, : width - width % 2].reshape(height, -1, 2, 3).astype(np.uint16)
+        yuy2[:, 0::2, 1] = (pairs[:, :, 0, 1] + pairs[:, :, 1, 1] + 1) // 2
+        yuy2[:, 1::2, 1] = (pairs[:, :, 0, 2] + pairs[:, :, 1, 2] + 1) // 2
+        return yuy2.ravel(), width * 2
+
+    raise ValueError(f"Unsupported color format {color_format}")
+
+
+class SyntheticFrames:
+    """Deterministic test pattern frames, a few distinct ones cycled so that encoding is paid once.
+
+    The color frame is a gradient with a moving square, the depth frame a tilted plane (500 to 4500 mm)
+    with a box in front of it, the IR frame follows the depth frame. Buffers are shared by the images
+    that use them and must not be written to.
+
+    Args:
+        patterns (int, optional): Number of distinct frames per stream. Defaults to 8.
+    """
+
+    def __init__(self, patterns=8):
+        self.patterns = patterns
+        self._cache = {}
+
+    def get_color(self, index, color_format, size):
+        """Encoded color frame `index` as ``(buffer, stride, (width, height))``."""
+        key = ("color", index % self.patterns, color_format, size)
+        if key not in self._cache:
+            self._cache[key] = encode_color(self.draw_color(index % self.patterns, size), color_format) + (size,)
+        return self._cache[key]
+
+    def get_depth(self, index, size):
+        key = ("depth", index % self.patterns, size)
+        if key not in self._cache:
+            self._cache[key] = self.draw_depth(index % self.patterns, size)
+        return self._cache[key]
+
+    def get_ir(self, index, size):
+        key = ("ir", index % self.patterns, size)
+        if key not in self._cache:
+            depth = self.get_depth(index, size)
+            # Brighter when closer, in the range of the active IR modes
+            self._cache[key] = (20000000 // np.maximum(depth, 1).astype(np.uint32)).clip(0, 1000).astype(np.uint16)
+        return self._cache[key]
+
+    def draw_color(self, index, size):
+        width, height = size
+        x = np.linspace(0, 255, width, dtype=np.float32)
+        y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+        bgr = np.empty((height, width, 3), dtype=np.uint8)
+        bgr[..., 0] = x
+        bgr[..., 1] = y
+        bgr[..., 2] = (x + y + 32 * index) % 256
+
+        side = max(min(width, height) // 6, 1)
+        left = (width - side) * index // max(self.patterns - 1, 1)
+        cv2.rectangle(bgr, (left, (height - side) // 2), (left + side, (height + side) // 2), (255, 255, 255), -1)
+        return bgr
+
+    def draw_depth(self, index, size):
+        width, height = size
+        depth = np.linspace(500, 4500, height, dtype=np.float32)[:, None].repeat(width, axis=1).astype(np.uint16)
+
+        side = max(min(width, height) // 4, 1)
+        top = (height - side) * index // max(self.patterns - 1, 1)
+        depth[top: top + side, (width - side) // 2: (width + side) // 2] = 800
+        return depth
+
+
+class DirectoryFrames(SyntheticFrames):
+    """Frames replayed from `.npy` files, in file name order and looped.
+
+    `directory` has `color` (or `rgb`), `depth` and `ir` subdirectories. Color files are BGR(A) uint8
+    frames, encoded to the configured color format, depth and IR files are uint16 frames. The size of
+    the replayed frames is kept, whatever the configured resolution. Streams without a subdirectory
+    are synthesized.
+    """
+
+    def __init__(self, directory, patterns=8):
+        super().__init__(patterns)
+        self.directory = directory
+        self.files = {}
+        for stream, names in STREAM_DIRECTORIES.items():
+            for name in names:
+                files = sorted(glob.glob(os.path.join(directory, name, "*.npy")))
+                if files:
+                    self.files[stream] = files
+                    break
+
+        if not self.files:
+            raise FileNotFoundError(f"No color, depth or ir .npy frames in '{directory}'")
+
+    def _load(self, stream, index, convert):
+        files = self.files[stream]
+        key = (stream, index % len(files))
+        if key not in self._cache:
+            self._cache[key] = convert(np.load(files[index % len(files)]))
+        return self._cache[key]
+
+    def get_color(self, index, color_format, size):
+        if "color" not in self.files:
+            return super().get_color(index, color_format, size)
+        key = ("color", index % len(self.files["color"]), color_format)
+        if key not in self._cache:
+            frame = np.load(self.files["color"][key[1]]).astype(np.uint8)
+            self._cache[key] = encode_color(frame, color_format) + ((frame.shape[1], frame.shape[0]),)
+        return self._cache[key]
+
+    def get_depth(self, index, size):
+        if "depth" not in self.files:
+            return super().get_depth(index, size)
+        return self._load("depth", index, lambda frame: np.ascontiguousarray(frame, dtype=np.uint16))
+
+    def get_ir(self, index, size):
+        if "ir" not in self.files:
+            return super().get_ir(index, size)
+        return self._load("ir", index, lambda frame: np.ascontiguousarray(frame, dtype=np.uint16))
+
+
+def synthesize_imu_samples(start_usec, period_usec, first, count):
+    """`count` IMU samples from index `first`: gravity on the accelerometer and slow sines on both sensors.
+
+    Returns:
+        np.ndarray: `IMU_SAMPLE_DTYPE` array, accelerometer and gyroscope share their timestamps.
+    """
+    indices = np.arange(first, first + count, dtype=np.int64)
+    timestamps = start_usec + indices * period_usec
+    phase = timestamps.astype(np.float64) * (2 * np.pi / 1e6)
+
+    imu_samples = np.zeros(count, dtype=IMU_SAMPLE_DTYPE)
+    imu_samples["temperature"] = 30.0
+    imu_samples["acc_sample"] = np.stack([0.1 * np.sin(phase), 0.1 * np.cos(phase), np.full(count, -9.81)], axis=1)
+    imu_samples["acc_timestamp_usec"] = timestamps
+    imu_samples["gyro_sample"] = np.stack([0.01 * np.sin(2 * phase), np.zeros(count), 0.01 * np.cos(phase)], axis=1)
+    imu_samples["gyro_timestamp_usec"] = timestamps
+    return imu_samples
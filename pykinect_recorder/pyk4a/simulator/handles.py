@@ -0,0 +1,133 @@
+import ctypes
+import threading
+
+import numpy as np
+
+from ..k4a import _k4a
+
+
+class HandleTable:
+    """Python objects behind the opaque handles given to the wrappers.
+
+    A handle points to a `_handle_k4a_*_t` structure owned by its object, the address of that structure
+    is the key of the object in the table.
+    """
+
+    def __init__(self):
+        self._objects = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._objects)
+
+    def add(self, handle_type, obj, out=None):
+        """Register `obj` and point `out` (a `handle_type` pointer, when given) at it.
+
+        Returns:
+            handle_type: New handle of `obj`.
+        """
+        obj.handle_struct = handle_type._type_()
+        with self._lock:
+            self._objects[ctypes.addressof(obj.handle_struct)] = obj
+        if out is not None:
+            out.contents = obj.handle_struct
+
+        return handle_type(obj.handle_struct)
+
+    def get(self, handle):
+        """Object of `handle`, None for a NULL, released or unknown handle."""
+        address = ctypes.cast(handle, ctypes.c_void_p).value
+        if address is None:
+            return None
+
+        return self._objects.get(address)
+
+    def remove(self, obj):
+        with self._lock:
+            self._objects.pop(ctypes.addressof(obj.handle_struct), None)
+
+
+class RefCounted:
+    """Object released from its table once its last reference is dropped, like the SDK objects."""
+
+    def __init__(self, table):
+        self.table = table
+        self.handle_struct = None
+        self.ref_count = 1
+        self._lock = threading.Lock()
+
+    def reference(self):
+        with self._lock:
+            self.ref_count += 1
+
+    def release(self):
+        with self._lock:
+            self.ref_count -= 1
+            freed = self.ref_count == 0
+        if freed:
+            self.table.remove(self)
+            self.free()
+
+    def free(self):
+        pass
+
+
+class SimulatedImage(RefCounted):
+    """`k4a_image_t` whose buffer is a NumPy array, possibly shared with other read-only images."""
+
+    def __init__(self, table, image_format, width, height, stride, buffer, device_timestamp_usec=0):
+        super().__init__(table)
+        self.format = image_format
+        self.width = width
+        self.height = height
+        self.stride = stride
+        self.buffer = buffer
+        self.device_timestamp_usec = device_timestamp_usec
+        self.system_timestamp_nsec = 0
+        self.exposure_usec = 0
+        self.white_balance = 0
+        self.iso_speed = 0
+
+    @property
+    def size(self):
+        return self.buffer.nbytes
+
+    def get_buffer_pointer(self):
+        return ctypes.cast(self.buffer.ctypes.data, ctypes.POINTER(ctypes.c_uint8))
+
+    def to_bytes(self):
+        return self.buffer.tobytes()
+
+
+class SimulatedCapture(RefCounted):
+    """`k4a_capture_t` holding a reference on each of its color, depth and IR images."""
+
+    def __init__(self, table):
+        super().__init__(table)
+        self.images = {"color": None, "depth": None, "ir": None}
+        self.temperature_c = 30.0
+
+    def set_image(self, stream, image):
+        if image is not None:
+            image.reference()
+        previous, self.images[stream] = self.images[stream], image
+        if previous is not None:
+            previous.release()
+
+    def free(self):
+        for stream in self.images:
+            self.set_image(stream, None)
+
+
+def new_image_buffer(size):
+    return np.zeros(size, dtype=np.uint8)
+
+
+def new_image(table, image_format, width, height, stride, buffer=None, device_timestamp_usec=0, out=None):
+    """Register a new image (one reference held by the caller), returns it and its `k4a_image_t` handle."""
+    if buffer is None:
+        buffer = new_image_buffer(stride * height if stride else 0)
+    image = SimulatedImage(table, image_format, width, height, stride, buffer, device_timestamp_usec)
+    handle = table.add(_k4a.k4a_image_t, image, out)
+
+    return image, handle
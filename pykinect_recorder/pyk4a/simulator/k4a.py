@@ -0,0 +1,538 @@
+import math
+import time
+import ctypes
+import threading
+
+import numpy as np
+
+from ..k4a import _k4a
+from .frames import COLOR_RESOLUTIONS, DEPTH_RESOLUTIONS, SyntheticFrames, synthesize_imu_samples
+from .handles import HandleTable, SimulatedCapture, new_image
+
+CAMERA_FPS = {
+    _k4a.K4A_FRAMES_PER_SECOND_5: 5,
+    _k4a.K4A_FRAMES_PER_SECOND_15: 15,
+    _k4a.K4A_FRAMES_PER_SECOND_30: 30,
+}
+
+# Device time of the first frame, a real device starts counting when it is powered
+START_TIMESTAMP_USEC = 200000
+IMU_RATE_HZ = 1600
+IMU_BLOCK_SIZE = 1024
+
+# Field of view (degrees) of the synthetic pinhole intrinsics
+DEPTH_FOV = 75.0
+COLOR_FOV = 90.0
+
+# Position (mm) of each sensor in the depth camera frame, extrinsics have no rotation
+SENSOR_POSITIONS_MM = {
+    _k4a.K4A_CALIBRATION_TYPE_DEPTH: (0.0, 0.0, 0.0),
+    _k4a.K4A_CALIBRATION_TYPE_COLOR: (32.0, 2.0, -4.0),
+    _k4a.K4A_CALIBRATION_TYPE_GYRO: (0.0, 0.0, 0.0),
+    _k4a.K4A_CALIBRATION_TYPE_ACCEL: (0.0, 0.0, 0.0),
+}
+
+_CArgObject = type(ctypes.byref(ctypes.c_int()))
+
+
+def target(argument):
+    """ctypes object of an output argument, passed as is or with `ctypes.byref`."""
+    return argument._obj if isinstance(argument, _CArgObject) else argument
+
+
+def value(argument):
+    """Python value of an input argument, passed as a ctypes scalar or as a Python number."""
+    return getattr(target(argument), "value", argument)
+
+
+def image_size(image_format, height, stride):
+    if image_format == _k4a.K4A_IMAGE_FORMAT_COLOR_NV12:
+        return stride * height * 3 // 2
+    return stride * height
+
+
+def make_calibration(depth_mode, color_resolution):
+    """Synthetic `k4a_calibration_t`: undistorted pinhole cameras, the color camera 32 mm left of the depth one."""
+    calibration = _k4a.k4a_calibration_t()
+    calibration.depth_mode = depth_mode
+    calibration.color_resolution = color_resolution
+
+    for camera, (width, height), fov, position in (
+        (
+            calibration.depth_camera_calibration,
+            DEPTH_RESOLUTIONS.get(depth_mode, (0, 0)),
+            DEPTH_FOV,
+            _k4a.K4A_CALIBRATION_TYPE_DEPTH,
+        ),
+        (
+            calibration.color_camera_calibration,
+            COLOR_RESOLUTIONS.get(color_resolution, (0, 0)),
+            COLOR_FOV,
+            _k4a.K4A_CALIBRATION_TYPE_COLOR,
+        ),
+    ):
+        camera.resolution_width = width
+        camera.resolution_height = height
+        camera.metric_radius = 1.7
+        camera.extrinsics = get_extrinsics(_k4a.K4A_CALIBRATION_TYPE_DEPTH, position)
+
+        camera.intrinsics.type = _k4a.K4A_CALIBRATION_LENS_DISTORTION_MODEL_BROWN_CONRADY
+        camera.intrinsics.parameter_count = 14
+        params = camera.intrinsics.parameters.param
+        params.cx = width / 2
+        params.cy = height / 2
+        params.fx = params.fy = width / (2 * math.tan(math.radians(fov / 2)))
+        params.metric_radius = 1.7
+
+    for source in range(_k4a.K4A_CALIBRATION_TYPE_NUM):
+        for target_camera in range(_k4a.K4A_CALIBRATION_TYPE_NUM):
+            calibration.extrinsics[source][target_camera] = get_extrinsics(source, target_camera)
+
+    return calibration
+
+
+def get_extrinsics(source, target_camera):
+    extrinsics = _k4a.k4a_calibration_extrinsics_t()
+    extrinsics.rotation[0] = extrinsics.rotation[4] = extrinsics.rotation[8] = 1.0
+    for axis in range(3):
+        extrinsics.translation[axis] = SENSOR_POSITIONS_MM[source][axis] - SENSOR_POSITIONS_MM[target_camera][axis]
+
+    return extrinsics
+
+
+class SimulatedDevice:
+    """State of one opened simulated device: its clock, frame counters and IMU stream.
+
+    The device clock is in microseconds. With `realtime` it follows the wall clock from the start of
+    the cameras and the calls wait for the frames and samples to be due, otherwise it jumps to the
+    timestamp of each capture as soon as it is requested, so the stack runs as fast as it can consume.
+    """
+
+    def __init__(self, index, frames, realtime, imu_rate_hz):
+        self.index = index
+        self.serial_number = f"SIM{index:09d}"
+        self.frames = frames
+        self.realtime = realtime
+        self.imu_period_usec = 1e6 / imu_rate_hz
+
+        self.configuration = None
+        self.imu_started = False
+        self.frame_index = 0
+        self.imu_index = 0
+        self.clock_usec = START_TIMESTAMP_USEC
+        self.color_controls = {}
+
+        self._start_time = None
+        self._imu_block = None
+        self._lock = threading.Lock()
+
+    def get_frame_timestamp(self, frame_index):
+        period_usec = 1e6 / CAMERA_FPS[self.configuration.camera_fps]
+        return (
+            START_TIMESTAMP_USEC
+            + int(frame_index * period_usec)
+            + int(self.configuration.subordinate_delay_off_master_usec)
+        )
+
+    def get_imu_timestamp(self, imu_index):
+        return START_TIMESTAMP_USEC + int(imu_index * self.imu_period_usec)
+
+    def now(self):
+        if self.realtime and self._start_time is not None:
+            return START_TIMESTAMP_USEC + int((time.perf_counter() - self._start_time) * 1e6)
+        return self.clock_usec
+
+    def wait_until(self, timestamp_usec, timeout_in_ms):
+        """Advance the device clock to `timestamp_usec` unless it takes longer than the timeout."""
+        if not self.realtime:
+            if timestamp_usec > self.clock_usec and timeout_in_ms == 0:
+                return False
+            self.clock_usec = max(self.clock_usec, timestamp_usec)
+            return True
+
+        delay = (timestamp_usec - self.now()) / 1e6
+        if timeout_in_ms != _k4a.K4A_WAIT_INFINITE and delay > timeout_in_ms / 1000:
+            time.sleep(timeout_in_ms / 1000)
+            return False
+        if delay > 0:
+            time.sleep(delay)
+        return True
+
+    def start_cameras(self, configuration):
+        self.configuration = configuration
+        self.frame_index = 0
+        self.clock_usec = START_TIMESTAMP_USEC
+        self._start_time = time.perf_counter()
+
+    def stop_cameras(self):
+        self.configuration = None
+
+    def get_capture(self, table, out, timeout_in_ms):
+        configuration = self.configuration
+        if configuration is None:
+            return _k4a.K4A_WAIT_RESULT_FAILED
+
+        # Waits outside of the lock, IMU samples can be read meanwhile
+        timestamp_usec = self.get_frame_timestamp(self.frame_index)
+        if not self.wait_until(timestamp_usec, timeout_in_ms):
+            return _k4a.K4A_WAIT_RESULT_TIMEOUT
+        with self._lock:
+            frame_index = self.frame_index
+            self.frame_index += 1
+        timestamp_usec = self.get_frame_timestamp(frame_index)
+
+        capture = SimulatedCapture(table)
+        system_timestamp_nsec = time.monotonic_ns()
+        if configuration.color_resolution != _k4a.K4A_COLOR_RESOLUTION_OFF:
+            buffer, stride, (width, height) = self.frames.get_color(
+                frame_index, configuration.color_format, COLOR_RESOLUTIONS[configuration.color_resolution]
+            )
+            image, _ = new_image(table, configuration.color_format, width, height, stride, buffer, timestamp_usec)
+            self._attach(capture, "color", image, system_timestamp_nsec)
+
+        if configuration.depth_mode != _k4a.K4A_DEPTH_MODE_OFF:
+            size = DEPTH_RESOLUTIONS[configuration.depth_mode]
+            depth_timestamp_usec = timestamp_usec + int(configuration.depth_delay_off_color_usec)
+            streams = [("ir", _k4a.K4A_IMAGE_FORMAT_IR16, self.frames.get_ir(frame_index, size))]
+            if configuration.depth_mode != _k4a.K4A_DEPTH_MODE_PASSIVE_IR:
+                streams.append(("depth", _k4a.K4A_IMAGE_FORMAT_DEPTH16, self.frames.get_depth(frame_index, size)))
+
+            for stream, image_format, frame in streams:
+                height, width = frame.shape
+                buffer = frame.reshape(-1).view(np.uint8)
+                image, _ = new_image(table, image_format, width, height, width * 2, buffer, depth_timestamp_usec)
+                self._attach(capture, stream, image, system_timestamp_nsec)
+
+        table.add(_k4a.k4a_capture_t, capture, target(out))
+        return _k4a.K4A_WAIT_RESULT_SUCCEEDED
+
+    @staticmethod
+    def _attach(capture, stream, image, system_timestamp_nsec):
+        image.system_timestamp_nsec = system_timestamp_nsec
+        capture.set_image(stream, image)
+        # The capture holds the only reference
+        image.release()
+
+    def get_imu_sample(self, out, timeout_in_ms):
+        if not self.imu_started or self.configuration is None:
+            return _k4a.K4A_WAIT_RESULT_FAILED
+
+        # Samples up to the current device time are pending, later ones have to be waited for
+        if not self.wait_until(self.get_imu_timestamp(self.imu_index), timeout_in_ms):
+            return _k4a.K4A_WAIT_RESULT_TIMEOUT
+
+        with self._lock:
+            block, offset = divmod(self.imu_index, IMU_BLOCK_SIZE)
+            if self._imu_block is None or self._imu_block[0] != block:
+                first = block * IMU_BLOCK_SIZE
+                imu_samples = synthesize_imu_samples(START_TIMESTAMP_USEC, self.imu_period_usec, first, IMU_BLOCK_SIZE)
+                self._imu_block = (block, imu_samples)
+            sample = self._imu_block[1][offset: offset + 1]
+            ctypes.memmove(ctypes.addressof(target(out)), sample.ctypes.data, _k4a.IMU_SAMPLE_SIZE)
+            self.imu_index += 1
+
+        return _k4a.K4A_WAIT_RESULT_SUCCEEDED
+
+
+class SimulatedK4A:
+    """Pure Python stand-in for `k4a.dll`/`libk4a.so`, given to `_k4a.set_library`.
+
+    Devices produce the frames of `frames` (synthetic by default) at the rate of their configuration
+    and IMU samples at `imu_rate_hz`, with timestamps derived from the frame index only, so a run is
+    deterministic. Images, captures and their reference counts behave like the SDK ones. The
+    transformation and point conversion functions are not simulated: they are missing from this
+    object, like from a library without them, and calling them raises AttributeError.
+
+    Args:
+        device_count (int, optional): Number of installed devices, the first one is the sync master. Defaults to 1.
+        frames (SyntheticFrames, optional): Source of the frames. Defaults to None (synthetic test pattern).
+        realtime (bool, optional): Deliver frames and samples at their nominal rate instead of as fast as
+            they are read. Defaults to False.
+        imu_rate_hz (int, optional): IMU sample rate. Defaults to 1600.
+    """
+
+    def __init__(self, device_count=1, frames=None, realtime=False, imu_rate_hz=IMU_RATE_HZ):
+        self.device_count = device_count
+        self.frames = frames if frames is not None else SyntheticFrames()
+        self.realtime = realtime
+        self.imu_rate_hz = imu_rate_hz
+        self.handles = HandleTable()
+        self._opened = set()
+
+    def _device(self, device_handle):
+        return self.handles.get(device_handle)
+
+    # Devices
+    def k4a_device_get_installed_count(self):
+        return self.device_count
+
+    def k4a_device_open(self, device_id, device_handle):
+        index = value(device_id)
+        if index >= self.device_count or index in self._opened:
+            return _k4a.K4A_RESULT_FAILED
+
+        self._opened.add(index)
+        device = SimulatedDevice(index, self.frames, self.realtime, self.imu_rate_hz)
+        self.handles.add(_k4a.k4a_device_t, device, target(device_handle))
+        return _k4a.K4A_RESULT_SUCCEEDED
+
+    def k4a_device_close(self, device_handle):
+        device = self._device(device_handle)
+        if device is not None:
+            self._opened.discard(device.index)
+            self.handles.remove(device)
+
+    def k4a_device_start_cameras(self, device_handle, config):
+        device = self._device(device_handle)
+        configuration = _k4a.k4a_device_configuration_t.from_buffer_copy(target(config))
+        # 30 fps is not available with the largest modes
+        if device is None or (
+            configuration.camera_fps == _k4a.K4A_FRAMES_PER_SECOND_30
+            and (
+                configuration.color_resolution == _k4a.K4A_COLOR_RESOLUTION_3072P
+                or configuration.depth_mode == _k4a.K4A_DEPTH_MODE_WFOV_UNBINNED
+            )
+        ):
+            return _k4a.K4A_RESULT_FAILED
+
+        device.start_cameras(configuration)
+        return _k4a.K4A_RESULT_SUCCEEDED
+
+    def k4a_device_stop_cameras(self, device_handle):
+        device = self._device(device_handle)
+        if device is not None:
+            device.stop_cameras()
+
+    def k4a_device_start_imu(self, device_handle):
+        device = self._device(device_handle)
+        if device is None or device.configuration is None:
+            return _k4a.K4A_RESULT_FAILED
+
+        device.imu_started = True
+        return _k4a.K4A_RESULT_SUCCEEDED
+
+    def k4a_device_stop_imu(self, device_handle):
+        device = self._device(device_handle)
+        if device is not None:
+            device.imu_started = False
+
+    def k4a_device_get_capture(self, device_handle, capture_handle, timeout_in_ms):
+        device = self._device(device_handle)
+        if device is None:
+            return _k4a.K4A_WAIT_RESULT_FAILED
+
+        return device.get_capture(self.handles, capture_handle, value(timeout_in_ms))
+
+    def k4a_device_get_imu_sample(self, device_handle, imu_sample, timeout_in_ms):
+        device = self._device(device_handle)
+        if device is None:
+            return _k4a.K4A_WAIT_RESULT_FAILED
+
+        return device.get_imu_sample(imu_sample, value(timeout_in_ms))
+
+    def k4a_device_get_serialnum(self, device_handle, serial_number, serial_number_size):
+        device = self._device(device_handle)
+        if device is None:
+            return _k4a.K4A_BUFFER_RESULT_FAILED
+
+        data = device.serial_number.encode("ascii") + b"\0"
+        size = target(serial_number_size)
+        if serial_number is None or size.value < len(data):
+            size.value = len(data)
+            return _k4a.K4A_BUFFER_RESULT_TOO_SMALL
+
+        ctypes.memmove(target(serial_number), data, len(data))
+        size.value = len(data)
+        return _k4a.K4A_BUFFER_RESULT_SUCCEEDED
+
+    def k4a_device_get_version(self, device_handle, hardware_version):
+        if self._device(device_handle) is None:
+            return _k4a.K4A_RESULT_FAILED
+
+        version = target(hardware_version)
+        for field, (major, minor, iteration) in (
+            ("rgb", (1, 6, 110)),
+            ("depth", (1, 6, 79)),
+            ("audio", (1, 6, 14)),
+            ("depth_sensor", (6109, 7, 0)),
+        ):
+            getattr(version, field).major = major
+            getattr(version, field).minor = minor
+            getattr(version, field).iteration = iteration
+        return _k4a.K4A_RESULT_SUCCEEDED
+
+    def k4a_device_get_calibration(self, device_handle, depth_mode, color_resolution, calibration):
+        if self._device(device_handle) is None:
+            return _k4a.K4A_RESULT_FAILED
+
+        ctypes.pointer(target(calibration))[0] = make_calibration(value(depth_mode), value(color_resolution))
+        return _k4a.K4A_RESULT_SUCCEEDED
+
+    def k4a_device_get_sync_jack(self, device_handle, sync_in_jack_connected, sync_out_jack_connected):
+        device = self._device(device_handle)
+        if device is None:
+            return _k4a.K4A_RESULT_FAILED
+
+        # Daisy chain: the first device only drives the sync out jack, the others are subordinates
+        chained = self.device_count > 1
+        target(sync_in_jack_connected).value = chained and device.index > 0
+        target(sync_out_jack_connected).value = chained and device.index == 0
+        return _k4a.K4A_RESULT_SUCCEEDED
+
+    def k4a_device_get_color_control(self, device_handle, command, mode, control_value):
+        device = self._device(device_handle)
+        if device is None:
+            return _k4a.K4A_RESULT_FAILED
+
+        stored_mode, stored_value = device.color_controls.get(value(command), (0, 0))
+        target(mode).value = stored_mode
+        target(control_value).value = stored_value
+        return _k4a.K4A_RESULT_SUCCEEDED
+
+    def k4a_device_set_color_control(self, device_handle, command, mode, control_value):
+        device = self._device(device_handle)
+        if device is None:
+            return _k4a.K4A_RESULT_FAILED
+
+        device.color_controls[value(command)] = (value(mode), value(control_value))
+        return _k4a.K4A_RESULT_SUCCEEDED
+
+    # Captures
+    def k4a_capture_create(self, capture_handle):
+        self.handles.add(_k4a.k4a_capture_t, SimulatedCapture(self.handles), target(capture_handle))
+        return _k4a.K4A_RESULT_SUCCEEDED
+
+    def k4a_capture_reference(self, capture_handle):
+        capture = self.handles.get(capture_handle)
+        if capture is not None:
+            capture.reference()
+
+    def k4a_capture_release(self, capture_handle):
+        capture = self.handles.get(capture_handle)
+        if capture is not None:
+            capture.release()
+
+    def _get_image(self, capture_handle, stream):
+        capture = self.handles.get(capture_handle)
+        image = capture.images[stream] if capture is not None else None
+        if image is None:
+            return _k4a.k4a_image_t()
+
+        image.reference()
+        return _k4a.k4a_image_t(image.handle_struct)
+
+    def _set_image(self, capture_handle, stream, image_handle):
+        capture = self.handles.get(capture_handle)
+        if capture is not None:
+            capture.set_image(stream, self.handles.get(image_handle))
+
+    def k4a_capture_get_color_image(self, capture_handle):
+        return self._get_image(capture_handle, "color")
+
+    def k4a_capture_get_depth_image(self, capture_handle):
+        return self._get_image(capture_handle, "depth")
+
+    def k4a_capture_get_ir_image(self, capture_handle):
+        return self._get_image(capture_handle, "ir")
+
+    def k4a_capture_set_color_image(self, capture_handle, image_handle):
+        self._set_image(capture_handle, "color", image_handle)
+
+    def k4a_capture_set_depth_image(self, capture_handle, image_handle):
+        self._set_image(capture_handle, "depth", image_handle)
+
+    def k4a_capture_set_ir_image(self, capture_handle, image_handle):
+        self._set_image(capture_handle, "ir", image_handle)
+
+    def k4a_capture_set_temperature_c(self, capture_handle, temperature):
+        capture = self.handles.get(capture_handle)
+        if capture is not None:
+            capture.temperature_c = value(temperature)
+
+    def k4a_capture_get_temperature_c(self, capture_handle):
+        capture = self.handles.get(capture_handle)
+        return capture.temperature_c if capture is not None else float("nan")
+
+    # Images
+    def k4a_image_create(self, image_format, width_pixels, height_pixels, stride_bytes, image_handle):
+        image_format, height, stride = value(image_format), value(height_pixels), value(stride_bytes)
+        buffer = np.zeros(image_size(image_format, height, stride), dtype=np.uint8)
+        new_image(self.handles, image_format, value(width_pixels), height, stride, buffer, out=target(image_handle))
+        return _k4a.K4A_RESULT_SUCCEEDED
+
+    def k4a_image_reference(self, image_handle):
+        image = self.handles.get(image_handle)
+        if image is not None:
+            image.reference()
+
+    def k4a_image_release(self, image_handle):
+        image = self.handles.get(image_handle)
+        if image is not None:
+            image.release()
+
+    def _get_field(self, image_handle, field, default=0):
+        image = self.handles.get(image_handle)
+        return getattr(image, field) if image is not None else default
+
+    def _set_field(self, image_handle, field, field_value):
+        image = self.handles.get(image_handle)
+        if image is not None:
+            setattr(image, field, value(field_value))
+
+    def k4a_image_get_buffer(self, image_handle):
+        image = self.handles.get(image_handle)
+        return image.get_buffer_pointer() if image is not None else ctypes.POINTER(ctypes.c_uint8)()
+
+    def k4a_image_get_size(self, image_handle):
+        return self._get_field(image_handle, "size")
+
+    def k4a_image_get_format(self, image_handle):
+        return self._get_field(image_handle, "format", _k4a.K4A_IMAGE_FORMAT_CUSTOM)
+
+    def k4a_image_get_width_pixels(self, image_handle):
+        return self._get_field(image_handle, "width")
+
+    def k4a_image_get_height_pixels(self, image_handle):
+        return self._get_field(image_handle, "height")
+
+    def k4a_image_get_stride_bytes(self, image_handle):
+        return self._get_field(image_handle, "stride")
+
+    def k4a_image_get_timestamp_usec(self, image_handle):
+        return self._get_field(image_handle, "device_timestamp_usec")
+
+    def k4a_image_get_device_timestamp_usec(self, image_handle):
+        return self._get_field(image_handle, "device_timestamp_usec")
+
+    def k4a_image_get_system_timestamp_nsec(self, image_handle):
+        return self._get_field(image_handle, "system_timestamp_nsec")
+
+    def k4a_image_get_exposure_usec(self, image_handle):
+        return self._get_field(image_handle, "exposure_usec")
+
+    def k4a_image_get_white_balance(self, image_handle):
+        return self._get_field(image_handle, "white_balance")
+
+    def k4a_image_get_iso_speed(self, image_handle):
+        return self._get_field(image_handle, "iso_speed")
+
+    def k4a_image_set_device_timestamp_usec(self, image_handle, timestamp_usec):
+        self._set_field(image_handle, "device_timestamp_usec", timestamp_usec)
+
+    def k4a_image_set_timestamp_usec(self, image_handle, timestamp_usec):
+        self._set_field(image_handle, "device_timestamp_usec", timestamp_usec)
+
+    def k4a_image_set_system_timestamp_nsec(self, image_handle, timestamp_nsec):
+        self._set_field(image_handle, "system_timestamp_nsec", timestamp_nsec)
+
+    def k4a_image_set_exposure_usec(self, image_handle, exposure_usec):
+        self._set_field(image_handle, "exposure_usec", exposure_usec)
+
+    def k4a_image_set_exposure_time_usec(self, image_handle, exposure_usec):
+        self._set_field(image_handle, "exposure_usec", exposure_usec)
+
+    def k4a_image_set_white_balance(self, image_handle, white_balance):
+        self._set_field(image_handle, "white_balance", white_balance)
+
+    def k4a_image_set_iso_speed(self, image_handle, iso_speed):
+        self._set_field(image_handle, "iso_speed", iso_speed)
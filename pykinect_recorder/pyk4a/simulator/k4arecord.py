@@ -0,0 +1,372 @@
+import io
+import json
+import base64
+import bisect
+import struct
+import ctypes
+import threading
+
+import cv2
+import numpy as np
+
+from ..k4a import _k4a
+from ..k4a.imu_sample import IMU_SAMPLE_DTYPE
+from ..k4arecord import _k4arecord
+from .handles import HandleTable, SimulatedCapture, new_image
+from .k4a import SimulatedK4A, make_calibration, target, value
+
+# Recordings of the simulator are not Matroska files, the SDK can't read them and the other way around
+MAGIC = b"K4ASIM\x00\x01"
+
+CAPTURE_RECORD = b"C"
+IMU_RECORD = b"I"
+
+_RECORD_HEADER = struct.Struct("<cI")
+_CAPTURE_HEADER = struct.Struct("<QQ")  # first and last image timestamps (usec)
+_IMAGE_HEADER = struct.Struct("<BiiiiQQI")  # stream, format, width, height, stride, device/system timestamps, size
+_LENGTH = struct.Struct("<I")
+
+STREAMS = ("color", "depth", "ir")
+
+_CONFIGURATION_FIELDS = [name for name, _ in _k4arecord.k4a_record_configuration_t._fields_]
+
+
+class SimulatedRecording:
+    """File being written by `k4a_record_*`."""
+
+    def __init__(self, file, configuration, calibration):
+        self.file = file
+        self.configuration = configuration
+        self.calibration = calibration
+        self.header_written = False
+        self.lock = threading.Lock()
+
+    def write_header(self):
+        header = json.dumps(
+            {
+                "configuration": {name: getattr(self.configuration, name) for name in _CONFIGURATION_FIELDS},
+                "calibration": base64.b64encode(bytes(self.calibration)).decode("ascii"),
+            }
+        ).encode("utf-8")
+        self.file.write(MAGIC + _LENGTH.pack(len(header)) + header)
+        self.header_written = True
+
+    def write_record(self, kind, payload):
+        with self.lock:
+            self.file.write(_RECORD_HEADER.pack(kind, len(payload)))
+            self.file.write(payload)
+
+
+class SimulatedPlayback:
+    """Recording opened by `k4a_playback_open`, with a read cursor on its captures and one on its IMU samples.
+
+    The offsets of the captures are indexed when opening, their images are only read when requested.
+    """
+
+    def __init__(self, file, header):
+        self.file = file
+        self.configuration = _k4arecord.k4a_record_configuration_t(
+            *[header["configuration"][name] for name in _CONFIGURATION_FIELDS]
+        )
+        self.calibration = _k4a.k4a_calibration_t.from_buffer_copy(base64.b64decode(header["calibration"]))
+        self.color_conversion = None
+
+        offsets, first_timestamps, last_timestamps, imu_samples = [], [], [], []
+        while True:
+            record_header = file.read(_RECORD_HEADER.size)
+            if len(record_header) < _RECORD_HEADER.size:
+                break
+            kind, length = _RECORD_HEADER.unpack(record_header)
+            if kind == CAPTURE_RECORD:
+                offsets.append(file.tell())
+                first_timestamp, last_timestamp = _CAPTURE_HEADER.unpack(file.read(_CAPTURE_HEADER.size))
+                first_timestamps.append(first_timestamp)
+                last_timestamps.append(last_timestamp)
+                file.seek(length - _CAPTURE_HEADER.size, io.SEEK_CUR)
+            elif kind == IMU_RECORD:
+                imu_samples.append(file.read(length))
+            else:
+                file.seek(length, io.SEEK_CUR)
+
+        self.capture_offsets = offsets
+        self.capture_timestamps = last_timestamps
+        self.imu_samples = np.frombuffer(b"".join(imu_samples), dtype=IMU_SAMPLE_DTYPE)
+        self.imu_timestamps = self.imu_samples["acc_timestamp_usec"].tolist()
+
+        self.configuration.start_timestamp_offset_usec = first_timestamps[0] if first_timestamps else 0
+        self.last_timestamp_usec = max(last_timestamps + self.imu_timestamps, default=0)
+
+        self.capture_position = 0
+        self.imu_position = 0
+        self.lock = threading.Lock()
+
+    def read_capture(self, index, table):
+        with self.lock:
+            self.file.seek(self.capture_offsets[index] + _CAPTURE_HEADER.size)
+            count = self.file.read(1)[0]
+            images = []
+            for _ in range(count):
+                stream, image_format, width, height, stride, device_timestamp, system_timestamp, size = (
+                    _IMAGE_HEADER.unpack(self.file.read(_IMAGE_HEADER.size))
+                )
+                buffer = np.frombuffer(self.file.read(size), dtype=np.uint8)
+                images.append((STREAMS[stream], image_format, width, height, stride, buffer, device_timestamp,
+                               system_timestamp))
+
+        capture = SimulatedCapture(table)
+        for stream, image_format, width, height, stride, buffer, device_timestamp, system_timestamp in images:
+            if stream == "color" and self.color_conversion is not None and image_format != self.color_conversion:
+                buffer = self.convert_color(image_format, width, height, buffer)
+                image_format, stride = self.color_conversion, width * 4
+            image, _ = new_image(table, image_format, width, height, stride, buffer, device_timestamp)
+            image.system_timestamp_nsec = system_timestamp
+            capture.set_image(stream, image)
+            image.release()
+
+        return capture
+
+    @staticmethod
+    def convert_color(image_format, width, height, buffer):
+        """BGRA32 buffer of a color image, the only target format of `k4a_playback_set_color_conversion`."""
+        if image_format == _k4a.K4A_IMAGE_FORMAT_COLOR_MJPG:
+            bgr = cv2.imdecode(buffer, cv2.IMREAD_COLOR)
+        elif image_format == _k4a.K4A_IMAGE_FORMAT_COLOR_NV12:
+            bgr = cv2.cvtColor(buffer.reshape(height * 3 // 2, width), cv2.COLOR_YUV2BGR_NV12)
+        else:
+            bgr = cv2.cvtColor(buffer.reshape(height, width, 2), cv2.COLOR_YUV2BGR_YUY2)
+
+        return cv2.cvtColor(bgr, cv2.COLOR_BGR2BGRA).ravel()
+
+
+class SimulatedK4ARecord:
+    """Pure Python stand-in for `k4arecord.dll`/`libk4arecord.so`, given to `_k4arecord.set_library`.
+
+    Recordings are written in a simple container of their own: a JSON header with the configuration and
+    the calibration, then the captures and IMU samples in the order they are written. Captures are written
+    with their images as they are (MJPG stays compressed). Track, tag, attachment and data block functions
+    are not simulated.
+
+    Args:
+        k4a (SimulatedK4A): Simulated devices, whose captures and handles are shared.
+    """
+
+    def __init__(self, k4a: SimulatedK4A):
+        self.k4a = k4a
+
+    @property
+    def handles(self) -> HandleTable:
+        return self.k4a.handles
+
+    # Recording
+    def k4a_record_create(self, path, device, device_config, recording_handle):
+        if device and self.handles.get(device) is None:
+            return _k4a.K4A_RESULT_FAILED
+        try:
+            file = open(value(path), "wb")
+        except OSError:
+            return _k4a.K4A_RESULT_FAILED
+
+        config = target(device_config)
+        configuration = _k4arecord.k4a_record_configuration_t(
+            color_format=config.color_format,
+            color_resolution=config.color_resolution,
+            depth_mode=config.depth_mode,
+            camera_fps=config.camera_fps,
+            color_track_enabled=config.color_resolution != _k4a.K4A_COLOR_RESOLUTION_OFF,
+            depth_track_enabled=config.depth_mode not in (_k4a.K4A_DEPTH_MODE_OFF, _k4a.K4A_DEPTH_MODE_PASSIVE_IR),
+            ir_track_enabled=config.depth_mode != _k4a.K4A_DEPTH_MODE_OFF,
+            depth_delay_off_color_usec=config.depth_delay_off_color_usec,
+            wired_sync_mode=config.wired_sync_mode,
+            subordinate_delay_off_master_usec=config.subordinate_delay_off_master_usec,
+        )
+        calibration = make_calibration(config.depth_mode, config.color_resolution)
+        recording = SimulatedRecording(file, configuration, calibration)
+        self.handles.add(_k4arecord.k4a_record_t, recording, target(recording_handle))
+        return _k4a.K4A_RESULT_SUCCEEDED
+
+    def k4a_record_add_imu_track(self, recording_handle):
+        recording = self.handles.get(recording_handle)
+        if recording is None or recording.header_written:
+            return _k4a.K4A_RESULT_FAILED
+
+        recording.configuration.imu_track_enabled = True
+        return _k4a.K4A_RESULT_SUCCEEDED
+
+    def k4a_record_write_header(self, recording_handle):
+        recording = self.handles.get(recording_handle)
+        if recording is None or recording.header_written:
+            return _k4a.K4A_RESULT_FAILED
+
+        recording.write_header()
+        return _k4a.K4A_RESULT_SUCCEEDED
+
+    def k4a_record_write_capture(self, recording_handle, capture_handle):
+        recording = self.handles.get(recording_handle)
+        capture = self.handles.get(capture_handle)
+        if recording is None or not recording.header_written or capture is None:
+            return _k4a.K4A_RESULT_FAILED
+
+        images = [(index, capture.images[stream]) for index, stream in enumerate(STREAMS) if capture.images[stream]]
+        if not images:
+            return _k4a.K4A_RESULT_FAILED
+
+        timestamps = [image.device_timestamp_usec for _, image in images]
+        chunks = [_CAPTURE_HEADER.pack(min(timestamps), max(timestamps)), bytes([len(images)])]
+        for index, image in images:
+            chunks.append(
+                _IMAGE_HEADER.pack(
+                    index, image.format, image.width, image.height, image.stride,
+                    image.device_timestamp_usec, image.system_timestamp_nsec, image.size,
+                )
+            )
+            chunks.append(image.buffer.data)
+        recording.write_record(CAPTURE_RECORD, b"".join(chunks))
+        return _k4a.K4A_RESULT_SUCCEEDED
+
+    def k4a_record_write_imu_sample(self, recording_handle, imu_sample):
+        recording = self.handles.get(recording_handle)
+        if recording is None or not recording.header_written or not recording.configuration.imu_track_enabled:
+            return _k4a.K4A_RESULT_FAILED
+
+        recording.write_record(IMU_RECORD, bytes(target(imu_sample)))
+        return _k4a.K4A_RESULT_SUCCEEDED
+
+    def k4a_record_flush(self, recording_handle):
+        recording = self.handles.get(recording_handle)
+        if recording is None:
+            return _k4a.K4A_RESULT_FAILED
+
+        with recording.lock:
+            recording.file.flush()
+        return _k4a.K4A_RESULT_SUCCEEDED
+
+    def k4a_record_close(self, recording_handle):
+        recording = self.handles.get(recording_handle)
+        if recording is not None:
+            with recording.lock:
+                recording.file.close()
+            self.handles.remove(recording)
+
+    # Playback
+    def k4a_playback_open(self, path, playback_handle):
+        try:
+            file = open(value(path), "rb")
+        except OSError:
+            return _k4a.K4A_RESULT_FAILED
+
+        try:
+            if file.read(len(MAGIC)) != MAGIC:
+                raise ValueError("Not a simulator recording")
+            (length,) = _LENGTH.unpack(file.read(_LENGTH.size))
+            playback = SimulatedPlayback(file, json.loads(file.read(length)))
+        except (ValueError, KeyError, struct.error):
+            file.close()
+            return _k4a.K4A_RESULT_FAILED
+
+        self.handles.add(_k4arecord.k4a_playback_t, playback, target(playback_handle))
+        return _k4a.K4A_RESULT_SUCCEEDED
+
+    def k4a_playback_close(self, playback_handle):
+        playback = self.handles.get(playback_handle)
+        if playback is not None:
+            playback.file.close()
+            self.handles.remove(playback)
+
+    def k4a_playback_get_calibration(self, playback_handle, calibration):
+        playback = self.handles.get(playback_handle)
+        if playback is None:
+            return _k4a.K4A_RESULT_FAILED
+
+        ctypes.pointer(target(calibration))[0] = playback.calibration
+        return _k4a.K4A_RESULT_SUCCEEDED
+
+    def k4a_playback_get_record_configuration(self, playback_handle, config):
+        playback = self.handles.get(playback_handle)
+        if playback is None:
+            return _k4a.K4A_RESULT_FAILED
+
+        ctypes.pointer(target(config))[0] = playback.configuration
+        return _k4a.K4A_RESULT_SUCCEEDED
+
+    def k4a_playback_set_color_conversion(self, playback_handle, target_format):
+        playback = self.handles.get(playback_handle)
+        if playback is None or value(target_format) != _k4a.K4A_IMAGE_FORMAT_COLOR_BGRA32:
+            return _k4a.K4A_RESULT_FAILED
+
+        playback.color_conversion = _k4a.K4A_IMAGE_FORMAT_COLOR_BGRA32
+        return _k4a.K4A_RESULT_SUCCEEDED
+
+    def _get_capture(self, playback_handle, capture_handle, step):
+        playback = self.handles.get(playback_handle)
+        if playback is None:
+            return _k4arecord.K4A_STREAM_RESULT_FAILED
+
+        # The cursor is between two captures: next reads the one after it, previous the one before it
+        index = playback.capture_position if step > 0 else playback.capture_position - 1
+        if not 0 <= index < len(playback.capture_offsets):
+            return _k4arecord.K4A_STREAM_RESULT_EOF
+
+        playback.capture_position += step
+        capture = playback.read_capture(index, self.handles)
+        self.handles.add(_k4a.k4a_capture_t, capture, target(capture_handle))
+        return _k4arecord.K4A_STREAM_RESULT_SUCCEEDED
+
+    def k4a_playback_get_next_capture(self, playback_handle, capture_handle):
+        return self._get_capture(playback_handle, capture_handle, 1)
+
+    def k4a_playback_get_previous_capture(self, playback_handle, capture_handle):
+        return self._get_capture(playback_handle, capture_handle, -1)
+
+    def _get_imu_sample(self, playback_handle, imu_sample, step):
+        playback = self.handles.get(playback_handle)
+        if playback is None:
+            return _k4arecord.K4A_STREAM_RESULT_FAILED
+
+        index = playback.imu_position if step > 0 else playback.imu_position - 1
+        if not 0 <= index < len(playback.imu_samples):
+            return _k4arecord.K4A_STREAM_RESULT_EOF
+
+        playback.imu_position += step
+        ctypes.memmove(
+            ctypes.addressof(target(imu_sample)), playback.imu_samples[index: index + 1].ctypes.data,
+            _k4a.IMU_SAMPLE_SIZE,
+        )
+        return _k4arecord.K4A_STREAM_RESULT_SUCCEEDED
+
+    def k4a_playback_get_next_imu_sample(self, playback_handle, imu_sample):
+        return self._get_imu_sample(playback_handle, imu_sample, 1)
+
+    def k4a_playback_get_previous_imu_sample(self, playback_handle, imu_sample):
+        return self._get_imu_sample(playback_handle, imu_sample, -1)
+
+    def k4a_playback_seek_timestamp(self, playback_handle, offset_usec, origin):
+        playback = self.handles.get(playback_handle)
+        if playback is None:
+            return _k4a.K4A_RESULT_FAILED
+
+        offset_usec, origin = value(offset_usec), value(origin)
+        if origin == _k4arecord.K4A_PLAYBACK_SEEK_BEGIN:
+            # The IMU samples written before the first capture are part of the beginning
+            timestamp = playback.configuration.start_timestamp_offset_usec + offset_usec if offset_usec > 0 else 0
+        elif origin == _k4arecord.K4A_PLAYBACK_SEEK_END:
+            timestamp = playback.last_timestamp_usec + offset_usec
+        elif origin == _k4arecord.K4A_PLAYBACK_SEEK_DEVICE_TIME:
+            timestamp = offset_usec
+        else:
+            return _k4a.K4A_RESULT_FAILED
+
+        # Next capture: the first one with an image at or after the timestamp
+        playback.capture_position = bisect.bisect_left(playback.capture_timestamps, timestamp)
+        playback.imu_position = bisect.bisect_left(playback.imu_timestamps, timestamp)
+        return _k4a.K4A_RESULT_SUCCEEDED
+
+    def k4a_playback_get_recording_length_usec(self, playback_handle):
+        playback = self.handles.get(playback_handle)
+        if playback is None:
+            return 0
+
+        return playback.last_timestamp_usec - playback.configuration.start_timestamp_offset_usec
+
+    def k4a_playback_get_last_timestamp_usec(self, playback_handle):
+        playback = self.handles.get(playback_handle)
+        return playback.last_timestamp_usec if playback is not None else 0
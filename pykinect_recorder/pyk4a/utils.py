@@ -1,5 +1,7 @@
 import sys
+import ctypes
 import platform
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -9,12 +11,91 @@ from numpy.typing import NDArray
 import open3d as o3d
 
 
+# Fixed display ranges, so the brightness does not follow the content of each frame
+DEPTH_CLIPPING_RANGE = (0, 5000)
+IR_CLIPPING_RANGE = (0, 1000)  # k4aviewer default for the active IR modes
+
+
+class Colorizer:
+    """Colorize 16 bits depth/IR images with a lookup table precomputed for a fixed clipping range.
+
+    The 65536 entries table maps every possible pixel value to its packed BGRA color, so a frame is
+    colorized with a single gather instead of clip + min/max normalize + colormap. Tables are built
+    once per (clipping range, colormap) and shared by every instance.
+
+    Args:
+        clipping_range (tuple[int, int], optional): Values mapped to the first and last colors. Defaults to (0, 5000).
+        colormap (int, optional): OpenCV colormap. Defaults to cv2.COLORMAP_HSV.
+    """
+
+    _lookup_tables = {}
+
+    def __init__(
+        self,
+        clipping_range: tuple[int, int] = DEPTH_CLIPPING_RANGE,
+        colormap: int = cv2.COLORMAP_HSV,
+    ) -> None:
+        self.clipping_range = clipping_range
+        self.colormap = colormap
+        self.lookup_table = self.get_lookup_table(clipping_range, colormap)
+        # Scratch BGRA frame reused by `__call__`, one per thread
+        self._scratch = threading.local()
+
+    @classmethod
+    def get_lookup_table(cls, clipping_range: tuple[int, int], colormap: int) -> NDArray:
+        """Packed BGRA lookup table (65536 uint32) for a clipping range and a colormap."""
+        key = (tuple(clipping_range), colormap)
+        lookup_table = cls._lookup_tables.get(key)
+        if lookup_table is None:
+            low, high = clipping_range
+            values = (np.arange(65536, dtype=np.float64) - low) * (255.0 / max(high - low, 1))
+            values = np.clip(np.rint(values), 0, 255).astype(np.uint8)
+
+            bgra = np.full((65536, 4), 255, dtype=np.uint8)
+            bgra[:, :3] = cv2.applyColorMap(values.reshape(-1, 1), colormap).reshape(-1, 3)
+            lookup_table = cls._lookup_tables.setdefault(key, bgra.view(np.uint32).ravel())
+
+        return lookup_table
+
+    def __call__(self, image: NDArray, out: Optional[NDArray] = None) -> NDArray:
+        """Colorize to BGR.
+        Args:
+            image (NDArray[H,W]): uint16 or uint8 image to colorize.
+            out (Optional[NDArray[H,W,3]], optional): uint8 buffer to write into. Defaults to None (allocated).
+        Returns:
+            NDArray[H,W,3]: Colorized image.
+        """
+        bgra = getattr(self._scratch, "bgra", None)
+        if bgra is None or bgra.shape[:2] != image.shape[:2]:
+            bgra = self._scratch.bgra = np.empty((*image.shape[:2], 4), dtype=np.uint8)
+
+        self.to_bgra(image, bgra)
+        return cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=out)
+
+    def to_bgra(self, image: NDArray, out: Optional[NDArray] = None) -> NDArray:
+        """Colorize to BGRA with an opaque alpha channel, the memory layout of QImage.Format_RGB32.
+        Args:
+            image (NDArray[H,W]): uint16 or uint8 image to colorize.
+            out (Optional[NDArray[H,W,4]], optional): uint8 buffer to write into. Defaults to None (allocated).
+        Returns:
+            NDArray[H,W,4]: Colorized image.
+        """
+        if out is None:
+            out = np.empty((*image.shape[:2], 4), dtype=np.uint8)
+
+        np.take(self.lookup_table, image, out=out.view(np.uint32).reshape(image.shape[:2]), mode="clip")
+        return out
+
+
 def colorize(
     image: NDArray,
     clipping_range: Optional[tuple[int, int]] = (None, None),
     colormap: int = cv2.COLORMAP_HSV,
 ) -> NDArray:
-    """Colorize image with OpenCV colormap.
+    """Colorize image with OpenCV colormap, after a min/max normalization of each frame.
+
+    For a stream of frames sharing a fixed clipping range, :class:`Colorizer` maps the same values
+    to the same colors in every frame with a single lookup.
     Args:
         image (NDArray[H,W]): Image to colorize.
         clipping_range (Optional[tuple[int, int]], optional): Clipping range for image. Defaults to (None, None).
@@ -145,19 +226,19 @@ def get_k4abt_lite_model_path():
     )
 
 
-def get_dict(struct):
-    result = {}
-    for field, _ in struct._fields_:
-        value = getattr(struct, field)
-        # if the type is not a primitive and it evaluates to False ...
-        if (type(value) not in [int, float, bool]) and not bool(value):
-            # it's a null pointer
-            value = None
-        elif hasattr(value, "_length_") and hasattr(value, "_type_"):
-            # Probably an array
-            value = np.array(list(value))
-        elif hasattr(value, "_fields_"):
-            # Probably another struct
-            value = get_dict(value)
-        result[field] = value
-    return result
+def struct_view(struct, dtype=None):
+    """Structured NumPy view of a ctypes structure, or of a ctypes array of structures, sharing its memory.
+
+    Args:
+        struct (ctypes.Structure | ctypes.Array): Structure(s) to view.
+        dtype (np.dtype, optional): Layout of one structure. Defaults to `np.dtype` of the structure type.
+    Returns:
+        np.void | np.ndarray: A record for a structure, an array of records for an array.
+    """
+    is_array = isinstance(struct, ctypes.Array)
+    if dtype is None:
+        dtype = np.dtype(struct._type_ if is_array else type(struct))
+
+    # Bytes of the same memory, so that NumPy ignores the PEP 3118 format of the structure
+    view = np.frombuffer((ctypes.c_ubyte * ctypes.sizeof(struct)).from_buffer(struct), dtype=dtype)
+    return view if is_array else view[0]
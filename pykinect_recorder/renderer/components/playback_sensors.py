@@ -1,9 +1,12 @@
-import cv2
+import threading
 
 from PySide6.QtCore import Qt, QTimer, QThread
-from PySide6.QtGui import QImage
+from .preview import PreviewPipeline
+from .seek_scheduler import SeekScheduler
+from ...pyk4a.k4a.decode_pool import get_decode_pool
+from ...pyk4a.k4arecord.frame_cache import FrameCache, ReadAhead
 from ...pyk4a.k4arecord.playback import Playback
-from ...pyk4a.utils import colorize
+from ...pyk4a.k4arecord.playback_index import PlaybackIndex
 from ..signals import all_signals
 
 
@@ -17,48 +20,53 @@ class PlaybackSensors(QThread):
         self.timer = QTimer()
         self.timer.setInterval(1000 / self.device_fps)
         self.timer.timeout.connect(self.run)
-        all_signals.playback_signals.time_control.connect(self.change_timestamp)
 
-    def change_timestamp(self, time: int):
-        self.playback.seek_timestamp(time)
-        self.update_next_frame()
+        self.decode_pool = get_decode_pool()
+        self.preview = PreviewPipeline(all_signals.playback_signals, decode_pool=self.decode_pool)
+        all_signals.playback_signals.preview_size.connect(self.preview.set_target_size)
 
-    def update_next_frame(self):
-        try:
-            _, current_frame = self.playback.update()
-            current_imu_data = self.playback.get_next_imu_sample()
-            current_rgb_frame = current_frame.get_color_image()
-            current_depth_frame = current_frame.get_colored_depth_image()
-            current_ir_frame = current_frame.get_ir_image()
+        # Seeks and decodes run on their own thread, slider bursts are coalesced there
+        self.cache = FrameCache(decode_pool=self.decode_pool)
+        self.read_ahead = ReadAhead(self.playback.filepath, self.cache)
+        self.scheduler = SeekScheduler(
+            self.playback,
+            self.preview,
+            all_signals.playback_signals,
+            self.device_fps,
+            cache=self.cache,
+            read_ahead=self.read_ahead,
+        )
+        self.scheduler.end_reached.connect(self.timer.stop)
+        self.scheduler.start()
+        all_signals.playback_signals.time_control.connect(self.change_timestamp)
+        all_signals.playback_signals.time_scrub.connect(self.scrub_timestamp)
 
-            if current_rgb_frame[0]:
-                rgb_frame = cv2.cvtColor(current_rgb_frame[1], cv2.COLOR_BGR2RGB)
-                h, w, ch = rgb_frame.shape
-                rgb_frame = QImage(rgb_frame, w, h, ch * w, QImage.Format_RGB888)
-                all_signals.playback_signals.rgb_image.emit(rgb_frame)
+        # Frame accurate seeks once the timestamp index is available, scanning a long file takes a while
+        self.playback.index = PlaybackIndex.load_sidecar(self.playback.filepath)
+        if self.playback.index is None:
+            threading.Thread(target=self.build_index, daemon=True).start()
 
-            if current_depth_frame[0]:
-                depth_frame = colorize(current_depth_frame[1], (None, 5000), cv2.COLORMAP_HSV)
-                h, w, ch = depth_frame.shape
-                depth_frame = QImage(depth_frame, w, h, w * ch, QImage.Format_RGB888)
-                all_signals.playback_signals.depth_image.emit(depth_frame)
+    def build_index(self):
+        playback = Playback(self.playback.filepath)
+        index = PlaybackIndex.build(playback)
+        playback.close()
+        index.save_sidecar(self.playback.filepath)
+        self.playback.index = index
+
+    def change_timestamp(self, time: int):
+        self.scheduler.request(time)
 
-            if current_ir_frame[0]:
-                ir_frame = colorize(current_ir_frame[1], (None, 5000), cv2.COLORMAP_BONE)
-                h, w, ch = ir_frame.shape
-                ir_frame = QImage(ir_frame, w, h, w * ch, QImage.Format_RGB888)     
-                all_signals.playback_signals.ir_image.emit(ir_frame)
-    
-            acc_time = current_imu_data.acc_time
-            acc_data = current_imu_data.acc
-            gyro_data = current_imu_data.gyro
+    def scrub_timestamp(self, time: int):
+        self.scheduler.request(time, scrub=True)
 
-            all_signals.playback_signals.video_fps.emit(int(self.device_fps))
-            all_signals.playback_signals.record_time.emit(acc_time / 1e6)
-            all_signals.playback_signals.imu_acc_data.emit(acc_data)
-            all_signals.playback_signals.imu_gyro_data.emit(gyro_data)
-        except:
-            self.timer.stop()
+    def stop(self):
+        """Stop the timer and the seek thread, the playback can be closed afterwards."""
+        self.timer.stop()
+        all_signals.playback_signals.time_control.disconnect(self.change_timestamp)
+        all_signals.playback_signals.time_scrub.disconnect(self.scrub_timestamp)
+        all_signals.playback_signals.preview_size.disconnect(self.preview.set_target_size)
+        self.scheduler.stop()
+        self.read_ahead.stop()
 
     def run(self):
         all_signals.playback_signals.time_value.emit(1e6//self.device_fps)
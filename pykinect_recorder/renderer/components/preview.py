@@ -0,0 +1,165 @@
+from contextlib import nullcontext
+
+import cv2
+from PySide6.QtGui import QImage
+
+from ...pyk4a.k4a.buffer_pool import BufferPool
+from ...pyk4a.k4a.pipeline_stats import DECODE, COLORIZE, EMIT
+from ...pyk4a.utils import Colorizer, DEPTH_CLIPPING_RANGE, IR_CLIPPING_RANGE
+
+
+# Largest label the sensor frames are shown in, used until the viewer reports its size
+DEFAULT_TARGET_SIZE = (595, 510)
+REDUCE_FACTORS = (8, 4, 2)
+# Stands for the stage timers when the pipeline isn't instrumented
+UNTIMED = nullcontext()
+
+
+def get_reduce_factor(width: int, height: int, target_size: tuple[int, int]) -> int:
+    """Largest power-of-two reduction that keeps the frame at least as big as the target.
+    Args:
+        width (int): Frame width in pixels.
+        height (int): Frame height in pixels.
+        target_size (tuple[int, int]): Width and height of the widget the frame is shown in.
+    Returns:
+        int: 1, 2, 4 or 8.
+    """
+    target_width, target_height = target_size
+    for factor in REDUCE_FACTORS:
+        if width // factor >= target_width and height // factor >= target_height:
+            return factor
+    return 1
+
+
+class PreviewPipeline:
+    """Decode and colorize captures at display resolution for the sensor viewers.
+
+    The frames shown in the viewers are scaled down to their labels anyway, so the color image is
+    decoded with JPEG DCT scaling and depth/IR are area-resized before the colormaps. The preview
+    cost follows the widget size instead of the sensor resolution; recorded captures are untouched.
+
+    Intermediate and displayed frames come from a :class:`BufferPool`. A displayed frame returns to the
+    pool once the viewer dropped the ``QImage`` wrapping it.
+
+    Given a :class:`PipelineStats`, the decode, colorize and emit stages of every frame are timed. Given a
+    :class:`DecodePool`, the color image is decoded on its workers while depth and IR are colorized.
+    """
+
+    def __init__(
+        self,
+        signals,
+        target_size: tuple[int, int] = DEFAULT_TARGET_SIZE,
+        max_buffers: int = 24,
+        stats=None,
+        decode_pool=None,
+    ) -> None:
+        self.signals = signals
+        self.stats = stats
+        self.decode_pool = decode_pool
+        self.target_size = target_size
+        self.pool = BufferPool(max_buffers)
+        self.depth_colorizer = Colorizer(DEPTH_CLIPPING_RANGE, cv2.COLORMAP_HSV)
+        self.ir_colorizer = Colorizer(IR_CLIPPING_RANGE, cv2.COLORMAP_BONE)
+
+    def set_target_size(self, width: int, height: int) -> None:
+        self.target_size = (max(width, 1), max(height, 1))
+
+    def update(self, capture, scale: int = 1) -> None:
+        """Emit the frames of a capture, `scale` > 1 decodes them for a label that many times smaller."""
+        target_size = self.get_target_size(scale)
+
+        color = None
+        with capture.get_color_image_object() as color_image:
+            if color_image.is_valid():
+                reduce = get_reduce_factor(color_image.width, color_image.height, target_size)
+                if self.decode_pool is not None:
+                    color = self.decode_pool.submit(color_image, reduce, self.pool)
+                else:
+                    with self.stage(DECODE):
+                        color = color_image.to_numpy(reduce=reduce, pool=self.pool)
+                    self.emit_color(color)
+                    color = None
+
+        depth_image = capture.get_depth_image_object()
+        if depth_image.is_valid():
+            reduce = get_reduce_factor(depth_image.width, depth_image.height, target_size)
+            with self.stage(DECODE):
+                ret, depth_frame = depth_image.to_numpy(copy=False, reduce=reduce, pool=self.pool)
+            if ret:
+                self.emit_colorized(self.signals.depth_image, self.depth_colorizer, depth_frame, reduce > 1)
+
+        ir_image = capture.get_ir_image_object()
+        if ir_image.is_valid():
+            reduce = get_reduce_factor(ir_image.width, ir_image.height, target_size)
+            with self.stage(DECODE):
+                ret, ir_frame = ir_image.to_numpy(copy=False, reduce=reduce, pool=self.pool)
+            if ret:
+                self.emit_colorized(self.signals.ir_image, self.ir_colorizer, ir_frame, reduce > 1)
+
+        if color is not None:
+            # Time left waiting for the workers
+            with self.stage(DECODE):
+                color = color.result()
+            self.emit_color(color)
+
+    def emit_color(self, decoded) -> None:
+        ret, bgr_frame = decoded
+        if ret:
+            # MJPG is decoded by OpenCV into its own array, the converted formats into a pool buffer
+            self.emit_rgb(bgr_frame, pooled=self.pool.owns(bgr_frame))
+
+    def update_frames(self, frames: dict, scale: int = 1) -> None:
+        """Emit full resolution frames decoded beforehand, e.g. by a :class:`FrameCache`, left untouched."""
+        target_size = self.get_target_size(scale)
+        if "color" in frames:
+            bgr_frame, pooled = self.resize(frames["color"], target_size)
+            self.emit_rgb(bgr_frame, pooled)
+        if "depth" in frames:
+            depth_frame, pooled = self.resize(frames["depth"], target_size)
+            self.emit_colorized(self.signals.depth_image, self.depth_colorizer, depth_frame, pooled)
+        if "ir" in frames:
+            ir_frame, pooled = self.resize(frames["ir"], target_size)
+            self.emit_colorized(self.signals.ir_image, self.ir_colorizer, ir_frame, pooled)
+
+    def stage(self, name: str):
+        return UNTIMED if self.stats is None else self.stats.stage(name)
+
+    def get_target_size(self, scale: int = 1) -> tuple[int, int]:
+        return max(self.target_size[0] // scale, 1), max(self.target_size[1] // scale, 1)
+
+    def resize(self, frame, target_size: tuple[int, int]):
+        """Area-resize a frame into a pool buffer by its reduce factor, returns (frame, pooled)."""
+        h, w = frame.shape[:2]
+        reduce = get_reduce_factor(w, h, target_size)
+        if reduce == 1:
+            return frame, False
+
+        reduced = self.pool.acquire((h // reduce, w // reduce) + frame.shape[2:], frame.dtype)
+        cv2.resize(frame, (w // reduce, h // reduce), dst=reduced, interpolation=cv2.INTER_AREA)
+        return reduced, True
+
+    def emit_rgb(self, bgr_frame, pooled: bool) -> None:
+        h, w = bgr_frame.shape[:2]
+        rgb_frame = self.pool.acquire((h, w, 3))
+        with self.stage(COLORIZE):
+            cv2.cvtColor(bgr_frame, cv2.COLOR_BGR2RGB, dst=rgb_frame)
+        if pooled:
+            self.pool.release(bgr_frame)
+        self.emit(self.signals.rgb_image, QImage(rgb_frame, w, h, 3 * w, QImage.Format_RGB888), rgb_frame)
+
+    def emit_colorized(self, signal, colorizer: Colorizer, frame, pooled: bool) -> None:
+        h, w = frame.shape[:2]
+        with self.stage(COLORIZE):
+            bgra_frame = colorizer.to_bgra(frame, out=self.pool.acquire((h, w, 4)))
+        if pooled:
+            # Reduced frames were resized into a pool buffer, full size ones are views on the SDK image
+            self.pool.release(frame)
+
+        # BGRA bytes are the little-endian layout of Format_RGB32, no channel swap needed
+        self.emit(signal, QImage(bgra_frame, w, h, 4 * w, QImage.Format_RGB32), bgra_frame)
+
+    def emit(self, signal, image: QImage, buffer) -> None:
+        with self.stage(EMIT):
+            signal.emit(image)
+        # The QImage keeps a reference on its buffer until the viewer is done with it
+        self.pool.release_when_unused(buffer)
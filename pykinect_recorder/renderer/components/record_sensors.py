@@ -1,20 +1,24 @@
+import os
 import time
+import datetime
 
-import cv2
 from PySide6.QtCore import Qt, QThread, QTimer
-from PySide6.QtGui import QImage
 from PySide6.QtMultimedia import (
     QAudioFormat,
     QAudioSource,
     QMediaDevices,
 )
 
+from .preview import PreviewPipeline
 from ..signals import all_signals
 from ...pyk4a import Device
-from ...pyk4a.utils import colorize
+from ...pyk4a.k4a.decode_pool import get_decode_pool
+from ...pyk4a.k4a.pipeline_stats import PipelineStats, CAPTURE_WAIT
 
 
 RESOLUTION = 4
+# Period of the pipeline statistics shown in the status bar
+STATS_INTERVAL_SEC = 1.0
 
 
 class RecordSensors(QThread):
@@ -29,32 +33,22 @@ class RecordSensors(QThread):
 
         self.timer = QTimer()
         self.timer.setInterval(1000 / self.device_fps)
-        self.timer.timeout.connect(self.update_next_frame)   
+        self.timer.timeout.connect(self.update_next_frame)
+
+        self.stats = PipelineStats(expected_fps=self.device_fps)
+        self.last_stats_time = time.time()
+        if self.device.record_writer is not None:
+            self.device.record_writer.pipeline_stats = self.stats
+
+        self.preview = PreviewPipeline(all_signals.record_signals, stats=self.stats, decode_pool=get_decode_pool())
+        all_signals.record_signals.preview_size.connect(self.preview.set_target_size)
 
     def update_next_frame(self):
-        current_frame = self.device.update()
+        with self.stats.stage(CAPTURE_WAIT):
+            current_frame = self.device.update()
         current_imu_data = self.device.update_imu()
-        current_rgb_frame = current_frame.get_color_image()
-        current_depth_frame = current_frame.get_colored_depth_image()
-        current_ir_frame = current_frame.get_ir_image()
-
-        if current_rgb_frame[0]:
-            rgb_frame = cv2.cvtColor(current_rgb_frame[1], cv2.COLOR_BGR2RGB)
-            h, w, ch = rgb_frame.shape
-            rgb_frame = QImage(rgb_frame, w, h, ch * w, QImage.Format_RGB888)    
-            all_signals.record_signals.rgb_image.emit(rgb_frame)            
-
-        if current_depth_frame[0]:
-            depth_frame = colorize(current_depth_frame[1], (None, 5000), cv2.COLORMAP_HSV)
-            h, w, ch = depth_frame.shape
-            depth_frame = QImage(depth_frame, w, h, w * ch, QImage.Format_RGB888)
-            all_signals.record_signals.depth_image.emit(depth_frame)
-
-        if current_ir_frame[0]:
-            ir_frame = colorize(current_ir_frame[1], (None, 5000), cv2.COLORMAP_BONE)
-            h, w, ch = ir_frame.shape
-            ir_frame = QImage(ir_frame, w, h, w * ch, QImage.Format_RGB888)
-            all_signals.record_signals.ir_image.emit(ir_frame)
+        self.preview.update(current_frame)
+        self.stats.frame(current_frame.get_device_timestamp_usec())
 
         end_time = time.time()
         acc_data = current_imu_data.acc
@@ -64,12 +58,30 @@ class RecordSensors(QThread):
         data = self.io_device.readAll()
         available_samples = data.size() // RESOLUTION
 
-        all_signals.record_signals.video_fps.emit(int(self.device_fps))
+        all_signals.record_signals.video_fps.emit(self.stats.fps)
         all_signals.record_signals.record_time.emit((end_time-self.start_time))
         all_signals.record_signals.imu_acc_data.emit(acc_data)
         all_signals.record_signals.imu_gyro_data.emit(gyro_data)
         all_signals.record_signals.audio_data.emit([data, available_samples])
 
+        if end_time - self.last_stats_time >= STATS_INTERVAL_SEC:
+            self.last_stats_time = end_time
+            stats = self.stats.get_stats()
+            if self.device.health is not None:
+                stats["health"] = self.device.health.get_counters()
+            all_signals.record_signals.pipeline_stats.emit(stats)
+
+    def export_stats(self):
+        """Save the statistics and a Chrome trace of the pipeline in the `PYKINECT_TRACE` directory, if set."""
+        directory = os.environ.get("PYKINECT_TRACE")
+        if not directory:
+            return
+
+        os.makedirs(directory, exist_ok=True)
+        name = os.path.join(directory, datetime.datetime.now().strftime("pipeline_%Y_%m_%d_%H_%M_%S"))
+        self.stats.save_json(f"{name}.json")
+        self.stats.save_chrome_trace(f"{name}.trace.json")
+
     def start_audio(self):
         self.ready_audio()
         self.io_device = self.audio_input.start()
@@ -0,0 +1,158 @@
+import time
+import threading
+from collections import deque
+
+import numpy as np
+from PySide6.QtCore import QThread, Signal
+
+# Frames shown while the slider is dragged are decoded for a label this many times smaller
+SCRUB_SCALE = 4
+
+
+class SeekScheduler(QThread):
+    """Seek and decode the frames requested by the playback slider off the GUI thread.
+
+    Requests are coalesced: only the latest target is kept, so a burst of slider moves costs a single
+    seek. A frame whose request was superseded while it was being read is dropped before it is decoded.
+    Frames requested while scrubbing are decoded at a reduced resolution, the others at full quality.
+
+    With a `cache`, full quality frames are decoded through it and uncached scrub frames are decoded
+    at the reduced resolution without being cached. `read_ahead` is then pointed at every full quality
+    frame, in the direction the requests move.
+
+    Every displayed frame is followed by ``signals.seek_done`` with the ``time.perf_counter()`` of its
+    request. Queued behind the frames, its slot measures the seek-to-display latency.
+
+    Args:
+        playback (Playback): Recording to read, only used from the scheduler thread once it is started.
+        preview (PreviewPipeline): Decodes and emits the frames.
+        signals (PlaybackSignals): Signals of the IMU, time and seek values.
+        fps (int): Camera fps of the recording.
+        cache (FrameCache, optional): Decoded frames cache. Defaults to None.
+        read_ahead (ReadAhead, optional): Prefetcher filling `cache`. Defaults to None.
+        max_latencies (int, optional): Number of recent latencies kept for the statistics. Defaults to 256.
+    """
+
+    end_reached = Signal()
+
+    def __init__(
+        self, playback, preview, signals, fps: int, cache=None, read_ahead=None, max_latencies: int = 256
+    ) -> None:
+        super().__init__()
+        self.playback = playback
+        self.preview = preview
+        self.signals = signals
+        self.fps = fps
+        self.cache = cache
+        self.read_ahead = read_ahead
+        self.direction = 1
+        self.last_offset = None
+
+        self.requests = 0
+        self.seeks = 0
+        self.dropped = 0
+        self.latencies = deque(maxlen=max_latencies)
+
+        self._target = None
+        self._stopped = False
+        self._condition = threading.Condition()
+
+    def request(self, offset: int, scrub: bool = False) -> None:
+        """Show the frame at `offset` usec from the beginning of the recording, replacing any pending request."""
+        with self._condition:
+            self.requests += 1
+            self._target = (offset, scrub, time.perf_counter())
+            self._condition.notify()
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        self.wait()
+
+    def is_stale(self) -> bool:
+        """Whether a newer request is waiting."""
+        return self._target is not None
+
+    def run(self) -> None:
+        while True:
+            with self._condition:
+                while self._target is None and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                offset, scrub, requested = self._target
+                self._target = None
+
+            if self.last_offset is not None and offset != self.last_offset:
+                self.direction = 1 if offset > self.last_offset else -1
+            self.last_offset = offset
+
+            if not self.seek(offset):
+                self.end_reached.emit()
+                continue
+            ret, capture = self.playback.update()
+            if not ret:
+                self.end_reached.emit()
+                continue
+            if self.is_stale():
+                self.dropped += 1
+                continue
+
+            if not self.show(capture, scrub):
+                # The IMU track is over
+                self.end_reached.emit()
+                continue
+
+            self.seeks += 1
+            self.latencies.append((time.perf_counter() - requested) * 1e3)
+            self.signals.seek_done.emit(requested)
+
+    def seek(self, offset: int) -> bool:
+        """Seek to `offset` usec from the beginning of the recording, False if the seek failed."""
+        if self.playback.index is not None:
+            frame = self.playback.timestamp_to_frame(self.playback.get_start_timestamp() + offset)
+            return self.playback.try_seek_timestamp(*self.playback.get_frame_seek(frame))
+        return self.playback.try_seek_timestamp(offset)
+
+    def show(self, capture, scrub: bool) -> bool:
+        """Display `capture` and the IMU sample following it, False once the IMU track is over."""
+        scale = SCRUB_SCALE if scrub else 1
+        if self.cache is None:
+            self.preview.update(capture, scale=scale)
+        elif scrub:
+            timestamp = capture.get_device_timestamp_usec()
+            frames = None if timestamp is None else self.cache.get(timestamp)
+            if frames is None:
+                self.preview.update(capture, scale=scale)
+            else:
+                self.preview.update_frames(frames, scale=scale)
+        else:
+            timestamp, frames = self.cache.decode(capture)
+            self.preview.update_frames(frames)
+            if self.read_ahead is not None and timestamp is not None:
+                self.read_ahead.schedule(timestamp, self.direction)
+
+        ret, imu_sample = self.playback.try_get_next_imu_sample()
+        if not ret:
+            return False
+
+        self.signals.video_fps.emit(int(self.fps))
+        self.signals.record_time.emit(imu_sample.acc_time / 1e6)
+        self.signals.imu_acc_data.emit(imu_sample.acc)
+        self.signals.imu_gyro_data.emit(imu_sample.gyro)
+        return True
+
+    def get_stats(self) -> dict:
+        """Request, seek and drop counts, and the percentiles of the request-to-emit latency in milliseconds."""
+        latencies = np.asarray(self.latencies, dtype=np.float64)
+        return {
+            "requests": self.requests,
+            "seeks": self.seeks,
+            "coalesced": max(self.requests - self.seeks - self.dropped, 0),
+            "dropped": self.dropped,
+            "latency_ms": {
+                "p50": float(np.percentile(latencies, 50)) if len(latencies) else 0.0,
+                "p99": float(np.percentile(latencies, 99)) if len(latencies) else 0.0,
+            },
+        }
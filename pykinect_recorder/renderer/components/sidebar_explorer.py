@@ -1,19 +1,28 @@
 import os
-import cv2
+import queue
+import base64
 import datetime
 from pathlib import Path
 
 import qtawesome as qta
-from PySide6.QtGui import QImage, QPixmap
-from PySide6.QtCore import Qt, Signal, Slot, QSize
+from PySide6.QtGui import QImage, QPixmap, QColor, QFont, QPen
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QSize, QThread, QRect, QTimer, QCoreApplication,
+    QAbstractListModel, QModelIndex, QFileSystemWatcher
+)
 from PySide6.QtWidgets import (
-    QFrame, QWidget, QVBoxLayout, QScrollArea, 
-    QPushButton, QHBoxLayout, QFileDialog
+    QFrame, QVBoxLayout, QPushButton, QHBoxLayout, QFileDialog,
+    QListView, QStyledItemDelegate, QStyle
 )
 
 from ..common_widgets import Label
 from ..signals import all_signals
-from ...pyk4a.pykinect import start_playback, initialize_libraries
+from ...pyk4a.pykinect import initialize_libraries
+from ...pyk4a.k4arecord.playback import CAMERA_FPS
+from ...pyk4a.k4arecord.recording_info import RecordingInfoCache, THUMBNAIL_WIDTH
+
+ITEM_SIZE = QSize(240, 60)
+THUMBNAIL_HEIGHT = 36
 
 
 class ExplorerSidebar(QFrame):
@@ -28,7 +37,7 @@ class ExplorerSidebar(QFrame):
 
         self.label_dirpath = Label(self.base_path)
         self.label_dirpath.setFixedSize(180, 50)
-        
+
         self.btn_reload = self.make_icons(qta.icon("mdi6.reload"), "Reload", scale=0.7)
         self.btn_search = self.make_icons(qta.icon("ri.search-line"), "Search directory", scale=0.7)
 
@@ -36,68 +45,105 @@ class ExplorerSidebar(QFrame):
         self.title_layout.addWidget(self.btn_reload)
         self.title_layout.addWidget(self.btn_search)
 
-        self.layout_scroll = QScrollArea()
-        self.layout_scroll.setWidgetResizable(True)
-        self.layout_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.layout_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        # Only the visible rows are painted, whatever the number of recordings
+        self.model = RecordingListModel()
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.list_view.setItemDelegate(RecordingItemDelegate())
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.list_view.setStyleSheet("QListView { border: none; }")
 
         self.main_layout.addLayout(self.title_layout)
-        self.main_layout.addWidget(self.layout_scroll)
+        self.main_layout.addWidget(self.list_view)
         self.setMaximumHeight(1080)
         self.setFixedWidth(300)
         self.setLayout(self.main_layout)
-        self.set_scrollarea(self.base_path)
+
+        self.info_cache = RecordingInfoCache()
+        self.info_worker = RecordingInfoWorker(self.info_cache)
+        self.info_worker.info_ready.connect(self.set_file_info)
+        self.info_worker.start()
+        QCoreApplication.instance().aboutToQuit.connect(self.info_worker.stop)
+        self.scanner = None
+
+        # Rescan when recordings are added, removed or renamed, bursts of events are merged
+        self.watcher = QFileSystemWatcher()
+        self.rescan_timer = QTimer()
+        self.rescan_timer.setSingleShot(True)
+        self.rescan_timer.setInterval(300)
+        self.rescan_timer.timeout.connect(self.reload_dir)
+        self.watcher.directoryChanged.connect(self.rescan_timer.start)
+
+        self.set_directory(self.base_path)
 
         self.btn_reload.clicked.connect(self.reload_dir)
         self.btn_search.clicked.connect(self.search_dir)
+        self.list_view.clicked.connect(self.select_recording)
 
     def reload_dir(self) -> None:
-        self.set_scrollarea(self.base_path)
+        self.scan_directory(self.base_path)
 
     def search_dir(self) -> None:
-        self.base_path = QFileDialog.getExistingDirectory(self, "Open Data Files", ".", QFileDialog.ShowDirsOnly)
+        base_path = QFileDialog.getExistingDirectory(self, "Open Data Files", ".", QFileDialog.ShowDirsOnly)
+        if base_path:
+            self.set_directory(base_path)
+
+    def set_directory(self, base_path: str) -> None:
+        if self.watcher.directories():
+            self.watcher.removePaths(self.watcher.directories())
+        if os.path.isdir(base_path):
+            self.watcher.addPath(base_path)
+
+        self.base_path = base_path
         self.label_dirpath.setText(self.base_path)  # /etc/ssh/ or /etc/ssh/config.txt
-        self.set_scrollarea(self.base_path)
+        self.model.clear()
+        self.scan_directory(base_path)
 
-    def set_scrollarea(self, filedirs: str) -> None:
-        self._widget = QWidget()
-        layout_file = QVBoxLayout()
-        layout_file.setAlignment(Qt.AlignmentFlag.AlignTop)
+    def scan_directory(self, base_path: str) -> None:
+        """List the recordings of a directory on a worker, rows stream in as they are found."""
+        if self.scanner is not None:
+            self.scanner.stop()
 
-        for filedir in Path(filedirs).iterdir():
-            _filename = str(filedir).split("\\")[-1]
-            if _filename[-4:] == ".mkv":
-                try:
-                    fileinfo = _FileInfo()
-                    playback = start_playback(str(filedir))
-                    handle = playback.get_record_configuration()._handle
-                    start_time = handle.start_timestamp_offset_usec
-
-                    # Thumbnail
-                    # playback.seek_timestamp(start_time)
-                    # _, current_frame = playback.update()
-                    # rgb_frame = current_frame.get_color_image()
-                    # thumbnail = cv2.cvtColor(rgb_frame[1], cv2.COLOR_BGR2RGB)
-                    # thumbnail = QImage(thumbnail, 30, 30, 30*3, QImage.Format_RGB888)
-                    # fileinfo.label_thumbnail.setPixmap(QPixmap.fromImage(thumbnail))
-                    
-                    record_length = (playback.get_recording_length()-start_time) // 1e6
-                    fsize = os.path.getsize(filedir) / (2**30)
-                    record_time = str(datetime.timedelta(seconds=record_length))
-                    playback.close()
-                    
-                    font_metrics = fileinfo.label_file_name.fontMetrics()
-                    elided_text = font_metrics.elidedText(_filename, Qt.ElideRight, fileinfo.label_file_name.width())
-                    fileinfo.label_file_name.setText(elided_text)
-                    fileinfo.label_metadata.setText(f"{record_time} ({fsize:.2f}GB)")
-                    layout_file.addWidget(fileinfo)
-                    fileinfo.Filename.connect(self.emit_file_path)
-                except:
-                    pass
+        self.scanner = DirectoryScanner(base_path, self.info_cache)
+        self.scanner.entries_found.connect(self.add_entries)
+        self.scanner.scan_finished.connect(self.finish_scan)
+        self.scanner.scan_failed.connect(self.show_scan_error)
+        self.scanner.start()
+
+    @Slot(str, list)
+    def add_entries(self, base_path: str, entries: list) -> None:
+        if base_path != self.base_path:
+            # Queued by the scan of the previous directory
+            return
+        missing = self.model.update_entries(entries)
+        if missing:
+            self.info_worker.enqueue(missing)
+
+    @Slot(str, list)
+    def finish_scan(self, base_path: str, paths: list) -> None:
+        if base_path == self.base_path:
+            self.model.remove_missing(set(paths))
+            self.model.sort_by_name()
+
+    @Slot(str)
+    def show_scan_error(self, message: str) -> None:
+        self.model.clear()
+        self.label_dirpath.setText(message)
+
+    @Slot(dict)
+    def set_file_info(self, info: dict) -> None:
+        if "error" in info:
+            # Not a recording the SDK can open
+            self.model.remove_path(info["path"])
+        else:
+            self.model.set_info(info)
+
+    @Slot(QModelIndex)
+    def select_recording(self, index: QModelIndex) -> None:
+        all_signals.playback_signals.playback_filepath.emit(index.data(RecordingListModel.PathRole))
 
-        self._widget.setLayout(layout_file)
-        self.layout_scroll.setWidget(self._widget)
-    
     def make_icons(self, icon: qta, tooltip: str, scale: float = 0.8) -> QPushButton:
         w, h = int(35 * scale), int(35 * scale)
         btn = QPushButton(icon, "")
@@ -113,53 +159,271 @@ class ExplorerSidebar(QFrame):
                 border-color: white;
             }
             QToolTip {
-                font:"Arial"; font-size: 15px; color: #ffffff; border: 1px solid #ffffff; 
+                font:"Arial"; font-size: 15px; color: #ffffff; border: 1px solid #ffffff;
             }
         """)
         return btn
 
-    @Slot(str)
-    def emit_file_path(self, filename) -> None:
-        tmp = os.path.join(self.base_path, filename)
-        all_signals.playback_signals.playback_filepath.emit(tmp)
 
+class DirectoryScanner(QThread):
+    """List the `.mkv` files of a directory with `os.scandir`, in batches.
+
+    Each entry is ``(path, size, mtime_ns, info)``, with the cached summary of the recording or None.
+    `scan_finished` carries every path found, so that the rows of removed recordings can be dropped.
+    """
+
+    entries_found = Signal(str, list)
+    scan_finished = Signal(str, list)
+    scan_failed = Signal(str)
+
+    def __init__(self, base_path: str, info_cache: RecordingInfoCache, batch_size: int = 100) -> None:
+        super().__init__()
+        self.base_path = base_path
+        self.info_cache = info_cache
+        self.batch_size = batch_size
+        self._stopped = False
+
+    def stop(self) -> None:
+        self._stopped = True
+        self.wait()
+
+    def run(self) -> None:
+        paths, batch = [], []
+        try:
+            with os.scandir(self.base_path) as entries:
+                for entry in entries:
+                    if self._stopped:
+                        return
+                    if not entry.name.endswith(".mkv") or not entry.is_file():
+                        continue
+
+                    stat = entry.stat()
+                    path = os.path.abspath(entry.path)
+                    paths.append(path)
+                    batch.append((path, stat.st_size, stat.st_mtime_ns, self.info_cache.get(path)))
+                    if len(batch) >= self.batch_size:
+                        self.entries_found.emit(self.base_path, batch)
+                        batch = []
+        except OSError as e:
+            self.scan_failed.emit(f"Can't read {self.base_path}: {e.strerror}")
+            return
+
+        if batch:
+            self.entries_found.emit(self.base_path, batch)
+        self.scan_finished.emit(self.base_path, paths)
+
+
+class RecordingInfoWorker(QThread):
+    """Read the summaries missing from the cache one recording at a time, saving the cache as it goes."""
+
+    info_ready = Signal(dict)
+
+    def __init__(self, info_cache: RecordingInfoCache, save_every: int = 10) -> None:
+        super().__init__()
+        self.info_cache = info_cache
+        self.save_every = save_every
+        self._queue = queue.Queue()
+
+    def enqueue(self, filepaths: list) -> None:
+        for filepath in filepaths:
+            self._queue.put(filepath)
+
+    def stop(self) -> None:
+        self._queue.put(None)
+        self.wait()
+
+    def run(self) -> None:
+        unsaved = 0
+        while True:
+            filepath = self._queue.get()
+            if filepath is None:
+                break
+
+            if self.info_cache.get(filepath) is None:
+                try:
+                    self.info_ready.emit(self.info_cache.update(filepath))
+                    unsaved += 1
+                except OSError:
+                    # Removed since the directory was listed
+                    pass
 
-class _FileInfo(QPushButton):
-    Filename = Signal(str)
+            if unsaved and (unsaved >= self.save_every or self._queue.empty()):
+                self.info_cache.save()
+                unsaved = 0
+
+        if unsaved:
+            self.info_cache.save()
+
+
+class RecordingListModel(QAbstractListModel):
+    """Rows of the explorer, one per recording: path, size, mtime and the summary once it is read."""
+
+    PathRole = Qt.UserRole + 1
+    MetadataRole = Qt.UserRole + 2
 
     def __init__(self) -> None:
         super().__init__()
-        self.setFixedSize(240, 60)
-        self.setObjectName("FileInfo")
-        self.setStyleSheet(
-            """
-            QPushButton#FileInfo {
-                border-color: white;
-                border-radius: 0px;
-            }
-            QPushButton#FileInfo:hover {
-                border-color: red;
-            }
-        """
-        )
-
-        main_layout = QVBoxLayout()
-        self.thumbnail_layout = QHBoxLayout()
-        # self.label_thumbnail = Label()
-        self.label_file_name = Label("File name: ", "Arial", 10, Qt.AlignLeft)
-        self.label_file_name.setWordWrap(True)
-        # self.label_file_name.setFixedWidth(240)
-        # self.thumbnail_layout.addWidget(self.label_thumbnail)
-        self.thumbnail_layout.addWidget(self.label_file_name)
-        main_layout.addLayout(self.thumbnail_layout)
-
-        self.metadata_layout = QHBoxLayout()
-        self.label_metadata = Label("", "Arial", 10, Qt.AlignLeft)
-        self.metadata_layout.addWidget(self.label_metadata)
-        main_layout.addLayout(self.metadata_layout)
-        self.setLayout(main_layout)
-
-        self.clicked.connect(self.emitName)
-
-    def emitName(self) -> None:
-        self.Filename.emit(self.label_file_name.text())
+        self._rows = []
+        self._index = {}
+        self._thumbnails = {}
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return os.path.basename(row["path"])
+        if role == self.PathRole:
+            return row["path"]
+        if role == self.MetadataRole:
+            return self.format_metadata(row)
+        if role == Qt.DecorationRole:
+            return self.get_thumbnail(row)
+        if role == Qt.ToolTipRole and row["info"] is not None:
+            info = row["info"]
+            color, depth = info["calibration"]["color"], info["calibration"]["depth"]
+            return (
+                f"Color: {color['width']}x{color['height']}\n"
+                f"Depth: {depth['width']}x{depth['height']}\n"
+                f"FPS: {CAMERA_FPS.get(info['config']['camera_fps'], '?')}"
+            )
+        return None
+
+    @staticmethod
+    def format_metadata(row: dict) -> str:
+        if row["info"] is None:
+            return "..."
+
+        info = row["info"]
+        start_time = info["config"]["start_timestamp_offset_usec"]
+        record_time = str(datetime.timedelta(seconds=(info["length_usec"] - start_time) // 1e6))
+        return f"{record_time} ({row['size'] / (2**30):.2f}GB)"
+
+    def get_thumbnail(self, row: dict):
+        """Thumbnail pixmap, decoded on first paint only."""
+        path = row["path"]
+        if path not in self._thumbnails:
+            encoded = row["info"]["thumbnail"] if row["info"] is not None else None
+            if encoded is None:
+                return None
+            self._thumbnails[path] = QPixmap.fromImage(QImage.fromData(base64.b64decode(encoded)))
+        return self._thumbnails[path]
+
+    def update_entries(self, entries: list) -> list:
+        """Add new recordings and reset the changed ones, returns the paths whose summary is missing."""
+        missing, new_rows = [], []
+        for path, size, mtime_ns, info in entries:
+            if info is not None and "error" in info:
+                # Not a recording the SDK can open
+                self.remove_path(path)
+                continue
+
+            position = self._index.get(path)
+            if position is None:
+                new_rows.append({"path": path, "size": size, "mtime_ns": mtime_ns, "info": info})
+            else:
+                row = self._rows[position]
+                if (row["size"], row["mtime_ns"]) == (size, mtime_ns) and row["info"] is not None:
+                    continue
+                row.update(size=size, mtime_ns=mtime_ns, info=info)
+                self._thumbnails.pop(path, None)
+                model_index = self.index(position)
+                self.dataChanged.emit(model_index, model_index)
+
+            if info is None:
+                missing.append(path)
+
+        if new_rows:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+            for position, row in enumerate(new_rows, first):
+                self._rows.append(row)
+                self._index[row["path"]] = position
+            self.endInsertRows()
+
+        return missing
+
+    def set_info(self, info: dict) -> None:
+        position = self._index.get(info["path"])
+        if position is None:
+            return
+
+        row = self._rows[position]
+        if (row["size"], row["mtime_ns"]) != (info["size"], info["mtime_ns"]):
+            # Read from an older version of the file, a newer scan queued it again
+            return
+        row["info"] = info
+        self._thumbnails.pop(info["path"], None)
+        model_index = self.index(position)
+        self.dataChanged.emit(model_index, model_index)
+
+    def remove_path(self, path: str) -> None:
+        position = self._index.get(path)
+        if position is None:
+            return
+
+        self.beginRemoveRows(QModelIndex(), position, position)
+        del self._rows[position]
+        self._thumbnails.pop(path, None)
+        self._reindex()
+        self.endRemoveRows()
+
+    def remove_missing(self, paths: set) -> None:
+        for row in [row for row in self._rows if row["path"] not in paths]:
+            self.remove_path(row["path"])
+
+    def sort_by_name(self) -> None:
+        names = [os.path.basename(row["path"]) for row in self._rows]
+        if names == sorted(names):
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        self._rows.sort(key=lambda row: os.path.basename(row["path"]))
+        self._reindex()
+        self.layoutChanged.emit()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._rows.clear()
+        self._index.clear()
+        self._thumbnails.clear()
+        self.endResetModel()
+
+    def _reindex(self) -> None:
+        self._index = {row["path"]: position for position, row in enumerate(self._rows)}
+
+
+class RecordingItemDelegate(QStyledItemDelegate):
+    """Paint a recording row: thumbnail, elided file name and duration/size line."""
+
+    def sizeHint(self, option, index) -> QSize:
+        return ITEM_SIZE
+
+    def paint(self, painter, option, index) -> None:
+        painter.save()
+        rect = option.rect.adjusted(2, 2, -2, -2)
+        hovered = option.state & QStyle.State_MouseOver
+        painter.setPen(QPen(QColor("red" if hovered else "white")))
+        painter.drawRect(rect)
+
+        thumbnail_rect = QRect(rect.left() + 5, rect.top() + 5, THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT)
+        thumbnail = index.data(Qt.DecorationRole)
+        if thumbnail is not None:
+            scaled = thumbnail.scaled(thumbnail_rect.size(), Qt.KeepAspectRatio)
+            painter.drawPixmap(thumbnail_rect.topLeft(), scaled)
+
+        text_left = thumbnail_rect.right() + 8
+        font = QFont("Arial", 10)
+        painter.setFont(font)
+        painter.setPen(QColor("white"))
+        name_rect = QRect(text_left, rect.top() + 5, rect.right() - text_left - 5, rect.height() // 2 - 5)
+        name = painter.fontMetrics().elidedText(index.data(Qt.DisplayRole), Qt.ElideRight, name_rect.width())
+        painter.drawText(name_rect, Qt.AlignLeft | Qt.AlignVCenter, name)
+
+        metadata_rect = QRect(text_left, rect.top() + rect.height() // 2, name_rect.width(), rect.height() // 2 - 5)
+        painter.drawText(metadata_rect, Qt.AlignLeft | Qt.AlignVCenter, index.data(RecordingListModel.MetadataRole))
+        painter.restore()
@@ -1,4 +1,5 @@
 import os
+import time
 import platform
 
 from PySide6.QtCore import QSize, Qt, Slot
@@ -6,6 +7,7 @@ from PySide6.QtWidgets import QFrame, QHBoxLayout, QSizeGrip
 
 from ..common_widgets import Label
 from ..signals import all_signals
+from ...pyk4a.k4a.pipeline_stats import STAGES
 
 class StatusBar(QFrame):
     def __init__(self):
@@ -27,6 +29,10 @@ class StatusBar(QFrame):
         self.sub_data_layout = QHBoxLayout()
         self.label_save_path = Label(f"Save dir: {self.base_path}", fontsize=12)
         self.sub_data_layout.addWidget(self.label_save_path)
+        self.label_seek_latency = Label("", fontsize=12)
+        self.sub_data_layout.addWidget(self.label_seek_latency)
+        self.label_pipeline = Label("", fontsize=12)
+        self.sub_data_layout.addWidget(self.label_pipeline)
         self.sub_data_layout.setAlignment(Qt.AlignLeft)
         self.main_layout.addLayout(self.sub_data_layout)
 
@@ -47,7 +53,33 @@ class StatusBar(QFrame):
         self.setLayout(self.main_layout)
 
         all_signals.option_signals.save_filepath.connect(self.set_save_path)
+        all_signals.playback_signals.seek_done.connect(self.set_seek_latency)
+        all_signals.record_signals.pipeline_stats.connect(self.set_pipeline_stats)
+        all_signals.option_signals.clear_frame.connect(self.clear_pipeline_stats)
 
     @Slot(str)
     def set_save_path(self, value):
-        self.label_save_path.setText("save path: " + value)
\ No newline at end of file
+        self.label_save_path.setText("save path: " + value)
+
+    @Slot(float)
+    def set_seek_latency(self, requested):
+        # Queued after the frames of the seek, so they are already displayed
+        self.label_seek_latency.setText("    Seek: %.1f ms" % ((time.perf_counter() - requested) * 1e3))
+
+    @Slot(dict)
+    def set_pipeline_stats(self, stats):
+        # Slowest executions of the timed stages, in pipeline order
+        latencies = "  ".join(
+            "%s %.1f" % (name, stats["stages"][name]["p99"]) for name in STAGES if name in stats["stages"]
+        )
+        text = "    %.1f fps, %d dropped    p99 ms: %s" % (stats["fps"], stats["dropped_frames"], latencies)
+        if "health" in stats:
+            health = stats["health"]
+            text += "    recorded: %d missing, %d reordered, %d IMU lost" % (
+                health["missing_frames"], health["reordered"], health["missing_imu_samples"]
+            )
+        self.label_pipeline.setText(text)
+
+    @Slot(bool)
+    def clear_pipeline_stats(self, value):
+        self.label_pipeline.setText("")
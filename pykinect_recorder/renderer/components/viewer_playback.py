@@ -76,6 +76,7 @@ class PlaybackViewer(QFrame):
         # playback signals
         self.btn_stop.clicked.connect(self.stop_playback)
         self.slider_time.valueChanged.connect(self.control_time)
+        self.slider_time.sliderReleased.connect(self.control_time)
         all_signals.playback_signals.time_value.connect(self.set_slider_value)
         all_signals.playback_signals.playback_filepath.connect(self.start_playback)
         
@@ -91,6 +92,8 @@ class PlaybackViewer(QFrame):
         return btn
 
     def set_slider_value(self, value):
+        if self.slider_time.isSliderDown():
+            return
         _time = self.slider_time.value() + value
         self.slider_time.setValue(_time)
 
@@ -98,7 +101,7 @@ class PlaybackViewer(QFrame):
     def start_playback(self, filepath) -> None:
         if self.viewer is not None:
             time.sleep(0.5)
-            self.viewer.timer.stop()
+            self.viewer.stop()
             self.btn_stop.setIcon(qta.icon("mdi.stop"))
             self.playback.close()
         try:
@@ -136,7 +139,12 @@ class PlaybackViewer(QFrame):
             self.btn_stop.setIcon(qta.icon("mdi.stop"))
 
     def control_time(self):
-        if self.viewer is not None:
+        if self.viewer is None:
+            return
+        if self.slider_time.isSliderDown():
+            # Low resolution frames while dragging, the full quality one on release
+            all_signals.playback_signals.time_scrub.emit(self.slider_time.value())
+        else:
             all_signals.playback_signals.time_control.emit(self.slider_time.value())
 
     # def extract_video_to_frame(self):
@@ -189,6 +197,7 @@ class CapturedImageViewer(QFrame):
         self.main_layout.addWidget(self.frame_rgb, 1, 0)
         self.main_layout.addWidget(self.frame_subdata, 1, 1)
 
+        self.preview_size = None
         self.setAcceptDrops(True)
         self.setLayout(self.main_layout)
 
@@ -249,6 +258,10 @@ class CapturedImageViewer(QFrame):
     @Slot(QImage)
     def set_rgb_image(self, image: QImage) -> None:
         w, h = self.frame_rgb.label_image.width(), self.frame_rgb.label_image.height()
+        if (w, h) != self.preview_size:
+            # Let the sensor thread decode at the size the frames are displayed
+            self.preview_size = (w, h)
+            all_signals.playback_signals.preview_size.emit(w-5, h-5)
         image = image.scaled(w-5, h-5, Qt.KeepAspectRatio)
         self.frame_rgb.label_image.setPixmap(QPixmap.fromImage(image))
 
@@ -285,6 +298,7 @@ class CapturedImageViewer(QFrame):
         self.imu_senser.label_gyro_z.setText("Z : %.5f" % values[2])
 
     def clear_frame(self):
+        self.preview_size = None
         self.frame_rgb.label_image.clear()
         self.frame_depth.label_image.clear()
         self.frame_ir.label_image.clear()
@@ -9,6 +9,7 @@ from PySide6.QtCore import Qt, Slot, QEvent, QMimeData, QPointF, QSize
 from PySide6.QtGui import QImage, QPixmap, QDrag
 from PySide6.QtWidgets import QHBoxLayout, QVBoxLayout, QFrame, QGridLayout
 
+from .preview import UNTIMED
 from .record_sensors import RecordSensors
 from .viewer_imu_sensors import ImuSensors
 from .viewer_audio import AudioSensor
@@ -18,6 +19,8 @@ from ..common_widgets import Frame, VLine, CustomProgressBarDialog
 from ...pyk4a.k4a._k4a import k4a_device_set_color_control, k4a_image_set_exposure_time_usec
 from ...pyk4a.k4a._k4atypes import color_command_dict, K4A_COLOR_CONTROL_MODE_MANUAL
 from ...pyk4a.k4a.configuration import Configuration
+from ...pyk4a.k4a.capture_ring import DROP_OLDEST
+from ...pyk4a.k4a.pipeline_stats import PAINT
 from ...pyk4a.pykinect import start_device
 
 
@@ -80,6 +83,8 @@ class SensorViewer(QFrame):
 
         self.is_play = True
         self.is_record = True
+        self.preview_size = None
+        self.stats = None
         self.setLayout(self.main_layout)
 
         # UI option signals 
@@ -124,6 +129,8 @@ class SensorViewer(QFrame):
                 record=self.is_record, 
                 record_filepath=self.filename_video
             )
+            # The recording writer is fed by the acquisition thread, the preview only needs fresh frames
+            self.device.start_acquisition(overflow=DROP_OLDEST)
             setattr(self.config, "depth_mode", self.emit_configs["depth_mode"])
             for k, v in self.emit_configs["color_option"].items():
                 k4a_device_set_color_control(
@@ -131,6 +138,7 @@ class SensorViewer(QFrame):
                 )
 
             self.viewer = RecordSensors(device=self.device)
+            self.stats = self.viewer.stats
             self.viewer.start_audio()
             self.viewer.timer.start()
             self.is_play = False
@@ -139,6 +147,9 @@ class SensorViewer(QFrame):
             self.viewer.stop_audio()
             self.viewer.quit()
             self.device.close()
+            # After the close, which waits for the recording writer
+            self.viewer.export_stats()
+            self.stats = None
             self.is_play = True
 
             if self.is_record:
@@ -222,28 +233,39 @@ class SensorViewer(QFrame):
     @Slot(QImage)
     def set_rgb_image(self, image: QImage) -> None:
         w, h = self.frame_rgb.label_image.width(), self.frame_rgb.label_image.height()
-        image = image.scaled(w-5, h-5, Qt.KeepAspectRatio)
-        self.frame_rgb.label_image.setPixmap(QPixmap.fromImage(image))
+        if (w, h) != self.preview_size:
+            # Let the sensor thread decode at the size the frames are displayed
+            self.preview_size = (w, h)
+            all_signals.record_signals.preview_size.emit(w-5, h-5)
+        with self.paint_stage():
+            image = image.scaled(w-5, h-5, Qt.KeepAspectRatio)
+            self.frame_rgb.label_image.setPixmap(QPixmap.fromImage(image))
 
     @Slot(QImage)
     def set_depth_image(self, image: QImage) -> None:
         w, h = self.frame_depth.label_image.width(), self.frame_depth.label_image.height()
-        image = image.scaled(w-5, h-5, Qt.KeepAspectRatio)
-        self.frame_depth.label_image.setPixmap(QPixmap.fromImage(image))
+        with self.paint_stage():
+            image = image.scaled(w-5, h-5, Qt.KeepAspectRatio)
+            self.frame_depth.label_image.setPixmap(QPixmap.fromImage(image))
 
     @Slot(QImage)
     def set_ir_image(self, image: QImage) -> None:
         w, h = self.frame_ir.label_image.width(), self.frame_ir.label_image.height()
-        image = image.scaled(w-5, h-5, Qt.KeepAspectRatio)
-        self.frame_ir.label_image.setPixmap(QPixmap.fromImage(image))
+        with self.paint_stage():
+            image = image.scaled(w-5, h-5, Qt.KeepAspectRatio)
+            self.frame_ir.label_image.setPixmap(QPixmap.fromImage(image))
+
+    def paint_stage(self):
+        # Frames queued before the capture stopped are painted without statistics
+        return UNTIMED if self.stats is None else self.stats.stage(PAINT)
 
     @Slot(float)
     def set_time(self, time) -> None:
         self.imu_senser.label_time.setText("Time(s) : %.3f" % time)
 
-    @Slot(int)
+    @Slot(float)
     def set_fps(self, value) -> None:
-        self.imu_senser.label_fps.setText("FPS : %d" % value)
+        self.imu_senser.label_fps.setText("FPS : %.1f" % value)
 
     @Slot(list)
     def set_acc_data(self, values) -> None:
@@ -275,6 +297,7 @@ class SensorViewer(QFrame):
         self.audio_sensor.series.replace(self.buffer)
 
     def clear_frame(self):
+        self.preview_size = None
         self.frame_rgb.label_image.clear()
         self.frame_depth.label_image.clear()
         self.frame_ir.label_image.clear()
@@ -10,7 +10,8 @@ from PySide6.QtWidgets import (
 )
 
 from ..signals import all_signals
-from ...pyk4a.utils import colorize
+from ...pyk4a.utils import Colorizer, DEPTH_CLIPPING_RANGE, IR_CLIPPING_RANGE
+from ...pyk4a.k4arecord.frame_cache import FrameCache, ReadAhead
 from ...pyk4a.pykinect import start_playback, start_device, initialize_libraries
 from ...pyk4a.k4a.configuration import Configuration
 
@@ -28,6 +29,8 @@ class VideoClippingDialog(QDialog):
         self.left, self.right = None, None
         self.progress_dialog = ProgressBarDialog()
         self.fps_dict = {0: "5", 1: "15", 2: "30"}
+        self.depth_colorizer = Colorizer(DEPTH_CLIPPING_RANGE, cv2.COLORMAP_HSV)
+        self.ir_colorizer = Colorizer(IR_CLIPPING_RANGE, cv2.COLORMAP_BONE)
 
         self.main_widget = QWidget()
         self.main_layout = QVBoxLayout()
@@ -114,8 +117,17 @@ class VideoClippingDialog(QDialog):
     def close_dialog(self):
         self.close()
 
+    def done(self, result):
+        # Every way out of the dialog ends here: close(), Esc, accept() and reject()
+        self.read_ahead.stop()
+        super().done(result)
+
     def initialize_playback(self):
         self.playback = start_playback(self.file_name)
+        # Stepping the range handles back and forth shows the same frames again
+        self.frame_cache = FrameCache(streams=("color",))
+        self.read_ahead = ReadAhead(self.file_name, self.frame_cache)
+        self.direction = 1
         self.start_time = self.playback.get_record_configuration()._handle.start_timestamp_offset_usec
         self.device_fps = self.playback.get_record_configuration()._handle.camera_fps
         self.ticks = int(1e6 // int(self.fps_dict[self.device_fps]))
@@ -131,18 +143,23 @@ class VideoClippingDialog(QDialog):
     def control_timestamp(self):
         cur_left, cur_right = self.time_slider.value()
         if cur_left != self.left:
+            self.direction = 1 if cur_left > self.left else -1
             self.left = cur_left
             self.playback.seek_timestamp(self.start_time + self.left*self.ticks)
         elif cur_right != self.right:
+            self.direction = 1 if cur_right > self.right else -1
             self.right = cur_right
             self.playback.seek_timestamp(self.start_time + self.right*self.ticks)
         self.update_next_frame()
 
     def update_next_frame(self):
         _, current_frame = self.playback.update()
-        current_rgb_frame = current_frame.get_color_image()
-        rgb_frame = current_rgb_frame[1]
-        rgb_frame = cv2.cvtColor(rgb_frame, cv2.COLOR_BGR2RGB)
+        timestamp, frames = self.frame_cache.decode(current_frame)
+        if timestamp is not None:
+            self.read_ahead.schedule(timestamp, self.direction)
+        if "color" not in frames:
+            return
+        rgb_frame = cv2.cvtColor(frames["color"], cv2.COLOR_BGR2RGB)
 
         h, w, ch = rgb_frame.shape
         rgb_frame = QImage(rgb_frame, w, h, ch * w, QImage.Format_RGB888)
@@ -224,13 +241,13 @@ class VideoClippingDialog(QDialog):
         current_ir_frame = current_frame.get_ir_image()
 
         if current_ir_frame[0]:
-            ir_frame = colorize(current_ir_frame[1], (None, 5000), cv2.COLORMAP_BONE)
+            ir_frame = self.ir_colorizer(current_ir_frame[1])
             cv2.imwrite(os.path.join(
                 self.root_path, self.save_file_name, "ir", f"{self.save_file_name}_ir_{str(self.cnt).zfill(6)}.png"), ir_frame,
             )
 
         if current_depth_frame[0]:
-            current_depth_frame = colorize(current_depth_frame[1], (None, 5000), cv2.COLORMAP_HSV)
+            current_depth_frame = self.depth_colorizer(current_depth_frame[1])
             cv2.imwrite(os.path.join(
                 self.root_path, self.save_file_name, "depth", f"{self.save_file_name}_depth_{str(self.cnt).zfill(6)}.png"), current_depth_frame,
             )
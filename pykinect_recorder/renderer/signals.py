@@ -22,8 +22,11 @@ class RecorderSignals(QObject):
     rgb_image = Signal(QImage)
     depth_image = Signal(QImage)
     ir_image = Signal(QImage)
+    preview_size = Signal(int, int)
     record_time = Signal(float)
-    video_fps = Signal(int)
+    # Measured frame rate, and `PipelineStats.get_stats()` once a second
+    video_fps = Signal(float)
+    pipeline_stats = Signal(dict)
     imu_acc_data = Signal(list)
     imu_gyro_data = Signal(list)
     audio_data = Signal(list)
@@ -34,14 +37,18 @@ class PlaybackSignals(QObject):
     rgb_image = Signal(QImage)
     depth_image = Signal(QImage)
     ir_image = Signal(QImage)
+    preview_size = Signal(int, int)
     record_time = Signal(float)
-    video_fps = Signal(int)
+    video_fps = Signal(float)
     imu_acc_data = Signal(list)
     imu_gyro_data = Signal(list)
 
     playback_filepath = Signal(str)
     time_control = Signal(int)
+    time_scrub = Signal(int)
     time_value = Signal(int)
+    # perf_counter() time of the seek request, emitted after its frame
+    seek_done = Signal(float)
     
     # Video clipping signals
     clip_option = Signal(str)
@@ -0,0 +1,59 @@
+import shutil
+import platform
+import subprocess
+from pathlib import Path
+
+import pytest
+
+STUB_DIR = Path(__file__).parent / "stub"
+
+
+@pytest.fixture(scope="session")
+def k4a_stub_library(tmp_path_factory):
+    """
+    Build the stub k4a library from `tests/stub/k4a_stub.c`.
+
+    The stub exports the same symbols as the Azure Kinect SDK, so `_k4a.setup_library()`
+    can load it in environments without the SDK or a camera.
+    """
+    compiler = shutil.which("cc") or shutil.which("gcc") or shutil.which("clang")
+    if compiler is None:
+        pytest.skip("A C compiler is required to build the stub k4a library.")
+
+    suffix = ".dll" if platform.system() == "Windows" else ".so"
+    library_path = tmp_path_factory.mktemp("stub") / f"libk4a_stub{suffix}"
+    subprocess.run(
+        [compiler, "-shared", "-fPIC", "-O2", "-o", str(library_path), str(STUB_DIR / "k4a_stub.c")],
+        check=True,
+    )
+
+    return str(library_path)
+
+
+@pytest.fixture
+def k4a_stub(k4a_stub_library):
+    """
+    Route the k4a and k4arecord wrappers to the stub library for the test, the libraries loaded before are restored.
+    """
+    from pykinect_recorder.pyk4a.k4a import _k4a
+    from pykinect_recorder.pyk4a.k4arecord import _k4arecord
+
+    libraries = _k4a.k4a_dll, _k4arecord.record_dll
+    _k4a.setup_library(k4a_stub_library)
+    _k4arecord.setup_library(k4a_stub_library)
+    yield k4a_stub_library
+    _k4a.k4a_dll, _k4arecord.record_dll = libraries
+
+
+@pytest.fixture
+def simulator():
+    """
+    Route the k4a and k4arecord wrappers to a `SimulatedK4A` for the test, the libraries loaded before are restored.
+    """
+    from pykinect_recorder.pyk4a import pykinect
+    from pykinect_recorder.pyk4a.k4a import _k4a
+    from pykinect_recorder.pyk4a.k4arecord import _k4arecord
+
+    libraries = _k4a.k4a_dll, _k4arecord.record_dll
+    yield pykinect.initialize_simulator()
+    _k4a.k4a_dll, _k4arecord.record_dll = libraries
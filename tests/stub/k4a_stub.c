@@ -0,0 +1,327 @@
+/*
+ * Minimal stand-in for the Azure Kinect Sensor SDK used by the tests.
+ *
+ * Only implements the capture and image API that the wrappers in `pyk4a/k4a/_k4a.py` call on the
+ * hot path, with real reference counting so the tests exercise the same ctypes marshalling and
+ * ownership as the SDK, and an IMU queue filled by `k4a_stub_queue_imu_samples`. The playback IMU
+ * track reads the same queue.
+ *
+ * The reference counts are atomic, the wrappers release the GIL during the calls. Released objects
+ * keep their header so that any later use is counted by `k4a_stub_get_use_after_free_count` instead
+ * of crashing the test process.
+ */
+#include <stdint.h>
+#include <stdlib.h>
+
+#ifdef _WIN32
+#include <windows.h>
+#define STUB_EXPORT __declspec(dllexport)
+#define STUB_INCREMENT(value) InterlockedIncrement(&(value))
+#define STUB_DECREMENT(value) InterlockedDecrement(&(value))
+#else
+#define STUB_EXPORT
+#define STUB_INCREMENT(value) __atomic_add_fetch(&(value), 1, __ATOMIC_SEQ_CST)
+#define STUB_DECREMENT(value) __atomic_sub_fetch(&(value), 1, __ATOMIC_SEQ_CST)
+#endif
+
+static volatile long stub_live_images = 0;
+static volatile long stub_live_captures = 0;
+static volatile long stub_use_after_free_count = 0;
+
+/* Not part of the SDK: leak and misuse counters for the tests */
+STUB_EXPORT long k4a_stub_get_live_images(void)
+{
+    return stub_live_images;
+}
+
+STUB_EXPORT long k4a_stub_get_live_captures(void)
+{
+    return stub_live_captures;
+}
+
+STUB_EXPORT long k4a_stub_get_use_after_free_count(void)
+{
+    return stub_use_after_free_count;
+}
+
+typedef struct
+{
+    int format;
+    int width_pixels;
+    int height_pixels;
+    int stride_bytes;
+    size_t size;
+    uint64_t device_timestamp_usec;
+    volatile long ref_count;
+    uint8_t *buffer;
+} stub_image_t;
+
+static stub_image_t *stub_check_image(stub_image_t *image_handle)
+{
+    if (image_handle->ref_count <= 0)
+    {
+        STUB_INCREMENT(stub_use_after_free_count);
+    }
+    return image_handle;
+}
+
+STUB_EXPORT int k4a_image_create(int format, int width_pixels, int height_pixels, int stride_bytes, stub_image_t **image_handle)
+{
+    stub_image_t *image = calloc(1, sizeof(stub_image_t));
+    if (image == NULL)
+    {
+        return 1;
+    }
+
+    image->format = format;
+    image->width_pixels = width_pixels;
+    image->height_pixels = height_pixels;
+    image->stride_bytes = stride_bytes;
+    image->size = (size_t)stride_bytes * (size_t)height_pixels;
+    image->ref_count = 1;
+    image->buffer = calloc(image->size ? image->size : 1, 1);
+    STUB_INCREMENT(stub_live_images);
+    *image_handle = image;
+    return 0;
+}
+
+STUB_EXPORT uint8_t *k4a_image_get_buffer(stub_image_t *image_handle)
+{
+    return stub_check_image(image_handle)->buffer;
+}
+
+STUB_EXPORT size_t k4a_image_get_size(stub_image_t *image_handle)
+{
+    return stub_check_image(image_handle)->size;
+}
+
+STUB_EXPORT int k4a_image_get_format(stub_image_t *image_handle)
+{
+    return stub_check_image(image_handle)->format;
+}
+
+STUB_EXPORT int k4a_image_get_width_pixels(stub_image_t *image_handle)
+{
+    return stub_check_image(image_handle)->width_pixels;
+}
+
+STUB_EXPORT int k4a_image_get_height_pixels(stub_image_t *image_handle)
+{
+    return stub_check_image(image_handle)->height_pixels;
+}
+
+STUB_EXPORT int k4a_image_get_stride_bytes(stub_image_t *image_handle)
+{
+    return stub_check_image(image_handle)->stride_bytes;
+}
+
+STUB_EXPORT uint64_t k4a_image_get_device_timestamp_usec(stub_image_t *image_handle)
+{
+    return stub_check_image(image_handle)->device_timestamp_usec;
+}
+
+STUB_EXPORT void k4a_image_set_device_timestamp_usec(stub_image_t *image_handle, uint64_t timestamp_usec)
+{
+    stub_check_image(image_handle)->device_timestamp_usec = timestamp_usec;
+}
+
+STUB_EXPORT void k4a_image_reference(stub_image_t *image_handle)
+{
+    if (STUB_INCREMENT(image_handle->ref_count) <= 1)
+    {
+        STUB_INCREMENT(stub_use_after_free_count);
+    }
+}
+
+STUB_EXPORT void k4a_image_release(stub_image_t *image_handle)
+{
+    long ref_count = STUB_DECREMENT(image_handle->ref_count);
+    if (ref_count == 0)
+    {
+        free(image_handle->buffer);
+        image_handle->buffer = NULL;
+        STUB_DECREMENT(stub_live_images);
+    }
+    else if (ref_count < 0)
+    {
+        STUB_INCREMENT(stub_use_after_free_count);
+    }
+}
+
+typedef struct
+{
+    volatile long ref_count;
+    stub_image_t *images[3]; /* color, depth, IR */
+} stub_capture_t;
+
+static stub_capture_t *stub_check_capture(stub_capture_t *capture_handle)
+{
+    if (capture_handle->ref_count <= 0)
+    {
+        STUB_INCREMENT(stub_use_after_free_count);
+    }
+    return capture_handle;
+}
+
+STUB_EXPORT int k4a_capture_create(stub_capture_t **capture_handle)
+{
+    stub_capture_t *capture = calloc(1, sizeof(stub_capture_t));
+    if (capture == NULL)
+    {
+        return 1;
+    }
+
+    capture->ref_count = 1;
+    STUB_INCREMENT(stub_live_captures);
+    *capture_handle = capture;
+    return 0;
+}
+
+STUB_EXPORT void k4a_capture_reference(stub_capture_t *capture_handle)
+{
+    if (STUB_INCREMENT(capture_handle->ref_count) <= 1)
+    {
+        STUB_INCREMENT(stub_use_after_free_count);
+    }
+}
+
+STUB_EXPORT void k4a_capture_release(stub_capture_t *capture_handle)
+{
+    long ref_count = STUB_DECREMENT(capture_handle->ref_count);
+    if (ref_count == 0)
+    {
+        for (int index = 0; index < 3; index++)
+        {
+            if (capture_handle->images[index] != NULL)
+            {
+                k4a_image_release(capture_handle->images[index]);
+                capture_handle->images[index] = NULL;
+            }
+        }
+        STUB_DECREMENT(stub_live_captures);
+    }
+    else if (ref_count < 0)
+    {
+        STUB_INCREMENT(stub_use_after_free_count);
+    }
+}
+
+/* Like the SDK, the returned image holds a new reference that the caller releases */
+static stub_image_t *stub_capture_get_image(stub_capture_t *capture_handle, int index)
+{
+    stub_image_t *image = stub_check_capture(capture_handle)->images[index];
+    if (image != NULL)
+    {
+        k4a_image_reference(image);
+    }
+    return image;
+}
+
+static void stub_capture_set_image(stub_capture_t *capture_handle, int index, stub_image_t *image_handle)
+{
+    stub_check_capture(capture_handle);
+    if (image_handle != NULL)
+    {
+        k4a_image_reference(image_handle);
+    }
+    if (capture_handle->images[index] != NULL)
+    {
+        k4a_image_release(capture_handle->images[index]);
+    }
+    capture_handle->images[index] = image_handle;
+}
+
+STUB_EXPORT stub_image_t *k4a_capture_get_color_image(stub_capture_t *capture_handle)
+{
+    return stub_capture_get_image(capture_handle, 0);
+}
+
+STUB_EXPORT stub_image_t *k4a_capture_get_depth_image(stub_capture_t *capture_handle)
+{
+    return stub_capture_get_image(capture_handle, 1);
+}
+
+STUB_EXPORT stub_image_t *k4a_capture_get_ir_image(stub_capture_t *capture_handle)
+{
+    return stub_capture_get_image(capture_handle, 2);
+}
+
+STUB_EXPORT void k4a_capture_set_color_image(stub_capture_t *capture_handle, stub_image_t *image_handle)
+{
+    stub_capture_set_image(capture_handle, 0, image_handle);
+}
+
+STUB_EXPORT void k4a_capture_set_depth_image(stub_capture_t *capture_handle, stub_image_t *image_handle)
+{
+    stub_capture_set_image(capture_handle, 1, image_handle);
+}
+
+STUB_EXPORT void k4a_capture_set_ir_image(stub_capture_t *capture_handle, stub_image_t *image_handle)
+{
+    stub_capture_set_image(capture_handle, 2, image_handle);
+}
+
+typedef struct
+{
+    float temperature;
+    float acc_sample[3];
+    uint64_t acc_timestamp_usec;
+    float gyro_sample[3];
+    uint64_t gyro_timestamp_usec;
+} stub_imu_sample_t;
+
+static int stub_pending_imu_samples = 0;
+static uint64_t stub_imu_timestamp_usec = 0;
+
+/* Not part of the SDK: make `count` more IMU samples available, 1.6 kHz apart */
+STUB_EXPORT void k4a_stub_queue_imu_samples(int count)
+{
+    stub_pending_imu_samples += count;
+}
+
+static int stub_pop_imu_sample(stub_imu_sample_t *imu_sample)
+{
+    if (stub_pending_imu_samples == 0)
+    {
+        return 0;
+    }
+
+    stub_pending_imu_samples--;
+    stub_imu_timestamp_usec += 625;
+    imu_sample->temperature = 30.0f;
+    imu_sample->acc_sample[0] = 0.0f;
+    imu_sample->acc_sample[1] = 0.0f;
+    imu_sample->acc_sample[2] = 9.81f;
+    imu_sample->acc_timestamp_usec = stub_imu_timestamp_usec;
+    imu_sample->gyro_sample[0] = 0.1f;
+    imu_sample->gyro_sample[1] = 0.2f;
+    imu_sample->gyro_sample[2] = 0.3f;
+    imu_sample->gyro_timestamp_usec = stub_imu_timestamp_usec;
+    return 1;
+}
+
+STUB_EXPORT int k4a_device_get_imu_sample(void *device_handle, stub_imu_sample_t *imu_sample, int32_t timeout_in_ms)
+{
+    (void)device_handle;
+    (void)timeout_in_ms;
+    return stub_pop_imu_sample(imu_sample) ? 0 : 2; /* K4A_WAIT_RESULT_TIMEOUT */
+}
+
+STUB_EXPORT int k4a_playback_get_next_imu_sample(void *playback_handle, stub_imu_sample_t *imu_sample)
+{
+    (void)playback_handle;
+    return stub_pop_imu_sample(imu_sample) ? 0 : 2; /* K4A_STREAM_RESULT_EOF */
+}
+
+STUB_EXPORT void k4a_playback_close(void *playback_handle)
+{
+    (void)playback_handle;
+}
+
+STUB_EXPORT int k4a_playback_seek_timestamp(void *playback_handle, int64_t offset_usec, int origin)
+{
+    (void)playback_handle;
+    (void)offset_usec;
+    (void)origin;
+    return 0;
+}
@@ -0,0 +1,49 @@
+from benchmarks.harness import compare
+from benchmarks.run import run_benchmarks
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    baseline = {
+        "decode": {"fps": 100.0, "p50_ms": 10.0, "p99_ms": 20.0},
+        "write": {"fps": 100.0, "p50_ms": 10.0, "p99_ms": 20.0},
+        "pointcloud": {"skipped": "unsupported"},
+    }
+    results = {
+        "decode": {"fps": 85.0, "p50_ms": 11.0, "p99_ms": 30.0},
+        "write": {"fps": 130.0, "p50_ms": 5.0, "p99_ms": None},
+        "pointcloud": {"fps": 1.0, "p50_ms": 1.0, "p99_ms": 1.0},
+        "new_stage": {"fps": 1.0, "p50_ms": 1.0, "p99_ms": 1.0},
+    }
+
+    regressions = compare(results, baseline, tolerance=0.2)
+    assert [(regression["benchmark"], regression["metric"]) for regression in regressions] == [("decode", "p99_ms")]
+
+
+def test_run_benchmarks_on_simulator(simulator, tmp_path):
+    stages = [
+        "acquisition", "mjpg_decode", "wrapper_call", "colorize", "colorize_normalize", "playback_read", "pointcloud",
+    ]
+    results = run_benchmarks(["720P"], ["NFOV_2X2BINNED"], stages, 5, str(tmp_path), echo=lambda line: None)
+
+    assert results["acquisition/720P/NFOV_2X2BINNED"]["frames"] == 5
+    assert results["mjpg_decode/720P/NFOV_2X2BINNED"]["p99_ms"] > 0
+    assert "skipped" in results["wrapper_call"]
+    assert results["colorize_normalize/720P/NFOV_2X2BINNED"]["p50_ms"] > 0
+    assert results["playback_read/720P/NFOV_2X2BINNED"]["fps"] > 0
+    assert "skipped" in results["pointcloud/720P/NFOV_2X2BINNED"]
+    assert len(simulator.handles) == 0
+
+
+def test_binding_overhead_on_stub(k4a_stub, tmp_path):
+    """
+    Per-call overhead of a hot wrapper before and after binding the prototypes, on the stub library without a device.
+    """
+    lines = []
+    results = run_benchmarks(
+        ["720P"], ["NFOV_2X2BINNED"], ["wrapper_call", "wrapper_call_unbound"], 5, str(tmp_path), echo=lines.append
+    )
+    print("\n".join(lines))
+
+    assert set(results) == {"wrapper_call", "wrapper_call_unbound"}
+    assert results["wrapper_call"]["p50_ms"] > 0
+    assert results["wrapper_call_unbound"]["p50_ms"] > 0
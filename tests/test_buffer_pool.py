@@ -0,0 +1,73 @@
+import numpy as np
+
+from pykinect_recorder.pyk4a.k4a import _k4a
+from pykinect_recorder.pyk4a.k4a.buffer_pool import BufferPool
+from pykinect_recorder.pyk4a.k4a.image import Image
+
+
+def test_buffers_are_reused_by_shape_and_dtype():
+    pool = BufferPool(max_buffers=2)
+    depth_buffer = pool.acquire((576, 640), np.uint16)
+    pool.release(depth_buffer)
+
+    assert pool.acquire((576, 640), np.uint16) is depth_buffer
+    assert pool.acquire((576, 640), np.uint8) is not depth_buffer
+    assert pool.get_stats() == {"hits": 1, "misses": 2, "in_use": 2, "free": 0, "high_water": 2}
+
+
+def test_cap_drops_extra_buffers():
+    pool = BufferPool(max_buffers=1)
+    buffers = [pool.acquire((4, 4)) for _ in range(3)]
+    for buffer in buffers:
+        pool.release(buffer)
+
+    assert pool.get_stats()["free"] == 1
+    assert pool.high_water == 3
+
+
+def test_release_when_unused():
+    """
+    A buffer still wrapped by someone else (e.g. a QImage waiting in the event queue) is not handed out again.
+    """
+    pool = BufferPool()
+    buffer = pool.acquire((4, 4))
+    holder = [buffer]
+    pool.release_when_unused(buffer)
+    del buffer
+
+    assert pool.acquire((4, 4)) is not holder[0]
+    pool.collect()
+    assert pool.get_stats()["free"] == 0
+
+    holder.clear()
+    pool.collect()
+    assert pool.get_stats()["free"] == 1
+
+
+def test_image_copies_into_pool(k4a_stub):
+    pool = BufferPool()
+    image = Image.create(_k4a.K4A_IMAGE_FORMAT_DEPTH16, 640, 576, 640 * 2)
+
+    _, depth = image.to_numpy(pool=pool)
+    pool.release(depth)
+    _, reduced = image.to_numpy(copy=False, reduce=2, pool=pool)
+    pool.release(reduced)
+    _, depth_again = image.to_numpy(pool=pool)
+
+    assert depth_again is depth
+    assert pool.get_stats()["hits"] == 1
+
+
+def test_release_ignores_foreign_arrays():
+    """
+    Arrays the pool didn't hand out (e.g. decoded by cv2.imdecode) and double releases leave the counts untouched.
+    """
+    pool = BufferPool()
+    buffer = pool.acquire((4, 4))
+    pool.release(np.empty((4, 4), np.uint8))
+    assert pool.owns(buffer)
+
+    pool.release(buffer)
+    pool.release(buffer)
+    assert not pool.owns(buffer)
+    assert pool.get_stats() == {"hits": 0, "misses": 1, "in_use": 0, "free": 1, "high_water": 1}
@@ -0,0 +1,132 @@
+import gc
+import time
+import ctypes
+import threading
+
+import numpy as np
+
+from pykinect_recorder.pyk4a.k4a import _k4a, calibration as calibration_module
+from pykinect_recorder.pyk4a.k4a.capture import Capture
+
+THREADS = 8
+ITERATIONS = 300
+
+
+class StubCounters:
+    def __init__(self, library_path):
+        library = ctypes.CDLL(library_path)
+        self.live_images = library.k4a_stub_get_live_images
+        self.live_captures = library.k4a_stub_get_live_captures
+        self.use_after_free = library.k4a_stub_get_use_after_free_count
+        for counter in (self.live_images, self.live_captures, self.use_after_free):
+            counter.restype = ctypes.c_long
+
+
+def create_capture(timestamp_usec=0):
+    """Capture holding a 64x48 depth image, the only references are owned by the returned Capture."""
+    capture_handle = _k4a.k4a_capture_t()
+    assert _k4a.k4a_capture_create(capture_handle) == 0
+
+    image_handle = _k4a.k4a_image_t()
+    assert _k4a.k4a_image_create(_k4a.K4A_IMAGE_FORMAT_DEPTH16, 64, 48, 64 * 2, image_handle) == 0
+    _k4a.k4a_image_set_device_timestamp_usec(image_handle, timestamp_usec)
+    _k4a.k4a_capture_set_depth_image(capture_handle, image_handle)
+    _k4a.k4a_image_release(image_handle)
+
+    return Capture(capture_handle, None)
+
+
+def test_references_are_independent(k4a_stub):
+    counters = StubCounters(k4a_stub)
+    live_captures, use_after_free = counters.live_captures(), counters.use_after_free()
+
+    capture = create_capture(33333)
+    other = capture.reference()
+    capture.reset()
+    capture.reset()
+    assert not capture.is_valid()
+    assert capture.get_device_timestamp_usec() is None
+
+    # The other owner still reads the capture, and a zero-copy view outlives it
+    assert other.get_device_timestamp_usec() == 33333
+    ret, depth = other.get_depth_image(copy=False)
+    assert ret and depth.shape == (48, 64)
+    with other:
+        pass
+    assert counters.live_captures() == live_captures
+    assert np.all(depth == 0)
+
+    del depth
+    gc.collect()
+    assert counters.use_after_free() == use_after_free
+
+
+def test_concurrent_use_and_release(k4a_stub):
+    """Threads read, reference and release shared captures, no SDK object is used after being freed."""
+    counters = StubCounters(k4a_stub)
+    live_images, live_captures = counters.live_images(), counters.live_captures()
+    use_after_free = counters.use_after_free()
+
+    shared = [create_capture(index) for index in range(ITERATIONS)]
+    errors = []
+    start = threading.Barrier(THREADS)
+
+    def work(offset):
+        try:
+            start.wait()
+            for index in range(ITERATIONS):
+                capture = shared[(index + offset) % ITERATIONS]
+                if offset % 2:
+                    # Half of the threads race to release the shared objects
+                    capture.reset()
+                    continue
+
+                owned = capture.reference()
+                ret, depth = owned.get_depth_image(copy=bool(index % 2))
+                if owned.is_valid() and not (ret and depth.shape == (48, 64)):
+                    errors.append(("decode", index))
+                owned.reset()
+                capture.get_device_timestamp_usec()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(offset,)) for offset in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    del shared
+    gc.collect()
+    assert errors == []
+    assert counters.use_after_free() == use_after_free
+    assert counters.live_captures() == live_captures
+    assert counters.live_images() == live_images
+
+
+def test_transformation_is_created_once(monkeypatch):
+    created = []
+
+    def create_transformation(calibration):
+        created.append(calibration)
+        # Widen the window between the check and the assignment
+        time.sleep(0.01)
+        return object()
+
+    monkeypatch.setattr(calibration_module, "Transformation", create_transformation)
+    calibration = calibration_module.Calibration(_k4a.k4a_calibration_t())
+    barrier = threading.Barrier(THREADS)
+    transformations = []
+
+    def worker():
+        barrier.wait()
+        transformations.append(calibration.get_transformation())
+
+    threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(transformation is transformations[0] for transformation in transformations)
@@ -0,0 +1,56 @@
+import time
+import threading
+
+from pykinect_recorder.pyk4a import pykinect
+from pykinect_recorder.pyk4a.k4a import _k4a, Configuration
+from pykinect_recorder.pyk4a.k4a.capture_ring import BLOCK, CaptureRing
+
+THREADS = 4
+
+
+def make_configuration():
+    configuration = Configuration()
+    configuration.color_resolution = _k4a.K4A_COLOR_RESOLUTION_720P
+    configuration.depth_mode = _k4a.K4A_DEPTH_MODE_NFOV_2X2BINNED
+    return configuration
+
+
+def test_stop_with_full_block_ring(simulator):
+    device = pykinect.start_device(config=make_configuration())
+    device.start_acquisition(ring_size=2, overflow=BLOCK)
+    # No consumer: the producer fills the ring and waits for room
+    while len(device.ring) < 2:
+        time.sleep(0.01)
+
+    stopper = threading.Thread(target=device.close, daemon=True)
+    stopper.start()
+    stopper.join(5)
+
+    assert not stopper.is_alive()
+    assert len(simulator.handles) == 0
+
+
+def test_late_frames_counted_by_concurrent_consumers(simulator):
+    device = pykinect.start_device(config=make_configuration())
+    capture = device.update().reference()
+
+    frames = 200
+    ring = CaptureRing(frames, late_threshold_sec=0)
+    for _ in range(frames):
+        ring.put(capture.handle())
+    ring.close()
+
+    def consume():
+        while (entry := ring.get()) is not None:
+            _k4a.k4a_capture_release(entry.capture_handle)
+
+    consumers = [threading.Thread(target=consume) for _ in range(THREADS)]
+    for consumer in consumers:
+        consumer.start()
+    for consumer in consumers:
+        consumer.join()
+
+    assert ring.get_stats()["late"] == frames
+    capture.reset()
+    device.capture = None
+    device.close()
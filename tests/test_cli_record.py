@@ -0,0 +1,27 @@
+from pykinect_recorder.cli.command import RecordStats
+from pykinect_recorder.pyk4a.k4a import _k4a
+from pykinect_recorder.pyk4a.k4a.image import Image
+
+
+class DepthOnlyCapture:
+    def __init__(self, timestamp_usec):
+        self.image = Image.create(_k4a.K4A_IMAGE_FORMAT_DEPTH16, 320, 288, 320 * 2)
+        _k4a.k4a_image_set_device_timestamp_usec(self.image.handle(), timestamp_usec)
+
+    def get_depth_image_object(self):
+        return self.image
+
+
+def test_record_stats_counts_device_drops(k4a_stub):
+    """
+    Frames the device dropped show up as gaps between consecutive device timestamps.
+    """
+    stats = RecordStats(fps=30)
+    period_usec = 1e6 / 30
+    for frame in [0, 1, 2, 5, 6, 8]:
+        stats.add(DepthOnlyCapture(int(frame * period_usec)))
+
+    assert stats.frames == 6
+    assert stats.dropped_frames == 3
+    assert stats.is_done(duration=None, frames=6)
+    assert not stats.is_done(duration=None, frames=None)
@@ -0,0 +1,59 @@
+import cv2
+import numpy as np
+
+from pykinect_recorder.pyk4a.k4a.capture import Capture
+from pykinect_recorder.pyk4a.utils import Colorizer, colorize
+
+
+def create_depth_image(shape=(576, 640)):
+    return np.random.default_rng(0).integers(0, 6000, size=shape, dtype=np.uint16)
+
+
+def test_color_depth_image_matches_scaled_colormap():
+    depth_image = create_depth_image()
+    expected = cv2.applyColorMap(cv2.convertScaleAbs(depth_image, alpha=0.05), cv2.COLORMAP_JET)
+
+    np.testing.assert_array_equal(Capture.color_depth_image(depth_image), expected)
+
+
+def test_colorizer_output_buffer():
+    colorizer = Colorizer((0, 5000), cv2.COLORMAP_HSV)
+    depth_image = create_depth_image()
+    out = np.empty((*depth_image.shape, 3), dtype=np.uint8)
+
+    assert colorizer(depth_image, out=out) is out
+    bgra = colorizer.to_bgra(depth_image)
+    np.testing.assert_array_equal(bgra[..., :3], out)
+    assert (bgra[..., 3] == 255).all()
+    assert Colorizer.get_lookup_table((0, 5000), cv2.COLORMAP_HSV) is colorizer.lookup_table
+
+
+def test_colorizer_matches_apply_color_map():
+    """
+    The lookup table gather equals the clip, fixed range scaling and colormap it replaces, on NFOV and WFOV frames.
+    """
+    for clipping_range, colormap in [((0, 5000), cv2.COLORMAP_HSV), ((500, 3000), cv2.COLORMAP_JET)]:
+        colorizer = Colorizer(clipping_range, colormap)
+        low, high = clipping_range
+        for shape in [(576, 640), (1024, 1024)]:
+            depth_image = create_depth_image(shape)
+            scaled = np.clip(np.rint((depth_image.astype(np.float64) - low) * (255.0 / (high - low))), 0, 255)
+            expected = cv2.applyColorMap(scaled.astype(np.uint8), colormap)
+
+            np.testing.assert_array_equal(colorizer(depth_image), expected)
+            np.testing.assert_array_equal(colorizer.to_bgra(depth_image)[..., :3], expected)
+
+
+def test_colorize_normalizes_each_frame():
+    depth_image = create_depth_image()
+    expected = cv2.applyColorMap(
+        cv2.normalize(depth_image, None, 0, 255, cv2.NORM_MINMAX, dtype=cv2.CV_8U), cv2.COLORMAP_HSV
+    )
+    np.testing.assert_array_equal(colorize(depth_image), expected)
+
+    clipped = depth_image.clip(None, 5000)
+    expected = cv2.applyColorMap(
+        cv2.normalize(clipped, None, 0, 255, cv2.NORM_MINMAX, dtype=cv2.CV_8U), cv2.COLORMAP_JET
+    )
+    np.testing.assert_array_equal(colorize(depth_image, (None, 5000), cv2.COLORMAP_JET), expected)
+    assert colorize(depth_image.astype(np.float32)).shape == (*depth_image.shape, 3)
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from pykinect_recorder.pyk4a import pykinect
+from pykinect_recorder.pyk4a.k4a import _k4a, Configuration
+from pykinect_recorder.pyk4a.k4a.decode_pool import DecodePool
+from pykinect_recorder.pyk4a.k4arecord.playback import decode_capture
+
+
+def get_captures(color_format, count):
+    configuration = Configuration()
+    configuration.color_format = color_format
+    configuration.color_resolution = _k4a.K4A_COLOR_RESOLUTION_720P
+    configuration.depth_mode = _k4a.K4A_DEPTH_MODE_NFOV_2X2BINNED
+    device = pykinect.start_device(config=configuration)
+    captures = [device.update().reference() for _ in range(count)]
+    device.close()
+    return captures
+
+
+@pytest.mark.parametrize(
+    "color_format",
+    [_k4a.K4A_IMAGE_FORMAT_COLOR_MJPG, _k4a.K4A_IMAGE_FORMAT_COLOR_NV12, _k4a.K4A_IMAGE_FORMAT_COLOR_YUY2],
+)
+def test_map_keeps_frame_order(simulator, color_format):
+    captures = get_captures(color_format, 8)
+    expected = [capture.get_color_image()[1] for capture in captures]
+
+    with DecodePool(workers=3, max_pending=4) as decode_pool:
+        images = [capture.get_color_image_object() for capture in captures]
+        decoded = list(decode_pool.map(images))
+        # The pool holds its own references, the images can be released before the frames are read
+        future = decode_pool.submit(images[0], reduce=2)
+        images[0].reset()
+        ret, reduced = future.result()
+
+    assert all(ret for ret, _ in decoded)
+    for (_, frame), reference in zip(decoded, expected):
+        np.testing.assert_array_equal(frame, reference)
+    assert ret and reduced.shape[:2] == (360, 640)
+
+
+def test_decode_capture_with_pool(simulator):
+    capture = get_captures(_k4a.K4A_IMAGE_FORMAT_COLOR_MJPG, 1)[0]
+    with DecodePool(workers=2) as decode_pool:
+        frames = decode_capture(capture, decode_pool=decode_pool)
+    reference = decode_capture(capture)
+
+    assert set(frames) == {"color", "depth", "ir"}
+    for stream in reference:
+        np.testing.assert_array_equal(frames[stream], reference[stream])
@@ -0,0 +1,93 @@
+import os
+
+from pykinect_recorder.pyk4a import pykinect
+from pykinect_recorder.pyk4a.k4a import _k4a
+from pykinect_recorder.pyk4a.k4a.configuration import Configuration
+from pykinect_recorder.pyk4a.k4a.device_group import DeviceGroup, FrameAligner
+
+FRAME_PERIOD_USEC = 33333
+
+
+def test_aligner_matches_frames_by_corrected_timestamp():
+    released = []
+    aligner = FrameAligner([0, 160, 320], tolerance_usec=FRAME_PERIOD_USEC // 2, release=released.append)
+
+    for frame in range(4):
+        timestamp = frame * FRAME_PERIOD_USEC
+        aligner.push(0, timestamp, ("master", frame))
+        aligner.push(2, timestamp + 320 + 40, ("subordinate 2", frame))
+        # Subordinate 1 misses its second frame
+        if frame != 1:
+            aligner.push(1, timestamp + 160 - 25, ("subordinate 1", frame))
+
+    frame_sets = []
+    while (match := aligner.pop()) is not None:
+        frame_sets.append(match)
+
+    assert [[frame[1] for frame in frames] for _, frames in frame_sets] == [[0, 0, 0], [2, 2, 2], [3, 3, 3]]
+    # The incomplete set is released, not delivered late
+    assert sorted(released) == [("master", 1), ("subordinate 2", 1)]
+
+    stats = aligner.get_stats()
+    assert stats["matched"] == 3
+    assert stats["dropped"] == [1, 0, 1]
+    assert stats["skew_usec"][1]["max"] == 25
+    assert stats["skew_usec"][2]["max"] == 40
+    assert stats["spread_usec"]["max"] == 65
+
+
+def test_aligner_waits_for_every_stream():
+    aligner = FrameAligner([0, 0], tolerance_usec=1000)
+    aligner.push(0, 0, "a")
+    assert aligner.pop() is None
+    assert aligner.needs() == [1]
+
+
+def test_configurations_start_with_master():
+    group = DeviceGroup.__new__(DeviceGroup)
+    group.devices = [None, None, None]
+
+    configuration = Configuration()
+    configuration.camera_fps = _k4a.K4A_FRAMES_PER_SECOND_15
+    configurations = group.get_configurations(configuration)
+
+    assert [c.wired_sync_mode for c in configurations] == [
+        _k4a.K4A_WIRED_SYNC_MODE_MASTER,
+        _k4a.K4A_WIRED_SYNC_MODE_SUBORDINATE,
+        _k4a.K4A_WIRED_SYNC_MODE_SUBORDINATE,
+    ]
+    assert [c.subordinate_delay_off_master_usec for c in configurations] == [0, 160, 320]
+    assert all(c.camera_fps == _k4a.K4A_FRAMES_PER_SECOND_15 for c in configurations)
+    # The shared configuration is left as is
+    assert configuration.wired_sync_mode == _k4a.K4A_WIRED_SYNC_MODE_STANDALONE
+    assert configurations[2].handle().subordinate_delay_off_master_usec == 320
+
+
+def test_simulated_master_and_subordinate(simulator, tmp_path):
+    # The fixture restores the libraries, a chained pair replaces its single device
+    k4a = pykinect.initialize_simulator(device_count=2)
+    configuration = Configuration()
+    configuration.color_resolution = _k4a.K4A_COLOR_RESOLUTION_720P
+    configuration.depth_mode = _k4a.K4A_DEPTH_MODE_NFOV_2X2BINNED
+
+    group = DeviceGroup()
+    assert len(group) == 2
+    group.start(configuration, record=True, record_dir=str(tmp_path))
+    assert [c.wired_sync_mode for c in group.configurations] == [
+        _k4a.K4A_WIRED_SYNC_MODE_MASTER,
+        _k4a.K4A_WIRED_SYNC_MODE_SUBORDINATE,
+    ]
+
+    timestamps = []
+    for _ in range(5):
+        frame_set = group.update(timeout_in_ms=5000)
+        assert frame_set is not None and len(frame_set) == 2
+        assert abs(frame_set.skew_usec[1]) <= FRAME_PERIOD_USEC // 2
+        timestamps.append(int(frame_set.timestamps[0]))
+        frame_set.release()
+    group.close()
+
+    assert timestamps == sorted(timestamps) and len(set(timestamps)) == 5
+    assert os.path.exists(tmp_path / "skew_report.json")
+    assert all(os.path.exists(tmp_path / f"{serial_number}.mkv") for serial_number in group.serial_numbers)
+    assert len(k4a.handles) == 0
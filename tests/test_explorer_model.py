@@ -0,0 +1,46 @@
+from pykinect_recorder.renderer.components.sidebar_explorer import RecordingListModel
+
+
+def make_info(path, size):
+    return {
+        "path": path,
+        "size": size,
+        "mtime_ns": 1,
+        "length_usec": 61000000,
+        "config": {"start_timestamp_offset_usec": 0, "camera_fps": 2},
+        "calibration": {"color": {"width": 1280, "height": 720}, "depth": {"width": 640, "height": 576}},
+        "thumbnail": None,
+    }
+
+
+def test_rows_are_updated_incrementally():
+    model = RecordingListModel()
+    missing = model.update_entries(
+        [("/videos/b.mkv", 10, 1, None), ("/videos/a.mkv", 20, 1, make_info("/videos/a.mkv", 20))]
+    )
+    assert missing == ["/videos/b.mkv"]
+    assert model.rowCount() == 2
+    assert model.index(1).data(RecordingListModel.MetadataRole) == "0:01:01 (0.00GB)"
+
+    # Unchanged rows are skipped, a changed one is reset and read again
+    assert model.update_entries([("/videos/a.mkv", 20, 1, make_info("/videos/a.mkv", 20))]) == []
+    assert model.update_entries([("/videos/a.mkv", 30, 2, None)]) == ["/videos/a.mkv"]
+    assert model.index(1).data(RecordingListModel.MetadataRole) == "..."
+
+    model.set_info(make_info("/videos/b.mkv", 10))
+    assert model.index(0).data(RecordingListModel.MetadataRole) != "..."
+
+    model.remove_missing({"/videos/a.mkv"})
+    assert model.rowCount() == 1
+    assert model.index(0).data(RecordingListModel.PathRole) == "/videos/a.mkv"
+
+
+def test_rows_are_sorted_once_the_scan_is_done():
+    model = RecordingListModel()
+    model.update_entries([(f"/videos/{name}.mkv", 1, 1, None) for name in "cab"])
+    model.sort_by_name()
+    assert [model.index(row).data() for row in range(3)] == ["a.mkv", "b.mkv", "c.mkv"]
+
+    model.remove_path("/videos/b.mkv")
+    model.update_entries([("/videos/c.mkv", 2, 1, None)])
+    assert model.index(1).data(RecordingListModel.PathRole) == "/videos/c.mkv"
@@ -0,0 +1,48 @@
+import os
+import csv
+import json
+
+from pykinect_recorder.pyk4a.k4arecord.extract import find_recordings, get_segment_marker, write_metadata
+
+
+def write_marker(root_path, segment, timestamps):
+    marker = get_segment_marker(root_path, segment)
+    os.makedirs(os.path.dirname(marker), exist_ok=True)
+    rows = [
+        {
+            "file_name": "a", "frame": None, "device_timestamp_usec": t, "rgb": f"a_rgb_{t:012d}.jpg", "ir": None,
+            "depth": None,
+        }
+        for t in timestamps
+    ]
+    with open(marker, "w", encoding="utf-8") as f:
+        json.dump(rows, f)
+
+
+def test_metadata_is_consolidated_in_segment_order(tmp_path):
+    segments = [("rec/a.mkv", 0, 0, 1000), ("rec/a.mkv", 1, 1000, -1)]
+    # Segments finish in any order, the metadata follows the device time
+    write_marker(tmp_path, segments[1], [1000, 1033])
+    write_marker(tmp_path, segments[0], [0, 33, 66])
+
+    with open(write_metadata(str(tmp_path), segments), newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+
+    assert [row["frame"] for row in rows] == ["0", "1", "2", "3", "4"]
+    assert [row["device_timestamp_usec"] for row in rows] == ["0", "33", "66", "1000", "1033"]
+
+
+def test_segment_marker_depends_on_bounds(tmp_path):
+    """
+    Resuming with another segment length does not pick up markers of the previous segmentation.
+    """
+    assert get_segment_marker(tmp_path, ("a.mkv", 0, 0, 1000)) != get_segment_marker(tmp_path, ("a.mkv", 0, 0, 2000))
+
+
+def test_find_recordings(tmp_path):
+    (tmp_path / "b.mkv").touch()
+    (tmp_path / "a.mkv").touch()
+    (tmp_path / "notes.txt").touch()
+
+    recordings = find_recordings([str(tmp_path), str(tmp_path / "a.mkv")])
+    assert recordings == [str(tmp_path / "a.mkv"), str(tmp_path / "b.mkv")]
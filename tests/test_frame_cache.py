@@ -0,0 +1,96 @@
+import time
+
+import numpy as np
+
+from pykinect_recorder.pyk4a import pykinect
+from pykinect_recorder.pyk4a.k4a import _k4a, Configuration
+from pykinect_recorder.pyk4a.k4a.decode_pool import DecodePool
+from pykinect_recorder.pyk4a.k4arecord.frame_cache import FrameCache, ReadAhead
+from pykinect_recorder.pyk4a.k4arecord.playback import Playback, decode_capture
+
+
+def make_frames(value, size=1000):
+    return {"depth": np.full(size, value, dtype=np.uint8)}
+
+
+def test_lru_is_byte_bounded():
+    cache = FrameCache(max_bytes=3000)
+    for timestamp in range(3):
+        cache.put(timestamp, make_frames(timestamp))
+
+    # Touch the oldest entry, the next insertion evicts timestamp 1 instead
+    assert cache.get(0)["depth"][0] == 0
+    cache.put(3, make_frames(3))
+
+    assert 0 in cache and 1 not in cache and 3 in cache
+    assert cache.get(1) is None
+    stats = cache.get_stats()
+    assert stats["bytes"] == 3000
+    assert stats["entries"] == 3
+    assert stats["evictions"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_oversized_entry_is_not_cached():
+    cache = FrameCache(max_bytes=500)
+    cache.put(0, make_frames(0))
+    assert len(cache) == 0
+    assert cache.bytes == 0
+
+
+class FakeCapture:
+    def __init__(self, timestamp):
+        self.timestamp = timestamp
+        self.decodes = 0
+
+    def get_device_timestamp_usec(self):
+        return self.timestamp
+
+    def get_depth_image(self):
+        self.decodes += 1
+        return True, np.zeros((4, 4), dtype=np.uint16)
+
+
+def test_decode_skips_cached_captures():
+    cache = FrameCache(streams=("depth",))
+    capture = FakeCapture(33333)
+
+    timestamp, frames = cache.decode(capture)
+    assert timestamp == 33333
+    assert frames["depth"].shape == (4, 4)
+
+    _, cached = cache.decode(capture)
+    assert cached is frames
+    assert capture.decodes == 1
+
+
+def test_read_ahead_uses_its_own_pool(simulator, tmp_path):
+    filepath = str(tmp_path / "read_ahead.mkv")
+    configuration = Configuration()
+    configuration.color_resolution = _k4a.K4A_COLOR_RESOLUTION_720P
+    configuration.depth_mode = _k4a.K4A_DEPTH_MODE_NFOV_2X2BINNED
+    device = pykinect.start_device(config=configuration, record=True, record_filepath=filepath)
+    for _ in range(10):
+        device.update()
+    device.close()
+
+    playback = Playback(filepath)
+    expected = [(timestamp, decode_capture(capture)) for timestamp, capture in playback.get_segment_captures(0, None)]
+    playback.close()
+
+    with DecodePool(workers=1) as foreground_pool:
+        cache = FrameCache(decode_pool=foreground_pool)
+        read_ahead = ReadAhead(filepath, cache, frames=4, decode_workers=2)
+        assert read_ahead.decode_pool is not foreground_pool
+        assert read_ahead.decode_pool.max_pending == 4
+
+        read_ahead.schedule(expected[0][0])
+        deadline = time.monotonic() + 10
+        while len(cache) < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        read_ahead.stop()
+
+    assert len(cache) == 4
+    for timestamp, reference in expected[1:5]:
+        for stream in reference:
+            np.testing.assert_array_equal(cache.get(timestamp)[stream], reference[stream])
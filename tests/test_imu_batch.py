@@ -0,0 +1,77 @@
+import numpy as np
+
+from pykinect_recorder.pyk4a import pykinect
+from pykinect_recorder.pyk4a.k4a import _k4a, Configuration
+from pykinect_recorder.pyk4a.k4a.imu_sample import IMU_SAMPLE_DTYPE
+from pykinect_recorder.pyk4a.k4arecord.playback import Playback
+from pykinect_recorder.pyk4a.simulator.frames import synthesize_imu_samples
+from pykinect_recorder.pyk4a.simulator.k4a import IMU_RATE_HZ, START_TIMESTAMP_USEC
+
+
+def start_device(**kwargs):
+    configuration = Configuration()
+    configuration.color_resolution = _k4a.K4A_COLOR_RESOLUTION_720P
+    configuration.depth_mode = _k4a.K4A_DEPTH_MODE_NFOV_2X2BINNED
+    return pykinect.start_device(config=configuration, **kwargs)
+
+
+def close_device(device):
+    device.capture = None
+    device.close()
+
+
+def test_drain_reads_every_pending_sample(simulator):
+    device = start_device()
+    # The simulated clock jumps to each capture, the IMU samples up to it are pending
+    for _ in range(6):
+        device.update()
+
+    imu_samples = device.drain_imu_samples()
+    assert imu_samples.dtype == IMU_SAMPLE_DTYPE
+    # The staging buffer grew past its initial 128 samples without losing any
+    assert len(imu_samples) > 128
+    expected = synthesize_imu_samples(START_TIMESTAMP_USEC, 1e6 / IMU_RATE_HZ, 0, len(imu_samples))
+    np.testing.assert_array_equal(imu_samples["acc_timestamp_usec"], expected["acc_timestamp_usec"])
+    np.testing.assert_allclose(imu_samples["acc_sample"], expected["acc_sample"], rtol=1e-6)
+    np.testing.assert_allclose(imu_samples["gyro_sample"], expected["gyro_sample"], rtol=1e-6, atol=1e-9)
+
+    assert len(device.drain_imu_samples()) == 0
+    close_device(device)
+    assert len(simulator.handles) == 0
+
+
+def test_drain_into_preallocated_array(simulator):
+    device = start_device()
+    device.update()
+    device.update()
+
+    out = np.zeros(6, dtype=IMU_SAMPLE_DTYPE)
+    imu_samples = device.drain_imu_samples(out)
+    assert len(imu_samples) == 6
+    assert np.shares_memory(imu_samples, out)
+    assert imu_samples["acc_timestamp_usec"][0] == START_TIMESTAMP_USEC
+    # The remaining samples are still queued
+    remaining = device.drain_imu_samples()
+    assert len(remaining) > 0
+    assert remaining["acc_timestamp_usec"][0] == imu_samples["acc_timestamp_usec"][-1] + 625
+    close_device(device)
+
+
+def test_update_imu_records_every_sample(simulator, tmp_path):
+    filepath = str(tmp_path / "imu.mkv")
+    device = start_device(record=True, record_filepath=filepath)
+
+    drained = []
+    for _ in range(10):
+        device.update()
+        imu_sample = device.update_imu()
+        drained.append(device.imu_samples.copy())
+        assert imu_sample.acc_time == device.imu_samples["acc_timestamp_usec"][-1]
+    close_device(device)
+    drained = np.concatenate(drained)
+    assert np.all(np.diff(drained["acc_timestamp_usec"].astype(np.int64)) == 625)
+
+    playback = Playback(filepath)
+    recorded = np.concatenate(list(playback.read_imu()))
+    playback.close()
+    np.testing.assert_array_equal(recorded["acc_timestamp_usec"], drained["acc_timestamp_usec"])
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from pykinect_recorder.pyk4a import pykinect
+from pykinect_recorder.pyk4a.k4a import _k4a, Configuration
+from pykinect_recorder.pyk4a.k4a.imu_sample import IMU_SAMPLE_DTYPE
+from pykinect_recorder.pyk4a.k4arecord.playback import Playback
+
+
+@pytest.fixture
+def recording(simulator, tmp_path):
+    """Path of a simulated recording and the IMU samples written to it."""
+    configuration = Configuration()
+    configuration.color_resolution = _k4a.K4A_COLOR_RESOLUTION_720P
+    configuration.depth_mode = _k4a.K4A_DEPTH_MODE_NFOV_2X2BINNED
+    filepath = str(tmp_path / "imu.mkv")
+    device = pykinect.start_device(config=configuration, record=True, record_filepath=filepath)
+
+    imu_samples = []
+    for _ in range(5):
+        device.update()
+        device.update_imu()
+        imu_samples.append(device.imu_samples.copy())
+    device.capture = None
+    device.close()
+    return filepath, np.concatenate(imu_samples)
+
+
+def test_read_imu_streams_chunks(recording):
+    filepath, imu_samples = recording
+    playback = Playback(filepath)
+
+    chunks = list(playback.read_imu(chunk_size=50))
+    assert [len(chunk) for chunk in chunks[:-1]] == [50] * (len(chunks) - 1)
+    assert 0 < len(chunks[-1]) <= 50
+    assert all(chunk.dtype == IMU_SAMPLE_DTYPE for chunk in chunks)
+    # Chunks are copies, not views of the reused buffer
+    np.testing.assert_array_equal(np.concatenate(chunks), imu_samples)
+    playback.close()
+
+
+def test_read_imu_stops_at_end(recording):
+    filepath, imu_samples = recording
+    playback = Playback(filepath)
+
+    timestamps = imu_samples["acc_timestamp_usec"]
+    start, end = int(timestamps[10]), int(timestamps[40])
+    read = np.concatenate(list(playback.read_imu(start, end, chunk_size=8)))
+    np.testing.assert_array_equal(read["acc_timestamp_usec"], timestamps[10:40])
+    playback.close()
+
+
+def test_export_imu_npz(recording, tmp_path):
+    filepath, imu_samples = recording
+    playback = Playback(filepath)
+
+    path = tmp_path / "imu.npz"
+    assert playback.export_imu(str(path), chunk_size=30) == len(imu_samples)
+    with np.load(path) as columns:
+        np.testing.assert_array_equal(columns["acc_timestamp_usec"], imu_samples["acc_timestamp_usec"])
+        np.testing.assert_allclose(columns["acc_z"], imu_samples["acc_sample"][:, 2], rtol=1e-6)
+        np.testing.assert_allclose(columns["gyro_y"], imu_samples["gyro_sample"][:, 1], rtol=1e-6)
+    playback.close()
+
+
+def test_export_imu_rejects_unknown_format(recording, tmp_path):
+    playback = Playback(recording[0])
+    with pytest.raises(ValueError):
+        playback.export_imu(str(tmp_path / "imu.csv"))
+    playback.close()
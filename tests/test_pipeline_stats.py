@@ -0,0 +1,55 @@
+import json
+import time
+
+import pytest
+
+from pykinect_recorder.pyk4a import pykinect
+from pykinect_recorder.pyk4a.k4a import _k4a, Configuration
+from pykinect_recorder.pyk4a.k4a.pipeline_stats import PipelineStats, DECODE, PAINT, RECORD_WRITE
+
+
+def test_dropped_frames_from_device_timestamps():
+    stats = PipelineStats(expected_fps=30)
+    # The 3rd and 5th frames (of 30 fps, 33333 us apart) never arrived
+    for timestamp in (200000, 233333, 299999, 366666):
+        stats.frame(timestamp)
+
+    assert stats.frames == 4
+    assert stats.dropped_frames == 2
+    assert stats.fps > 0
+
+
+def test_stage_latencies_and_chrome_trace(tmp_path):
+    stats = PipelineStats(window=4)
+    for _ in range(6):
+        with stats.stage(DECODE):
+            time.sleep(0.001)
+    start_ns = time.perf_counter_ns()
+    stats.add(PAINT, start_ns, start_ns + 2_000_000)
+
+    decode = stats.get_stats()["stages"][DECODE]
+    assert decode["count"] == 4 and decode["p50"] >= 1.0
+    assert stats.get_stage_stats(PAINT)["max"] == pytest.approx(2.0)
+
+    stats.save_chrome_trace(str(tmp_path / "pipeline.trace.json"))
+    with open(tmp_path / "pipeline.trace.json", "r", encoding="utf-8") as f:
+        events = json.load(f)["traceEvents"]
+    assert [event["name"] for event in events].count(DECODE) == 4
+    assert all(event["ph"] == "X" and event["dur"] > 0 for event in events)
+    assert events == sorted(events, key=lambda event: event["ts"])
+
+
+def test_record_write_stage(simulator, tmp_path):
+    configuration = Configuration()
+    configuration.color_resolution = _k4a.K4A_COLOR_RESOLUTION_720P
+    configuration.depth_mode = _k4a.K4A_DEPTH_MODE_NFOV_2X2BINNED
+    device = pykinect.start_device(config=configuration, record=True, record_filepath=str(tmp_path / "stats.mkv"))
+    stats = PipelineStats(expected_fps=30)
+    device.record_writer.pipeline_stats = stats
+
+    for _ in range(5):
+        stats.frame(device.update().get_device_timestamp_usec())
+    device.close()
+
+    assert stats.get_stage_stats(RECORD_WRITE)["count"] == 5
+    assert stats.dropped_frames == 0
@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+from pykinect_recorder.pyk4a import pykinect
+from pykinect_recorder.pyk4a.k4a import _k4a, Configuration
+from pykinect_recorder.pyk4a.k4arecord.playback import Playback
+from pykinect_recorder.pyk4a.k4arecord.playback_index import (
+    COLOR_STREAM,
+    DEPTH_STREAM,
+    PlaybackIndex,
+    get_index_path,
+)
+
+
+@pytest.fixture
+def index():
+    timestamps = [1000 + 33333 * frame for frame in range(10)]
+    return PlaybackIndex(timestamps, [COLOR_STREAM | DEPTH_STREAM] * 9 + [DEPTH_STREAM])
+
+
+def test_frame_timestamp_mapping(index):
+    assert index.frame_count == 10
+    assert index.frame_to_timestamp(3) == 1000 + 3 * 33333
+    assert index.timestamp_to_frame(1000 + 3 * 33333) == 3
+    assert index.timestamp_to_frame(1000 + 3 * 33333 + 10) == 3
+    assert index.timestamp_to_frame(0) == 0
+    assert index.timestamp_to_frame(10**12) == 9
+    assert index.has_stream(0, COLOR_STREAM)
+    assert not index.has_stream(9, COLOR_STREAM)
+
+
+def test_sidecar_round_trip(tmp_path, index):
+    recording = tmp_path / "recording.mkv"
+    recording.write_bytes(b"mkv")
+    stat = os.stat(recording)
+    index.source_size, index.source_mtime_ns = stat.st_size, stat.st_mtime_ns
+
+    index.save_sidecar(str(recording))
+    loaded = PlaybackIndex.load_sidecar(str(recording))
+    assert os.path.exists(get_index_path(str(recording)))
+    assert list(loaded.timestamps) == list(index.timestamps)
+    assert list(loaded.streams) == list(index.streams)
+
+    # A modified recording invalidates its index
+    recording.write_bytes(b"mkv, longer")
+    assert PlaybackIndex.load_sidecar(str(recording)) is None
+
+
+def test_seek_frame_on_simulated_recording(simulator, tmp_path):
+    filepath = str(tmp_path / "index.mkv")
+    configuration = Configuration()
+    configuration.color_resolution = _k4a.K4A_COLOR_RESOLUTION_720P
+    configuration.depth_mode = _k4a.K4A_DEPTH_MODE_NFOV_2X2BINNED
+    device = pykinect.start_device(config=configuration, record=True, record_filepath=filepath)
+    for _ in range(12):
+        device.update()
+    device.close()
+
+    playback = Playback(filepath)
+    timestamps = [timestamp for timestamp, _ in playback.get_segment_captures(0, None)]
+    playback.index = PlaybackIndex.build(playback)
+    assert playback.get_frame_count() == 12
+    assert list(playback.index.timestamps) == timestamps
+
+    for frame in (0, 5, 11, 4):
+        playback.seek_frame(frame)
+        assert playback.update()[1].get_device_timestamp_usec() == timestamps[frame]
+    # Clamped to the last frame past the end, to the first one before the start
+    playback.seek_frame(100)
+    assert playback.update()[1].get_device_timestamp_usec() == timestamps[-1]
+    playback.seek_frame(-3)
+    assert playback.update()[1].get_device_timestamp_usec() == timestamps[0]
+    playback.close()
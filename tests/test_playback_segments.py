@@ -0,0 +1,70 @@
+import pytest
+
+from pykinect_recorder.pyk4a import pykinect
+from pykinect_recorder.pyk4a.k4a import _k4a, Configuration
+from pykinect_recorder.pyk4a.k4arecord.playback import Playback, split_time_range
+
+FRAMES = 24
+SEGMENTS = 5
+
+
+@pytest.fixture
+def recording(simulator, tmp_path):
+    filepath = str(tmp_path / "segments.mkv")
+    configuration = Configuration()
+    configuration.color_resolution = _k4a.K4A_COLOR_RESOLUTION_720P
+    configuration.depth_mode = _k4a.K4A_DEPTH_MODE_NFOV_2X2BINNED
+    device = pykinect.start_device(config=configuration, record=True, record_filepath=filepath)
+    for _ in range(FRAMES):
+        device.update()
+    device.close()
+
+    return filepath
+
+
+def test_segments_are_contiguous():
+    """
+    Every device timestamp of the recording falls in exactly one [start, end) segment.
+    """
+    segments = split_time_range(1_000_000, 10_000_001, 7)
+
+    assert len(segments) == 7
+    assert segments[0][0] == 1_000_000
+    assert segments[-1][1] is None
+    for (_, end), (start, _) in zip(segments, segments[1:]):
+        assert end == start
+    assert all(start < end for start, end in segments[:-1])
+
+
+def test_single_segment():
+    assert split_time_range(5, 100, 0) == [(5, None)]
+    assert split_time_range(5, 0, 1) == [(5, None)]
+
+
+def assert_every_capture_once(timestamps):
+    assert len(timestamps) == FRAMES
+    assert timestamps == sorted(timestamps)
+    assert len(set(timestamps)) == FRAMES
+
+
+def test_segments_read_every_capture_once(recording):
+    playback = Playback(recording)
+    timestamps = [
+        timestamp
+        for start, end in playback.get_segments(SEGMENTS)
+        for timestamp, _ in playback.get_segment_captures(start, end)
+    ]
+    playback.close()
+
+    assert_every_capture_once(timestamps)
+
+
+def test_parallel_read_every_capture_once(recording, monkeypatch):
+    # The spawned workers install the simulator as well
+    monkeypatch.setenv("PYKINECT_SIMULATOR", "1")
+    playback = Playback(recording)
+    frames = list(playback.iter_frames_parallel(workers=2, segments=SEGMENTS, streams=("depth",)))
+    playback.close()
+
+    assert_every_capture_once([timestamp for timestamp, _ in frames])
+    assert all(set(decoded) == {"depth"} for _, decoded in frames)
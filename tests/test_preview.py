@@ -0,0 +1,55 @@
+import numpy as np
+
+from pykinect_recorder.pyk4a.k4a import _k4a
+from pykinect_recorder.pyk4a.k4a.image import Image
+from pykinect_recorder.renderer.components.preview import get_reduce_factor
+
+
+def test_reduce_factor_follows_widget_size():
+    assert get_reduce_factor(3840, 2160, (590, 505)) == 4
+    assert get_reduce_factor(1280, 720, (590, 505)) == 1
+    assert get_reduce_factor(640, 576, (300, 250)) == 2
+    assert get_reduce_factor(1024, 1024, (100, 100)) == 8
+
+
+def test_reduced_depth_image(k4a_stub):
+    """
+    Depth is area-resized before colorizing, the full resolution view is left untouched.
+    """
+    image = Image.create(_k4a.K4A_IMAGE_FORMAT_DEPTH16, 640, 576, 640 * 2)
+    ret, depth_view = image.to_numpy(copy=False)
+    assert ret
+    assert depth_view.shape == (576, 640)
+
+    ret, reduced = image.to_numpy(copy=False, reduce=2)
+    assert ret
+    assert reduced.shape == (288, 320)
+    assert reduced.dtype == np.uint16
+    assert reduced.flags.writeable
+
+
+def test_preview_pool_accounting(simulator):
+    """
+    MJPG frames decoded by OpenCV aren't pool buffers, previewing them leaves the pool counts balanced.
+    """
+    from pykinect_recorder.pyk4a import pykinect
+    from pykinect_recorder.pyk4a.k4a import Configuration
+    from pykinect_recorder.renderer.components.preview import PreviewPipeline
+    from pykinect_recorder.renderer.signals import RecorderSignals
+
+    configuration = Configuration()
+    configuration.color_resolution = _k4a.K4A_COLOR_RESOLUTION_720P
+    configuration.depth_mode = _k4a.K4A_DEPTH_MODE_NFOV_2X2BINNED
+    device = pykinect.start_device(config=configuration)
+    signals = RecorderSignals()
+    images = []
+    signals.rgb_image.connect(images.append)
+    preview = PreviewPipeline(signals)
+    for _ in range(5):
+        preview.update(device.update())
+    device.close()
+
+    assert len(images) == 5
+    images.clear()
+    preview.pool.collect()
+    assert preview.pool.get_stats()["in_use"] == 0
@@ -0,0 +1,47 @@
+import ctypes
+
+from pykinect_recorder.pyk4a.k4a import _k4a
+
+
+def get_size_per_call_prototype(image_handle):
+    # How every wrapper declared its prototype before `setup_library()` bound them once.
+    _k4a_image_get_size = _k4a.k4a_dll.k4a_image_get_size
+    _k4a_image_get_size.restype = ctypes.c_size_t
+    _k4a_image_get_size.argtypes = (_k4a.k4a_image_t,)
+
+    return _k4a_image_get_size(image_handle)
+
+
+def create_depth_image():
+    image_handle = _k4a.k4a_image_t()
+    assert _k4a.k4a_image_create(_k4a.K4A_IMAGE_FORMAT_DEPTH16, 640, 576, 640 * 2, image_handle) == 0
+    return image_handle
+
+
+def test_prototypes_bound_on_setup(k4a_stub):
+    """
+    `setup_library()` declares the prototypes once, so the wrappers marshal arguments correctly.
+    """
+    image_handle = create_depth_image()
+
+    assert _k4a.k4a_dll.k4a_image_get_size.restype is ctypes.c_size_t
+    assert _k4a.k4a_image_get_size(image_handle) == 640 * 576 * 2
+    assert _k4a.k4a_image_get_width_pixels(image_handle) == 640
+    assert _k4a.k4a_image_get_height_pixels(image_handle) == 576
+    assert _k4a.k4a_image_get_buffer(image_handle)
+
+    _k4a.k4a_image_release(image_handle)
+
+
+def test_per_call_prototype_gives_the_same_results(k4a_stub):
+    """
+    The prototypes bound once declare what the wrappers used to declare on every call, with identical results.
+    """
+    image_handle = create_depth_image()
+
+    function = _k4a.k4a_dll.k4a_image_get_size
+    assert tuple(function.argtypes) == (_k4a.k4a_image_t,)
+    assert function.restype is ctypes.c_size_t
+    assert _k4a.k4a_image_get_size(image_handle) == get_size_per_call_prototype(image_handle) == 640 * 576 * 2
+
+    _k4a.k4a_image_release(image_handle)
@@ -0,0 +1,134 @@
+import threading
+
+import pytest
+
+from pykinect_recorder.pyk4a import pykinect
+from pykinect_recorder.pyk4a.k4a import _k4a, Configuration
+from pykinect_recorder.pyk4a.k4arecord.playback import Playback
+from pykinect_recorder.pyk4a.k4arecord.record import Record, RecordWriter
+
+
+class FailingRecord:
+    """Stand-in `Record` whose capture writes fail once `fail` is set."""
+
+    def __init__(self):
+        self.fail = threading.Event()
+
+    def write_capture(self, capture_handle):
+        self.fail.wait()
+        raise OSError("No space left on device")
+
+    def flush(self):
+        pass
+
+
+class GatedRecord(Record):
+    """`Record` whose capture writes wait for `release`, counting its flushes."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.release = threading.Event()
+        self.flushes = 0
+
+    def write_capture(self, capture_handle):
+        self.release.wait()
+        super().write_capture(capture_handle)
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+def make_configuration():
+    configuration = Configuration()
+    configuration.color_resolution = _k4a.K4A_COLOR_RESOLUTION_720P
+    configuration.depth_mode = _k4a.K4A_DEPTH_MODE_NFOV_2X2BINNED
+    return configuration
+
+
+def test_stop_writes_queued_captures(simulator, tmp_path):
+    configuration = make_configuration()
+    device = pykinect.start_device(config=configuration)
+    filepath = str(tmp_path / "writer.mkv")
+    record = GatedRecord(device.handle(), configuration.handle(), filepath)
+    record.add_imu_track()
+    # Flushed after every write
+    writer = RecordWriter(record, queue_size=64, flush_interval_sec=0)
+    writer.start()
+
+    frames = 10
+    capture_bytes = 0
+    imu_samples = 0
+    for _ in range(frames):
+        capture_handle = device.update().handle()
+        writer.write_capture(capture_handle)
+        capture_bytes += RecordWriter.get_capture_size(capture_handle)
+        samples = device.drain_imu_samples()
+        writer.write_imu_samples(samples)
+        imu_samples += len(samples)
+
+    # The first capture may be taken by the thread, waiting for the release
+    assert writer.queue_depth >= 2 * frames - 1
+    assert writer.get_stats()["captures"] == 0
+    record.release.set()
+    writer.stop()
+
+    stats = writer.get_stats()
+    assert stats["queue_depth"] == 0
+    assert stats["captures"] == frames
+    assert stats["imu_samples"] == imu_samples
+    assert stats["bytes"] == capture_bytes + imu_samples * _k4a.IMU_SAMPLE_SIZE
+    assert stats["bytes_per_second"] > 0
+    assert stats["latency_ms"]["max"] >= stats["latency_ms"]["p50"] > 0
+    # One flush per write and the final one
+    assert record.flushes == 2 * frames + 1
+    record.close()
+
+    device.capture = None
+    device.close()
+    assert len(simulator.handles) == 0
+
+    playback = Playback(filepath)
+    assert len(list(playback.get_segment_captures(0, None))) == frames
+    assert sum(len(chunk) for chunk in playback.read_imu()) == imu_samples
+    playback.close()
+
+
+def test_failed_writer_unblocks_producers(simulator):
+    device = pykinect.start_device(config=make_configuration())
+    capture = device.update().reference()
+
+    record = FailingRecord()
+    writer = RecordWriter(record, queue_size=2)
+    writer.start()
+    errors = []
+
+    def produce():
+        try:
+            while True:
+                writer.write_capture(capture.handle())
+        except RuntimeError as e:
+            errors.append(e)
+
+    # The producer fills the queue and blocks until the write fails
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    producer.join(0.2)
+    assert producer.is_alive()
+    record.fail.set()
+    producer.join(5)
+
+    assert not producer.is_alive()
+    assert isinstance(errors[0].__cause__, OSError)
+    assert isinstance(writer.error, OSError)
+    with pytest.raises(RuntimeError):
+        writer.write_imu_samples(None)
+    with pytest.raises(RuntimeError) as stop_error:
+        writer.stop()
+    assert stop_error.value.__cause__ is writer.error
+
+    # Every reference taken for the queue was released
+    capture.reset()
+    device.capture = None
+    device.close()
+    assert len(simulator.handles) == 0
@@ -0,0 +1,100 @@
+import json
+
+import numpy as np
+
+from pykinect_recorder.pyk4a import pykinect
+from pykinect_recorder.pyk4a.k4a import _k4a, Configuration
+from pykinect_recorder.pyk4a.k4a.imu_sample import IMU_SAMPLE_DTYPE
+from pykinect_recorder.pyk4a.k4arecord.health import RecordingHealth, get_health_path
+
+
+def make_configuration():
+    configuration = Configuration()
+    configuration.color_resolution = _k4a.K4A_COLOR_RESOLUTION_720P
+    configuration.depth_mode = _k4a.K4A_DEPTH_MODE_NFOV_2X2BINNED
+    return configuration
+
+
+def test_gaps_and_reordering(simulator):
+    device = pykinect.start_device(config=make_configuration())
+    captures = [device.update().reference() for _ in range(8)]
+
+    health = RecordingHealth(camera_fps=30)
+    # Frames 2 and 3 are lost, frame 6 is written again after frame 7
+    for i in (0, 1, 4, 5, 7, 6):
+        health.add_capture(captures[i].handle())
+    for capture in captures:
+        capture.reset()
+    device.close()
+
+    report = health.get_report()
+    assert not report["healthy"]
+    assert set(report["streams"]) == {"color", "depth", "ir"}
+    assert report["streams"]["depth"]["gaps"] == 2
+    assert report["streams"]["depth"]["missing_frames"] == 3
+    assert report["streams"]["color"]["reordered"] == 1
+    assert [event["type"] for event in report["events"] if event["stream"] == "ir"] == ["gap", "gap", "reordered"]
+
+
+def test_imu_sample_loss():
+    health = RecordingHealth(camera_fps=30, imu_rate_hz=1000)
+    imu_samples = np.zeros(10, dtype=IMU_SAMPLE_DTYPE)
+    imu_samples["acc_timestamp_usec"] = 1000 * np.arange(10)
+    health.add_imu_samples(imu_samples[:4])
+    # Samples 4 to 6 lost between the batches
+    health.add_imu_samples(imu_samples[7:])
+
+    imu = health.get_report()["imu"]
+    assert imu["samples"] == 7
+    assert imu["gaps"] == 1 and imu["missing_samples"] == 3
+    assert imu["last_timestamp_usec"] == 9000
+
+
+def test_report_written_next_to_recording(simulator, tmp_path):
+    filepath = str(tmp_path / "health.mkv")
+    device = pykinect.start_device(config=make_configuration(), record=True, record_filepath=filepath)
+    for _ in range(10):
+        device.update()
+        device.update_imu()
+    device.close()
+
+    with open(get_health_path(filepath), "r", encoding="utf-8") as f:
+        report = json.load(f)
+    assert report["healthy"]
+    assert report["captures"] == 10
+    assert report["streams"]["depth"]["frames"] == 10
+    assert report["imu"]["samples"] > 0 and report["imu"]["missing_samples"] == 0
+
+
+
+class TimestampedCapture:
+    def __init__(self, timestamp_usec):
+        self.device_timestamp = timestamp_usec
+
+    def get_depth_image_object(self):
+        return self
+
+    def is_valid(self):
+        return True
+
+
+def test_drop_counts_agree():
+    """
+    The headless record stats, the pipeline stats and the health report count the same gaps.
+    """
+    from pykinect_recorder.cli.command import RecordStats
+    from pykinect_recorder.pyk4a.k4a.pipeline_stats import PipelineStats
+    from pykinect_recorder.pyk4a.k4arecord.health import StreamContinuity
+
+    period_usec = 1e6 / 30
+    record_stats = RecordStats(30)
+    pipeline_stats = PipelineStats(expected_fps=30)
+    continuity = StreamContinuity(period_usec)
+    # 1.4 periods is a late frame, not a drop
+    for frame in (0, 1, 2.4, 5, 6, 8):
+        timestamp = int(frame * period_usec)
+        record_stats.add(TimestampedCapture(timestamp))
+        pipeline_stats.frame(timestamp)
+        continuity.add(timestamp)
+
+    assert record_stats.dropped_frames == pipeline_stats.dropped_frames == continuity.missing_frames == 3
@@ -0,0 +1,36 @@
+import os
+
+from pykinect_recorder.pyk4a.k4arecord.recording_info import RecordingInfoCache
+
+
+def make_info(path):
+    stat = os.stat(path)
+    return {"path": os.path.abspath(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "length_usec": 1000000}
+
+
+def test_cache_persists_and_detects_changed_files(tmp_path):
+    recording = tmp_path / "a.mkv"
+    recording.write_bytes(b"0" * 16)
+    cache_path = str(tmp_path / "cache" / "recordings.json")
+
+    cache = RecordingInfoCache(cache_path)
+    assert cache.get(str(recording)) is None
+    cache.put(make_info(recording))
+    cache.save()
+
+    reloaded = RecordingInfoCache(cache_path)
+    assert reloaded.get(str(recording))["length_usec"] == 1000000
+
+    # Rewritten with another size, the entry is stale
+    recording.write_bytes(b"0" * 32)
+    assert reloaded.get(str(recording)) is None
+
+
+def test_unreadable_recording_is_cached_as_error(simulator, tmp_path):
+    recording = tmp_path / "broken.mkv"
+    recording.write_bytes(b"not a matroska file")
+
+    cache = RecordingInfoCache(str(tmp_path / "recordings.json"))
+    info = cache.update(str(recording))
+    assert "error" in info
+    assert cache.get(str(recording)) is info
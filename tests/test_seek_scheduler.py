@@ -0,0 +1,101 @@
+import time
+from types import SimpleNamespace
+
+from PySide6.QtCore import Qt
+
+from pykinect_recorder.renderer.signals import PlaybackSignals
+from pykinect_recorder.renderer.components.seek_scheduler import SCRUB_SCALE, SeekScheduler
+
+
+class FakePlayback:
+    index = None
+
+    def __init__(self):
+        self.seeks = []
+        self.on_update = None
+        self.imu_samples = None
+
+    def try_seek_timestamp(self, offset):
+        self.seeks.append(offset)
+        return True
+
+    def update(self):
+        if self.on_update is not None:
+            self.on_update()
+        return True, object()
+
+    def try_get_next_imu_sample(self):
+        if self.imu_samples is not None:
+            if not self.imu_samples:
+                return False, None
+            self.imu_samples -= 1
+        return True, SimpleNamespace(acc_time=0, acc=[0.0, 0.0, 0.0], gyro=[0.0, 0.0, 0.0])
+
+
+class FakePreview:
+    def __init__(self):
+        self.scales = []
+
+    def update(self, capture, scale=1):
+        self.scales.append(scale)
+
+
+def run_until_idle(scheduler, seeks):
+    scheduler.start()
+    while scheduler.seeks < seeks:
+        time.sleep(0.01)
+    scheduler.stop()
+
+
+def test_requests_are_coalesced_to_the_latest():
+    playback, preview = FakePlayback(), FakePreview()
+    scheduler = SeekScheduler(playback, preview, PlaybackSignals(), fps=30)
+    for offset in range(0, 100000, 10000):
+        scheduler.request(offset, scrub=True)
+    scheduler.request(123456)
+
+    run_until_idle(scheduler, 1)
+    assert playback.seeks == [123456]
+    assert preview.scales == [1]
+    stats = scheduler.get_stats()
+    assert stats["requests"] == 11
+    assert stats["seeks"] == 1
+    assert stats["coalesced"] == 10
+
+
+def test_stale_frame_is_dropped_before_decoding():
+    playback, preview = FakePlayback(), FakePreview()
+    scheduler = SeekScheduler(playback, preview, PlaybackSignals(), fps=30)
+
+    def superseded():
+        # A new slider position arrives while the first target is being read
+        playback.on_update = None
+        scheduler.request(2000, scrub=True)
+
+    playback.on_update = superseded
+    scheduler.request(1000)
+
+    run_until_idle(scheduler, 1)
+    assert playback.seeks == [1000, 2000]
+    assert preview.scales == [SCRUB_SCALE]
+    assert scheduler.get_stats()["dropped"] == 1
+
+
+def test_end_of_imu_track_ends_playback():
+    playback, preview = FakePlayback(), FakePreview()
+    playback.imu_samples = 1
+    scheduler = SeekScheduler(playback, preview, PlaybackSignals(), fps=30)
+    ended = []
+    scheduler.end_reached.connect(lambda: ended.append(True), Qt.DirectConnection)
+
+    scheduler.start()
+    scheduler.request(1000)
+    while scheduler.seeks < 1:
+        time.sleep(0.01)
+    scheduler.request(2000)
+    while not ended:
+        time.sleep(0.01)
+    scheduler.stop()
+
+    assert playback.seeks == [1000, 2000]
+    assert scheduler.get_stats()["seeks"] == 1
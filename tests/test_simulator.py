@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from pykinect_recorder.pyk4a import pykinect
+from pykinect_recorder.pyk4a.k4a import _k4a, Configuration
+from pykinect_recorder.pyk4a.k4arecord.playback import Playback
+
+
+def make_configuration(color_format):
+    configuration = Configuration()
+    configuration.color_format = color_format
+    configuration.color_resolution = _k4a.K4A_COLOR_RESOLUTION_720P
+    configuration.depth_mode = _k4a.K4A_DEPTH_MODE_NFOV_2X2BINNED
+    return configuration
+
+
+@pytest.mark.parametrize(
+    "color_format",
+    [
+        _k4a.K4A_IMAGE_FORMAT_COLOR_MJPG,
+        _k4a.K4A_IMAGE_FORMAT_COLOR_NV12,
+        _k4a.K4A_IMAGE_FORMAT_COLOR_YUY2,
+        _k4a.K4A_IMAGE_FORMAT_COLOR_BGRA32,
+    ],
+)
+def test_device_frames(simulator, color_format):
+    device = pykinect.start_device(config=make_configuration(color_format))
+    timestamps = []
+    for _ in range(3):
+        capture = device.update()
+        ret, color_image = capture.get_color_image()
+        assert ret and color_image.shape[:2] == (720, 1280)
+        ret, depth_image = capture.get_depth_image()
+        assert ret and depth_image.shape == (288, 320) and depth_image.dtype == np.uint16
+        timestamps.append(capture.get_device_timestamp_usec())
+    device.update_imu()
+    device.close()
+
+    # 30 fps, and IMU samples up to the last frame are pending
+    assert np.diff(timestamps).tolist() == [33333, 33333]
+    assert device.imu_samples["acc_timestamp_usec"][-1] <= timestamps[-1]
+    capture.reset()
+    assert len(simulator.handles) == 0
+
+
+def test_record_and_playback(simulator, tmp_path):
+    filepath = str(tmp_path / "simulated.mkv")
+    device = pykinect.start_device(
+        config=make_configuration(_k4a.K4A_IMAGE_FORMAT_COLOR_MJPG), record=True, record_filepath=filepath
+    )
+    recorded = []
+    for _ in range(10):
+        recorded.append(device.update().get_device_timestamp_usec())
+        device.update_imu()
+    device.close()
+
+    playback = Playback(filepath)
+    assert playback.get_start_timestamp() == recorded[0]
+    assert playback.get_record_configuration().get_view()["imu_track_enabled"]
+
+    played = []
+    while True:
+        ret, capture = playback.update()
+        if not ret:
+            break
+        played.append(capture.get_device_timestamp_usec())
+    assert played == recorded
+
+    imu_samples = np.concatenate(list(playback.read_imu()))
+    assert len(imu_samples) > 0 and np.all(np.diff(imu_samples["acc_timestamp_usec"].astype(np.int64)) > 0)
+
+    playback.seek_device_timestamp(recorded[5])
+    ret, capture = playback.update()
+    assert ret and capture.get_device_timestamp_usec() == recorded[5]
+    playback.close()
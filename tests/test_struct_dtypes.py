@@ -0,0 +1,71 @@
+import ctypes
+
+import numpy as np
+
+from pykinect_recorder.pyk4a.k4a import _k4a
+from pykinect_recorder.pyk4a.k4a.calibration import CALIBRATION_DTYPE, Calibration
+from pykinect_recorder.pyk4a.k4a.imu_sample import IMU_SAMPLE_DTYPE, ImuSample
+from pykinect_recorder.pyk4a.k4arecord import _k4arecord
+from pykinect_recorder.pyk4a.k4arecord.record_configuration import RECORD_CONFIGURATION_DTYPE, RecordConfiguration
+from pykinect_recorder.pyk4a.utils import struct_view
+
+
+def test_dtypes_match_struct_sizes():
+    assert IMU_SAMPLE_DTYPE.itemsize == ctypes.sizeof(_k4a.k4a_imu_sample_t)
+    assert CALIBRATION_DTYPE.itemsize == ctypes.sizeof(_k4a.k4a_calibration_t)
+    assert RECORD_CONFIGURATION_DTYPE.itemsize == ctypes.sizeof(_k4arecord.k4a_record_configuration_t)
+
+
+def test_struct_view_shares_memory():
+    structs = (_k4a.k4a_imu_sample_t * 3)()
+    view = struct_view(structs, IMU_SAMPLE_DTYPE)
+    assert view.shape == (3,)
+
+    structs[1].acc_timestamp_usec = 1234
+    structs[1].acc_sample.xyz.z = 9.81
+    assert view[1]["acc_timestamp_usec"] == 1234
+    assert view[1]["acc_sample"][2] == np.float32(9.81)
+
+    view[2]["temperature"] = 30.0
+    assert structs[2].temperature == 30.0
+
+
+def test_imu_sample_reads_struct_in_place():
+    struct = _k4a.k4a_imu_sample_t()
+    struct.gyro_sample.v[:] = (0.1, 0.2, 0.3)
+    struct.gyro_timestamp_usec = 625
+    imu_sample = ImuSample(struct)
+
+    np.testing.assert_allclose(imu_sample.gyro, [0.1, 0.2, 0.3], rtol=1e-6)
+    assert imu_sample.gyro_time == 625
+    struct.acc_timestamp_usec = 1250
+    assert imu_sample.acc_time == 1250
+
+
+def test_imu_sample_over_array_record():
+    imu_samples = np.zeros(2, dtype=IMU_SAMPLE_DTYPE)
+    imu_samples[1]["acc_timestamp_usec"] = 625
+    imu_samples[1]["temperature"] = 30.0
+    imu_sample = ImuSample(imu_samples[1])
+
+    assert imu_sample.acc_time == 625
+    assert imu_sample.struct().temperature == 30.0
+    assert set(imu_sample.get_sample()) == set(IMU_SAMPLE_DTYPE.names)
+
+
+def test_calibration_and_record_configuration_views():
+    calibration_struct = _k4a.k4a_calibration_t()
+    calibration_struct.color_camera_calibration.intrinsics.parameters.param.fx = 600.0
+    calibration_struct.color_camera_calibration.resolution_width = 1280
+    view = Calibration(calibration_struct).get_view()
+    color = view["color_camera_calibration"]
+    assert color["intrinsics"]["parameters"]["param"]["fx"] == 600.0
+    assert color["intrinsics"]["parameters"]["v"][2] == 600.0
+    assert color["resolution_width"] == 1280
+
+    config_struct = _k4arecord.k4a_record_configuration_t()
+    config_struct.camera_fps = 2
+    config_struct.imu_track_enabled = True
+    config = RecordConfiguration(config_struct).get_view()
+    assert config["camera_fps"] == 2
+    assert bool(config["imu_track_enabled"])
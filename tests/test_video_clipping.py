@@ -0,0 +1,28 @@
+from PySide6.QtWidgets import QApplication
+
+from pykinect_recorder.pyk4a import pykinect
+from pykinect_recorder.pyk4a.k4a import _k4a, Configuration
+
+
+def test_rejected_dialog_stops_read_ahead(simulator, tmp_path):
+    from pykinect_recorder.renderer.components.viewer_video_clipping import VideoClippingDialog
+
+    filepath = str(tmp_path / "clip.mkv")
+    configuration = Configuration()
+    configuration.color_resolution = _k4a.K4A_COLOR_RESOLUTION_720P
+    configuration.depth_mode = _k4a.K4A_DEPTH_MODE_NFOV_2X2BINNED
+    device = pykinect.start_device(config=configuration, record=True, record_filepath=filepath)
+    for _ in range(10):
+        device.update()
+        device.update_imu()
+    device.close()
+
+    app = QApplication.instance() or QApplication([])
+    dialog = VideoClippingDialog(filepath)
+    assert dialog.read_ahead._thread.is_alive()
+
+    # Esc rejects the dialog without a close event
+    dialog.reject()
+    assert not dialog.read_ahead._thread.is_alive()
+    dialog.playback.close()
+    app.processEvents()